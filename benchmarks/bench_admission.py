@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Mixed-load admission benchmark
+Times interactive read_latest calls while batch threads run year-long scans, with one shared reader and with admission control
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.admission import AdmissionController, AdmissionError
+from tickdb.core import TickDB, TickDBConfig
+
+
+def generate_day(symbols, day, rows, seed):
+    """Generate one ts-ordered day of ticks"""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 86_400_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(pd.Timestamp(day).value + offsets, type=pa.timestamp("ns")),
+        "symbol": rng.choice(symbols, rows),
+        "price": rng.uniform(4000, 5000, rows),
+        "size": rng.integers(1, 1000, rows),
+    })
+
+
+def mixed_load(run_batch, run_interactive, batch_threads, interactive_calls):
+    """Interactive latencies (ms) measured while batch threads loop"""
+    stop = threading.Event()
+    
+    def batch_loop():
+        while not stop.is_set():
+            run_batch()
+    
+    loaders = [threading.Thread(target=batch_loop) for _ in range(batch_threads)]
+    for thread in loaders:
+        thread.start()
+    time.sleep(0.5)
+    
+    latencies = []
+    try:
+        for _ in range(interactive_calls):
+            start = time.perf_counter()
+            run_interactive()
+            latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(0.01)
+    finally:
+        stop.set()
+        for thread in loaders:
+            thread.join()
+    return np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark interactive latency under batch load")
+    parser.add_argument("--days", type=int, default=60, help="Days of data")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows per day")
+    parser.add_argument("--symbols", type=int, default=50, help="Number of symbols")
+    parser.add_argument("--batch-threads", type=int, default=4, help="Concurrent batch scanners")
+    parser.add_argument("--calls", type=int, default=100, help="Interactive calls to time")
+    args = parser.parse_args()
+    
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+    batch_query = {
+        "schema_id": "ticks_v1",
+        "fields": ["symbol", "price", "size"],
+        "ts_start": "2025-01-01",
+        "ts_end": "2026-01-01",
+        "order_by": "price"
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = TickDBConfig(
+            data_path=Path(tmpdir) / "data",
+            quarantine_path=Path(tmpdir) / "quarantine",
+            enable_metrics=False,
+            enable_checkpoints=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+        print(f"Writing {args.days} days x {args.rows:,} rows...")
+        for day in range(args.days):
+            start = pd.Timestamp("2025-01-01") + pd.Timedelta(days=day)
+            tickdb.loader.store_table(generate_day(symbols, start, args.rows, day), "ticks_v1", "feed")
+        
+        # Everything on one reader: interactive calls queue behind scans
+        shared = tickdb.reader
+        lock = threading.Lock()
+        
+        def shared_batch():
+            with lock:
+                shared.query(batch_query)
+        
+        def shared_interactive():
+            with lock:
+                shared.read_latest(symbols[0], limit=100)
+        
+        baseline = mixed_load(shared_batch, shared_interactive, args.batch_threads, args.calls)
+        
+        controller = AdmissionController(config)
+        
+        def admitted_batch():
+            try:
+                with controller.admit("batch") as reader:
+                    reader.query(batch_query)
+            except AdmissionError:
+                pass
+        
+        def admitted_interactive():
+            with controller.admit("interactive") as reader:
+                reader.read_latest(symbols[0], limit=100)
+        
+        admitted = mixed_load(admitted_batch, admitted_interactive, args.batch_threads, args.calls)
+        
+        print(f"{'mode':>12} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+        for name, latencies in (("shared", baseline), ("admission", admitted)):
+            print(f"{name:>12} {np.percentile(latencies, 50):>10.1f} "
+                  f"{np.percentile(latencies, 99):>10.1f} {latencies.max():>10.1f}")
+        
+        for name, stats in controller.stats().items():
+            print(f"{name}: admitted={stats['admitted']} rejected={stats['rejected']} "
+                  f"wait p99={stats['wait_p99_ms']:.1f}ms")
+        
+        controller.close()
+        tickdb.reader.close()
+
+
+if __name__ == "__main__":
+    main()
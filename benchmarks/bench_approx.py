@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Approximate query benchmark
+Times exact and sampled dashboard tiles (hourly bars with quantiles, a sampled read) over a lake of ticks
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.core import TickDB, TickDBConfig
+
+
+def generate_hour(symbols, start, rows, seed):
+    """Generate one ts-ordered file of ticks covering one hour"""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 3_600_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(pd.Timestamp(start).value + offsets, type=pa.timestamp("ns")),
+        "symbol": rng.choice(symbols, rows),
+        "price": 4500 + rng.normal(0, 0.25, rows).cumsum(),
+        "size": rng.integers(1, 100, rows),
+    })
+
+
+def timed(fn, repeat):
+    """Result of the last run and median wall time of `repeat` runs, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, float(np.median(times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark exact against sampled dashboard queries")
+    parser.add_argument("--hours", type=int, default=24, help="Hourly files in the lake")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows per file")
+    parser.add_argument("--samples", type=float, nargs="+", default=[0.1, 0.01], help="Sample fractions to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (median is reported)")
+    args = parser.parse_args()
+    
+    symbols = ["ES", "NQ", "CL", "GC"]
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = TickDBConfig(
+            data_path=Path(tmpdir) / "data",
+            quarantine_path=Path(tmpdir) / "quarantine",
+            enable_metrics=False,
+            enable_checkpoints=False,
+            rollup_intervals=[]
+        )
+        schema_path = config.data_path / "ticks_v1"
+        schema_path.mkdir(parents=True)
+        
+        # Written directly: going through the loader would dominate the run
+        for i in range(args.hours):
+            start = pd.Timestamp("2025-01-02") + pd.Timedelta(hours=i)
+            pq.write_table(generate_hour(symbols, start, args.rows, i), schema_path / f"ticks_v1_feed_{i:04d}.parquet")
+        
+        tickdb = TickDB(config)
+        aggs = ["trade_count", "volume", "vwap", "quantiles"]
+        print(f"Lake: {args.hours} files x {args.rows:,} rows, {len(symbols)} symbols")
+        
+        tiles = [
+            ("ES, whole lake", {"symbols": "ES"}),
+            ("all, 6 hours", {"ts_start": "2025-01-02T03:00:00", "ts_before": "2025-01-02T09:00:00"}),
+        ]
+        for name, tile in tiles:
+            exact, exact_ms = timed(lambda: tickdb.bars(interval="1h", aggs=aggs, **tile), args.repeat)
+            print(f"{name:>16} {'exact':>8} {exact_ms:>9.1f} ms")
+            truth = exact.to_pandas().set_index(["symbol", "ts"])
+            
+            for fraction in args.samples:
+                sampled, elapsed = timed(
+                    lambda: tickdb.bars(interval="1h", aggs=aggs, sample=fraction, **tile),
+                    args.repeat
+                )
+                bars = sampled.to_pandas().set_index(["symbol", "ts"])
+                count_error = (bars["trade_count"] / truth["trade_count"] - 1).abs().max()
+                bound = (bars["trade_count_error"] / truth["trade_count"]).mean()
+                covered = ((bars["trade_count"] - truth["trade_count"]).abs() <= bars["trade_count_error"]).mean()
+                print(f"{'':>16} {fraction:>8.0%} {elapsed:>9.1f} ms  speedup {exact_ms / elapsed:>5.1f}x  "
+                      f"max count error {count_error:.1%}  mean bound {bound:.1%}  covered {covered:.0%}")
+        
+        _, full_ms = timed(lambda: tickdb.read("ES", fields=["ts", "price"]), args.repeat)
+        _, sampled_ms = timed(lambda: tickdb.read("ES", fields=["ts", "price"], sample=10_000), args.repeat)
+        print(f"{'ES read':>16} {'full':>8} {full_ms:>9.1f} ms")
+        print(f"{'':>16} {'10k rows':>8} {sampled_ms:>9.1f} ms  speedup {full_ms / sampled_ms:>5.1f}x")
+        
+        tickdb.reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Downsampling benchmark
+Times min-max and LTTB downsampling of a day of ES ticks against fetching the full day
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.core import TickDB, TickDBConfig
+
+
+def generate_day(rows, seed=0):
+    """Generate one day of ES ticks as a random walk"""
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2025-01-02").value
+    offsets = np.sort(rng.integers(0, 86_400_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(start + offsets, type=pa.timestamp("ns")),
+        "symbol": pa.array(["ES"] * rows),
+        "price": 4500 + np.round(rng.normal(0, 0.25, rows).cumsum() * 4) / 4,
+        "size": rng.integers(1, 50, rows),
+    })
+
+
+def timed(fn, repeat):
+    """Result of the last run and median wall time of `repeat` runs, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, float(np.median(times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark downsampling against a full fetch")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Ticks in the day")
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 4000], help="Output points to time")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (median is reported)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = TickDBConfig(
+            data_path=Path(tmpdir) / "data",
+            quarantine_path=Path(tmpdir) / "quarantine",
+            enable_metrics=False,
+            enable_checkpoints=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+        day = generate_day(args.rows)
+        tickdb.loader.store_table(day, "ticks_v1", "bench")
+        
+        ts_start, ts_end = "2025-01-02T00:00:00", "2025-01-02T23:59:59.999999999"
+        high, low = max(day.column("price").to_pylist()), min(day.column("price").to_pylist())
+        print(f"Day: {args.rows:,} ES ticks, price range {low:.2f} - {high:.2f}")
+        
+        full, full_ms = timed(
+            lambda: tickdb.read("ES", ts_start, ts_end, fields=["ts", "price"], schema_id="ticks_v1"),
+            args.repeat
+        )
+        print(f"{'full fetch':>16} {'':>7} {full_ms:>10.1f} ms {len(full):>10,} rows {full.nbytes / 1e6:>8.1f} MB")
+        
+        for points in args.points:
+            for method in ("minmax", "lttb"):
+                result, elapsed = timed(
+                    lambda: tickdb.downsample("ES", ts_start, ts_end, points=points, method=method),
+                    args.repeat
+                )
+                prices = result.column("price").to_pylist()
+                extremes = max(prices) == high and min(prices) == low
+                print(f"{method:>16} {points:>7} {elapsed:>10.1f} ms {len(result):>10,} rows "
+                      f"{result.nbytes / 1e6:>8.3f} MB  extremes kept: {extremes}")
+        
+        tickdb.reader.close()
+
+
+if __name__ == "__main__":
+    main()
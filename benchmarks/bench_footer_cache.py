@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Footer cache benchmark
+Times a small point query against growing file counts with a cold and a warm footer cache
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.footers import footer_cache
+
+
+def generate_file(symbols, start, rows, seed):
+    """Generate one ts-ordered file of ticks covering one minute"""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 60_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(pd.Timestamp(start).value + offsets, type=pa.timestamp("ns")),
+        "symbol": rng.choice(symbols, rows),
+        "price": rng.uniform(4000, 5000, rows),
+        "size": rng.integers(1, 1000, rows),
+    })
+
+
+def timed(fn, repeat):
+    """Median wall time of `repeat` runs, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return float(np.median(times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark small-query latency against file count")
+    parser.add_argument("--files", type=int, nargs="+", default=[100, 1000, 5000], help="File counts to time")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per file")
+    parser.add_argument("--symbols", type=int, default=20, help="Number of symbols")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (median is reported)")
+    args = parser.parse_args()
+    
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+    
+    print(f"{'files':>8} {'cold (ms)':>10} {'warm (ms)':>10} {'warm-up (ms)':>13} {'cache (KB)':>11}")
+    for n_files in args.files:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = TickDBConfig(
+                data_path=Path(tmpdir) / "data",
+                quarantine_path=Path(tmpdir) / "quarantine",
+                enable_metrics=False,
+                enable_checkpoints=False,
+                rollup_intervals=[]
+            )
+            schema_path = config.data_path / "ticks_v1"
+            schema_path.mkdir(parents=True)
+            
+            # Written directly: going through the loader would dominate the run
+            for i in range(n_files):
+                start = pd.Timestamp("2025-01-01") + pd.Timedelta(minutes=i)
+                pq.write_table(
+                    generate_file(symbols, start, args.rows, i),
+                    schema_path / f"ticks_v1_feed_{i:06d}.parquet"
+                )
+            
+            # One minute in the middle of the lake: a single file survives pruning
+            middle = pd.Timestamp("2025-01-01") + pd.Timedelta(minutes=n_files // 2)
+            query = {
+                "symbol": symbols[0],
+                "ts_start": str(middle),
+                "ts_end": str(middle + pd.Timedelta(seconds=59)),
+                "fields": ["ts", "price"],
+                "schema_id": "ticks_v1"
+            }
+            
+            def cold():
+                footer_cache.clear()
+                tickdb.reader.query(query)
+            
+            tickdb = TickDB(config)
+            cold_ms = timed(cold, args.repeat)
+            
+            footer_cache.clear()
+            warm_up_ms = timed(lambda: tickdb.reader.warm_up(["ticks_v1"]), 1)
+            warm_ms = timed(lambda: tickdb.reader.query(query), args.repeat)
+            
+            print(f"{n_files:>8} {cold_ms:>10.1f} {warm_ms:>10.1f} {warm_up_ms:>13.1f} "
+                  f"{footer_cache.nbytes / 1024:>11.0f}")
+            tickdb.reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Metrics hot-path benchmark
+Times record_ingest / record_append / record_query per call, against the same updates made through labels() lookups on every call
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+from prometheus_client import CollectorRegistry, Histogram, Summary
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.metrics import MetricsCollector
+
+
+def per_call_ns(fn, calls, threads=1):
+    """Wall time per call in nanoseconds, with `threads` threads making `calls` calls each"""
+    def run():
+        for i in range(calls):
+            fn(i)
+    
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    start = time.perf_counter_ns()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter_ns() - start) / (calls * threads)
+
+
+def unbatched_query(collector, reference, query_time_ms, rows_returned, schema_id="ticks_v1", status="success"):
+    """The updates of record_query made with a labels() lookup per metric and call, observing prometheus_client metrics"""
+    collector.query_total.labels(schema_id=schema_id, status=status).inc()
+    collector.query_rows_total.labels(schema_id=schema_id).inc(rows_returned)
+    reference["duration"].labels(schema_id=schema_id).observe(query_time_ms / 1000.0)
+    reference["latency"].labels(schema_id=schema_id).observe(query_time_ms)
+
+
+def unbatched_append(collector, rows_processed, schema_id="ticks_v1"):
+    """The counter updates of record_append made with a labels() lookup per metric and call"""
+    collector.ingest_total.labels(source_id="append", schema_id=schema_id, status="success").inc()
+    collector.ingest_rows_total.labels(source_id="append", schema_id=schema_id, status="success").inc(rows_processed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the metrics hot path")
+    parser.add_argument("--calls", type=int, default=200_000, help="Calls per thread")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4], help="Thread counts to run")
+    args = parser.parse_args()
+    
+    collector = MetricsCollector(registry=CollectorRegistry())
+    # The stock metrics record_query observed before observations were batched
+    reference_registry = CollectorRegistry()
+    reference = {
+        "duration": Histogram(
+            "reference_query_duration_seconds", "Reference", ["schema_id"],
+            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0], registry=reference_registry
+        ),
+        "latency": Summary("reference_query_latency_ms", "Reference", ["schema_id"], registry=reference_registry),
+    }
+    cases = {
+        "record_query": lambda i: collector.record_query(1.5, 100, schema_id="ticks_v1"),
+        "record_append": lambda i: collector.record_append("ticks_v1", 1_000, 0),
+        "record_ingest": lambda i: collector.record_ingest("feed", 1 << 20, 10_000, 0, schema_id="ticks_v1"),
+        "record_ingest (stages)": lambda i: collector.record_ingest(
+            "feed", 1 << 20, 10_000, 0, schema_id="ticks_v1", duration_seconds=0.2,
+            stages={"parse": 50.0, "validate.prices": 5.0, "sort": 20.0, "encode": 100.0, "fsync": 5.0}
+        ),
+        "labels() per call: query": lambda i: unbatched_query(collector, reference, 1.5, 100),
+        "labels() per call: append": lambda i: unbatched_append(collector, 1_000),
+    }
+    
+    print(f"{'call':<28}" + "".join(f"{f'{threads} thread(s)':>16}" for threads in args.threads))
+    for name, fn in cases.items():
+        times = [per_call_ns(fn, args.calls, threads) for threads in args.threads]
+        print(f"{name:<28}" + "".join(f"{ns:>13,.0f} ns" for ns in times))
+    
+    collector.flush()
+    queries = collector.get_metrics()["metrics"]["query_ticks_v1"]["total_queries"]
+    assert queries == args.calls * sum(args.threads), queries
+
+
+if __name__ == "__main__":
+    main()
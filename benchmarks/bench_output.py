@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Output adapter benchmark
+Times and measures the memory of converting a large float table to each output format, against plain to_pandas()
+"""
+
+import argparse
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.output import HAS_POLARS, convert
+
+
+def generate_table(rows, columns, chunk_rows):
+    """Generate float64 columns in chunks, as DuckDB returns them"""
+    rng = np.random.default_rng(0)
+    chunks = []
+    for offset in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - offset)
+        chunks.append(pa.record_batch({f"f{i}": rng.standard_normal(n) for i in range(columns)}))
+    return pa.Table.from_batches(chunks)
+
+
+def measure(fn):
+    """Wall time (s) and new Arrow/process memory (MB) of one conversion"""
+    pool_before = pa.total_allocated_bytes()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    pool_mb = (pa.total_allocated_bytes() - pool_before) / 1e6
+    return result, elapsed, pool_mb
+
+
+def rss_mb():
+    """Peak resident set size of the process so far, in MB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zero-copy output adapters")
+    parser.add_argument("--rows", type=int, default=100_000_000, help="Rows per column")
+    parser.add_argument("--columns", type=int, default=1, help="float64 columns")
+    parser.add_argument("--chunk-rows", type=int, default=100_000_000, help="Rows per Arrow chunk (1 chunk allows NumPy views)")
+    args = parser.parse_args()
+    
+    table = generate_table(args.rows, args.columns, args.chunk_rows)
+    print(f"Table: {args.rows:,} rows x {args.columns} float64 columns, "
+          f"{table.nbytes / 1e6:,.0f} MB in {table.column(0).num_chunks} chunk(s)")
+    
+    cases = [
+        ("to_pandas() (copy)", lambda: table.to_pandas()),
+        ("pandas (ArrowDtype)", lambda: convert(table, "pandas")),
+        ("numpy", lambda: convert(table, "numpy")),
+    ]
+    if HAS_POLARS:
+        cases.append(("polars", lambda: convert(table, "polars")))
+    
+    print(f"{'output':>22} {'time (ms)':>10} {'new Arrow MB':>13} {'process peak RSS MB':>20}")
+    for name, fn in cases:
+        result, elapsed, pool_mb = measure(fn)
+        print(f"{name:>22} {elapsed * 1000:>10.1f} {pool_mb:>13.1f} {rss_mb():>20.0f}")
+        del result
+    
+    # NumPy views are zero-copy: the array points at the Arrow buffer
+    arrays = convert(table, "numpy")
+    shared = arrays["f0"].ctypes.data == table.column("f0").chunk(0).buffers()[1].address
+    print(f"numpy view shares Arrow buffer: {shared}")
+
+
+if __name__ == "__main__":
+    main()
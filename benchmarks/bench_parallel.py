@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Parallel scan scaling benchmark
+Times read_parallel with 1 to 16 worker processes against the in-process reader
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.core import TickDB, TickDBConfig
+
+
+def generate_day(symbols, day, rows, seed):
+    """Generate one ts-ordered day of ticks"""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 86_400_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(pd.Timestamp(day).value + offsets, type=pa.timestamp("ns")),
+        "symbol": rng.choice(symbols, rows),
+        "price": rng.uniform(4000, 5000, rows),
+        "size": rng.integers(1, 1000, rows),
+    })
+
+
+def timed(fn, repeat):
+    """Best wall time of `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(fn())
+        best = min(best, time.perf_counter() - start)
+    return best, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel partition-split scans")
+    parser.add_argument("--days", type=int, default=32, help="Days of data (files per day set by --files-per-day)")
+    parser.add_argument("--files-per-day", type=int, default=4, help="Raw files per day")
+    parser.add_argument("--rows", type=int, default=250_000, help="Rows per file")
+    parser.add_argument("--symbols", type=int, default=50, help="Number of symbols")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Worker counts to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+    
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+    query = {
+        "symbols": symbols[: args.symbols // 2],
+        "ts_start": "2025-01-02",
+        "ts_end": str(pd.Timestamp("2025-01-01") + pd.Timedelta(days=args.days - 1)),
+        "fields": ["ts", "symbol", "price", "size"]
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = TickDBConfig(
+            data_path=Path(tmpdir) / "data",
+            quarantine_path=Path(tmpdir) / "quarantine",
+            enable_metrics=False,
+            enable_checkpoints=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+        
+        n_files = args.days * args.files_per_day
+        print(f"Writing {n_files} files x {args.rows:,} rows...")
+        for day in range(args.days):
+            start = pd.Timestamp("2025-01-01") + pd.Timedelta(days=day)
+            for part in range(args.files_per_day):
+                seed = day * args.files_per_day + part
+                tickdb.loader.store_table(generate_day(symbols, start, args.rows, seed), "ticks_v1", f"feed{part}")
+        
+        print(f"CPU cores available: {os.cpu_count()}")
+        baseline, rows = timed(lambda: tickdb.reader.read_symbols(**query), args.repeat)
+        print(f"in-process read_symbols: {rows:,} rows in {baseline:.2f}s")
+        
+        print(f"{'workers':>8} {'ordered (s)':>12} {'speedup':>8} {'unordered (s)':>14} {'speedup':>8}")
+        for workers in args.workers:
+            # Warm the pool so process start-up is not measured
+            tickdb.read_parallel(workers=workers, **query)
+            ordered, _ = timed(lambda: tickdb.read_parallel(workers=workers, **query), args.repeat)
+            unordered, _ = timed(lambda: tickdb.read_parallel(workers=workers, ordered=False, **query), args.repeat)
+            print(f"{workers:>8} {ordered:>12.2f} {baseline / ordered:>7.1f}x "
+                  f"{unordered:>14.2f} {baseline / unordered:>7.1f}x")
+        
+        tickdb.reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Replay throughput benchmark
+Compares k-way merged replay against a sorted read_symbols query (events/s)
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.core import TickDB, TickDBConfig
+
+
+def generate_batch(symbols, start, rows, seed):
+    """Generate one ts-ordered batch of ticks"""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 3_600_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(pd.Timestamp(start).value + offsets, type=pa.timestamp("ns")),
+        "symbol": rng.choice(symbols, rows),
+        "price": rng.uniform(4000, 5000, rows),
+        "size": rng.integers(1, 1000, rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark k-way merged replay")
+    parser.add_argument("--files", type=int, default=16, help="Number of raw files")
+    parser.add_argument("--rows", type=int, default=250_000, help="Rows per file")
+    parser.add_argument("--symbols", type=int, default=50, help="Number of symbols")
+    parser.add_argument("--batch-size", type=int, default=65536, help="Replay batch size")
+    args = parser.parse_args()
+    
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = TickDBConfig(
+            data_path=Path(tmpdir) / "data",
+            quarantine_path=Path(tmpdir) / "quarantine",
+            enable_metrics=False,
+            enable_checkpoints=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+        
+        print(f"Writing {args.files} files x {args.rows:,} rows...")
+        for i in range(args.files):
+            # Overlapping hours so every stream takes part in the merge
+            start = pd.Timestamp("2025-01-01") + pd.Timedelta(minutes=15 * i)
+            tickdb.loader.store_table(generate_batch(symbols, start, args.rows, i), "ticks_v1", f"feed{i}")
+        
+        total = args.files * args.rows
+        
+        start = time.perf_counter()
+        result = tickdb.reader.read_symbols(symbols, fields=["ts", "symbol", "price", "size"])
+        result = result.sort_by("ts")
+        elapsed = time.perf_counter() - start
+        print(f"read_symbols + sort: {len(result):,} events in {elapsed:.2f}s "
+              f"({len(result) / elapsed:,.0f} events/s)")
+        del result
+        
+        start = time.perf_counter()
+        events = 0
+        for batch in tickdb.replay(symbols, fields=["ts", "symbol", "price", "size"], batch_size=args.batch_size):
+            events += len(batch)
+        elapsed = time.perf_counter() - start
+        print(f"replay:              {events:,} events in {elapsed:.2f}s "
+              f"({events / elapsed:,.0f} events/s)")
+        
+        assert events == total
+
+
+if __name__ == "__main__":
+    main()
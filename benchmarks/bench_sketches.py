@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Sketch benchmark
+Times sketch-merged quantiles and distinct symbol counts against exact DuckDB scans over a month of files
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.core import TickDB, TickDBConfig
+
+
+def generate_day(symbols, day, rows, seed):
+    """Generate one day of ticks with heavy-tailed trade sizes"""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 86_400_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(pd.Timestamp(day).value + offsets, type=pa.timestamp("ns")),
+        "symbol": rng.choice(symbols, rows),
+        "price": 100 + rng.normal(0, 0.05, rows).cumsum(),
+        "size": (rng.pareto(1.5, rows) * 10 + 1).astype("int64"),
+    })
+
+
+def timed(fn, repeat):
+    """Result of the last run and median wall time of `repeat` runs, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, float(np.median(times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sketch-merged quantiles against exact scans")
+    parser.add_argument("--days", type=int, default=30, help="Daily files loaded")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows per day")
+    parser.add_argument("--symbols", type=int, default=50, help="Number of symbols")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (median is reported)")
+    args = parser.parse_args()
+
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = TickDBConfig(
+            data_path=Path(tmpdir) / "data",
+            quarantine_path=Path(tmpdir) / "quarantine",
+            enable_metrics=False,
+            enable_checkpoints=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+
+        start = time.perf_counter()
+        for i in range(args.days):
+            day = pd.Timestamp("2025-01-01") + pd.Timedelta(days=i)
+            tickdb.loader.store_table(generate_day(symbols, day, args.rows, i), "ticks_v1", "bench")
+        print(f"Loaded {args.days} days x {args.rows:,} rows, {args.symbols} symbols "
+              f"in {time.perf_counter() - start:.1f}s (sketches included)")
+
+        source = f"read_parquet('{config.data_path / 'ticks_v1'}/*.parquet')"
+        con = tickdb.reader.duckdb_con
+
+        exact, exact_ms = timed(lambda: con.execute(
+            f"SELECT quantile_cont(size, 0.99) FROM {source} WHERE symbol = 'SYM001'"
+        ).fetchone()[0], args.repeat)
+        sketched, sketch_ms = timed(
+            lambda: tickdb.quantiles("size", qs=[0.99], symbols="SYM001").column("p99")[0].as_py(),
+            args.repeat
+        )
+        print(f"{'p99 size, 1 symbol':>24}  exact {exact_ms:>8.1f} ms ({exact:.1f})  "
+              f"sketch {sketch_ms:>6.1f} ms ({sketched:.1f})")
+
+        _, exact_ms = timed(lambda: con.execute(
+            f"SELECT symbol, quantile_cont(size, 0.99) FROM {source} GROUP BY symbol"
+        ).fetchall(), args.repeat)
+        _, sketch_ms = timed(lambda: tickdb.quantiles("size", qs=[0.99]), args.repeat)
+        print(f"{'p99 size, all symbols':>24}  exact {exact_ms:>8.1f} ms  sketch {sketch_ms:>6.1f} ms")
+
+        exact, exact_ms = timed(lambda: con.execute(
+            f"SELECT count(DISTINCT symbol) FROM {source}"
+        ).fetchone()[0], args.repeat)
+        counted, count_ms = timed(lambda: tickdb.count_symbols(), args.repeat)
+        print(f"{'distinct symbols':>24}  exact {exact_ms:>8.1f} ms ({exact})  footers {count_ms:>5.1f} ms ({counted})")
+
+        tickdb.reader.close()
+
+
+if __name__ == "__main__":
+    main()
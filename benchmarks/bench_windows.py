@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Event-window benchmark
+Compares one batched read_windows scan against a read_time_slice call per event
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tickdb.core import TickDB, TickDBConfig
+
+
+def generate_day(symbols, day, rows, seed):
+    """Generate one ts-ordered day of ticks"""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 86_400_000_000_000, rows))
+    return pa.table({
+        "ts": pa.array(pd.Timestamp(day).value + offsets, type=pa.timestamp("ns")),
+        "symbol": rng.choice(symbols, rows),
+        "price": rng.uniform(4000, 5000, rows),
+        "size": rng.integers(1, 1000, rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched event-window reads")
+    parser.add_argument("--days", type=int, default=5, help="Days of data (one file per day)")
+    parser.add_argument("--rows", type=int, default=500_000, help="Rows per day")
+    parser.add_argument("--symbols", type=int, default=20, help="Number of symbols")
+    parser.add_argument("--windows", type=int, default=10_000, help="Number of event windows")
+    parser.add_argument("--per-call-sample", type=int, default=500,
+                        help="Events timed with read_time_slice; the total is extrapolated")
+    args = parser.parse_args()
+    
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+    rng = np.random.default_rng(42)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = TickDBConfig(
+            data_path=Path(tmpdir) / "data",
+            quarantine_path=Path(tmpdir) / "quarantine",
+            enable_metrics=False,
+            enable_checkpoints=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+        
+        print(f"Writing {args.days} days x {args.rows:,} rows...")
+        for day in range(args.days):
+            start = pd.Timestamp("2025-01-01") + pd.Timedelta(days=day)
+            tickdb.loader.store_table(generate_day(symbols, start, args.rows, day), "ticks_v1", "feed")
+        
+        span = args.days * 86_400_000_000_000
+        events = pd.DataFrame({
+            "event_id": np.arange(args.windows),
+            "symbol": rng.choice(symbols, args.windows),
+            "ts": pd.to_datetime(pd.Timestamp("2025-01-01").value + rng.integers(0, span, args.windows))
+        })
+        before, after = pd.Timedelta("1min"), pd.Timedelta("5min")
+        
+        start = time.perf_counter()
+        result = tickdb.read_windows(events, before=before, after=after)
+        batched = time.perf_counter() - start
+        print(f"read_windows:    {args.windows:,} windows, {len(result):,} rows in {batched:.2f}s")
+        
+        sample = events.head(args.per_call_sample)
+        rows = 0
+        start = time.perf_counter()
+        for event in sample.itertuples():
+            rows += len(tickdb.reader.read_time_slice(event.symbol, event.ts - before, event.ts + after))
+        elapsed = time.perf_counter() - start
+        per_call = elapsed / len(sample) * args.windows
+        print(f"read_time_slice: {len(sample):,} windows in {elapsed:.2f}s "
+              f"(~{per_call:.1f}s extrapolated to {args.windows:,})")
+        print(f"Speedup: {per_call / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
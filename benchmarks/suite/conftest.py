@@ -0,0 +1,87 @@
+"""
+Standard TickDB benchmark suite (pytest-benchmark).
+
+Every benchmark runs on the deterministic synthetic dataset of one scale
+(see ``tickdb.synth.SCALES``), so results of different runs and versions
+are comparable:
+
+    pytest benchmarks/suite --no-cov --scale M --benchmark-autosave
+    pytest benchmarks/suite --no-cov --scale M --benchmark-compare --benchmark-compare-fail=median:10%
+
+Results are saved as JSON under ``.benchmarks/`` (or ``--benchmark-json
+PATH``) with the scale and dataset size recorded alongside the timings.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
+import pytest
+
+import tickdb
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.synth import SCALES, generate_scale
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--scale",
+        choices=sorted(SCALES),
+        default=os.environ.get("TICKDB_BENCH_SCALE", "S"),
+        help="Synthetic dataset scale (default: $TICKDB_BENCH_SCALE or S)"
+    )
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Record the dataset every result was measured on."""
+    scale = config.getoption("--scale")
+    output_json["tickdb"] = {"version": tickdb.__version__, "scale": scale, **SCALES[scale]}
+
+
+def make_config(root: Path) -> TickDBConfig:
+    """Configuration of a benchmark database under `root`."""
+    return TickDBConfig(
+        data_path=root / "data",
+        quarantine_path=root / "quarantine",
+        enable_metrics=False
+    )
+
+
+@pytest.fixture(scope="session")
+def scale(request):
+    """Name of the dataset scale."""
+    return request.config.getoption("--scale")
+
+
+@pytest.fixture(scope="session")
+def day_ticks(scale):
+    """The first trading day of the dataset."""
+    return generate_scale(scale, day=0)
+
+
+@pytest.fixture(scope="session")
+def day_files(tmp_path_factory, day_ticks):
+    """The first day written as CSV and Parquet source files."""
+    directory = tmp_path_factory.mktemp("sources")
+    csv.write_csv(day_ticks, directory / "ticks.csv")
+    pq.write_table(day_ticks, directory / "ticks.parquet")
+    return {"csv": directory / "ticks.csv", "parquet": directory / "ticks.parquet"}
+
+
+@pytest.fixture(scope="session")
+def lake(tmp_path_factory, scale):
+    """Database holding the whole dataset, one file per trading day."""
+    db = TickDB(make_config(tmp_path_factory.mktemp("lake")))
+    for day in range(SCALES[scale]["days"]):
+        db.loader.store_table(generate_scale(scale, day=day), "ticks_v1", "synth")
+    yield db
+    db.reader.close()
+
+
+@pytest.fixture
+def fresh_root(tmp_path_factory):
+    """Factory of empty directories for databases rebuilt every round."""
+    base = tmp_path_factory.mktemp("rounds")
+    return lambda: Path(tempfile.mkdtemp(dir=base))
@@ -0,0 +1,30 @@
+"""
+Append benchmarks: latency of TickDB.append for small DataFrame batches.
+"""
+
+import pytest
+
+from tickdb.core import TickDB
+
+from .conftest import make_config
+
+
+@pytest.mark.benchmark(group="append")
+@pytest.mark.parametrize("batch_rows", [1_000, 10_000])
+def test_append(benchmark, day_ticks, fresh_root, batch_rows):
+    """Append consecutive batches of one day to a growing lake."""
+    tickdb = TickDB(make_config(fresh_root()))
+    batches = iter(
+        day_ticks.slice(offset, batch_rows).to_pandas()
+        for offset in range(0, len(day_ticks) - batch_rows + 1, batch_rows)
+    )
+    
+    def setup():
+        return (next(batches), "ticks_v1", "synth"), {}
+    
+    rounds = min(20, len(day_ticks) // batch_rows)
+    result = benchmark.pedantic(tickdb.append, setup=setup, rounds=rounds)
+    
+    assert result["rows_processed"] == batch_rows
+    benchmark.extra_info["rows"] = batch_rows
+    tickdb.reader.close()
@@ -0,0 +1,40 @@
+"""
+Compaction benchmarks: TickDB.compact after a day of small appends.
+"""
+
+import shutil
+
+import pytest
+
+from tickdb.core import TickDB
+
+from .conftest import make_config
+
+# Batches the day is appended in, each leaving a raw file and rollup deltas
+APPEND_BATCHES = 20
+
+
+@pytest.fixture(scope="module")
+def appended_root(tmp_path_factory, day_ticks):
+    """A lake built from many small appends, not yet compacted."""
+    root = tmp_path_factory.mktemp("appended")
+    tickdb = TickDB(make_config(root))
+    batch_rows = -(-len(day_ticks) // APPEND_BATCHES)
+    for offset in range(0, len(day_ticks), batch_rows):
+        tickdb.loader.store_table(day_ticks.slice(offset, batch_rows), "ticks_v1", "synth")
+    tickdb.reader.close()
+    return root
+
+
+@pytest.mark.benchmark(group="compaction")
+def test_compact(benchmark, appended_root, fresh_root):
+    """Merge the rollup deltas and reconcile the sketches of a fresh copy."""
+    def setup():
+        root = fresh_root()
+        shutil.copytree(appended_root / "data", root / "data")
+        return (TickDB(make_config(root)),), {}
+    
+    result = benchmark.pedantic(TickDB.compact, setup=setup, rounds=5)
+    
+    assert all(merged == APPEND_BATCHES for merged in result["rollups"].values())
+    benchmark.extra_info["delta_files"] = APPEND_BATCHES
@@ -0,0 +1,27 @@
+"""
+Ingest benchmarks: DataLoader.load_file from CSV and Parquet sources.
+"""
+
+import pytest
+
+from tickdb.loader import DataLoader
+from tickdb.schemas import SchemaRegistry
+
+from .conftest import make_config
+
+
+@pytest.mark.benchmark(group="ingest")
+@pytest.mark.parametrize("source_format", ["csv", "parquet"])
+def test_load_file(benchmark, day_files, day_ticks, fresh_root, source_format):
+    """Load one day of ticks into an empty lake."""
+    schema = SchemaRegistry().get_schema("ticks_v1")
+    file_path = day_files[source_format]
+    
+    def setup():
+        loader = DataLoader(make_config(fresh_root()))
+        return (loader, "synth", file_path, schema), {}
+    
+    result = benchmark.pedantic(DataLoader.load_file, setup=setup, rounds=5)
+    
+    assert result["rows_processed"] == len(day_ticks)
+    benchmark.extra_info.update(rows=len(day_ticks), bytes=file_path.stat().st_size)
@@ -0,0 +1,36 @@
+"""
+Query benchmarks: DataReader.query shapes over the whole dataset.
+"""
+
+import pandas as pd
+import pytest
+
+from tickdb.synth import symbol_names
+
+# Trading day, most active symbol and a symbol from the tail of the activity curve
+DAY = pd.Timestamp("2025-01-02")
+TOP = symbol_names(1)[0]
+TAIL = symbol_names(50)[-1]
+
+QUERY_SHAPES = {
+    "full_column": {"fields": ["price"]},
+    "symbol": {"symbol": TOP, "fields": ["ts", "price", "size"]},
+    "rare_symbol": {"symbol": TAIL, "fields": ["ts", "price", "size"]},
+    "time_slice": {
+        "symbol": TOP,
+        "ts_start": str(DAY + pd.Timedelta(hours=10)),
+        "ts_end": str(DAY + pd.Timedelta(hours=10, minutes=5)),
+        "fields": ["ts", "price", "size"]
+    },
+    "latest": {"symbol": TOP, "order_by": "ts DESC", "limit": 1000},
+}
+
+
+@pytest.mark.benchmark(group="query")
+@pytest.mark.parametrize("shape", sorted(QUERY_SHAPES))
+def test_query(benchmark, lake, shape):
+    """Run one query shape against the loaded lake."""
+    table = benchmark(lake.reader.query, dict(QUERY_SHAPES[shape]))
+    
+    assert len(table) > 0
+    benchmark.extra_info["rows_returned"] = len(table)
@@ -0,0 +1,26 @@
+"""
+Validation benchmarks: DataValidator.validate_table.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from tickdb.config import TickDBConfig
+from tickdb.schemas import SchemaRegistry
+from tickdb.validation import DataValidator
+
+
+@pytest.mark.benchmark(group="validate")
+def test_validate_table(benchmark, day_ticks):
+    """Validate one day of ticks against the tick schema."""
+    schema = SchemaRegistry().get_schema("ticks_v1")
+    validator = DataValidator(TickDBConfig())
+    # The metadata columns the loader adds before validating
+    table = day_ticks.append_column("source_id", pa.array(["synth"] * len(day_ticks)))
+    table = table.append_column("ingest_ts", pa.array([pd.Timestamp.now()] * len(day_ticks), pa.timestamp("ns")))
+    
+    result = benchmark(validator.validate_table, table, schema)
+    
+    assert result["valid"]
+    benchmark.extra_info["rows"] = len(table)
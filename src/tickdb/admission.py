@@ -0,0 +1,272 @@
+"""
+Query admission control with priority classes.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from .config import TickDBConfig
+from .reader import DataReader
+from .schemas import SchemaRegistry
+
+logger = logging.getLogger(__name__)
+
+# Queue waits kept per class for percentile reporting
+WAIT_HISTORY = 1024
+
+
+class PriorityClass(BaseModel):
+    """Admission limits of one priority class."""
+    
+    max_concurrency: int
+    # DuckDB threads and memory limit of each of the class's connections
+    threads: int = 1
+    memory_limit: Optional[str] = None
+    queue_timeout_s: Optional[float] = None
+
+
+def default_classes() -> Dict[str, PriorityClass]:
+    """
+    Default priority classes.
+    
+    Interactive reads get the most slots and a short queue timeout; batch
+    scans share half the cores; maintenance (rollup rebuilds, compaction)
+    runs one at a time on a single thread.
+    """
+    cores = os.cpu_count() or 1
+    return {
+        "interactive": PriorityClass(max_concurrency=8, threads=min(2, cores), queue_timeout_s=5.0),
+        "batch": PriorityClass(max_concurrency=2, threads=max(1, cores // 2)),
+        "maintenance": PriorityClass(max_concurrency=1, threads=1),
+    }
+
+
+class AdmissionError(TimeoutError):
+    """A query waited longer than its class's queue timeout."""
+
+
+class _ClassState:
+    """Slots, reader pool and queueing counters of one priority class."""
+    
+    def __init__(self, limits: PriorityClass):
+        self.limits = limits
+        self.slots = threading.BoundedSemaphore(limits.max_concurrency)
+        self.readers: "queue.LifoQueue[DataReader]" = queue.LifoQueue()
+        self.queued = 0
+        self.running = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.waits_ms: Deque[float] = deque(maxlen=WAIT_HISTORY)
+
+
+class AdmissionController:
+    """
+    Admission controller in front of `DataReader`.
+    
+    Every priority class has its own concurrency limit and its own pool of
+    readers, whose DuckDB connections are capped to the class's threads and
+    memory. A year-long batch scan therefore queues behind other batch scans
+    and runs on its own, smaller share of the cores, while interactive reads
+    keep their slots and connections.
+    
+    Every `TickDB` read entry point goes through the controller: point and
+    index-backed reads as "interactive", scans (bars, as-of joins, event
+    windows, parallel reads, replay) as "batch", unless given another
+    priority. Other callers borrow a reader directly::
+    
+        with controller.admit("batch") as reader:
+            reader.query({"schema_id": "ticks_v1"})
+    """
+    
+    def __init__(
+        self,
+        config: TickDBConfig,
+        classes: Optional[Dict[str, PriorityClass]] = None,
+        metrics: Optional[Any] = None,
+        schema_registry: Optional[SchemaRegistry] = None
+    ):
+        """
+        Initialize admission controller.
+        
+        Args:
+            config: TickDB configuration
+            classes: Priority classes by name (defaults to `default_classes`)
+            metrics: Optional MetricsCollector for queueing metrics
+            schema_registry: SchemaRegistry shared with the pooled readers
+        """
+        self.config = config
+        self.classes = classes or default_classes()
+        self.metrics = metrics
+        self.schema_registry = schema_registry
+        self._states = {name: _ClassState(limits) for name, limits in self.classes.items()}
+        self._lock = threading.Lock()
+        self._all_readers: List[DataReader] = []
+        # Readers created before the last `invalidate` are closed on return
+        self._generation = 0
+        self._reader_generations: Dict[int, int] = {}
+    
+    @contextmanager
+    def admit(self, priority: str = "interactive") -> Iterator[DataReader]:
+        """
+        Wait for a slot in a priority class and lend out one of its readers.
+        
+        Args:
+            priority: Priority class name
+            
+        Yields:
+            DataReader capped to the class's DuckDB threads and memory
+            
+        Raises:
+            KeyError: Unknown priority class
+            AdmissionError: No slot freed up within the class's queue timeout
+        """
+        if priority not in self._states:
+            raise KeyError(f"Unknown priority class '{priority}'")
+        state = self._states[priority]
+        
+        self._update(priority, queued=1)
+        start = time.perf_counter()
+        acquired = state.slots.acquire(timeout=state.limits.queue_timeout_s)
+        wait_ms = (time.perf_counter() - start) * 1000
+        
+        if not acquired:
+            self._update(priority, queued=-1, rejected=1)
+            if self.metrics:
+                self.metrics.record_admission(priority, wait_ms, admitted=False)
+            logger.warning("Query rejected by admission control", extra={
+                "priority": priority,
+                "wait_ms": wait_ms
+            })
+            raise AdmissionError(
+                f"No '{priority}' slot within {state.limits.queue_timeout_s}s "
+                f"({state.limits.max_concurrency} running)"
+            )
+        
+        self._update(priority, queued=-1, running=1, admitted=1, wait_ms=wait_ms)
+        if self.metrics:
+            self.metrics.record_admission(priority, wait_ms, admitted=True)
+        
+        reader = None
+        try:
+            reader = self._checkout(priority)
+            yield reader
+        finally:
+            if reader is not None:
+                with self._lock:
+                    current = self._reader_generations.get(id(reader)) == self._generation
+                if current:
+                    state.readers.put(reader)
+                else:
+                    self._retire(reader)
+            self._update(priority, running=-1)
+            state.slots.release()
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Queueing statistics per priority class.
+        
+        Returns:
+            Dictionary of running, queued, admitted and rejected counts and
+            queue-wait percentiles over recent admissions, by class
+        """
+        stats = {}
+        with self._lock:
+            for name, state in self._states.items():
+                waits = np.array(state.waits_ms)
+                stats[name] = {
+                    "max_concurrency": state.limits.max_concurrency,
+                    "running": state.running,
+                    "queued": state.queued,
+                    "admitted": state.admitted,
+                    "rejected": state.rejected,
+                    "wait_p50_ms": float(np.percentile(waits, 50)) if len(waits) else 0.0,
+                    "wait_p99_ms": float(np.percentile(waits, 99)) if len(waits) else 0.0,
+                }
+        return stats
+    
+    def invalidate(self) -> None:
+        """
+        Retire every pooled reader, e.g. after the catalog was refreshed.
+        
+        Idle readers are closed now, readers in use when they are returned;
+        later admissions get new readers.
+        """
+        with self._lock:
+            self._generation += 1
+        for state in self._states.values():
+            while True:
+                try:
+                    reader = state.readers.get_nowait()
+                except queue.Empty:
+                    break
+                self._retire(reader)
+    
+    def close(self) -> None:
+        """Close every pooled reader."""
+        with self._lock:
+            readers, self._all_readers = self._all_readers, []
+            self._reader_generations.clear()
+        for reader in readers:
+            reader.close()
+    
+    def _checkout(self, priority: str) -> DataReader:
+        """Take an idle reader of a class, creating one if none is idle."""
+        state = self._states[priority]
+        try:
+            return state.readers.get_nowait()
+        except queue.Empty:
+            pass
+        
+        limits = state.limits
+        with self._lock:
+            generation = self._generation
+        # The footer cache is process-wide, so pooled readers need not warm it
+        reader = DataReader(self.config.model_copy(update={
+            "duckdb_threads": limits.threads,
+            "memory_limit": limits.memory_limit or self.config.memory_limit,
+            "warm_footer_cache": False
+        }), schema_registry=self.schema_registry)
+        with self._lock:
+            self._all_readers.append(reader)
+            self._reader_generations[id(reader)] = generation
+        return reader
+    
+    def _retire(self, reader: DataReader) -> None:
+        """Close a pooled reader and forget it."""
+        with self._lock:
+            if reader in self._all_readers:
+                self._all_readers.remove(reader)
+            self._reader_generations.pop(id(reader), None)
+        reader.close()
+    
+    def _update(
+        self,
+        priority: str,
+        queued: int = 0,
+        running: int = 0,
+        admitted: int = 0,
+        rejected: int = 0,
+        wait_ms: Optional[float] = None
+    ) -> None:
+        """Adjust a class's counters and publish its queue depth."""
+        state = self._states[priority]
+        with self._lock:
+            state.queued += queued
+            state.running += running
+            state.admitted += admitted
+            state.rejected += rejected
+            if wait_ms is not None:
+                state.waits_ms.append(wait_ms)
+            depth, active = state.queued, state.running
+        
+        if self.metrics:
+            self.metrics.set_admission_state(priority, queued=depth, running=active)
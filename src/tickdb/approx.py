@@ -0,0 +1,114 @@
+"""
+Sampled and approximate query support for dashboards.
+"""
+
+import logging
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Two-sided 95% normal quantile used for error bounds
+Z_95 = 1.96
+
+# Rows per DuckDB vector: system sampling keeps or drops whole vectors
+SAMPLE_BLOCK_ROWS = 2048
+
+# Price quantiles reported by the "quantiles" bar aggregate
+BAR_QUANTILES = (0.5, 0.99)
+
+
+def parse_sample(sample: Union[float, int, str]) -> Union[float, int]:
+    """
+    Normalize a sample specification.
+    
+    Args:
+        sample: Fraction of rows (0 < f <= 1), percentage string ("5%"), or
+            number of rows (int)
+            
+    Returns:
+        Fraction as float, or row count as int
+    """
+    if isinstance(sample, str) and sample.strip().endswith("%"):
+        sample = float(sample.strip()[:-1]) / 100
+    if isinstance(sample, bool):
+        raise ValueError(f"Invalid sample: {sample!r}")
+    if isinstance(sample, int):
+        if sample < 1:
+            raise ValueError(f"Sample row count must be positive, got {sample}")
+        return sample
+    if isinstance(sample, float) and 0 < sample <= 1:
+        return sample
+    raise ValueError(f"Invalid sample {sample!r} (expected a fraction in (0, 1], 'N%' or a row count)")
+
+
+def sample_clause(sample: Union[float, int]) -> str:
+    """
+    DuckDB TABLESAMPLE clause for a parsed sample.
+    
+    Fractions use system (vector-level) sampling, which skips whole blocks of
+    the scan; row counts use reservoir sampling of exactly that many rows.
+    The clause is attached to an already filtered subquery so that filters
+    are still pushed into the Parquet scan.
+    """
+    if isinstance(sample, int):
+        return f"TABLESAMPLE {sample} ROWS"
+    return f"TABLESAMPLE {sample * 100:.6g} PERCENT (system)"
+
+
+def sample_fraction(sample: Optional[Union[float, int]]) -> Optional[float]:
+    """Sampled fraction of rows, or None for row-count samples and full scans."""
+    return sample if isinstance(sample, float) else None
+
+
+def quantile_aggregates(approx: bool = False) -> List[str]:
+    """Price quantile expressions, as t-digest estimates when `approx`."""
+    function = "approx_quantile" if approx else "quantile_cont"
+    return [
+        f"{function}(price, {q}) AS price_p{int(q * 100)}"
+        for q in BAR_QUANTILES
+    ]
+
+
+def approx_bar_aggregates(fraction: float) -> Dict[str, List[str]]:
+    """
+    Bar aggregates estimated from a `fraction` sample, with 95% error bounds.
+    
+    Counts and volumes are scaled up by 1 / fraction (Horvitz-Thompson) and
+    VWAP is the sample's ratio estimate; each gets a ``*_error`` column
+    holding the half-width of its 95% confidence interval. System sampling
+    keeps whole vectors of up to `SAMPLE_BLOCK_ROWS` consecutive ticks, so
+    the variance is that of a cluster sample, bounded from the row-level
+    sums by treating every sampled vector as full. The bounds are close for
+    full vectors of similar ticks and conservative otherwise. OHLC values
+    are those of the sampled ticks: high and low can only understate the
+    true range.
+    """
+    scale = 1 / fraction
+    # Cluster-sampling variance bound, with finite-population correction
+    design = SAMPLE_BLOCK_ROWS * (1 - fraction)
+    return {
+        "ohlc": [
+            "arg_min(price, ts) AS open",
+            "max(price) AS high",
+            "min(price) AS low",
+            "arg_max(price, ts) AS close",
+        ],
+        "volume": [
+            f"round(sum(size) * {scale})::BIGINT AS volume",
+            f"{Z_95} * sqrt({design} * sum(size::DOUBLE * size)) * {scale} AS volume_error",
+        ],
+        "vwap": [
+            "sum(price * size) / nullif(sum(size), 0) AS vwap",
+            # Linearized variance of the ratio sum(price * size) / sum(size)
+            f"{Z_95} * sqrt(greatest({design} * ("
+            "sum(size::DOUBLE * size * price * price) "
+            "- 2 * (sum(price * size) / nullif(sum(size), 0)) * sum(size::DOUBLE * size * price) "
+            "+ pow(sum(price * size) / nullif(sum(size), 0), 2) * sum(size::DOUBLE * size)"
+            "), 0)) / nullif(sum(size), 0) AS vwap_error",
+        ],
+        "trade_count": [
+            f"round(count(*) * {scale})::BIGINT AS trade_count",
+            f"{Z_95} * sqrt({design} * count(*)) * {scale} AS trade_count_error",
+        ],
+        "quantiles": quantile_aggregates(approx=True),
+    }
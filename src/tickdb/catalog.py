@@ -0,0 +1,195 @@
+"""
+Persistent DuckDB catalog: per-schema views, cached statistics and settings.
+"""
+
+import logging
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import duckdb
+
+from .config import TickDBConfig
+from .footers import footer_cache, footer_symbols, partition_symbols
+
+logger = logging.getLogger(__name__)
+
+# Catalog file name under data_path
+CATALOG_FILE = "_catalog.duckdb"
+
+# Name the catalog is attached under in reader connections
+CATALOG_ALIAS = "tickdb_catalog"
+
+
+class Catalog:
+    """
+    DuckDB database file describing the data lake.
+    
+    The catalog holds one view per schema directory over its Parquet files,
+    a ``schema_stats`` table summarizing each schema from its footers, and a
+    ``settings`` table of DuckDB settings applied to every connection. Readers
+    attach it read-only, so any number of processes can serve from it at
+    once; `refresh` builds a new file and atomically replaces the old one,
+    so it never waits on (or disturbs) readers.
+    """
+    
+    def __init__(self, config: TickDBConfig):
+        """
+        Initialize catalog.
+        
+        Args:
+            config: TickDB configuration
+        """
+        self.config = config
+        self.path = config.data_path / CATALOG_FILE
+    
+    def attach(self, con: duckdb.DuckDBPyConnection) -> bool:
+        """
+        Attach the catalog read-only to a connection and apply its settings.
+        
+        The catalog is built first if it does not exist yet.
+        
+        Returns:
+            Whether the catalog was attached
+        """
+        try:
+            if not self.path.exists():
+                self.refresh()
+            con.execute(f"ATTACH '{_sql_path(self.path)}' AS {CATALOG_ALIAS} (READ_ONLY)")
+        except Exception as e:
+            logger.warning(f"Failed to attach catalog {self.path}: {e}")
+            return False
+        
+        for name, value in con.execute(f"SELECT name, value FROM {CATALOG_ALIAS}.settings").fetchall():
+            con.execute(f"SET {name} = '{value}'")
+        return True
+    
+    def views(self, con: duckdb.DuckDBPyConnection) -> List[str]:
+        """Schemas with a view in the attached catalog."""
+        rows = con.execute(f"""
+        SELECT view_name FROM duckdb_views()
+        WHERE database_name = '{CATALOG_ALIAS}' AND NOT internal
+        """).fetchall()
+        return sorted(row[0] for row in rows)
+    
+    def statistics(self, con: duckdb.DuckDBPyConnection, schema_id: str) -> Optional[Dict[str, Any]]:
+        """Cached statistics of a schema, as of the last refresh."""
+        cursor = con.execute(f"SELECT * FROM {CATALOG_ALIAS}.schema_stats WHERE schema_id = ?", [schema_id])
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([d[0] for d in cursor.description], row))
+    
+    def refresh(self, schema_ids: Optional[List[str]] = None) -> Path:
+        """
+        Rebuild the catalog from the data lake.
+        
+        Args:
+            schema_ids: Schemas to describe (default: every directory under
+                data_path holding Parquet files)
+                
+        Returns:
+            Catalog path
+        """
+        start_time = datetime.now()
+        
+        data_path = self.config.data_path
+        if schema_ids is None:
+            directories = sorted(p for p in data_path.iterdir() if p.is_dir()) if data_path.exists() else []
+            schema_ids = [d.name for d in directories if footer_cache.list_files(d)]
+        
+        data_path.mkdir(parents=True, exist_ok=True)
+        build_path = data_path / f".{CATALOG_FILE}.{uuid.uuid4().hex}"
+        con = duckdb.connect(str(build_path))
+        try:
+            con.execute("CREATE TABLE settings (name VARCHAR PRIMARY KEY, value VARCHAR)")
+            con.executemany("INSERT INTO settings VALUES (?, ?)", list(self._settings().items()))
+            
+            con.execute("""
+            CREATE TABLE schema_stats (
+                schema_id VARCHAR PRIMARY KEY,
+                files BIGINT,
+                total_rows BIGINT,
+                total_bytes BIGINT,
+                min_ts TIMESTAMP_NS,
+                max_ts TIMESTAMP_NS,
+                symbols VARCHAR[],
+                refreshed_at TIMESTAMP
+            )
+            """)
+            
+            for schema_id in schema_ids:
+                schema_path = data_path / schema_id
+                if not footer_cache.list_files(schema_path):
+                    continue
+                con.execute(f"""
+                CREATE VIEW "{schema_id}" AS
+                SELECT * FROM read_parquet('{_sql_path(schema_path)}/*.parquet', union_by_name = true)
+                """)
+                con.execute(
+                    "INSERT INTO schema_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._schema_stats(schema_path)
+                )
+            
+            con.execute("CHECKPOINT")
+        finally:
+            con.close()
+        
+        # Readers keep the old file open; new readers see the new one
+        os.replace(build_path, self.path)
+        wal_path = Path(f"{build_path}.wal")
+        if wal_path.exists():
+            wal_path.unlink()
+        
+        logger.info("Catalog refreshed", extra={
+            "catalog_path": str(self.path),
+            "schemas": schema_ids,
+            "refresh_time_ms": (datetime.now() - start_time).total_seconds() * 1000
+        })
+        return self.path
+    
+    def _settings(self) -> Dict[str, str]:
+        """DuckDB settings every reader connection runs with."""
+        settings = {
+            "parquet_metadata_cache": "true",
+            "autoinstall_known_extensions": "false",
+        }
+        if self.config.memory_limit:
+            settings["memory_limit"] = self.config.memory_limit
+        if self.config.temp_directory:
+            settings["temp_directory"] = str(self.config.temp_directory)
+        return settings
+    
+    def _schema_stats(self, schema_path: Path) -> List[Any]:
+        """One schema_stats row, from cached footers."""
+        footers = footer_cache.directory_footers(schema_path)
+        lows, highs = [], []
+        total_rows = 0
+        symbols = set(partition_symbols(schema_path) or [])
+        for file_path, footer in footers.items():
+            if footer is None:
+                continue
+            total_rows += footer.num_rows
+            stats = footer_cache.stats(file_path, validate=False)
+            if "ts" in stats:
+                lows.append(stats["ts"][0])
+                highs.append(stats["ts"][1])
+            symbols.update(footer_symbols(footer) or [])
+        
+        return [
+            schema_path.name,
+            len(footers),
+            total_rows,
+            sum(f.stat().st_size for f in footers),
+            min(lows) if lows else None,
+            max(highs) if highs else None,
+            sorted(symbols),
+            datetime.now()
+        ]
+
+
+def _sql_path(path: Path) -> str:
+    """Render a path as a SQL string literal body."""
+    return str(path).replace("'", "''")
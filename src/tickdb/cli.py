@@ -5,16 +5,24 @@ Command-line interface for TickDB.
 import json
 import logging
 import sys
+import time
+import urllib.request
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import click
 import pandas as pd
 import pyarrow as pa
+import pyarrow.parquet as pq
 from rich.console import Console
 from rich.table import Table
 
 from .core import TickDB, TickDBConfig
+from .latency import LATENCY_QUANTILES, latency_from_exposition, quantile_label
+from .output import to_pandas
+from .querylog import REPLAY_PERCENTILES, replay_queries as replay_queries_from_log
+from .sla import REGRESSION_TOLERANCE, SLA_ROWS, SLAReport, compare_baseline, run_sla
+from .synth import FORMATS, KINDS, L2_DEPTH, SynthSpec, write_dataset
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -97,6 +105,7 @@ def load(tickdb: TickDB, source_id: str, file_path: str, schema_id: str, delimit
         table.add_row("Processing Time (ms)", f"{result.get('processing_time_ms', 0):.2f}")
         
         console.print(table)
+        _print_stages(result)
         
         # Show errors if any
         if result.get("errors"):
@@ -172,9 +181,10 @@ def append(tickdb: TickDB, schema_id: str, csv_file: str, source_id: Optional[st
 @click.option("--schema-id", default="ticks_v1", help="Schema identifier")
 @click.option("--limit", type=int, help="Limit number of rows")
 @click.option("--output", "-o", type=click.Path(), help="Output file (CSV/Parquet)")
+@click.option("--priority", default="interactive", help="Admission priority class (interactive, batch, maintenance)")
 @click.pass_obj
 def query(tickdb: TickDB, symbol: Optional[str], ts_start: Optional[str], ts_end: Optional[str], 
-          fields: Optional[str], schema_id: str, limit: Optional[int], output: Optional[str]) -> None:
+          fields: Optional[str], schema_id: str, limit: Optional[int], output: Optional[str], priority: str) -> None:
     """Query data from the data lake."""
     
     console.print("[blue]Querying data lake...[/blue]")
@@ -201,13 +211,14 @@ def query(tickdb: TickDB, symbol: Optional[str], ts_start: Optional[str], ts_end
             query_params["limit"] = limit
         
         # Execute query
-        result = tickdb.read(**query_params)
+        result = tickdb.read(priority=priority, **query_params)
         
         console.print(f"[green]Query returned {len(result)} rows[/green]")
         
         # Display sample data
         if len(result) > 0:
-            df = result.to_pandas()
+            # Arrow-backed, so the result is converted once and not copied
+            df = to_pandas(result)
             
             # Show first few rows
             console.print("\n[cyan]Sample data:[/cyan]")
@@ -224,7 +235,8 @@ def query(tickdb: TickDB, symbol: Optional[str], ts_start: Optional[str], ts_end
                 if output_path.suffix.lower() == ".csv":
                     df.to_csv(output_path, index=False)
                 elif output_path.suffix.lower() == ".parquet":
-                    result.to_pandas().to_parquet(output_path, index=False)
+                    # Written from the Arrow result, not converted back from pandas
+                    pq.write_table(result, output_path)
                 else:
                     console.print(f"[red]Unsupported output format: {output_path.suffix}[/red]")
                     return
@@ -374,13 +386,24 @@ def health(tickdb: TickDB) -> None:
 
 
 @main.command()
+@click.option("--latency", is_flag=True, help="Show query latency quantiles per schema and query shape")
+@click.option("--url", help="Read metrics from a running instance's /metrics endpoint, e.g. http://localhost:8000/metrics")
 @click.pass_obj
-def metrics(tickdb: TickDB) -> None:
+def metrics(tickdb: TickDB, latency: bool, url: Optional[str]) -> None:
     """Show system metrics."""
     
     console.print("[blue]System metrics:[/blue]")
     
     try:
+        if latency or url:
+            if url:
+                with urllib.request.urlopen(url, timeout=10) as response:
+                    latency_data = latency_from_exposition(response.read().decode("utf-8"))
+            else:
+                latency_data = tickdb.get_metrics().get("latency", {})
+            _print_latency(latency_data)
+            return
+        
         metrics_data = tickdb.get_metrics()
         
         if not metrics_data:
@@ -412,6 +435,228 @@ def metrics(tickdb: TickDB) -> None:
         sys.exit(1)
 
 
+@main.command()
+@click.argument("log_path", type=click.Path(exists=True))
+@click.option("--concurrency", default=4, help="Number of concurrent query threads")
+@click.option("--repeat", default=1, help="Times to run each captured query")
+@click.option("--output", "-o", type=click.Path(), help="Write per-query results to a JSON file")
+@click.pass_obj
+def replay_queries(tickdb: TickDB, log_path: str, concurrency: int, repeat: int, output: Optional[str]) -> None:
+    """Re-run a captured slow-query log and compare latencies."""
+    
+    console.print(f"[blue]Replaying slow-query log: {log_path}[/blue]")
+    
+    try:
+        summary = replay_queries_from_log(tickdb.config, log_path, concurrency=concurrency, repeat=repeat)
+        
+        if summary["queries"] == 0:
+            console.print("[yellow]Slow-query log is empty[/yellow]")
+            return
+        
+        table = Table(title=f"Replay Results ({summary['queries']} queries, concurrency {concurrency})")
+        table.add_column("Percentile", style="cyan")
+        table.add_column("Captured (ms)", style="green")
+        table.add_column("Replayed (ms)", style="green")
+        table.add_column("Delta (ms)", style="yellow")
+        
+        for p in REPLAY_PERCENTILES:
+            stats = summary[f"p{p}"]
+            table.add_row(
+                f"p{p}",
+                f"{stats['captured_ms']:.2f}",
+                f"{stats['replayed_ms']:.2f}",
+                f"{stats['delta_ms']:+.2f}"
+            )
+        
+        console.print(table)
+        
+        if summary["errors"]:
+            console.print(f"\n[red]{summary['errors']} queries failed on replay[/red]")
+        
+        if output:
+            with open(output, "w") as f:
+                json.dump(summary["results"], f, indent=2, default=str)
+            console.print(f"[green]Results saved to: {output}[/green]")
+    
+    except Exception as e:
+        console.print(f"[red]Replay failed: {e}[/red]")
+        sys.exit(1)
+
+
+@main.group()
+def bench() -> None:
+    """Benchmark the data lake."""
+
+
+@bench.command()
+@click.option("--rows", default=SLA_ROWS, help="Rows in the generated dataset")
+@click.option("--files", default=20, help="Source files (trading days) the dataset is split into")
+@click.option("--workers", type=int, help="Files ingested concurrently (default: available cores)")
+@click.option("--repeat", default=20, help="Timed runs per query (median is reported)")
+@click.option("--work-dir", type=click.Path(), help="Keep the generated dataset here (default: temporary)")
+@click.option("--baseline", type=click.Path(exists=True), help="Compare against a report saved with --save")
+@click.option("--tolerance", default=REGRESSION_TOLERANCE, help="Relative change flagged as a regression")
+@click.option("--save", type=click.Path(), help="Save the report as a JSON baseline")
+@click.pass_obj
+def sla(tickdb: TickDB, rows: int, files: int, workers: Optional[int], repeat: int, work_dir: Optional[str],
+        baseline: Optional[str], tolerance: float, save: Optional[str]) -> None:
+    """Measure ingest and scan latency against the README targets."""
+    
+    console.print(f"[blue]Running SLA benchmark on {rows:,} generated rows in {files} files...[/blue]")
+    
+    try:
+        report = run_sla(tickdb.config, rows=rows, files=files, workers=workers, repeat=repeat, work_dir=work_dir)
+        if baseline:
+            previous = SLAReport.load(baseline)
+            report = compare_baseline(report, previous, tolerance=tolerance)
+        
+        hardware = report.hardware
+        console.print(
+            f"Hardware: {hardware['cpu']}, {hardware['cores_available']}/{hardware['cores']} cores, "
+            f"{hardware['memory_gb']} GB; tickdb {report.version}, duckdb {hardware['duckdb']}, "
+            f"pyarrow {hardware['pyarrow']}; {report.workers} ingest workers"
+        )
+        if report.rows < SLA_ROWS:
+            console.print(f"[yellow]Dataset is smaller than the {SLA_ROWS:,} rows the targets are stated for[/yellow]")
+        
+        table = Table(title=f"SLA Results ({report.rows:,} rows)")
+        table.add_column("Target", style="cyan")
+        table.add_column("Required", style="white")
+        table.add_column("Measured", style="green")
+        table.add_column("Result")
+        if baseline:
+            table.add_column("Baseline", style="white")
+            table.add_column("Change")
+        
+        for result in report.results:
+            comparison = ">=" if result.higher_is_better else "<"
+            row = [
+                result.description,
+                f"{comparison} {result.threshold:g} {result.unit}",
+                f"{result.value:.2f} {result.unit}",
+                "[green]PASS[/green]" if result.passed else "[red]FAIL[/red]",
+            ]
+            if baseline:
+                if result.baseline is None:
+                    row += ["-", "-"]
+                else:
+                    change = f"{result.change:+.1%}"
+                    row += [f"{result.baseline:.2f} {result.unit}", f"[red]{change} regression[/red]" if result.regression else change]
+            table.add_row(*row)
+        
+        console.print(table)
+        
+        if baseline and previous.hardware.get("cpu") != hardware.get("cpu"):
+            console.print(f"[yellow]Baseline ran on different hardware: {previous.hardware.get('cpu')}[/yellow]")
+        
+        if save:
+            report.save(save)
+            console.print(f"[green]Report saved to: {save}[/green]")
+        
+        if report.regressions:
+            console.print(f"\n[red]✗ {len(report.regressions)} regression(s) against the baseline[/red]")
+            sys.exit(1)
+        if report.passed:
+            console.print("\n[green]✓ All targets met[/green]")
+        else:
+            console.print("\n[yellow]Some targets were not met on this machine[/yellow]")
+    
+    except Exception as e:
+        console.print(f"[red]SLA benchmark failed: {e}[/red]")
+        sys.exit(1)
+
+
+@main.command()
+@click.argument("output_dir", type=click.Path())
+@click.option("--kind", type=click.Choice(KINDS), default="trades", help="Market data to generate")
+@click.option("--rows", default=1_000_000, help="Total rows")
+@click.option("--symbols", default=2_000, help="Number of symbols (Zipf-distributed activity)")
+@click.option("--days", default=1, help="Trading days")
+@click.option("--start", default="2025-01-02", help="First trading day")
+@click.option("--parts", default=1, help="Files per trading day")
+@click.option("--format", "file_format", type=click.Choice(list(FORMATS)), default="parquet", help="Output format")
+@click.option("--workers", type=int, help="Processes generating files (default: CPU count)")
+@click.option("--seed", default=0, help="Random seed")
+@click.option("--depth", default=L2_DEPTH, help="Book levels of L2 deltas")
+@click.option("--out-of-order-rate", default=0.0, help="Share of rows arriving late")
+@click.option("--bad-row-rate", default=0.0, help="Share of rows with an invalid value")
+@click.pass_obj
+def synth(tickdb: TickDB, output_dir: str, kind: str, rows: int, symbols: int, days: int, start: str, parts: int,
+          file_format: str, workers: Optional[int], seed: int, depth: int, out_of_order_rate: float,
+          bad_row_rate: float) -> None:
+    """Generate synthetic market data files."""
+    
+    try:
+        spec = SynthSpec(
+            kind=kind,
+            rows=rows,
+            symbols=symbols,
+            days=days,
+            start=start,
+            seed=seed,
+            parts=parts,
+            depth=depth,
+            out_of_order_rate=out_of_order_rate,
+            bad_row_rate=bad_row_rate
+        )
+        console.print(f"[blue]Generating {rows:,} {kind} rows for {symbols:,} symbols over {days} day(s)...[/blue]")
+        
+        start_time = time.perf_counter()
+        paths = write_dataset(spec, output_dir, file_format=file_format, workers=workers)
+        seconds = time.perf_counter() - start_time
+        
+        size_mb = sum(path.stat().st_size for path in paths) / 1e6
+        console.print(f"[green]✓ Wrote {len(paths)} {file_format} file(s), {size_mb:,.1f} MB, to {output_dir}[/green]")
+        console.print(f"  Time: {seconds:.1f} s ({rows / max(seconds, 1e-9):,.0f} rows/s)")
+    
+    except Exception as e:
+        console.print(f"[red]Generation failed: {e}[/red]")
+        sys.exit(1)
+
+
+def _print_stages(result: Dict[str, Any]) -> None:
+    """Print where an ingest spent its time, slowest stage first."""
+    stages = result.get("stages") or {}
+    if not stages:
+        return
+    
+    total_ms = result.get("processing_time_ms") or sum(stages.values())
+    table = Table(title="Ingest Stages")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Time (ms)", style="green")
+    table.add_column("Share", style="white")
+    for stage, time_ms in sorted(stages.items(), key=lambda item: -item[1]):
+        table.add_row(stage, f"{time_ms:.2f}", f"{time_ms / total_ms:.1%}" if total_ms else "-")
+    console.print(table)
+
+
+def _print_latency(latency: Dict[str, Any]) -> None:
+    """Print query latency quantiles, per schema and then per query shape."""
+    if not latency:
+        console.print("[yellow]No query latencies recorded[/yellow]")
+        return
+    
+    keys = [f"{quantile_label(quantile)}_ms" for quantile in LATENCY_QUANTILES]
+    table = Table(title="Query Latency (ms)")
+    table.add_column("Schema", style="cyan")
+    table.add_column("Shape", style="cyan")
+    table.add_column("Count", style="white")
+    for key in keys:
+        table.add_column(key[:-3], style="green")
+    table.add_column("max", style="yellow")
+    
+    for schema_id, data in sorted(latency.items()):
+        for shape, summary in [("all", data["all"]), *sorted(data["shapes"].items())]:
+            table.add_row(
+                schema_id if shape == "all" else "",
+                shape,
+                f"{summary.get('count', 0):,}",
+                *[f"{summary[key]:.3f}" if key in summary else "-" for key in keys],
+                f"{summary['max_ms']:.3f}" if "max_ms" in summary else "-"
+            )
+    console.print(table)
+
+
 def _load_config(config_path: str) -> TickDBConfig:
     """Load configuration from file."""
     try:
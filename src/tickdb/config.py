@@ -3,6 +3,8 @@ Configuration module for TickDB.
 """
 
 from pathlib import Path
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -14,5 +16,19 @@ class TickDBConfig(BaseModel):
     batch_size: int = Field(default=16384, description="Batch size for processing")
     compression: str = Field(default="zstd", description="Compression algorithm")
     compression_level: int = Field(default=5, description="Compression level")
+    fsync_writes: bool = Field(default=True, description="fsync data files before reporting them written")
     enable_metrics: bool = Field(default=True, description="Enable Prometheus metrics")
-    enable_logging: bool = Field(default=True, description="Enable structured logging") 
\ No newline at end of file
+    enable_logging: bool = Field(default=True, description="Enable structured logging")
+    memory_limit: Optional[str] = Field(default=None, description="DuckDB memory limit, e.g. '4GB' (spills to disk beyond it)")
+    duckdb_threads: Optional[int] = Field(default=None, description="DuckDB worker threads per connection (default: all cores)")
+    temp_directory: Optional[Path] = Field(default=None, description="DuckDB spill directory")
+    enable_checkpoints: bool = Field(default=True, description="Maintain per-file checkpoints for snapshot queries")
+    scan_workers: Optional[int] = Field(default=None, description="Worker processes for parallel scans (default: CPU count)")
+    slow_query_log_path: Optional[Path] = Field(default=None, description="Directory of the slow-query log (None disables it)")
+    slow_query_threshold_ms: float = Field(default=20.0, description="Latency above which reads are logged as slow")
+    slow_query_profile: bool = Field(default=False, description="Profile every read so slow-query entries carry operator timings")
+    footer_cache_bytes: int = Field(default=256 * 1024 * 1024, description="Memory budget of the process-wide Parquet footer cache")
+    warm_footer_cache: bool = Field(default=False, description="Load every file footer into the cache when a reader starts")
+    persistent_catalog: bool = Field(default=False, description="Serve queries through a DuckDB catalog file under data_path")
+    approx_sample: float = Field(default=0.01, description="Fraction of rows scanned by approximate (approx=True) queries")
+    rollup_intervals: List[str] = Field(default=["1s", "1m", "1d"], description="Bar intervals materialized as rollups (empty to disable)") 
\ No newline at end of file
@@ -4,16 +4,21 @@ Core TickDB class that orchestrates the data lake system.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
 import pyarrow as pa
+
+from .admission import AdmissionController
 from .config import TickDBConfig
+from .latency import query_shape
 from .loader import DataLoader
+from .metrics import MetricsCollector
+from .output import convert, num_rows
+from .profiling import QueryProfile
 from .reader import DataReader
 from .schemas import SchemaRegistry
 from .validation import DataValidator
-from .metrics import MetricsCollector
 
 logger = logging.getLogger(__name__)
 
@@ -42,9 +47,11 @@ class TickDB:
         # Initialize components
         self.schema_registry = SchemaRegistry()
         self.loader = DataLoader(self.config)
-        self.reader = DataReader(self.config)
+        self.reader = DataReader(self.config, schema_registry=self.schema_registry)
         self.validator = DataValidator(self.config)
         self.metrics = MetricsCollector(enable_server=False) if self.config.enable_metrics else None
+        # Per-priority reader pools are created on first admission
+        self.admission = AdmissionController(self.config, metrics=self.metrics, schema_registry=self.schema_registry)
         
         logger.info("TickDB initialized", extra={
             "data_path": str(self.config.data_path),
@@ -94,7 +101,10 @@ class TickDB:
                 source_id=source_id,
                 bytes_processed=result.get("bytes_processed", 0),
                 rows_processed=result.get("rows_processed", 0),
-                rows_failed=result.get("rows_failed", 0)
+                rows_failed=result.get("rows_failed", 0),
+                schema_id=schema_id,
+                duration_seconds=result.get("processing_time_ms", 0.0) / 1000.0,
+                stages=result.get("stages")
             )
         
         return result
@@ -124,16 +134,13 @@ class TickDB:
             "rows": len(df)
         })
         
-        # Get schema for validation
-        schema = self.schema_registry.get_schema(schema_id)
-        
-        # Convert to Arrow and validate
-        table = pa.Table.from_pandas(df)
-        validated_table = self.validator.validate_table(table, schema)
+        # Convert to Arrow; store_table validates against the schema and
+        # quarantines rejected batches
+        table = pa.Table.from_pandas(df, preserve_index=False)
         
         # Store data
         result = self.loader.store_table(
-            table=validated_table,
+            table=table,
             schema_id=schema_id,
             source_id=source_id,
             **kwargs
@@ -144,7 +151,9 @@ class TickDB:
             self.metrics.record_append(
                 schema_id=schema_id,
                 rows_processed=len(df),
-                rows_failed=result.get("rows_failed", 0)
+                rows_failed=result.get("rows_failed", 0),
+                duration_seconds=result.get("processing_time_ms", 0.0) / 1000.0,
+                stages=result.get("stages")
             )
         
         return result
@@ -156,28 +165,60 @@ class TickDB:
         ts_end: Optional[str] = None,
         fields: Optional[List[str]] = None,
         schema_id: Optional[str] = None,
+        profile: bool = False,
+        output: str = "arrow",
+        sample: Optional[Union[float, int, str]] = None,
+        approx: bool = False,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        priority: str = "interactive",
         **kwargs: Any
-    ) -> pa.Table:
+    ) -> Any:
         """
         Read data from the data lake.
         
+        The read waits for a slot of its priority class (see
+        `AdmissionController`) and runs on one of that class's readers, so
+        long batch scans do not take the cores interactive reads need.
+        
         Args:
             symbol: Symbol to filter by
             ts_start: Start timestamp (ISO format)
             ts_end: End timestamp (ISO format)
             fields: List of fields to return
             schema_id: Schema identifier
+            profile: Profile the query and return a QueryResult carrying
+                the table and its QueryProfile
+            output: Result format: "arrow", "pandas" (Arrow-backed dtypes),
+                "polars" or "numpy" (dict of arrays); conversions share the
+                Arrow buffers wherever the column types allow
+            sample: Read a sample of the matching rows: a fraction, "N%"
+                or a row count
+            approx: Sample `config.approx_sample` of the rows when no
+                sample is given
+            page_size: Read one page of this many rows, ordered by
+                (ts, symbol, file, row)
+            cursor: Resume token of the previous page
+            priority: Admission priority class: "interactive", "batch" or
+                "maintenance" by default
             **kwargs: Additional query parameters
             
         Returns:
-            Arrow Table with query results
+            Query results in the requested format (QueryResult with an Arrow
+            table when profiling). Paginated reads return a Page holding the
+            rows in the requested format and the next page's cursor (None on
+            the last page)
+            
+        Raises:
+            AdmissionError: No slot of the priority class freed up in time
         """
         logger.info("Reading data", extra={
             "symbol": symbol,
             "ts_start": ts_start,
             "ts_end": ts_end,
             "fields": fields,
-            "schema_id": schema_id
+            "schema_id": schema_id,
+            "priority": priority
         })
         
         # Build query
@@ -187,19 +228,459 @@ class TickDB:
             "ts_end": ts_end,
             "fields": fields,
             "schema_id": schema_id,
+            "profile": profile,
             **kwargs
         }
+        # Only options actually asked for, so paginated reads can reject them
+        if sample is not None:
+            query["sample"] = sample
+        if approx:
+            query["approx"] = approx
+        if page_size is not None:
+            query.update(page_size=page_size, cursor=cursor)
         
-        # Execute query
+        # Execute query; the latency includes the wait for admission
         start_time = pd.Timestamp.now()
-        result = self.reader.query(query)
+        with self.admission.admit(priority) as reader:
+            result = reader.query(query)
         query_time = (pd.Timestamp.now() - start_time).total_seconds() * 1000
+        rows_returned = result.rows_returned if profile or page_size is not None else num_rows(result)
         
         # Update metrics
         if self.metrics:
             self.metrics.record_query(
                 query_time_ms=query_time,
-                rows_returned=len(result)
+                rows_returned=rows_returned,
+                schema_id=schema_id or "ticks_v1",
+                shape=query_shape("read", query)
+            )
+            if profile:
+                self.metrics.record_query_profile(result.profile, schema_id=schema_id or "ticks_v1")
+        
+        logger.info("Query completed", extra={
+            "query_time_ms": query_time,
+            "rows_returned": rows_returned
+        })
+        
+        if page_size is not None:
+            result.table = convert(result.table, output)
+            return result
+        return result if profile else convert(result, output)
+    
+    def read_latest(
+        self,
+        symbol: str,
+        limit: int = 1000,
+        fields: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1",
+        output: str = "arrow",
+        priority: str = "interactive"
+    ) -> Any:
+        """
+        Read the most recent ticks of a symbol, newest first.
+        
+        Args:
+            symbol: Symbol to read
+            limit: Number of rows to return
+            fields: List of fields to return
+            schema_id: Schema identifier
+            output: Result format, as in `read`
+            priority: Admission priority class, as in `read`
+            
+        Returns:
+            Query results in the requested format
+        """
+        return self.read(
+            symbol=symbol,
+            fields=fields,
+            schema_id=schema_id,
+            output=output,
+            priority=priority,
+            order_by="ts DESC",
+            limit=limit
+        )
+    
+    def explain(
+        self,
+        symbol: Optional[str] = None,
+        ts_start: Optional[str] = None,
+        ts_end: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1",
+        priority: str = "interactive",
+        **kwargs: Any
+    ) -> QueryProfile:
+        """
+        Run a read under the profiler and report where its time went.
+        
+        Args:
+            symbol: Symbol to filter by
+            ts_start: Start timestamp (ISO format)
+            ts_end: End timestamp (ISO format)
+            fields: List of fields to return
+            schema_id: Schema identifier
+            priority: Admission priority class, as in `read`
+            **kwargs: Additional query parameters
+            
+        Returns:
+            QueryProfile with files considered/pruned, row groups skipped,
+            bytes scanned and time per stage and operator
+        """
+        with self.admission.admit(priority) as reader:
+            profile = reader.explain({
+                "symbol": symbol,
+                "ts_start": ts_start,
+                "ts_end": ts_end,
+                "fields": fields or ["*"],
+                "schema_id": schema_id,
+                **kwargs
+            })
+        
+        if self.metrics:
+            self.metrics.record_query_profile(profile, schema_id=schema_id)
+        
+        logger.info("Explain completed", extra={
+            "total_time_ms": profile.total_time_ms,
+            "files_scanned": profile.files_scanned,
+            "files_pruned": profile.files_pruned,
+            "bytes_scanned": profile.bytes_scanned
+        })
+        
+        return profile
+    
+    def bars(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[str] = None,
+        ts_end: Optional[str] = None,
+        interval: str = "1m",
+        aggs: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1",
+        sample: Optional[Union[float, str]] = None,
+        approx: bool = False,
+        ts_before: Optional[str] = None,
+        priority: str = "batch"
+    ) -> pa.Table:
+        """
+        Compute time bars (OHLC, volume, VWAP, trade count) in the engine.
+        
+        Args:
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (ISO format, inclusive)
+            ts_end: End timestamp (ISO format, inclusive)
+            interval: Bar width, e.g. "1s", "1m", "5m", "1h", "1d"
+            aggs: Subset of "ohlc", "volume", "vwap", "trade_count",
+                "quantiles"
+            schema_id: Schema identifier
+            sample: Fraction of ticks to aggregate (e.g. 0.01 or "1%");
+                counts and volumes are scaled up with 95% error bounds
+            approx: Sample `config.approx_sample` of the ticks when no
+                sample is given
+            ts_before: End timestamp (ISO format, exclusive) instead of
+                `ts_end`, so consecutive requests tile; aligned ranges are
+                answered from rollups (see `DataReader.bars`)
+            priority: Admission priority class, as in `read`
+            
+        Returns:
+            Arrow Table with one row per symbol and bar
+        """
+        logger.info("Computing bars", extra={
+            "symbols": symbols,
+            "ts_start": ts_start,
+            "ts_end": ts_end,
+            "ts_before": ts_before,
+            "interval": interval,
+            "schema_id": schema_id,
+            "sample": sample,
+            "approx": approx
+        })
+        
+        start_time = pd.Timestamp.now()
+        with self.admission.admit(priority) as reader:
+            result = reader.bars(
+                symbols=symbols,
+                ts_start=ts_start,
+                ts_end=ts_end,
+                interval=interval,
+                aggs=aggs,
+                schema_id=schema_id,
+                sample=sample,
+                approx=approx,
+                ts_before=ts_before
+            )
+        query_time = (pd.Timestamp.now() - start_time).total_seconds() * 1000
+        
+        if self.metrics:
+            self.metrics.record_query(
+                query_time_ms=query_time,
+                rows_returned=len(result),
+                schema_id=schema_id,
+                shape=query_shape("bars", {
+                    "symbol": symbols,
+                    "ts_start": ts_start,
+                    "ts_end": ts_end or ts_before,
+                    "sample": sample,
+                    "approx": approx
+                })
+            )
+        
+        return result
+    
+    def downsample(
+        self,
+        symbol: str,
+        ts_start: str,
+        ts_end: str,
+        points: int = 2000,
+        method: str = "lttb",
+        field: str = "price",
+        schema_id: str = "ticks_v1",
+        priority: str = "interactive"
+    ) -> pa.Table:
+        """
+        Downsample one symbol's series for charting, keeping visual extremes.
+        
+        Args:
+            symbol: Symbol
+            ts_start: Start timestamp (ISO format, inclusive)
+            ts_end: End timestamp (ISO format, inclusive)
+            points: Maximum number of points returned
+            method: "lttb" (Largest-Triangle-Three-Buckets) or "minmax"
+            field: Numeric column to downsample
+            schema_id: Schema identifier
+            priority: Admission priority class, as in `read`
+            
+        Returns:
+            Arrow Table with at most `points` rows of ts and `field`
+        """
+        logger.info("Downsampling series", extra={
+            "symbol": symbol,
+            "ts_start": ts_start,
+            "ts_end": ts_end,
+            "points": points,
+            "method": method,
+            "schema_id": schema_id
+        })
+        
+        start_time = pd.Timestamp.now()
+        with self.admission.admit(priority) as reader:
+            result = reader.downsample(
+                symbol=symbol,
+                ts_start=ts_start,
+                ts_end=ts_end,
+                points=points,
+                method=method,
+                field=field,
+                schema_id=schema_id
+            )
+        query_time = (pd.Timestamp.now() - start_time).total_seconds() * 1000
+        
+        if self.metrics:
+            self.metrics.record_query(
+                query_time_ms=query_time,
+                rows_returned=len(result),
+                schema_id=schema_id,
+                shape="downsample"
+            )
+        
+        return result
+    
+    def asof_join(
+        self,
+        left_query: Dict[str, Any],
+        right_query: Dict[str, Any],
+        by: Optional[str] = "symbol",
+        on: str = "ts",
+        tolerance: Optional[Union[str, pd.Timedelta]] = None,
+        priority: str = "batch",
+        **kwargs: Any
+    ) -> pa.RecordBatchReader:
+        """
+        As-of join two queries, e.g. trades to prevailing quotes or news.
+        
+        Args:
+            left_query: Query parameters for the left side (schema_id, symbol,
+                symbols, ts_start, ts_end, fields, source_id)
+            right_query: Query parameters for the right side
+            by: Column that must match exactly (None to align all rows)
+            on: Ordered column to match on
+            tolerance: Maximum age of the matched right row, e.g. "500ms"
+            priority: Admission priority class, as in `read`; the slot is
+                held until the stream is exhausted or released
+            **kwargs: Additional arguments passed to the reader
+            
+        Returns:
+            RecordBatchReader streaming the joined rows in `on` order
+        """
+        logger.info("As-of joining", extra={
+            "left_query": left_query,
+            "right_query": right_query,
+            "by": by,
+            "on": on,
+            "tolerance": str(tolerance)
+        })
+        
+        batches, joined = self._admitted_stream(priority, lambda reader: reader.asof_join(
+            left_query=left_query,
+            right_query=right_query,
+            by=by,
+            on=on,
+            tolerance=tolerance,
+            **kwargs
+        ))
+        return pa.RecordBatchReader.from_batches(joined.schema, batches)
+    
+    def snapshot(
+        self,
+        ts: str,
+        symbols: Optional[Union[str, List[str]]] = None,
+        fields: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1",
+        priority: str = "interactive"
+    ) -> pa.Table:
+        """
+        Get the state (last tick) of every symbol as of time `ts`.
+        
+        Args:
+            ts: Snapshot time (ISO format, inclusive)
+            symbols: Symbol or list of symbols (None for all symbols)
+            fields: Fields to return
+            schema_id: Schema identifier
+            priority: Admission priority class, as in `read`
+            
+        Returns:
+            Arrow Table with one row per symbol
+        """
+        start_time = pd.Timestamp.now()
+        with self.admission.admit(priority) as reader:
+            result = reader.snapshot(
+                ts=ts,
+                symbols=symbols,
+                fields=fields,
+                schema_id=schema_id
+            )
+        query_time = (pd.Timestamp.now() - start_time).total_seconds() * 1000
+        
+        if self.metrics:
+            self.metrics.record_query(
+                query_time_ms=query_time,
+                rows_returned=len(result),
+                schema_id=schema_id,
+                shape=query_shape("snapshot", {"symbol": symbols})
+            )
+        
+        logger.info("Snapshot completed", extra={
+            "ts": ts,
+            "query_time_ms": query_time,
+            "rows_returned": len(result)
+        })
+        
+        return result
+    
+    def read_windows(
+        self,
+        events: Union[pa.Table, pd.DataFrame],
+        before: str,
+        after: str,
+        fields: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1",
+        priority: str = "batch"
+    ) -> pa.Table:
+        """
+        Read the ticks in a window around each of many events in one scan.
+        
+        Args:
+            events: Table with `symbol`, `ts` and optional `event_id` columns
+            before: Window length before each event (e.g. "5min")
+            after: Window length after each event (e.g. "30min")
+            fields: Fields to return
+            schema_id: Schema identifier
+            priority: Admission priority class, as in `read`
+        
+        Returns:
+            Arrow Table of window ticks tagged with their event_id
+        """
+        start_time = pd.Timestamp.now()
+        with self.admission.admit(priority) as reader:
+            result = reader.read_windows(
+                events=events,
+                before=before,
+                after=after,
+                fields=fields,
+                schema_id=schema_id
+            )
+        query_time = (pd.Timestamp.now() - start_time).total_seconds() * 1000
+        
+        if self.metrics:
+            self.metrics.record_query(
+                query_time_ms=query_time,
+                rows_returned=len(result),
+                schema_id=schema_id,
+                shape="read_windows"
+            )
+        
+        logger.info("Window read completed", extra={
+            "events": len(events),
+            "query_time_ms": query_time,
+            "rows_returned": len(result)
+        })
+        
+        return result
+    
+    def read_parallel(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[str] = None,
+        ts_end: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1",
+        ordered: bool = True,
+        workers: Optional[int] = None,
+        priority: str = "batch"
+    ) -> pa.Table:
+        """
+        Read a large multi-day, multi-symbol range with a process pool.
+        
+        Args:
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (ISO format)
+            ts_end: End timestamp (ISO format)
+            fields: List of fields to return
+            schema_id: Schema identifier
+            ordered: Keep global ts order (False returns rows unordered)
+            workers: Worker processes (defaults to config.scan_workers)
+            priority: Admission priority class, as in `read`
+            
+        Returns:
+            Arrow Table with query results
+        """
+        logger.info("Reading data in parallel", extra={
+            "symbols": symbols,
+            "ts_start": ts_start,
+            "ts_end": ts_end,
+            "ordered": ordered,
+            "workers": workers
+        })
+        
+        start_time = pd.Timestamp.now()
+        with self.admission.admit(priority) as reader:
+            result = reader.read_parallel(
+                symbols=symbols,
+                ts_start=ts_start,
+                ts_end=ts_end,
+                schema_id=schema_id,
+                fields=fields,
+                ordered=ordered,
+                workers=workers
+            )
+        query_time = (pd.Timestamp.now() - start_time).total_seconds() * 1000
+        
+        if self.metrics:
+            self.metrics.record_query(
+                query_time_ms=query_time,
+                rows_returned=len(result),
+                schema_id=schema_id,
+                shape=query_shape("read_parallel", {"symbol": symbols, "ts_start": ts_start, "ts_end": ts_end})
             )
         
         logger.info("Query completed", extra={
@@ -209,6 +690,191 @@ class TickDB:
         
         return result
     
+    def replay(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[str] = None,
+        ts_end: Optional[str] = None,
+        speed: Optional[float] = None,
+        schema_id: str = "ticks_v1",
+        priority: str = "batch",
+        **kwargs: Any
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Replay ticks for many symbols in global timestamp order.
+        
+        Args:
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (ISO format)
+            ts_end: End timestamp (ISO format)
+            speed: Wall-clock pacing relative to event time (e.g. 1.0 for
+                real time, 10.0 for ten times faster); None replays unpaced
+            schema_id: Schema identifier
+            priority: Admission priority class, as in `read`; the slot is
+                held until the iterator is exhausted, closed or released
+            **kwargs: Additional arguments passed to the reader (fields, batch_size)
+            
+        Returns:
+            Iterator of record batches in ts order
+        """
+        logger.info("Replaying data", extra={
+            "symbols": symbols,
+            "ts_start": ts_start,
+            "ts_end": ts_end,
+            "speed": speed,
+            "schema_id": schema_id
+        })
+        
+        batches, _ = self._admitted_stream(priority, lambda reader: reader.replay(
+            symbols=symbols,
+            ts_start=ts_start,
+            ts_end=ts_end,
+            speed=speed,
+            schema_id=schema_id,
+            **kwargs
+        ))
+        return batches
+    
+    def rebuild_rollups(self, schema_id: str = "ticks_v1") -> Dict[str, int]:
+        """
+        Rebuild the materialized bar rollups of a schema from raw data.
+        
+        Args:
+            schema_id: Schema identifier
+            
+        Returns:
+            Number of buckets written per rollup interval
+        """
+        return self.loader.rollups.rebuild(schema_id)
+    
+    def compact(self, schema_id: str = "ticks_v1") -> Dict[str, Any]:
+        """
+        Run maintenance for a schema: merge rollup deltas and rebuild the
+        per-file sketches that are missing, stale or orphaned.
+        
+        Args:
+            schema_id: Schema identifier
+            
+        Returns:
+            Rollup delta files merged per interval and sketch files written
+            and removed
+        """
+        result = {
+            "rollups": self.loader.rollups.compact(schema_id),
+            "sketches": self.loader.sketches.rebuild(schema_id)
+        }
+        
+        logger.info("Compacted schema", extra={"schema_id": schema_id, **result})
+        return result
+    
+    def count_symbols(
+        self,
+        ts_start: Optional[str] = None,
+        ts_end: Optional[str] = None,
+        schema_id: str = "ticks_v1",
+        priority: str = "interactive"
+    ) -> int:
+        """
+        Count the distinct symbols traded in a time range without scanning.
+        
+        Args:
+            ts_start: Start timestamp (ISO format)
+            ts_end: End timestamp (ISO format)
+            schema_id: Schema identifier
+            priority: Admission priority class, as in `read`
+            
+        Returns:
+            Number of distinct symbols in the files overlapping the range
+        """
+        with self.admission.admit(priority) as reader:
+            return reader.count_symbols(ts_start=ts_start, ts_end=ts_end, schema_id=schema_id)
+    
+    def quantiles(
+        self,
+        field: str = "size",
+        qs: Sequence[float] = (0.5, 0.99),
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[str] = None,
+        ts_end: Optional[str] = None,
+        schema_id: str = "ticks_v1",
+        priority: str = "interactive"
+    ) -> pa.Table:
+        """
+        Estimate price or size quantiles per symbol from merged sketches.
+        
+        Args:
+            field: "price" or "size"
+            qs: Quantiles in [0, 1]
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (ISO format)
+            ts_end: End timestamp (ISO format)
+            schema_id: Schema identifier
+            priority: Admission priority class, as in `read`
+            
+        Returns:
+            Arrow Table with one row per symbol (see `DataReader.quantiles`)
+        """
+        start_time = pd.Timestamp.now()
+        with self.admission.admit(priority) as reader:
+            result = reader.quantiles(
+                field=field,
+                qs=qs,
+                symbols=symbols,
+                ts_start=ts_start,
+                ts_end=ts_end,
+                schema_id=schema_id
+            )
+        query_time = (pd.Timestamp.now() - start_time).total_seconds() * 1000
+        
+        if self.metrics:
+            self.metrics.record_query(
+                query_time_ms=query_time,
+                rows_returned=len(result),
+                schema_id=schema_id,
+                shape=query_shape("quantiles", {"symbol": symbols, "ts_start": ts_start, "ts_end": ts_end})
+            )
+        
+        return result
+    
+    def _admitted_stream(self, priority: str, open_stream: Callable[[DataReader], Any]) -> Tuple[Iterator[Any], Any]:
+        """
+        Open a stream on an admitted reader, holding the slot while it is read.
+        
+        Admission happens now, so AdmissionError is raised to the caller
+        rather than on the first batch.
+        
+        Args:
+            priority: Admission priority class
+            open_stream: Opens the stream on the lent reader
+            
+        Returns:
+            Iterator over the stream that returns the slot once exhausted,
+            closed or garbage-collected, and the stream itself
+        """
+        def batches() -> Iterator[Any]:
+            with self.admission.admit(priority) as reader:
+                stream = open_stream(reader)
+                yield stream
+                yield from stream
+        
+        iterator = batches()
+        return iterator, next(iterator)
+    
+    def refresh_catalog(self, schema_ids: Optional[List[str]] = None) -> Path:
+        """
+        Rebuild the persistent DuckDB catalog (views, statistics, settings).
+        
+        Args:
+            schema_ids: Schemas to describe (default: every schema directory)
+            
+        Returns:
+            Catalog path
+        """
+        path = self.reader.refresh_catalog(schema_ids)
+        # Pooled readers attached the old catalog; later reads get new ones
+        self.admission.invalidate()
+        return path
+    
     def get_schema(self, schema_id: str) -> Dict[str, Any]:
         """Get schema definition."""
         return self.schema_registry.get_schema(schema_id)
@@ -0,0 +1,173 @@
+"""
+Downsampling of tick series for charting: min-max buckets and LTTB.
+"""
+
+import bisect
+import logging
+from typing import Iterable, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Supported downsampling methods
+DOWNSAMPLE_METHODS = ("minmax", "lttb")
+
+# Min-max points preselected per LTTB output point
+LTTB_PRESELECT_RATIO = 4
+
+
+def epoch_ns(array: pa.Array) -> np.ndarray:
+    """Timestamps of any unit as int64 epoch nanoseconds."""
+    as_ns = array.cast(pa.timestamp("ns", tz=array.type.tz))
+    return as_ns.cast(pa.int64()).to_numpy(zero_copy_only=False)
+
+
+def minmax_indices(ts: np.ndarray, values: np.ndarray, start_ns: int, width_ns: int) -> np.ndarray:
+    """
+    Positions of the minimum and maximum value of every time bucket.
+    
+    Args:
+        ts: Ascending timestamps (epoch ns)
+        values: Values (NaN is ignored)
+        start_ns: Start of the first bucket (epoch ns)
+        width_ns: Bucket width (ns)
+        
+    Returns:
+        Ascending positions; one per bucket where both extremes coincide
+    """
+    if not len(ts):
+        return np.empty(0, dtype=np.int64)
+    
+    bucket = (ts - start_ns) // width_ns
+    starts = np.flatnonzero(np.diff(bucket, prepend=bucket[0] - 1))
+    counts = np.diff(starts, append=len(ts))
+    
+    # First position of each bucket equal to the bucket's extreme
+    positions = np.arange(len(ts))
+    missing = len(ts)
+    low = np.fmin.reduceat(values, starts)
+    high = np.fmax.reduceat(values, starts)
+    argmin = np.minimum.reduceat(np.where(values == np.repeat(low, counts), positions, missing), starts)
+    argmax = np.minimum.reduceat(np.where(values == np.repeat(high, counts), positions, missing), starts)
+    
+    selected = np.union1d(argmin, argmax)
+    return selected[selected < missing]
+
+
+def minmax_reduce(
+    batches: Iterable[pa.RecordBatch],
+    start_ns: int,
+    end_ns: int,
+    buckets: int
+) -> pa.Table:
+    """
+    Reduce a streamed (ts, value) scan to the extremes of equal-width buckets.
+    
+    Each record batch is reduced on arrival, so memory stays bounded by the
+    batch size and the number of buckets; the candidates of all batches are
+    reduced once more at the end, which also merges buckets split across
+    batches. Each bucket keeps the rows holding its minimum and maximum, so
+    spikes survive at any zoom level.
+    
+    Args:
+        batches: Record batches of (ts, value), in any order
+        start_ns: Range start (epoch ns)
+        end_ns: Range end (epoch ns)
+        buckets: Number of buckets
+        
+    Returns:
+        Table of at most 2 * `buckets` rows, ordered by ts
+    """
+    width_ns = max(-(-(end_ns - start_ns + 1) // buckets), 1)
+    
+    def reduce(batch: pa.RecordBatch) -> pa.RecordBatch:
+        ts = epoch_ns(batch.column(0))
+        if len(ts) > 1 and not (ts[1:] >= ts[:-1]).all():
+            order = np.argsort(ts, kind="stable")
+            batch, ts = batch.take(order), ts[order]
+        values = batch.column(1).cast(pa.float64()).to_numpy(zero_copy_only=False)
+        return batch.take(minmax_indices(ts, values, start_ns, width_ns))
+    
+    schema = None
+    candidates = []
+    for batch in batches:
+        schema = batch.schema
+        if batch.num_rows:
+            candidates.append(reduce(batch))
+    
+    if not candidates:
+        return pa.table({name: [] for name in schema.names}, schema=schema) if schema else pa.table({})
+    return pa.Table.from_batches([reduce(pa.Table.from_batches(candidates).combine_chunks().to_batches()[0])])
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection.
+    
+    Keeps the first and last point; of every bucket in between it keeps the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket. The points holding the global minimum
+    and maximum then replace their bucket's pick, so the series' extremes
+    survive unless both fall in one bucket. The search within a bucket is
+    vectorized; only the loop over output points is in Python.
+    
+    Args:
+        x: Sorted x coordinates (e.g. epoch ns as float64)
+        y: Values
+        points: Number of points to keep
+        
+    Returns:
+        Indices of the kept points, ascending
+    """
+    n = len(x)
+    if points >= n:
+        return np.arange(n)
+    if points <= 2:
+        return np.array([0, n - 1][:max(points, 0)], dtype=np.int64)
+    
+    # Interior points are split into points - 2 buckets of equal count
+    every = (n - 2) / (points - 2)
+    selected = np.empty(points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    previous = 0
+    for i in range(points - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        
+        px, py = x[previous], y[previous]
+        area = np.abs(
+            (px - next_x) * (y[start:end] - py) - (px - x[start:end]) * (next_y - py)
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    
+    bucket_starts = [int(i * every) + 1 for i in range(points - 2)]
+    for extreme in (int(np.nanargmin(y)), int(np.nanargmax(y))):
+        if 0 < extreme < n - 1:
+            selected[bisect.bisect_right(bucket_starts, extreme)] = extreme
+    
+    return selected
+
+
+def split_points(points: int, method: str) -> Tuple[int, int]:
+    """
+    Min-max buckets and output points for a downsampling request.
+    
+    Returns:
+        (min-max buckets reduced from the scan, points kept after LTTB;
+        0 when the min-max result is returned as is)
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsampling method '{method}' (expected one of {', '.join(DOWNSAMPLE_METHODS)})")
+    if points < 2:
+        raise ValueError("points must be at least 2")
+    if method == "minmax":
+        return points // 2, 0
+    return points * LTTB_PRESELECT_RATIO // 2, points
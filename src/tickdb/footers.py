@@ -0,0 +1,303 @@
+"""
+Parquet footer statistics used to prune files before scanning them.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Footer key holding the sorted distinct symbols of a file
+SYMBOLS_METADATA_KEY = b"tickdb.symbols"
+
+# Threads used to read uncached footers
+FOOTER_READ_THREADS = 8
+
+# Default memory budget of the footer cache
+DEFAULT_FOOTER_CACHE_BYTES = 256 * 1024 * 1024
+
+# Age after which a directory's mtime is trusted to cover its listing
+LISTING_SETTLE_NS = 1_000_000_000
+
+
+def to_timestamp(value: Optional[Union[str, datetime]]) -> Optional[pd.Timestamp]:
+    """Convert a query bound to a naive UTC timestamp for statistics pruning."""
+    if value is None or value == "":
+        return None
+    
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts
+
+
+class _FooterEntry(NamedTuple):
+    """Cached footer of one file version."""
+    
+    version: Tuple[int, int]
+    metadata: pq.FileMetaData
+    nbytes: int
+    stats: Dict[str, Any]
+
+
+class FooterCache:
+    """
+    Thread-safe, memory-bounded cache of parsed Parquet footers.
+    
+    Footers are keyed by file path, mtime and size, so a rewritten file is
+    read again while unchanged files never are; the least recently used
+    footers are evicted once their serialized size exceeds the budget.
+    Directory listings are cached too, keyed by the directory's mtime, so
+    resolving a schema's files does not re-glob it on every query.
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_FOOTER_CACHE_BYTES):
+        """
+        Initialize an empty footer cache.
+        
+        Args:
+            max_bytes: Memory budget for cached footers
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _FooterEntry]" = OrderedDict()
+        self._bytes = 0
+        self._listings: Dict[str, Tuple[int, List[Path]]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, file_path: Path, validate: bool = True) -> pq.FileMetaData:
+        """
+        Get a file's footer, reading it on a cache miss.
+        
+        Args:
+            file_path: Parquet file
+            validate: Check the file's mtime and size against the cached
+                entry; skipped for files known to be unchanged
+        """
+        return self._entry(file_path, validate).metadata
+    
+    def stats(self, file_path: Path, validate: bool = True) -> Dict[str, Any]:
+        """Get a file's ts and symbol (min, max) statistics, as `metadata_stats`."""
+        return self._entry(file_path, validate).stats
+    
+    def get_many(
+        self,
+        files: List[Path],
+        validate: bool = True,
+        stats: bool = False
+    ) -> Dict[Path, Any]:
+        """
+        Get the footers (or statistics) of many files, reading misses on a
+        thread pool.
+        
+        Unreadable files map to None.
+        """
+        def read(file_path: Path) -> Any:
+            try:
+                entry = self._entry(file_path, validate)
+            except Exception as e:
+                logger.warning(f"Failed to read metadata from {file_path}: {e}")
+                return None
+            return entry.stats if stats else entry.metadata
+        
+        with self._lock:
+            misses = sum(1 for f in files if str(f) not in self._entries)
+        if misses <= 1:
+            return {f: read(f) for f in files}
+        with ThreadPoolExecutor(max_workers=min(FOOTER_READ_THREADS, misses)) as pool:
+            return dict(zip(files, pool.map(read, files)))
+    
+    def list_files(self, directory: Path, pattern: str = "*.parquet") -> List[Path]:
+        """Sorted files of a directory, re-listed only when the directory changes."""
+        try:
+            version = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        key = f"{directory}/{pattern}"
+        with self._lock:
+            listing = self._listings.get(key)
+        if listing is not None and listing[0] == version:
+            return listing[1]
+        
+        files = sorted(directory.glob(pattern))
+        # Directory mtimes are coarse: a listing taken in the same tick as a
+        # write could miss a file without the mtime changing, so only settled
+        # directories are cached
+        if time.time_ns() - version > LISTING_SETTLE_NS:
+            with self._lock:
+                self._listings[key] = (version, files)
+        return files
+    
+    def directory_footers(self, directory: Path, stats: bool = False) -> Dict[Path, Any]:
+        """
+        Footers (or statistics) of every Parquet file in a directory.
+        
+        Data files are write-once, so while the directory listing is unchanged
+        cached footers are used without re-checking each file.
+        """
+        key = f"{directory}/*.parquet"
+        with self._lock:
+            previous = self._listings.get(key)
+        files = self.list_files(directory)
+        with self._lock:
+            unchanged = previous is not None and self._listings.get(key) is previous
+        return self.get_many(files, validate=not unchanged, stats=stats)
+    
+    def warm(self, directories: List[Path]) -> int:
+        """
+        Load the footers of every Parquet file under the given directories.
+        
+        Returns:
+            Number of footers cached
+        """
+        footers = 0
+        for directory in directories:
+            footers += sum(1 for m in self.directory_footers(directory).values() if m is not None)
+        return footers
+    
+    def set_budget(self, max_bytes: int) -> None:
+        """Change the memory budget, evicting footers beyond it."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+    
+    @property
+    def nbytes(self) -> int:
+        """Serialized size of the cached footers."""
+        with self._lock:
+            return self._bytes
+    
+    def clear(self) -> None:
+        """Drop all cached footers and directory listings."""
+        with self._lock:
+            self._entries.clear()
+            self._listings.clear()
+            self._bytes = 0
+    
+    def _entry(self, file_path: Path, validate: bool) -> "_FooterEntry":
+        """Get a file's cache entry, reading its footer on a miss."""
+        key = str(file_path)
+        version = None
+        if validate:
+            stat = Path(file_path).stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (version is None or entry.version == version):
+                self._entries.move_to_end(key)
+                return entry
+        
+        if version is None:
+            stat = Path(file_path).stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+        metadata = pq.read_metadata(file_path)
+        # Statistics are derived once per footer read, not per query
+        entry = _FooterEntry(version, metadata, metadata.serialized_size, metadata_stats(metadata))
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = entry
+            self._bytes += entry.nbytes
+            self._evict()
+        return entry
+    
+    def _evict(self) -> None:
+        """Drop least recently used footers over the budget (lock held)."""
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.nbytes
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide footer cache shared by every reader
+footer_cache = FooterCache()
+
+
+def footer_symbols(metadata: pq.FileMetaData) -> Optional[List[str]]:
+    """Distinct symbols recorded in a file's footer, if the writer stored them."""
+    kv = metadata.metadata or {}
+    if SYMBOLS_METADATA_KEY not in kv:
+        return None
+    return json.loads(kv[SYMBOLS_METADATA_KEY])
+
+
+def partition_symbols(schema_path: Path) -> Optional[List[str]]:
+    """Symbols of a ``symbol=<value>`` partitioned layout, taken from directory names."""
+    prefix = "symbol="
+    names = [p.name[len(prefix):] for p in schema_path.glob(f"{prefix}*") if p.is_dir()]
+    return sorted(names) if names else None
+
+
+def file_stats(file_path: Path) -> Dict[str, Any]:
+    """Collect (min, max) statistics for the ts and symbol columns of a file."""
+    return footer_cache.stats(file_path)
+
+
+def metadata_stats(metadata: pq.FileMetaData) -> Dict[str, Any]:
+    """Collect (min, max) statistics for the ts and symbol columns from a footer."""
+    columns = {}
+    for i in range(metadata.num_columns):
+        name = metadata.schema.column(i).name
+        if name in ("ts", "symbol"):
+            columns[name] = i
+    
+    stats: Dict[str, Any] = {}
+    for name, index in columns.items():
+        lows, highs = [], []
+        for rg in range(metadata.num_row_groups):
+            col_stats = metadata.row_group(rg).column(index).statistics
+            if col_stats is None or not col_stats.has_min_max:
+                # Missing statistics: the column cannot be used for pruning
+                lows, highs = [], []
+                break
+            lows.append(col_stats.min)
+            highs.append(col_stats.max)
+        
+        if lows:
+            low, high = min(lows), max(highs)
+            if name == "ts":
+                low, high = to_timestamp(low), to_timestamp(high)
+            stats[name] = (low, high)
+    
+    return stats
+
+
+def row_group_overlaps(
+    row_group: pq.RowGroupMetaData,
+    index: Dict[str, int],
+    symbols: Optional[List[str]] = None,
+    ts_start: Optional[pd.Timestamp] = None,
+    ts_end: Optional[pd.Timestamp] = None
+) -> bool:
+    """Whether a row group's statistics may hold rows for the symbols and time range."""
+    if "ts" in index:
+        stats = row_group.column(index["ts"]).statistics
+        if stats is not None and stats.has_min_max:
+            if ts_start is not None and to_timestamp(stats.max) < ts_start:
+                return False
+            if ts_end is not None and to_timestamp(stats.min) > ts_end:
+                return False
+    
+    if symbols and "symbol" in index:
+        stats = row_group.column(index["symbol"]).statistics
+        if stats is not None and stats.has_min_max:
+            if not any(stats.min <= s <= stats.max for s in symbols):
+                return False
+    
+    return True
@@ -0,0 +1,184 @@
+"""
+HDR-style latency histograms: query latency quantiles with bounded relative error.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sub-buckets per power of two: recorded values are kept within 1/128 (0.8%)
+LATENCY_PRECISION_BITS = 7
+
+# Quantiles reported per schema and query shape
+LATENCY_QUANTILES = [0.5, 0.99, 0.999]
+
+# Upper bounds (seconds) of the exported Prometheus buckets: a factor of
+# sqrt(2) apart, from 50 us to about 26 s
+LATENCY_BUCKETS = [round(50e-6 * 2 ** (i / 2), 9) for i in range(39)]
+
+# Query parameters that make up a query's shape, and the name each one contributes
+SHAPE_PARAMS = {
+    "symbol": "symbol",
+    "ts_start": "ts",
+    "ts_end": "ts",
+    "sample": "sample",
+    "approx": "approx",
+    "page_size": "page",
+    "limit": "limit",
+    "order_by": "order",
+}
+
+
+def query_shape(operation: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Shape of a query: the operation and which filters it sets, not their values.
+    
+    Shapes have a bounded number of values, so they can label metrics:
+    ``read:symbol+ts`` for a read of one symbol over a time range.
+    
+    Args:
+        operation: Query entry point (read, bars, snapshot, ...)
+        params: Query parameters
+    """
+    features = sorted({
+        name for key, name in SHAPE_PARAMS.items()
+        if params and params.get(key) not in (None, False, [], "")
+    })
+    return f"{operation}:{'+'.join(features)}" if features else operation
+
+
+def quantile_label(quantile: float) -> str:
+    """Key of a quantile in summaries: 0.5 -> "p50", 0.999 -> "p99.9"."""
+    return f"p{quantile * 100:g}"
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in microseconds, in the manner of
+    HdrHistogram.
+    
+    Values below 2^precision_bits are counted exactly; above, every power
+    of two is split into 2^precision_bits equal sub-buckets, so a quantile
+    is within 2^-precision_bits of the recorded value at any magnitude.
+    Memory grows with the number of distinct buckets hit (a few hundred in
+    practice), not with the number of values.
+    """
+    
+    def __init__(self, precision_bits: int = LATENCY_PRECISION_BITS):
+        self.precision_bits = precision_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+    
+    def _index(self, value_us: int) -> int:
+        """Bucket of a value."""
+        shift = max(value_us.bit_length() - self.precision_bits - 1, 0)
+        return (shift << self.precision_bits) + (value_us >> shift)
+    
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """Lowest and highest value of a bucket."""
+        shift = max((index >> self.precision_bits) - 1, 0)
+        mantissa = index - (shift << self.precision_bits)
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+    
+    def record(self, value_us: int, count: int = 1) -> None:
+        """Record a latency in microseconds, `count` times."""
+        value_us = max(int(value_us), 0)
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total_us += value_us * count
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+    
+    def record_many_ms(self, values_ms: Iterable[float]) -> None:
+        """Record latencies given in milliseconds."""
+        for value_ms in values_ms:
+            self.record(round(value_ms * 1000))
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the values of another histogram of the same precision."""
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Cannot merge histograms of different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.count:
+            self.count += other.count
+            self.total_us += other.total_us
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+            self.max_us = other.max_us if self.max_us is None else max(self.max_us, other.max_us)
+    
+    def value_at_quantile(self, quantile: float) -> int:
+        """
+        Latency (us) at or below which `quantile` of the values fall.
+        
+        Returns the highest value of the bucket holding the quantile (capped
+        at the maximum recorded), so quantiles err on the slow side.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(round(quantile * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._bounds(index)[1], self.max_us)
+        return self.max_us
+    
+    def cumulative_counts(self, bounds_us: List[float]) -> List[int]:
+        """Number of values at or below each of the sorted `bounds_us`."""
+        counts = []
+        seen = 0
+        buckets = sorted(self.counts.items())
+        position = 0
+        for bound in bounds_us:
+            while position < len(buckets) and self._bounds(buckets[position][0])[1] <= bound:
+                seen += buckets[position][1]
+                position += 1
+            counts.append(seen)
+        return counts
+    
+    def summary(self, quantiles: List[float] = LATENCY_QUANTILES) -> Dict[str, Any]:
+        """Count, mean, extremes and quantiles, in milliseconds."""
+        summary = {
+            "count": self.count,
+            "min_ms": (self.min_us or 0) / 1000,
+            "mean_ms": self.total_us / self.count / 1000 if self.count else 0.0,
+            "max_ms": (self.max_us or 0) / 1000,
+        }
+        for quantile in quantiles:
+            summary[f"{quantile_label(quantile)}_ms"] = self.value_at_quantile(quantile) / 1000
+        return summary
+
+
+def latency_from_exposition(text: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Rebuild latency summaries from a /metrics scrape of another process.
+    
+    Args:
+        text: Prometheus text exposition
+        
+    Returns:
+        Same layout as ``get_metrics()["latency"]``; only the quantiles and
+        counts exported there are available
+    """
+    from prometheus_client.parser import text_string_to_metric_families
+    
+    latency: Dict[str, Dict[str, Any]] = {}
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            if sample.name not in ("tickdb_query_latency_quantile_seconds", "tickdb_query_latency_seconds_count"):
+                continue
+            schema = latency.setdefault(sample.labels["schema_id"], {"all": {}, "shapes": {}})
+            shape = sample.labels["shape"]
+            target = schema["all"] if shape == "all" else schema["shapes"].setdefault(shape, {})
+            if sample.name.endswith("_count"):
+                # Histograms are exported per shape only; a schema's count is their sum
+                target["count"] = int(sample.value)
+                schema["all"]["count"] = schema["all"].get("count", 0) + int(sample.value)
+            else:
+                target[f"{quantile_label(float(sample.labels['quantile']))}_ms"] = sample.value * 1000
+    return latency
@@ -3,20 +3,29 @@ High-performance data loader for the data lake.
 """
 
 import gzip
+import json
 import logging
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.csv as csv
 import pyarrow.parquet as pq
 from pydantic import BaseModel
 
 from .config import TickDBConfig
+from .footers import SYMBOLS_METADATA_KEY
+from .replay import SORTED_BY_METADATA_KEY
+from .rollups import RollupManager
 from .schemas import SchemaDefinition
+from .sketches import SketchIndex
+from .snapshot import CheckpointIndex
 
 # Try to import Rust components for high performance
 try:
@@ -48,6 +57,33 @@ class LoadResult(BaseModel):
     errors: List[str] = []
     warnings: List[str] = []
     processing_time_ms: float = 0.0
+    stages: Dict[str, float] = {}
+
+
+class StageTimer:
+    """
+    Wall time per ingest stage, in milliseconds, from a monotonic clock.
+    
+    Stages: decompress, parse, metadata, validate.<rule>, partition, sort,
+    encode (Parquet encoding and compression), fsync, rollups, checkpoints,
+    sketches and quarantine. Time of repeated stages adds up.
+    """
+    
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+    
+    def add(self, name: str, time_ms: float) -> None:
+        """Add time measured elsewhere to a stage."""
+        self.stages[name] = self.stages.get(name, 0.0) + time_ms
 
 
 class DataLoader:
@@ -71,6 +107,9 @@ class DataLoader:
         """
         self.config = config
         self.supported_formats = {".csv", ".csv.gz", ".json", ".json.gz", ".parquet"}
+        self.rollups = RollupManager(config)
+        self.checkpoints = CheckpointIndex(config)
+        self.sketches = SketchIndex(config)
         
         logger.info("Data loader initialized", extra={
             "batch_size": config.batch_size,
@@ -98,7 +137,8 @@ class DataLoader:
             Load result dictionary
         """
         file_path = Path(file_path)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        timer = StageTimer()
         
         logger.info("Loading file", extra={
             "source_id": source_id,
@@ -113,14 +153,15 @@ class DataLoader:
             file_format = self._detect_format(file_path)
             
             # Read file into Arrow table
-            table = self._read_file(file_path, file_format, **kwargs)
+            table = self._read_file(file_path, file_format, timer=timer, **kwargs)
             result.bytes_processed = file_path.stat().st_size
             
             # Add metadata columns
-            table = self._add_metadata(table, source_id)
+            with timer.stage("metadata"):
+                table = self._add_metadata(table, source_id)
             
             # Validate and process
-            processed_result = self._process_table(table, schema, source_id)
+            processed_result = self._process_table(table, schema, source_id, timer)
             
             # Merge results
             result.rows_processed = processed_result.rows_processed
@@ -134,14 +175,16 @@ class DataLoader:
             result.errors.append(error_msg)
             logger.error(error_msg, exc_info=True)
         
-        result.processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+        result.processing_time_ms = (time.perf_counter() - start_time) * 1000
+        result.stages = timer.stages
         
         logger.info("File load completed", extra={
             "source_id": source_id,
             "file_path": str(file_path),
             "rows_processed": result.rows_processed,
             "rows_failed": result.rows_failed,
-            "processing_time_ms": result.processing_time_ms
+            "processing_time_ms": result.processing_time_ms,
+            "stages": result.stages
         })
         
         return result.model_dump()
@@ -165,7 +208,8 @@ class DataLoader:
         Returns:
             Store result dictionary
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        timer = StageTimer()
         
         logger.info("Storing table", extra={
             "schema_id": schema_id,
@@ -178,7 +222,8 @@ class DataLoader:
         try:
             # Add metadata if not present
             if "source_id" not in table.column_names and source_id:
-                table = self._add_metadata(table, source_id)
+                with timer.stage("metadata"):
+                    table = self._add_metadata(table, source_id)
             
             # Get schema for partitioning
             from .schemas import SchemaRegistry
@@ -186,7 +231,7 @@ class DataLoader:
             schema = schema_registry.get_schema(schema_id)
             
             # Process and store
-            processed_result = self._process_table(table, schema, source_id or "unknown")
+            processed_result = self._process_table(table, schema, source_id or "unknown", timer)
             
             result.rows_processed = processed_result.rows_processed
             result.rows_failed = processed_result.rows_failed
@@ -199,7 +244,8 @@ class DataLoader:
             result.errors.append(error_msg)
             logger.error(error_msg, exc_info=True)
         
-        result.processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+        result.processing_time_ms = (time.perf_counter() - start_time) * 1000
+        result.stages = timer.stages
         
         return result.model_dump()
     
@@ -207,7 +253,7 @@ class DataLoader:
         """Detect file format based on extension."""
         suffix = file_path.suffix.lower()
         if suffix == ".gz":
-            suffix = file_path.stem + suffix
+            suffix = Path(file_path.stem).suffix.lower() + suffix
         
         if suffix not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {suffix}")
@@ -218,20 +264,25 @@ class DataLoader:
         self,
         file_path: Path,
         file_format: str,
+        timer: Optional[StageTimer] = None,
         **kwargs: Any
     ) -> pa.Table:
         """Read file into Arrow table based on format."""
+        timer = timer or StageTimer()
         
         if file_format == ".csv":
-            return self._read_csv(file_path, **kwargs)
+            with timer.stage("parse"):
+                return self._read_csv(file_path, **kwargs)
         elif file_format == ".csv.gz":
-            return self._read_csv_gz(file_path, **kwargs)
+            return self._read_csv_gz(file_path, timer=timer, **kwargs)
         elif file_format == ".json":
-            return self._read_json(file_path, **kwargs)
+            with timer.stage("parse"):
+                return self._read_json(file_path, **kwargs)
         elif file_format == ".json.gz":
-            return self._read_json_gz(file_path, **kwargs)
+            return self._read_json_gz(file_path, timer=timer, **kwargs)
         elif file_format == ".parquet":
-            return self._read_parquet(file_path, **kwargs)
+            with timer.stage("parse"):
+                return self._read_parquet(file_path, **kwargs)
         else:
             raise ValueError(f"Unsupported format: {file_format}")
     
@@ -278,8 +329,7 @@ class DataLoader:
         logger.info("Using standard Arrow CSV reader")
         read_options = csv.ReadOptions(
             skip_rows=kwargs.get("skip_rows", 0),
-            column_names=kwargs.get("column_names"),
-            batch_size=self.config.batch_size
+            column_names=kwargs.get("column_names")
         )
         
         parse_options = csv.ParseOptions(
@@ -303,36 +353,40 @@ class DataLoader:
             convert_options=convert_options
         )
     
-    def _read_csv_gz(self, file_path: Path, **kwargs: Any) -> pa.Table:
+    def _read_csv_gz(self, file_path: Path, timer: Optional[StageTimer] = None, **kwargs: Any) -> pa.Table:
         """Read gzipped CSV file."""
-        with gzip.open(file_path, "rt") as f:
+        timer = timer or StageTimer()
+        with timer.stage("decompress"), gzip.open(file_path, "rt") as f:
             # Create a temporary file for Arrow to read
             import tempfile
             with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
                 tmp.write(f.read())
                 tmp_path = tmp.name
-            
-            try:
+        
+        try:
+            with timer.stage("parse"):
                 return self._read_csv(Path(tmp_path), **kwargs)
-            finally:
-                os.unlink(tmp_path)
+        finally:
+            os.unlink(tmp_path)
     
     def _read_json(self, file_path: Path, **kwargs: Any) -> pa.Table:
         """Read JSON file."""
         return pa.json.read_json(file_path)
     
-    def _read_json_gz(self, file_path: Path, **kwargs: Any) -> pa.Table:
+    def _read_json_gz(self, file_path: Path, timer: Optional[StageTimer] = None, **kwargs: Any) -> pa.Table:
         """Read gzipped JSON file."""
-        with gzip.open(file_path, "rt") as f:
+        timer = timer or StageTimer()
+        with timer.stage("decompress"), gzip.open(file_path, "rt") as f:
             import tempfile
             with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
                 tmp.write(f.read())
                 tmp_path = tmp.name
-            
-            try:
+        
+        try:
+            with timer.stage("parse"):
                 return self._read_json(Path(tmp_path), **kwargs)
-            finally:
-                os.unlink(tmp_path)
+        finally:
+            os.unlink(tmp_path)
     
     def _read_parquet(self, file_path: Path, **kwargs: Any) -> pa.Table:
         """Read Parquet file."""
@@ -358,31 +412,53 @@ class DataLoader:
         self,
         table: pa.Table,
         schema: SchemaDefinition,
-        source_id: str
+        source_id: str,
+        timer: Optional[StageTimer] = None
     ) -> LoadResult:
         """Process table and write to partitioned Parquet files."""
         result = LoadResult()
+        timer = timer or StageTimer()
         
         try:
             # Validate table against schema
             from .validation import DataValidator
             validator = DataValidator(self.config)
             validation_result = validator.validate_table(table, schema)
+            for rule, time_ms in validation_result["stages"].items():
+                timer.add(f"validate.{rule}", time_ms)
             
             if validation_result["valid"]:
                 # Write valid data
+                # Derive partition columns once so sidecar indexes match the files
+                with timer.stage("partition"):
+                    table = self._add_partition_columns(table, schema)
+                with timer.stage("sort"):
+                    table = self._sort_table(table, schema)
                 files_created = self._write_partitioned_parquet(
-                    table, schema, source_id
+                    table, schema, source_id, timer
                 )
                 result.files_created = files_created
                 result.rows_processed = len(table)
+                
+                # Fold the batch into the materialized bar rollups
+                with timer.stage("rollups"):
+                    self.rollups.update(table, schema.id, files_created)
+                
+                # Index the last tick per symbol and minute for snapshots
+                with timer.stage("checkpoints"):
+                    self.checkpoints.update(table, schema.id, files_created)
+                
+                # Sketch price and size per symbol for scan-free quantiles
+                with timer.stage("sketches"):
+                    self.sketches.update(table, schema.id, files_created)
             else:
                 # Handle invalid data
                 result.rows_failed = len(table)
                 result.errors.extend(validation_result["errors"])
                 
                 # Quarantine invalid data
-                self._quarantine_table(table, source_id, validation_result["errors"])
+                with timer.stage("quarantine"):
+                    self._quarantine_table(table, source_id, validation_result["errors"])
             
             result.warnings.extend(validation_result.get("warnings", []))
             
@@ -397,7 +473,8 @@ class DataLoader:
         self,
         table: pa.Table,
         schema: SchemaDefinition,
-        source_id: str
+        source_id: str,
+        timer: Optional[StageTimer] = None
     ) -> List[str]:
         """Write table to partitioned Parquet files."""
         files_created = []
@@ -408,7 +485,7 @@ class DataLoader:
         if not partition_cols:
             # No partitioning, write single file
             file_path = self._get_output_path(schema.id, source_id)
-            self._write_parquet_file(table, file_path)
+            self._write_parquet_file(table, file_path, timer)
             files_created.append(str(file_path))
         else:
             # Partitioned write
@@ -416,35 +493,82 @@ class DataLoader:
             # In production, this would use Arrow's partitioning capabilities
             
             # Extract date from timestamp for partitioning
-            if "ts" in table.column_names and "dt" not in table.column_names:
-                # Add date column for partitioning
-                ts_array = table.column("ts")
-                if pa.types.is_timestamp(ts_array.type):
-                    # Convert timestamp to date
-                    date_array = ts_array.cast(pa.date32())
-                    table = table.append_column("dt", date_array)
+            table = self._add_partition_columns(table, schema)
             
             # Group by partition columns and write separate files
             # This is a simplified implementation
             file_path = self._get_output_path(schema.id, source_id)
-            self._write_parquet_file(table, file_path)
+            self._write_parquet_file(table, file_path, timer)
             files_created.append(str(file_path))
         
         return files_created
     
-    def _write_parquet_file(self, table: pa.Table, file_path: Path) -> None:
-        """Write table to Parquet file with compression."""
+    def _add_partition_columns(
+        self,
+        table: pa.Table,
+        schema: SchemaDefinition
+    ) -> pa.Table:
+        """Add derived partition columns (the "dt" date) to a table."""
+        if not schema.partition_by:
+            return table
+        
+        if "ts" in table.column_names and "dt" not in table.column_names:
+            # Add date column for partitioning
+            ts_array = table.column("ts")
+            if pa.types.is_timestamp(ts_array.type):
+                # Convert timestamp to date
+                date_array = ts_array.cast(pa.date32())
+                table = table.append_column("dt", date_array)
+        
+        return table
+    
+    def _sort_table(
+        self,
+        table: pa.Table,
+        schema: SchemaDefinition
+    ) -> pa.Table:
+        """Sort a table by the schema's sort columns and mark it as sorted."""
+        sort_cols = [col for col in schema.sort_by or [] if col in table.column_names]
+        if not sort_cols:
+            return table
+        
+        table = table.sort_by([(col, "ascending") for col in sort_cols])
+        
+        # Recorded in the footer so readers can stream the file without re-sorting
+        metadata = dict(table.schema.metadata or {})
+        metadata[SORTED_BY_METADATA_KEY] = json.dumps(sort_cols).encode()
+        return table.replace_schema_metadata(metadata)
+    
+    def _write_parquet_file(self, table: pa.Table, file_path: Path, timer: Optional[StageTimer] = None) -> None:
+        """Write table to Parquet file with compression, then fsync it."""
+        timer = timer or StageTimer()
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        pq.write_table(
-            table,
-            file_path,
-            compression=self.config.compression,
-            compression_level=self.config.compression_level,
-            row_group_size=self.config.batch_size,
-            use_dictionary=True,
-            write_statistics=True
-        )
+        with timer.stage("encode"):
+            if "symbol" in table.column_names:
+                # Distinct symbols in the footer let readers list symbols without scanning
+                symbols = pc.unique(table.column("symbol").drop_null()).to_pylist()
+                metadata = dict(table.schema.metadata or {})
+                metadata[SYMBOLS_METADATA_KEY] = json.dumps(sorted(symbols)).encode()
+                table = table.replace_schema_metadata(metadata)
+            
+            pq.write_table(
+                table,
+                file_path,
+                compression=self.config.compression,
+                compression_level=self.config.compression_level,
+                row_group_size=self.config.batch_size,
+                use_dictionary=True,
+                write_statistics=True
+            )
+        
+        if self.config.fsync_writes:
+            with timer.stage("fsync"):
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
         
         logger.debug("Wrote Parquet file", extra={
             "file_path": str(file_path),
@@ -454,7 +578,8 @@ class DataLoader:
     
     def _get_output_path(self, schema_id: str, source_id: str) -> Path:
         """Generate output file path."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Microsecond resolution so batches written in the same second don't collide
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"{schema_id}_{source_id}_{timestamp}.parquet"
         return self.config.data_path / schema_id / filename
     
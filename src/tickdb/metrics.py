@@ -3,22 +3,294 @@ Metrics collection component for the data lake.
 """
 
 import logging
+import threading
 import time
+import weakref
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
     Counter,
     Gauge,
     Histogram,
-    Summary,
     generate_latest,
     start_http_server,
 )
+from prometheus_client.core import GaugeMetricFamily, HistogramMetricFamily, SummaryMetricFamily
+from prometheus_client.utils import floatToGoString
+
+from .latency import LATENCY_BUCKETS, LATENCY_QUANTILES, LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
+# Seconds a thread batches counter updates before flushing them
+FLUSH_INTERVAL_SECONDS = 1.0
+
+
+class _IngestSeries:
+    """Label children and in-memory totals of one (source_id, schema_id), bound once."""
+    
+    __slots__ = (
+        "operations", "operations_failed", "bytes", "rows", "rows_failed",
+        "duration", "throughput", "stage_seconds", "stage_children", "stage_labels",
+        "stats", "__weakref__"
+    )
+    
+    def __init__(self, collector: "MetricsCollector", source_id: str, schema_id: str, stats: Optional[Dict[str, Any]]):
+        self.operations = collector.ingest_total.labels(source_id, schema_id, "success")
+        self.operations_failed = collector.ingest_total.labels(source_id, schema_id, "failed")
+        # Bytes are only known for file loads
+        self.bytes = collector.ingest_bytes_total.labels(source_id, schema_id) if stats is not None else None
+        self.rows = collector.ingest_rows_total.labels(source_id, schema_id, "success")
+        self.rows_failed = collector.ingest_rows_total.labels(source_id, schema_id, "failed")
+        self.duration = collector.ingest_duration_seconds.labels(source_id, schema_id)
+        self.throughput = collector.ingest_throughput_mbps.labels(source_id, schema_id)
+        self.stage_seconds = collector.ingest_stage_seconds.labels
+        self.stage_children: Dict[str, Any] = {}
+        self.stats = stats
+        self.stage_labels = (source_id, schema_id)
+    
+    def stage(self, name: str) -> Any:
+        """Stage histogram child of this series."""
+        child = self.stage_children.get(name)
+        if child is None:
+            child = self.stage_children[name] = self.stage_seconds(*self.stage_labels, name)
+        return child
+    
+    def flush(self, values: List[Any]) -> None:
+        """Apply batched [operations, bytes, rows, rows_failed, duration, stages]."""
+        operations, bytes_processed, rows, rows_failed, duration, stages = values
+        self.operations.inc(operations)
+        if rows_failed:
+            self.operations_failed.inc(rows_failed)
+            self.rows_failed.inc(rows_failed)
+        if self.bytes is not None:
+            self.bytes.inc(bytes_processed)
+        self.rows.inc(rows)
+        
+        if self.stats is not None:
+            self.stats["total_bytes"] += bytes_processed
+            self.stats["total_rows"] += rows
+            self.stats["failed_rows"] += rows_failed
+            self.stats["total_duration"] += duration
+            self.stats["count"] += operations
+            for stage, time_ms in stages.items():
+                self.stats["stage_time_ms"][stage] += time_ms
+
+
+class _QuerySeries:
+    """Label children and in-memory totals of one (schema_id, status), bound once."""
+    
+    __slots__ = ("queries", "rows", "duration", "latency", "stats", "__weakref__")
+    
+    def __init__(self, collector: "MetricsCollector", schema_id: str, status: str, stats: Dict[str, Any]):
+        self.queries = collector.query_total.labels(schema_id, status)
+        self.rows = collector.query_rows_total.labels(schema_id) if status == "success" else None
+        self.duration = collector.query_duration_seconds.labels(schema_id)
+        self.latency = collector.query_latency_ms.labels(schema_id)
+        self.stats = stats
+    
+    def flush(self, values: List[Any]) -> None:
+        """Apply batched [queries, rows, time_ms]."""
+        queries, rows, time_ms = values
+        self.queries.inc(queries)
+        if self.rows is not None:
+            self.rows.inc(rows)
+        
+        self.stats["total_queries"] += queries
+        self.stats["total_rows"] += rows
+        self.stats["total_time_ms"] += time_ms
+        self.stats["avg_latency_ms"] = self.stats["total_time_ms"] / self.stats["total_queries"]
+
+
+class _CounterBuffer:
+    """Counter updates and observations of one thread, waiting to be flushed."""
+    
+    __slots__ = ("lock", "pending", "observed", "latencies", "last_flush", "thread")
+    
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pending: Dict[Any, List[Any]] = {}
+        self.observed: Dict[Any, List[Any]] = {}
+        self.latencies: Dict[Tuple[str, str], List[float]] = {}
+        self.last_flush = time.monotonic()
+        self.thread = weakref.ref(threading.current_thread())
+    
+    def observe(self, child: "_BatchedChild", amount: float) -> None:
+        """Batch an observation of a histogram or summary child (caller holds the lock)."""
+        observed = self.observed.get(child)
+        if observed is None:
+            observed = self.observed[child] = [0.0, 0, [0] * len(child.bounds) if child.bounds is not None else None]
+        observed[0] += amount
+        observed[1] += 1
+        if observed[2] is not None:
+            observed[2][bisect_left(child.bounds, amount)] += 1
+
+
+class _BatchedChild:
+    """Sum, count and bucket counts of one label set of a batched metric."""
+    
+    __slots__ = ("bounds", "lock", "sum", "count", "counts", "__weakref__")
+    
+    def __init__(self, bounds: Optional[List[float]]):
+        self.bounds = bounds
+        self.lock = threading.Lock()
+        self.sum = 0.0
+        self.count = 0
+        self.counts = [0] * len(bounds) if bounds is not None else None
+    
+    def observe(self, amount: float) -> None:
+        """Observe a single value."""
+        with self.lock:
+            self.sum += amount
+            self.count += 1
+            if self.counts is not None:
+                self.counts[bisect_left(self.bounds, amount)] += 1
+    
+    def add(self, total: float, count: int, counts: Optional[List[int]]) -> None:
+        """Add batched observations; counts are per bucket, not cumulative."""
+        with self.lock:
+            self.sum += total
+            self.count += count
+            if counts is not None:
+                for i, bucket_count in enumerate(counts):
+                    self.counts[i] += bucket_count
+    
+    def snapshot(self) -> Tuple[float, int, Optional[List[int]]]:
+        """Consistent (sum, count, counts) of the child."""
+        with self.lock:
+            return self.sum, self.count, None if self.counts is None else list(self.counts)
+
+
+class _BatchedMetric:
+    """
+    Histogram or summary whose children take observations in batches.
+    
+    prometheus_client metrics only observe one value at a time, so the
+    per-thread buffers of `MetricsCollector` flush into these instead,
+    and they are exported at scrape time as a custom collector. Summaries
+    (no `buckets`) only export their count and sum, as prometheus_client's do.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: List[str],
+        buckets: Optional[List[float]] = None,
+        registry: Optional[CollectorRegistry] = REGISTRY
+    ):
+        self._name = name
+        self._documentation = documentation
+        self._labelnames = tuple(labelnames)
+        self._bounds = None if buckets is None else [float(bound) for bound in buckets] + [float("inf")]
+        self._children: Dict[Tuple[str, ...], _BatchedChild] = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+    
+    def labels(self, *labelvalues: Any, **labelkwargs: Any) -> _BatchedChild:
+        """Child of a label set, given positionally or by name."""
+        if labelkwargs:
+            if labelvalues or sorted(labelkwargs) != sorted(self._labelnames):
+                raise ValueError(f"Incorrect label names for {self._name}")
+            labelvalues = tuple(labelkwargs[name] for name in self._labelnames)
+        if len(labelvalues) != len(self._labelnames):
+            raise ValueError(f"Incorrect label count for {self._name}")
+        
+        key = tuple(str(value) for value in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, _BatchedChild(self._bounds))
+        return child
+    
+    def _family(self) -> Any:
+        if self._bounds is None:
+            return SummaryMetricFamily(self._name, self._documentation, labels=self._labelnames)
+        return HistogramMetricFamily(self._name, self._documentation, labels=self._labelnames)
+    
+    def describe(self) -> List[Any]:
+        return [self._family()]
+    
+    def collect(self) -> List[Any]:
+        family = self._family()
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            total, count, counts = child.snapshot()
+            if counts is None:
+                family.add_metric(key, count, total)
+            else:
+                buckets, cumulative = [], 0
+                for bound, bucket_count in zip(self._bounds, counts):
+                    cumulative += bucket_count
+                    buckets.append((floatToGoString(bound), cumulative))
+                family.add_metric(key, buckets, total)
+        return [family]
+
+
+class _FlushOnCollect:
+    """Registry hook flushing batched counters before every scrape."""
+    
+    def __init__(self, collector: "MetricsCollector"):
+        self._collector = weakref.ref(collector)
+    
+    def describe(self) -> List[Any]:
+        return []
+    
+    def collect(self) -> List[Any]:
+        collector = self._collector()
+        if collector is not None:
+            collector.flush()
+        return []
+
+
+class _LatencyExport:
+    """Registry hook exporting the latency histograms at scrape time."""
+    
+    def __init__(self, collector: "MetricsCollector"):
+        self._collector = weakref.ref(collector)
+    
+    def describe(self) -> List[Any]:
+        return []
+    
+    def collect(self) -> List[Any]:
+        collector = self._collector()
+        if collector is None:
+            return []
+        
+        histograms = HistogramMetricFamily(
+            "tickdb_query_latency_seconds",
+            "Query latency per schema and query shape",
+            labels=["schema_id", "shape"]
+        )
+        quantiles = GaugeMetricFamily(
+            "tickdb_query_latency_quantile_seconds",
+            "Query latency quantiles per schema and query shape (shape=\"all\" across shapes)",
+            labels=["schema_id", "shape", "quantile"]
+        )
+        bounds_us = [bound * 1e6 for bound in LATENCY_BUCKETS]
+        
+        for schema_id, shapes in collector._latency_by_schema().items():
+            merged = LatencyHistogram()
+            for shape, histogram in shapes.items():
+                merged.merge(histogram)
+                counts = histogram.cumulative_counts(bounds_us)
+                histograms.add_metric(
+                    [schema_id, shape],
+                    [(repr(bound), count) for bound, count in zip(LATENCY_BUCKETS, counts)] + [("+Inf", histogram.count)],
+                    histogram.total_us / 1e6
+                )
+            for shape, histogram in [*shapes.items(), ("all", merged)]:
+                for quantile in LATENCY_QUANTILES:
+                    quantiles.add_metric([schema_id, shape, repr(quantile)], histogram.value_at_quantile(quantile) / 1e6)
+        return [histograms, quantiles]
+
 
 class MetricsCollector:
     """
@@ -30,26 +302,51 @@ class MetricsCollector:
     - Error rate monitoring
     - Throughput metrics
     - Query latency tracking
+    
+    Ingest, append and query counters are recorded on a fast path: label
+    children are bound once per label set, and each thread batches its
+    counter updates and duration observations, flushing them every
+    `flush_interval` seconds and before every scrape or summary.
     """
     
-    def __init__(self, port: int = 8000, enable_server: bool = False):
+    def __init__(
+        self,
+        port: int = 8000,
+        enable_server: bool = False,
+        registry: Optional[CollectorRegistry] = None,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS
+    ):
         """
         Initialize metrics collector.
         
         Args:
             port: Port for Prometheus metrics server
             enable_server: Whether to start the HTTP metrics server
+            registry: Prometheus registry (default: the global registry)
+            flush_interval: Seconds a thread batches counter updates
         """
         self.port = port
         self.enable_server = enable_server
+        self.registry = registry if registry is not None else REGISTRY
+        self.flush_interval = flush_interval
+        
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, ...], Any] = {}
+        self._buffers: List[_CounterBuffer] = []
+        self._local = threading.local()
+        self._latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+        
+        # Registered first so scrapes flush batched counters before reading them
+        self.registry.register(_FlushOnCollect(self))
         
         # Initialize Prometheus metrics
         self._init_prometheus_metrics()
+        self.registry.register(_LatencyExport(self))
         
         # Start metrics server only if enabled
         if enable_server:
             try:
-                start_http_server(port)
+                start_http_server(port, registry=self.registry)
                 logger.info(f"Prometheus metrics server started on port {port}")
             except Exception as e:
                 logger.warning(f"Failed to start metrics server: {e}")
@@ -69,100 +366,193 @@ class MetricsCollector:
         self.ingest_total = Counter(
             "tickdb_ingest_total",
             "Total number of ingest operations",
-            ["source_id", "schema_id", "status"]
+            ["source_id", "schema_id", "status"],
+            registry=self.registry
         )
         
         self.ingest_bytes_total = Counter(
             "tickdb_ingest_bytes_total",
             "Total bytes ingested",
-            ["source_id", "schema_id"]
+            ["source_id", "schema_id"],
+            registry=self.registry
         )
         
         self.ingest_rows_total = Counter(
             "tickdb_ingest_rows_total",
             "Total rows ingested",
-            ["source_id", "schema_id", "status"]
+            ["source_id", "schema_id", "status"],
+            registry=self.registry
         )
         
         self.query_total = Counter(
             "tickdb_query_total",
             "Total number of queries",
-            ["schema_id", "status"]
+            ["schema_id", "status"],
+            registry=self.registry
         )
         
         self.query_rows_total = Counter(
             "tickdb_query_rows_total",
             "Total rows returned by queries",
-            ["schema_id"]
+            ["schema_id"],
+            registry=self.registry
+        )
+        
+        self.admission_rejected_total = Counter(
+            "tickdb_admission_rejected_total",
+            "Queries rejected after waiting out their queue timeout",
+            ["priority"],
+            registry=self.registry
         )
         
         self.validation_errors_total = Counter(
             "tickdb_validation_errors_total",
             "Total validation errors",
-            ["schema_id", "error_type"]
+            ["schema_id", "error_type"],
+            registry=self.registry
         )
         
         # Gauges
         self.active_connections = Gauge(
             "tickdb_active_connections",
-            "Number of active database connections"
+            "Number of active database connections",
+            registry=self.registry
         )
         
         self.data_lake_size_bytes = Gauge(
             "tickdb_data_lake_size_bytes",
             "Total size of data lake in bytes",
-            ["schema_id"]
+            ["schema_id"],
+            registry=self.registry
         )
         
         self.data_lake_files = Gauge(
             "tickdb_data_lake_files",
             "Number of files in data lake",
-            ["schema_id"]
+            ["schema_id"],
+            registry=self.registry
+        )
+        
+        self.admission_queued = Gauge(
+            "tickdb_admission_queued",
+            "Queries waiting for an admission slot",
+            ["priority"],
+            registry=self.registry
+        )
+        
+        self.admission_running = Gauge(
+            "tickdb_admission_running",
+            "Queries holding an admission slot",
+            ["priority"],
+            registry=self.registry
         )
         
         self.quarantine_size_bytes = Gauge(
             "tickdb_quarantine_size_bytes",
-            "Total size of quarantine in bytes"
+            "Total size of quarantine in bytes",
+            registry=self.registry
         )
         
         self.quarantine_files = Gauge(
             "tickdb_quarantine_files",
-            "Number of files in quarantine"
+            "Number of files in quarantine",
+            registry=self.registry
         )
         
         # Histograms
-        self.ingest_duration_seconds = Histogram(
+        self.ingest_duration_seconds = _BatchedMetric(
             "tickdb_ingest_duration_seconds",
             "Time spent on ingest operations",
             ["source_id", "schema_id"],
-            buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0]
+            buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0],
+            registry=self.registry
         )
         
-        self.query_duration_seconds = Histogram(
+        self.ingest_stage_seconds = _BatchedMetric(
+            "tickdb_ingest_stage_seconds",
+            "Time spent per ingest stage (decompress, parse, validate.<rule>, sort, encode, fsync, ...)",
+            ["source_id", "schema_id", "stage"],
+            buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0],
+            registry=self.registry
+        )
+        
+        self.query_duration_seconds = _BatchedMetric(
             "tickdb_query_duration_seconds",
             "Time spent on query operations",
             ["schema_id"],
-            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0]
+            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
+            registry=self.registry
+        )
+        
+        self.query_stage_seconds = Histogram(
+            "tickdb_query_stage_seconds",
+            "Time spent per query stage (prune, scan, filter, sort, ...)",
+            ["schema_id", "stage"],
+            buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0],
+            registry=self.registry
+        )
+        
+        self.query_bytes_scanned = Histogram(
+            "tickdb_query_bytes_scanned",
+            "Compressed bytes read per query",
+            ["schema_id"],
+            buckets=[1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10],
+            registry=self.registry
+        )
+        
+        self.query_files_scanned = Histogram(
+            "tickdb_query_files_scanned",
+            "Files scanned per query after pruning",
+            ["schema_id"],
+            buckets=[0, 1, 2, 5, 10, 50, 100, 500, 1000],
+            registry=self.registry
+        )
+        
+        self.query_files_pruned_ratio = Histogram(
+            "tickdb_query_files_pruned_ratio",
+            "Fraction of candidate files pruned per query",
+            ["schema_id"],
+            buckets=[0.0, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0],
+            registry=self.registry
+        )
+        
+        self.query_row_groups_skipped_ratio = Histogram(
+            "tickdb_query_row_groups_skipped_ratio",
+            "Fraction of row groups in scanned files skipped per query",
+            ["schema_id"],
+            buckets=[0.0, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0],
+            registry=self.registry
+        )
+        
+        self.admission_wait_seconds = Histogram(
+            "tickdb_admission_wait_seconds",
+            "Time queries waited for an admission slot",
+            ["priority"],
+            buckets=[0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0],
+            registry=self.registry
         )
         
         self.validation_duration_seconds = Histogram(
             "tickdb_validation_duration_seconds",
             "Time spent on validation operations",
             ["schema_id"],
-            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0]
+            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0],
+            registry=self.registry
         )
         
         # Summaries
-        self.ingest_throughput_mbps = Summary(
+        self.ingest_throughput_mbps = _BatchedMetric(
             "tickdb_ingest_throughput_mbps",
             "Ingest throughput in MB/s",
-            ["source_id", "schema_id"]
+            ["source_id", "schema_id"],
+            registry=self.registry
         )
         
-        self.query_latency_ms = Summary(
+        self.query_latency_ms = _BatchedMetric(
             "tickdb_query_latency_ms",
             "Query latency in milliseconds",
-            ["schema_id"]
+            ["schema_id"],
+            registry=self.registry
         )
     
     def record_ingest(
@@ -172,7 +562,8 @@ class MetricsCollector:
         rows_processed: int,
         rows_failed: int,
         schema_id: str = "unknown",
-        duration_seconds: Optional[float] = None
+        duration_seconds: Optional[float] = None,
+        stages: Optional[Dict[str, float]] = None
     ) -> None:
         """
         Record ingest metrics.
@@ -184,85 +575,40 @@ class MetricsCollector:
             rows_failed: Number of rows that failed
             schema_id: Schema identifier
             duration_seconds: Duration of ingest operation
+            stages: Milliseconds spent per ingest stage
         """
-        # Update Prometheus metrics
-        self.ingest_total.labels(
-            source_id=source_id,
-            schema_id=schema_id,
-            status="success"
-        ).inc()
-        
-        if rows_failed > 0:
-            self.ingest_total.labels(
-                source_id=source_id,
-                schema_id=schema_id,
-                status="failed"
-            ).inc(rows_failed)
-        
-        self.ingest_bytes_total.labels(
-            source_id=source_id,
-            schema_id=schema_id
-        ).inc(bytes_processed)
-        
-        self.ingest_rows_total.labels(
-            source_id=source_id,
-            schema_id=schema_id,
-            status="success"
-        ).inc(rows_processed)
+        series = self._series.get(("ingest", source_id, schema_id))
+        if series is None:
+            series = self._bind(("ingest", source_id, schema_id), lambda: _IngestSeries(
+                self, source_id, schema_id, self._stats(f"ingest_{source_id}_{schema_id}", {
+                    "total_bytes": 0,
+                    "total_rows": 0,
+                    "failed_rows": 0,
+                    "total_duration": 0.0,
+                    "count": 0,
+                    "stage_time_ms": defaultdict(float)
+                })
+            ))
         
-        if rows_failed > 0:
-            self.ingest_rows_total.labels(
-                source_id=source_id,
-                schema_id=schema_id,
-                status="failed"
-            ).inc(rows_failed)
-        
-        if duration_seconds:
-            self.ingest_duration_seconds.labels(
-                source_id=source_id,
-                schema_id=schema_id
-            ).observe(duration_seconds)
-            
-            # Calculate throughput
-            throughput_mbps = (bytes_processed / (1024 * 1024)) / duration_seconds
-            self.ingest_throughput_mbps.labels(
-                source_id=source_id,
-                schema_id=schema_id
-            ).observe(throughput_mbps)
+        self._add_ingest(series, bytes_processed, rows_processed, rows_failed, duration_seconds, stages)
         
-        # Update in-memory metrics
-        key = f"ingest_{source_id}_{schema_id}"
-        if key not in self._metrics:
-            self._metrics[key] = {
-                "total_bytes": 0,
-                "total_rows": 0,
-                "failed_rows": 0,
-                "total_duration": 0.0,
-                "count": 0
-            }
-        
-        self._metrics[key]["total_bytes"] += bytes_processed
-        self._metrics[key]["total_rows"] += rows_processed
-        self._metrics[key]["failed_rows"] += rows_failed
-        if duration_seconds:
-            self._metrics[key]["total_duration"] += duration_seconds
-        self._metrics[key]["count"] += 1
-        
-        logger.debug("Recorded ingest metrics", extra={
-            "source_id": source_id,
-            "schema_id": schema_id,
-            "bytes_processed": bytes_processed,
-            "rows_processed": rows_processed,
-            "rows_failed": rows_failed,
-            "duration_seconds": duration_seconds
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recorded ingest metrics", extra={
+                "source_id": source_id,
+                "schema_id": schema_id,
+                "bytes_processed": bytes_processed,
+                "rows_processed": rows_processed,
+                "rows_failed": rows_failed,
+                "duration_seconds": duration_seconds
+            })
     
     def record_append(
         self,
         schema_id: str,
         rows_processed: int,
         rows_failed: int,
-        duration_seconds: Optional[float] = None
+        duration_seconds: Optional[float] = None,
+        stages: Optional[Dict[str, float]] = None
     ) -> None:
         """
         Record append metrics.
@@ -272,53 +618,63 @@ class MetricsCollector:
             rows_processed: Number of rows processed successfully
             rows_failed: Number of rows that failed
             duration_seconds: Duration of append operation
+            stages: Milliseconds spent per ingest stage
         """
-        # Update Prometheus metrics
-        self.ingest_total.labels(
-            source_id="append",
-            schema_id=schema_id,
-            status="success"
-        ).inc()
-        
-        if rows_failed > 0:
-            self.ingest_total.labels(
-                source_id="append",
-                schema_id=schema_id,
-                status="failed"
-            ).inc(rows_failed)
-        
-        self.ingest_rows_total.labels(
-            source_id="append",
-            schema_id=schema_id,
-            status="success"
-        ).inc(rows_processed)
-        
-        if rows_failed > 0:
-            self.ingest_rows_total.labels(
-                source_id="append",
-                schema_id=schema_id,
-                status="failed"
-            ).inc(rows_failed)
+        series = self._series.get(("append", schema_id))
+        if series is None:
+            series = self._bind(("append", schema_id), lambda: _IngestSeries(self, "append", schema_id, None))
         
-        if duration_seconds:
-            self.ingest_duration_seconds.labels(
-                source_id="append",
-                schema_id=schema_id
-            ).observe(duration_seconds)
+        self._add_ingest(series, 0, rows_processed, rows_failed, duration_seconds, stages)
         
-        logger.debug("Recorded append metrics", extra={
-            "schema_id": schema_id,
-            "rows_processed": rows_processed,
-            "rows_failed": rows_failed,
-            "duration_seconds": duration_seconds
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recorded append metrics", extra={
+                "schema_id": schema_id,
+                "rows_processed": rows_processed,
+                "rows_failed": rows_failed,
+                "duration_seconds": duration_seconds
+            })
+    
+    def _add_ingest(
+        self,
+        series: _IngestSeries,
+        bytes_processed: int,
+        rows_processed: int,
+        rows_failed: int,
+        duration_seconds: Optional[float],
+        stages: Optional[Dict[str, float]]
+    ) -> None:
+        """Batch the updates of one ingest in this thread's buffer."""
+        buffer = self._buffer()
+        with buffer.lock:
+            if duration_seconds:
+                buffer.observe(series.duration, duration_seconds)
+                if series.bytes is not None:
+                    # Calculate throughput
+                    buffer.observe(series.throughput, (bytes_processed / (1024 * 1024)) / duration_seconds)
+            if stages:
+                for stage, time_ms in stages.items():
+                    buffer.observe(series.stage(stage), time_ms / 1000.0)
+            
+            pending = buffer.pending.get(series)
+            if pending is None:
+                pending = buffer.pending[series] = [0, 0, 0, 0, 0.0, defaultdict(float)]
+            pending[0] += 1
+            pending[1] += bytes_processed
+            pending[2] += rows_processed
+            pending[3] += rows_failed
+            pending[4] += duration_seconds or 0.0
+            if stages:
+                for stage, time_ms in stages.items():
+                    pending[5][stage] += time_ms
+        self._maybe_flush(buffer)
     
     def record_query(
         self,
         query_time_ms: float,
         rows_returned: int,
         schema_id: str = "unknown",
-        status: str = "success"
+        status: str = "success",
+        shape: str = "read"
     ) -> None:
         """
         Record query metrics.
@@ -328,49 +684,112 @@ class MetricsCollector:
             rows_returned: Number of rows returned
             schema_id: Schema identifier
             status: Query status (success/failed)
+            shape: Query shape (see `latency.query_shape`); successful
+                queries feed the latency histogram of their schema and shape
         """
-        # Update Prometheus metrics
-        self.query_total.labels(
-            schema_id=schema_id,
-            status=status
-        ).inc()
+        series = self._series.get(("query", schema_id, status))
+        if series is None:
+            series = self._bind(("query", schema_id, status), lambda: _QuerySeries(
+                self, schema_id, status, self._stats(f"query_{schema_id}", {
+                    "total_queries": 0,
+                    "total_rows": 0,
+                    "total_time_ms": 0.0,
+                    "avg_latency_ms": 0.0
+                })
+            ))
         
-        if status == "success":
-            self.query_rows_total.labels(
-                schema_id=schema_id
-            ).inc(rows_returned)
+        buffer = self._buffer()
+        with buffer.lock:
+            buffer.observe(series.duration, query_time_ms / 1000.0)
+            buffer.observe(series.latency, query_time_ms)
+            if status == "success":
+                latencies = buffer.latencies.get((schema_id, shape))
+                if latencies is None:
+                    latencies = buffer.latencies[(schema_id, shape)] = []
+                latencies.append(query_time_ms)
+            pending = buffer.pending.get(series)
+            if pending is None:
+                pending = buffer.pending[series] = [0, 0, 0.0]
+            pending[0] += 1
+            pending[1] += rows_returned
+            pending[2] += query_time_ms
+        self._maybe_flush(buffer)
         
-        self.query_duration_seconds.labels(
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recorded query metrics", extra={
+                "schema_id": schema_id,
+                "query_time_ms": query_time_ms,
+                "rows_returned": rows_returned,
+                "status": status
+            })
+    
+    def record_query_profile(
+        self,
+        profile: Any,
+        schema_id: str = "unknown"
+    ) -> None:
+        """
+        Record the profile of a query.
+        
+        Args:
+            profile: QueryProfile of the query
+            schema_id: Schema identifier
+        """
+        for stage, time_ms in profile.stages.items():
+            self.query_stage_seconds.labels(
+                schema_id=schema_id,
+                stage=stage
+            ).observe(time_ms / 1000.0)
+        
+        self.query_bytes_scanned.labels(
             schema_id=schema_id
-        ).observe(query_time_ms / 1000.0)
+        ).observe(profile.bytes_scanned)
         
-        self.query_latency_ms.labels(
+        self.query_files_scanned.labels(
             schema_id=schema_id
-        ).observe(query_time_ms)
+        ).observe(profile.files_scanned)
         
-        # Update in-memory metrics
-        key = f"query_{schema_id}"
-        if key not in self._metrics:
-            self._metrics[key] = {
-                "total_queries": 0,
-                "total_rows": 0,
-                "total_time_ms": 0.0,
-                "avg_latency_ms": 0.0
-            }
+        if profile.files_considered:
+            self.query_files_pruned_ratio.labels(
+                schema_id=schema_id
+            ).observe(profile.files_pruned / profile.files_considered)
         
-        self._metrics[key]["total_queries"] += 1
-        self._metrics[key]["total_rows"] += rows_returned
-        self._metrics[key]["total_time_ms"] += query_time_ms
-        self._metrics[key]["avg_latency_ms"] = (
-            self._metrics[key]["total_time_ms"] / self._metrics[key]["total_queries"]
-        )
+        if profile.row_groups_total:
+            self.query_row_groups_skipped_ratio.labels(
+                schema_id=schema_id
+            ).observe(profile.row_groups_skipped / profile.row_groups_total)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recorded query profile", extra={
+                "schema_id": schema_id,
+                "files_scanned": profile.files_scanned,
+                "files_pruned": profile.files_pruned,
+                "row_groups_skipped": profile.row_groups_skipped,
+                "bytes_scanned": profile.bytes_scanned
+            })
+    
+    def record_admission(
+        self,
+        priority: str,
+        wait_ms: float,
+        admitted: bool = True
+    ) -> None:
+        """
+        Record the queue wait of a query at admission.
         
-        logger.debug("Recorded query metrics", extra={
-            "schema_id": schema_id,
-            "query_time_ms": query_time_ms,
-            "rows_returned": rows_returned,
-            "status": status
-        })
+        Args:
+            priority: Priority class
+            wait_ms: Time spent waiting for a slot
+            admitted: Whether the query got a slot (False when rejected)
+        """
+        self.admission_wait_seconds.labels(priority=priority).observe(wait_ms / 1000.0)
+        if not admitted:
+            self.admission_rejected_total.labels(priority=priority).inc()
+    
+    def set_admission_state(self, priority: str, queued: int, running: int) -> None:
+        """Set the queue depth and running count of a priority class."""
+        self.admission_queued.labels(priority=priority).set(queued)
+        self.admission_running.labels(priority=priority).set(running)
     
     def record_validation(
         self,
@@ -420,13 +839,14 @@ class MetricsCollector:
             for error_type in error_types:
                 self._metrics[key]["error_types"][error_type] += 1
         
-        logger.debug("Recorded validation metrics", extra={
-            "schema_id": schema_id,
-            "rows_checked": rows_checked,
-            "rows_failed": rows_failed,
-            "validation_time_ms": validation_time_ms,
-            "error_types": error_types
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recorded validation metrics", extra={
+                "schema_id": schema_id,
+                "rows_checked": rows_checked,
+                "rows_failed": rows_failed,
+                "validation_time_ms": validation_time_ms,
+                "error_types": error_types
+            })
     
     def update_data_lake_metrics(
         self,
@@ -450,11 +870,12 @@ class MetricsCollector:
             schema_id=schema_id
         ).set(file_count)
         
-        logger.debug("Updated data lake metrics", extra={
-            "schema_id": schema_id,
-            "total_size_bytes": total_size_bytes,
-            "file_count": file_count
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated data lake metrics", extra={
+                "schema_id": schema_id,
+                "total_size_bytes": total_size_bytes,
+                "file_count": file_count
+            })
     
     def update_quarantine_metrics(
         self,
@@ -471,24 +892,116 @@ class MetricsCollector:
         self.quarantine_size_bytes.set(total_size_bytes)
         self.quarantine_files.set(file_count)
         
-        logger.debug("Updated quarantine metrics", extra={
-            "total_size_bytes": total_size_bytes,
-            "file_count": file_count
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated quarantine metrics", extra={
+                "total_size_bytes": total_size_bytes,
+                "file_count": file_count
+            })
     
     def set_active_connections(self, count: int) -> None:
         """Set number of active connections."""
         self.active_connections.set(count)
     
+    def _bind(self, key: Tuple[str, ...], factory: Any) -> Any:
+        """Bind the label children of a series once, on first use."""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = factory()
+            return series
+    
+    def _stats(self, key: str, initial: Dict[str, Any]) -> Dict[str, Any]:
+        """In-memory totals under `key`, created with `initial` values."""
+        return self._metrics.setdefault(key, initial)
+    
+    def _buffer(self) -> _CounterBuffer:
+        """Counter buffer of the calling thread."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = _CounterBuffer()
+            with self._lock:
+                self._buffers.append(buffer)
+        return buffer
+    
+    def _maybe_flush(self, buffer: _CounterBuffer) -> None:
+        """Flush a buffer once its flush interval has passed."""
+        if time.monotonic() - buffer.last_flush >= self.flush_interval:
+            self._flush_buffer(buffer)
+    
+    def _flush_buffer(self, buffer: _CounterBuffer) -> None:
+        """Apply a buffer's pending updates to the metrics."""
+        with buffer.lock:
+            pending, buffer.pending = buffer.pending, {}
+            observed, buffer.observed = buffer.observed, {}
+            latencies, buffer.latencies = buffer.latencies, {}
+            buffer.last_flush = time.monotonic()
+        if pending or observed or latencies:
+            with self._lock:
+                for series, values in pending.items():
+                    series.flush(values)
+                for child, values in observed.items():
+                    child.add(*values)
+                for key, values in latencies.items():
+                    histogram = self._latency.get(key)
+                    if histogram is None:
+                        histogram = self._latency[key] = LatencyHistogram()
+                    histogram.record_many_ms(values)
+    
+    def flush(self) -> None:
+        """Apply the batched counter updates of every thread."""
+        with self._lock:
+            buffers = list(self._buffers)
+        for buffer in buffers:
+            self._flush_buffer(buffer)
+        
+        # Forget buffers of finished threads
+        with self._lock:
+            self._buffers = [
+                buffer for buffer in self._buffers
+                if buffer.pending or buffer.observed or buffer.latencies or (buffer.thread() is not None and buffer.thread().is_alive())
+            ]
+    
+    def _latency_by_schema(self) -> Dict[str, Dict[str, LatencyHistogram]]:
+        """Copies of the latency histograms, by schema and shape."""
+        by_schema: Dict[str, Dict[str, LatencyHistogram]] = defaultdict(dict)
+        with self._lock:
+            for (schema_id, shape), histogram in self._latency.items():
+                copy = LatencyHistogram(histogram.precision_bits)
+                copy.merge(histogram)
+                by_schema[schema_id][shape] = copy
+        return by_schema
+    
+    def get_latency(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Query latency per schema, overall and per query shape.
+        
+        Returns:
+            {schema_id: {"all": summary, "shapes": {shape: summary}}}, each
+            summary holding count, min/mean/max and p50/p99/p99.9 in ms
+        """
+        self.flush()
+        latency = {}
+        for schema_id, shapes in sorted(self._latency_by_schema().items()):
+            merged = LatencyHistogram()
+            for histogram in shapes.values():
+                merged.merge(histogram)
+            latency[schema_id] = {
+                "all": merged.summary(),
+                "shapes": {shape: histogram.summary() for shape, histogram in sorted(shapes.items())}
+            }
+        return latency
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics summary."""
+        self.flush()
         uptime = datetime.now() - self._start_time
         
         summary = {
             "uptime_seconds": uptime.total_seconds(),
             "start_time": self._start_time.isoformat(),
             "prometheus_endpoint": f"http://localhost:{self.port}/metrics",
-            "metrics": dict(self._metrics)
+            "metrics": dict(self._metrics),
+            "latency": self.get_latency()
         }
         
         # Calculate aggregate statistics
@@ -520,10 +1033,14 @@ class MetricsCollector:
     
     def get_prometheus_metrics(self) -> str:
         """Get Prometheus metrics as string."""
-        return generate_latest().decode("utf-8")
+        return generate_latest(self.registry).decode("utf-8")
     
     def reset_metrics(self) -> None:
         """Reset all metrics."""
+        self.flush()
+        with self._lock:
+            self._series.clear()
+            self._latency.clear()
         self._metrics.clear()
         self._start_time = datetime.now()
         logger.info("Metrics reset") 
\ No newline at end of file
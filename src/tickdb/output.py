@@ -0,0 +1,90 @@
+"""
+Output adapters converting Arrow query results without copying.
+"""
+
+import logging
+from typing import Any, Dict, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# Polars is optional
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+logger = logging.getLogger(__name__)
+
+# Supported output formats
+OUTPUT_FORMATS = ("arrow", "pandas", "polars", "numpy")
+
+
+def num_rows(table: Union[pa.Table, ds.Dataset]) -> int:
+    """Rows of a query result; a Dataset's are counted from its file metadata."""
+    return table.count_rows() if isinstance(table, ds.Dataset) else len(table)
+
+
+def convert(table: Union[pa.Table, ds.Dataset], output: str = "arrow") -> Any:
+    """
+    Convert a query result to the requested output format.
+    
+    Args:
+        table: Arrow Table, or a Dataset over a Parquet destination (only
+            read into memory for non-Arrow outputs)
+        output: "arrow", "pandas", "polars" or "numpy"
+        
+    Returns:
+        The table, an Arrow-backed DataFrame, a polars DataFrame, or a dict of
+        NumPy arrays by column
+    """
+    if output == "arrow":
+        return table
+    if isinstance(table, ds.Dataset) and output in OUTPUT_FORMATS:
+        table = table.to_table()
+    if output == "pandas":
+        return to_pandas(table)
+    if output == "polars":
+        return to_polars(table)
+    if output == "numpy":
+        return to_numpy(table)
+    raise ValueError(f"Unsupported output format '{output}' (expected one of {', '.join(OUTPUT_FORMATS)})")
+
+
+def to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    DataFrame with Arrow-backed (``pd.ArrowDtype``) columns.
+    
+    The columns wrap the table's buffers instead of converting them to NumPy
+    (or, for strings, Python objects), so no data is copied.
+    """
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def to_polars(table: pa.Table) -> Any:
+    """polars DataFrame sharing the table's buffers."""
+    if not HAS_POLARS:
+        raise ImportError("polars output requires the 'polars' package (pip install tickdb[polars])")
+    return pl.from_arrow(table, rechunk=False)
+
+
+def to_numpy(table: pa.Table) -> Dict[str, np.ndarray]:
+    """
+    NumPy arrays by column.
+    
+    Fixed-width columns without nulls held in one chunk become read-only views
+    of the Arrow buffers; multi-chunk columns are concatenated once, and
+    columns with nulls or variable-width values are converted with a copy.
+    """
+    arrays = {}
+    for name, column in zip(table.column_names, table.columns):
+        fixed_width = pa.types.is_primitive(column.type) and not pa.types.is_boolean(column.type)
+        if fixed_width and column.null_count == 0:
+            chunk = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+            arrays[name] = chunk.to_numpy(zero_copy_only=True)
+        else:
+            arrays[name] = column.to_numpy()
+    return arrays
@@ -0,0 +1,198 @@
+"""
+Keyset pagination with opaque resume tokens.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+from pydantic import BaseModel, ValidationError
+
+from .profiling import QueryProfile
+
+logger = logging.getLogger(__name__)
+
+# Cursor format version; tokens of another version are rejected
+CURSOR_VERSION = 1
+
+# Sort key of paged reads: ts, then symbol, then position in the lake
+# (file, row within the file) to break ties between identical ticks
+PAGE_ORDER = "ts, symbol, filename, file_row_number"
+
+# Key columns selected alongside the requested fields, stripped before return
+PAGE_KEY_COLUMNS = {
+    "__page_ts": "epoch_ns(ts)",
+    "__page_symbol": "symbol",
+    "__page_file": "filename",
+    "__page_row": "file_row_number",
+}
+
+
+class PageKey(BaseModel):
+    """Sort key of the last row of a page."""
+    
+    ts: int
+    symbol: str
+    file: str
+    row: int
+    
+    @property
+    def ts_start(self) -> str:
+        """The key's timestamp as a ts_start filter (nanosecond precision)."""
+        return str(pd.Timestamp(self.ts))
+
+
+class Page(BaseModel):
+    """One page of a paginated read."""
+    
+    model_config = {"arbitrary_types_allowed": True}
+    
+    # Rows of the page (in the requested output format)
+    table: Any
+    # Token resuming after the last row, None on the last page
+    cursor: Optional[str] = None
+    rows_returned: int = 0
+    query_time_ms: float = 0.0
+    profile: Optional[QueryProfile] = None
+
+
+def query_fingerprint(query_params: Dict[str, Any]) -> str:
+    """
+    Short hash of the filters and projection of a query.
+    
+    Cursors carry it so a token cannot resume a different query. Unset
+    (None) parameters are ignored, as they are in the slow-query log, so a
+    logged page's cursor still resumes it on replay.
+    """
+    params = {key: value for key, value in query_params.items() if value is not None}
+    canonical = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
+
+
+def encode_cursor(key: PageKey, fingerprint: str) -> str:
+    """Encode a page key as an opaque, URL-safe token."""
+    payload = {"v": CURSOR_VERSION, "q": fingerprint, **key.model_dump()}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, fingerprint: str) -> PageKey:
+    """
+    Decode a resume token.
+    
+    Args:
+        token: Token returned with the previous page
+        fingerprint: Fingerprint of the query being resumed
+        
+    Returns:
+        Key of the last row already returned
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        if payload.pop("v") != CURSOR_VERSION:
+            raise ValueError("unsupported version")
+        token_fingerprint = payload.pop("q")
+        key = PageKey(**payload)
+    except (ValueError, KeyError, TypeError, ValidationError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    
+    if token_fingerprint != fingerprint:
+        raise ValueError("Cursor belongs to a different query")
+    return key
+
+
+def keyset_condition(key: PageKey, schema_path: Path) -> str:
+    """
+    SQL predicate selecting rows sorted strictly after a page key.
+    
+    The caller also filters ``ts >= key.ts_start``, which reaches the Parquet
+    scan; this predicate only breaks ties among rows at that timestamp.
+    """
+    file_path = str(schema_path / key.file).replace("'", "''")
+    symbol = key.symbol.replace("'", "''")
+    return (
+        f"(epoch_ns(ts) > {key.ts} OR (epoch_ns(ts) = {key.ts} AND "
+        f"(symbol > '{symbol}' OR (symbol = '{symbol}' AND "
+        f"(filename > '{file_path}' OR (filename = '{file_path}' AND "
+        f"file_row_number > {key.row}))))))"
+    )
+
+
+def split_page(
+    table: pa.Table,
+    page_size: int,
+    fingerprint: str
+) -> Tuple[pa.Table, Optional[str]]:
+    """
+    Split a page from a result fetched with one row of lookahead.
+    
+    Args:
+        table: Up to page_size + 1 rows including the key columns
+        page_size: Rows per page
+        fingerprint: Fingerprint of the query
+        
+    Returns:
+        (page without key columns, cursor or None when no rows follow)
+    """
+    cursor = None
+    if len(table) > page_size:
+        table = table.slice(0, page_size)
+        last = {name: table.column(name)[-1].as_py() for name in PAGE_KEY_COLUMNS}
+        key = PageKey(
+            ts=last["__page_ts"],
+            symbol=last["__page_symbol"],
+            file=Path(last["__page_file"]).name,
+            row=last["__page_row"]
+        )
+        cursor = encode_cursor(key, fingerprint)
+    
+    keep = [name for name in table.column_names if name not in PAGE_KEY_COLUMNS]
+    return table.select(keep), cursor
+
+
+def page_windows(
+    files: List[Tuple[Path, Optional[pd.Timestamp], int]],
+    page_size: int,
+    after: Optional[PageKey] = None
+) -> Iterator[Tuple[List[Path], Optional[pd.Timestamp]]]:
+    """
+    Growing sets of files to read a page from, earliest first.
+    
+    Files are ordered by their first timestamp. Every file outside a window
+    starts at or after the window's bound, so the window's rows before the
+    bound are all rows of the lake before it: a page read under the bound is
+    exact once it fills. Otherwise the next window, twice as many files, is
+    tried, ending with every file and no bound. Reading a page from the
+    first few files avoids sorting the whole remaining lake.
+    
+    Args:
+        files: (path, first timestamp or None when unknown, row count)
+        page_size: Rows per page
+        after: Key the page starts after
+        
+    Yields:
+        (files of the window, exclusive ts bound or None for the last window)
+    """
+    ordered = sorted(files, key=lambda f: pd.Timestamp.min if f[1] is None else f[1])
+    after_ts = pd.Timestamp(after.ts) if after is not None else None
+    
+    # The first window holds at least a page and its lookahead row, and
+    # reaches past the cursor
+    count = rows = 0
+    while count < len(ordered) and (
+        rows <= page_size
+        or (after_ts is not None and ordered[count][1] is not None and ordered[count][1] <= after_ts)
+    ):
+        rows += ordered[count][2]
+        count += 1
+    
+    while count < len(ordered):
+        yield [f[0] for f in ordered[:count]], ordered[count][1]
+        count *= 2
+    yield [f[0] for f in ordered], None
@@ -0,0 +1,206 @@
+"""
+Parallel partition-split scans across worker processes.
+"""
+
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import duckdb
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from .config import TickDBConfig
+from .replay import merge_streams
+
+logger = logging.getLogger(__name__)
+
+# Work units handed out per worker, so uneven files still balance
+UNITS_PER_WORKER = 4
+
+
+def split_units(files: List[Path], workers: int) -> List[List[Path]]:
+    """
+    Split a pruned file set into contiguous work units.
+    
+    Files are listed in name (and so write-time) order; keeping units
+    contiguous keeps each unit's time range narrow.
+    
+    Args:
+        files: Files to scan
+        workers: Number of worker processes
+        
+    Returns:
+        List of non-empty work units
+    """
+    n_units = min(len(files), max(1, workers * UNITS_PER_WORKER))
+    if n_units == 0:
+        return []
+    
+    size, extra = divmod(len(files), n_units)
+    units = []
+    offset = 0
+    for i in range(n_units):
+        count = size + (1 if i < extra else 0)
+        units.append(files[offset:offset + count])
+        offset += count
+    return units
+
+
+def _scan_unit(
+    files: List[str],
+    select_list: str,
+    where_clause: str,
+    ordered: bool,
+    output_dir: str
+) -> str:
+    """
+    Scan one work unit in a worker process into an Arrow IPC file.
+    
+    Returns:
+        Path of the IPC file
+    """
+    con = duckdb.connect(":memory:")
+    try:
+        # Parallelism comes from the pool; one thread per worker avoids oversubscription
+        con.execute("SET threads = 1")
+        file_list = ", ".join("'{}'".format(f.replace("'", "''")) for f in files)
+        order_clause = "ORDER BY ts" if ordered else ""
+        reader = con.execute(f"""
+        SELECT {select_list}
+        FROM read_parquet([{file_list}], union_by_name = true)
+        {where_clause}
+        {order_clause}
+        """).fetch_record_batch()
+        
+        output_path = Path(output_dir) / f"{uuid.uuid4().hex}.arrow"
+        with ipc.new_file(output_path, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+    finally:
+        con.close()
+    
+    return str(output_path)
+
+
+class ParallelScanner:
+    """
+    Process-pool scanner for large range reads.
+    
+    The pruned file set is split into work units that worker processes scan
+    with their own DuckDB connections. Each worker writes its result as an
+    Arrow IPC file (under /dev/shm when available), which the parent
+    memory-maps, so results are never pickled or copied back. With global
+    ordering the per-unit sorted results are k-way merged by ts.
+    """
+    
+    def __init__(self, config: TickDBConfig):
+        """
+        Initialize parallel scanner.
+        
+        Args:
+            config: TickDB configuration
+        """
+        self.config = config
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._workers = 0
+    
+    def scan(
+        self,
+        files: List[Path],
+        select_list: str,
+        where_clause: str,
+        ordered: bool = True,
+        workers: Optional[int] = None
+    ) -> pa.Table:
+        """
+        Scan files in parallel.
+        
+        Args:
+            files: Pruned files to scan
+            select_list: SQL select list
+            where_clause: SQL WHERE clause (may be empty)
+            ordered: Return rows in global ts order; when False, units are
+                concatenated in completion order
+            workers: Worker processes (defaults to config.scan_workers)
+            
+        Returns:
+            Arrow Table; unordered results are backed by the memory-mapped
+            worker output directly
+        """
+        workers = workers or self.config.scan_workers or os.cpu_count() or 1
+        units = split_units(files, workers)
+        pool = self._get_pool(workers)
+        
+        output_dir = tempfile.mkdtemp(prefix="tickdb-scan-", dir=_shared_memory_dir())
+        try:
+            futures = {
+                pool.submit(
+                    _scan_unit, [str(f) for f in unit], select_list, where_clause, ordered, output_dir
+                ): i
+                for i, unit in enumerate(units)
+            }
+            
+            results = {}
+            for future in as_completed(futures):
+                results[futures[future]] = map_ipc(future.result())
+            
+            logger.debug("Parallel scan completed", extra={
+                "files": len(files),
+                "units": len(units),
+                "workers": workers,
+                "ordered": ordered
+            })
+            
+            tables = [results[i] for i in sorted(results)] if ordered else list(results.values())
+            non_empty = [t for t in tables if len(t)] or tables[:1]
+            if ordered and len(non_empty) > 1:
+                chunk = self.config.batch_size
+                streams = [_chunks(t, chunk) for t in non_empty]
+                batches = list(merge_streams(streams, batch_size=chunk))
+                return pa.Table.from_batches(batches, schema=non_empty[0].schema)
+            return pa.concat_tables(non_empty, promote_options="default")
+        finally:
+            # Mapped files stay readable after unlinking
+            shutil.rmtree(output_dir, ignore_errors=True)
+    
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Get (or resize) the worker pool, kept alive across scans."""
+        if self._pool is None or self._workers != workers:
+            self.close()
+            # Forking a process that holds DuckDB threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            self._workers = workers
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self._workers = 0
+
+
+def _chunks(table: pa.Table, size: int) -> Iterator[pa.Table]:
+    """Zero-copy slices of a table."""
+    for offset in range(0, len(table), size):
+        yield table.slice(offset, size)
+
+
+def map_ipc(path: str) -> pa.Table:
+    """Read an Arrow IPC file zero-copy through a memory map."""
+    return ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def _shared_memory_dir() -> Optional[str]:
+    """RAM-backed directory for worker output, if the platform has one."""
+    return "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
@@ -0,0 +1,174 @@
+"""
+Query profiling: DuckDB operator timings mapped onto the data lake model.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import duckdb
+import pyarrow as pa
+from pydantic import BaseModel
+
+from .footers import footer_cache, row_group_overlaps, to_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Stage each DuckDB operator type is reported under
+OPERATOR_STAGES = {
+    "TABLE_SCAN": "scan",
+    "FILTER": "filter",
+    "PROJECTION": "project",
+    "ORDER_BY": "sort",
+    "TOP_N": "sort",
+    "LIMIT": "limit",
+    "STREAMING_LIMIT": "limit",
+    "HASH_GROUP_BY": "aggregate",
+    "PERFECT_HASH_GROUP_BY": "aggregate",
+    "UNGROUPED_AGGREGATE": "aggregate",
+    "WINDOW": "aggregate",
+    "STREAMING_WINDOW": "aggregate",
+    "HASH_JOIN": "join",
+    "ASOF_JOIN": "join",
+    "IE_JOIN": "join",
+    "PIECEWISE_MERGE_JOIN": "join",
+    "NESTED_LOOP_JOIN": "join",
+}
+
+
+class OperatorProfile(BaseModel):
+    """Timing and cardinality of one physical operator."""
+    
+    name: str
+    operator_type: str
+    time_ms: float = 0.0
+    rows: int = 0
+    rows_scanned: int = 0
+
+
+class QueryProfile(BaseModel):
+    """Where a query spent its time and how much data it touched."""
+    
+    sql: str = ""
+    files_considered: int = 0
+    files_pruned: int = 0
+    files_scanned: int = 0
+    row_groups_total: int = 0
+    row_groups_skipped: int = 0
+    bytes_scanned: int = 0
+    rows_scanned: int = 0
+    rows_returned: int = 0
+    total_time_ms: float = 0.0
+    stages: Dict[str, float] = {}
+    operators: List[OperatorProfile] = []
+
+
+def execute_profiled(con: duckdb.DuckDBPyConnection, query: str) -> Tuple[pa.Table, Dict[str, Any]]:
+    """
+    Execute a query with DuckDB's JSON profiler enabled.
+    
+    Profiling settings are per connection, so the query runs on a cursor and
+    does not affect other users of `con`.
+    
+    Returns:
+        Query result and the raw profile tree
+    """
+    fd, profile_path = tempfile.mkstemp(prefix="tickdb-profile-", suffix=".json")
+    os.close(fd)
+    cursor = con.cursor()
+    try:
+        cursor.execute("PRAGMA enable_profiling = 'json'")
+        cursor.execute(f"PRAGMA profiling_output = '{profile_path}'")
+        table = cursor.execute(query).arrow()
+        cursor.execute("PRAGMA disable_profiling")
+        with open(profile_path) as f:
+            profile = json.load(f)
+    finally:
+        cursor.close()
+        os.unlink(profile_path)
+    
+    return table, profile
+
+
+def parse_profile(profile: Dict[str, Any]) -> Tuple[List[OperatorProfile], Dict[str, float], int]:
+    """
+    Flatten a DuckDB profile tree.
+    
+    Returns:
+        Operators (pre-order), milliseconds per stage, and rows scanned
+    """
+    operators = []
+    stages: Dict[str, float] = {}
+    
+    def visit(node: Dict[str, Any]) -> None:
+        if "operator_type" in node:
+            operator = OperatorProfile(
+                name=node.get("operator_name", "").strip(),
+                operator_type=node["operator_type"],
+                time_ms=node.get("operator_timing", 0.0) * 1000,
+                rows=node.get("operator_cardinality", 0),
+                rows_scanned=node.get("operator_rows_scanned", 0)
+            )
+            operators.append(operator)
+            stage = OPERATOR_STAGES.get(operator.operator_type, "other")
+            stages[stage] = stages.get(stage, 0.0) + operator.time_ms
+        for child in node.get("children", []):
+            visit(child)
+    
+    visit(profile)
+    return operators, stages, profile.get("cumulative_rows_scanned", 0)
+
+
+def scan_footprint(
+    files: List[Path],
+    columns: Optional[List[str]] = None,
+    symbols: Optional[List[str]] = None,
+    ts_start: Optional[Union[str, datetime]] = None,
+    ts_end: Optional[Union[str, datetime]] = None
+) -> Dict[str, int]:
+    """
+    Estimate the row groups and bytes a scan reads from footer metadata.
+    
+    Row groups are skipped with the same min/max test DuckDB applies to the
+    pushed-down filters; bytes are the compressed sizes of the projected and
+    filtered columns in the remaining row groups.
+    
+    Args:
+        files: Files the query scans
+        columns: Projected columns (None for all)
+        symbols: Symbol filter
+        ts_start: Start timestamp (inclusive)
+        ts_end: End timestamp (inclusive)
+        
+    Returns:
+        Dictionary with row_groups_total, row_groups_skipped and bytes_scanned
+    """
+    start = to_timestamp(ts_start)
+    end = to_timestamp(ts_end)
+    wanted = None
+    if columns:
+        wanted = set(columns) | {"ts"} | ({"symbol"} if symbols else set())
+    
+    footprint = {"row_groups_total": 0, "row_groups_skipped": 0, "bytes_scanned": 0}
+    for metadata in footer_cache.get_many(files).values():
+        if metadata is None:
+            continue
+        
+        index = {metadata.schema.column(i).name: i for i in range(metadata.num_columns)}
+        read_columns = [i for name, i in index.items() if wanted is None or name in wanted]
+        
+        for rg in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg)
+            footprint["row_groups_total"] += 1
+            if not row_group_overlaps(row_group, index, symbols, start, end):
+                footprint["row_groups_skipped"] += 1
+                continue
+            footprint["bytes_scanned"] += sum(
+                row_group.column(i).total_compressed_size for i in read_columns
+            )
+    
+    return footprint
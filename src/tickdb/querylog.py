@@ -0,0 +1,242 @@
+"""
+Slow-query log with capture and replay.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .config import TickDBConfig
+
+logger = logging.getLogger(__name__)
+
+# Columns of a slow-query log part file
+LOG_SCHEMA = pa.schema([
+    ("logged_at", pa.timestamp("us")),
+    ("schema_id", pa.string()),
+    ("fingerprint", pa.string()),
+    ("params", pa.string()),
+    ("latency_ms", pa.float64()),
+    ("rows_returned", pa.int64()),
+    ("files_scanned", pa.int64()),
+    ("bytes_scanned", pa.int64()),
+    ("profile", pa.string()),
+])
+
+# Percentiles reported by replay
+REPLAY_PERCENTILES = (50, 95, 99)
+
+
+def normalize_params(query_params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize query parameters for logging and replay.
+    
+    Unset parameters are dropped and values made JSON-serializable, so equal
+    queries log identically and every entry can be passed back to `query`.
+    """
+    normalized = {}
+    for key in sorted(query_params):
+        value = query_params[key]
+        if value is None or key == "profile":
+            continue
+        if isinstance(value, (list, tuple)):
+            value = [v if isinstance(v, (int, float, bool)) else str(v) for v in value]
+        elif not isinstance(value, (int, float, bool)):
+            value = str(value)
+        normalized[key] = value
+    return normalized
+
+
+def fingerprint(params: Dict[str, Any]) -> str:
+    """Hash of a query's shape: its parameter names and projection, not its values."""
+    shape = {key: (value if key in ("schema_id", "fields", "order_by") else "?") for key, value in params.items()}
+    return hashlib.sha1(json.dumps(shape, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class SlowQueryLog:
+    """
+    Append-only Parquet log of queries slower than a threshold.
+    
+    Every slow query is written as its own small part file under
+    ``config.slow_query_log_path``, so concurrent writers never contend and
+    a crash loses at most the entry being written. The directory reads back
+    as one table with `read`.
+    """
+    
+    def __init__(self, config: TickDBConfig):
+        """
+        Initialize slow-query log.
+        
+        Args:
+            config: TickDB configuration
+        """
+        self.config = config
+        self.path = config.slow_query_log_path
+        self.threshold_ms = config.slow_query_threshold_ms
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether slow queries are being captured."""
+        return self.path is not None
+    
+    def record(
+        self,
+        query_params: Dict[str, Any],
+        latency_ms: float,
+        rows_returned: int,
+        files_scanned: int = 0,
+        bytes_scanned: int = 0,
+        profile: Optional[Any] = None
+    ) -> bool:
+        """
+        Log a query if it missed the latency threshold.
+        
+        Args:
+            query_params: Query parameters as passed to the reader
+            latency_ms: End-to-end query latency
+            rows_returned: Rows returned
+            files_scanned: Files scanned after pruning
+            bytes_scanned: Bytes scanned
+            profile: QueryProfile, when the query was profiled
+            
+        Returns:
+            Whether the query was logged
+        """
+        if not self.enabled or latency_ms < self.threshold_ms:
+            return False
+        
+        params = normalize_params(query_params)
+        entry = {
+            "logged_at": [datetime.now()],
+            "schema_id": [params.get("schema_id", "ticks_v1")],
+            "fingerprint": [fingerprint(params)],
+            "params": [json.dumps(params)],
+            "latency_ms": [latency_ms],
+            "rows_returned": [rows_returned],
+            "files_scanned": [files_scanned],
+            "bytes_scanned": [bytes_scanned],
+            "profile": [profile.model_dump_json(exclude={"sql"}) if profile is not None else None],
+        }
+        
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            file_name = f"slow_{datetime.now():%Y%m%d_%H%M%S_%f}_{uuid.uuid4().hex[:8]}.parquet"
+            pq.write_table(pa.table(entry, schema=LOG_SCHEMA), self.path / file_name)
+        except Exception as e:
+            # Logging must never fail the query itself
+            logger.error(f"Failed to write slow-query log entry: {e}", exc_info=True)
+            return False
+        
+        logger.warning("Slow query", extra={
+            "latency_ms": latency_ms,
+            "threshold_ms": self.threshold_ms,
+            "params": params
+        })
+        return True
+    
+    @staticmethod
+    def read(path: Union[str, Path]) -> pa.Table:
+        """Read a slow-query log directory (or single part file), oldest first."""
+        path = Path(path)
+        if not path.exists():
+            return LOG_SCHEMA.empty_table()
+        files = sorted(path.glob("*.parquet")) if path.is_dir() else [path]
+        if not files:
+            return LOG_SCHEMA.empty_table()
+        return pa.concat_tables([pq.read_table(f, schema=LOG_SCHEMA) for f in files]).sort_by("logged_at")
+
+
+def replay_queries(
+    config: TickDBConfig,
+    log_path: Union[str, Path],
+    concurrency: int = 4,
+    repeat: int = 1
+) -> Dict[str, Any]:
+    """
+    Re-run a captured slow-query log against the current data lake.
+    
+    Each worker thread uses its own reader (and DuckDB connection); replayed
+    queries are not logged again. Logged pages (entries with a "page_size")
+    are re-run as the same page, resuming at their logged cursor.
+    
+    Args:
+        config: Configuration of the data lake to replay against
+        log_path: Slow-query log directory or part file
+        concurrency: Number of concurrent query threads
+        repeat: Times to run each captured query
+        
+    Returns:
+        Dictionary with per-query results and captured/replayed percentiles
+    """
+    from .reader import DataReader
+    
+    log = SlowQueryLog.read(log_path)
+    entries = log.to_pylist()
+    replay_config = config.model_copy(update={"slow_query_log_path": None})
+    
+    local = threading.local()
+    readers: List[DataReader] = []
+    lock = threading.Lock()
+    
+    def run(entry: Dict[str, Any]) -> Dict[str, Any]:
+        if not hasattr(local, "reader"):
+            local.reader = DataReader(replay_config)
+            with lock:
+                readers.append(local.reader)
+        
+        params = json.loads(entry["params"])
+        start = datetime.now()
+        try:
+            if "page_size" in params:
+                page_params = {key: value for key, value in params.items() if key not in ("page_size", "cursor")}
+                rows = local.reader.query_page(page_params, params["page_size"], params.get("cursor")).rows_returned
+            else:
+                rows = len(local.reader.query(params))
+            error = None
+        except Exception as e:
+            rows, error = 0, str(e)
+        latency_ms = (datetime.now() - start).total_seconds() * 1000
+        
+        return {
+            "fingerprint": entry["fingerprint"],
+            "params": params,
+            "captured_ms": entry["latency_ms"],
+            "replayed_ms": latency_ms,
+            "captured_rows": entry["rows_returned"],
+            "replayed_rows": rows,
+            "error": error
+        }
+    
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(run, entries * repeat))
+    finally:
+        for reader in readers:
+            reader.close()
+    
+    succeeded = [r for r in results if r["error"] is None]
+    summary = {
+        "queries": len(results),
+        "errors": len(results) - len(succeeded),
+        "concurrency": concurrency,
+        "results": results
+    }
+    
+    captured = np.array([r["captured_ms"] for r in succeeded])
+    replayed = np.array([r["replayed_ms"] for r in succeeded])
+    for p in REPLAY_PERCENTILES:
+        before = float(np.percentile(captured, p)) if len(captured) else 0.0
+        after = float(np.percentile(replayed, p)) if len(replayed) else 0.0
+        summary[f"p{p}"] = {"captured_ms": before, "replayed_ms": after, "delta_ms": after - before}
+    
+    return summary
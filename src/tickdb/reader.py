@@ -5,30 +5,87 @@ High-performance data reader for the data lake.
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import duckdb
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
 import pyarrow.parquet as pq
 from pydantic import BaseModel
 
+from .approx import (
+    approx_bar_aggregates,
+    parse_sample,
+    quantile_aggregates,
+    sample_clause,
+    sample_fraction,
+)
+from .catalog import CATALOG_ALIAS, Catalog
 from .config import TickDBConfig
+from .downsample import epoch_ns, lttb, minmax_reduce, split_points
+from .footers import (
+    footer_cache,
+    footer_symbols,
+    partition_symbols,
+    to_timestamp,
+)
+from .output import num_rows
+from .pagination import (
+    PAGE_KEY_COLUMNS,
+    PAGE_ORDER,
+    Page,
+    PageKey,
+    decode_cursor,
+    keyset_condition,
+    page_windows,
+    query_fingerprint,
+    split_page,
+)
+from .parallel import ParallelScanner, map_ipc
+from .profiling import QueryProfile, execute_profiled, parse_profile, scan_footprint
+from .querylog import SlowQueryLog
+from .replay import FileStream, merge_streams, pace
+from .rollups import ROLLUP_AGGREGATES, RollupManager, interval_sql
+from .schemas import SchemaRegistry
+from .sketches import SketchIndex, quantile
+from .snapshot import CheckpointIndex
 
 logger = logging.getLogger(__name__)
 
+# SQL select expressions computed for each bar aggregate
+BAR_AGGREGATES = {
+    "ohlc": [
+        "arg_min(price, ts) AS open",
+        "max(price) AS high",
+        "min(price) AS low",
+        "arg_max(price, ts) AS close",
+    ],
+    "volume": ["sum(size)::BIGINT AS volume"],
+    "vwap": ["sum(price * size) / nullif(sum(size), 0) AS vwap"],
+    "trade_count": ["count(*) AS trade_count"],
+    "quantiles": quantile_aggregates(),
+}
+
 
 class QueryResult(BaseModel):
     """Result of a data query operation."""
     
     model_config = {"arbitrary_types_allowed": True}
     
-    table: pa.Table
+    # A Dataset over the file for Parquet destinations
+    table: Union[pa.Table, ds.Dataset]
     query_time_ms: float = 0.0
     rows_returned: int = 0
     files_scanned: int = 0
+    # Size of the scanned files; profiled queries narrow it to the projected
+    # columns of the row groups their filters keep
     bytes_scanned: int = 0
+    profile: Optional[QueryProfile] = None
+    # Sampled fraction (or row count) when the result came from a sample
+    sample: Optional[Union[float, int]] = None
 
 
 class DataReader:
@@ -43,63 +100,300 @@ class DataReader:
     - Symbol-based filtering
     """
     
-    def __init__(self, config: TickDBConfig):
+    def __init__(self, config: TickDBConfig, schema_registry: Optional[SchemaRegistry] = None):
         """
         Initialize data reader.
         
         Args:
             config: TickDB configuration
+            schema_registry: Registry whose schemas type empty results
+                (created on first use if not given)
         """
         self.config = config
+        self.schema_registry = schema_registry
+        self._empty_columns: Dict[str, str] = {}
         self.duckdb_con = duckdb.connect(":memory:")
         
-        # Register Arrow functions
-        self.duckdb_con.install_extension("arrow")
-        self.duckdb_con.load_extension("arrow")
+        # Parquet support is built in; never download extensions at runtime
+        self.duckdb_con.execute("SET autoinstall_known_extensions = false")
+        
+        # Keep parsed footers across read_parquet calls instead of re-parsing per query
+        self.duckdb_con.execute("SET parquet_metadata_cache = true")
+        footer_cache.set_budget(config.footer_cache_bytes)
+        
+        # Views, statistics and settings persisted by an earlier process
+        self.catalog = Catalog(config)
+        self._catalog_views: List[str] = []
+        if config.persistent_catalog and self.catalog.attach(self.duckdb_con):
+            self._catalog_views = self.catalog.views(self.duckdb_con)
+        
+        # Bound operator memory; large joins and sorts spill past the limit
+        if config.memory_limit:
+            self.duckdb_con.execute(f"SET memory_limit = '{config.memory_limit}'")
+        if config.temp_directory:
+            self.duckdb_con.execute(f"SET temp_directory = '{config.temp_directory}'")
+        if config.duckdb_threads:
+            self.duckdb_con.execute(f"SET threads = {config.duckdb_threads}")
+        
+        self.rollups = RollupManager(config)
+        self.checkpoints = CheckpointIndex(config)
+        self.sketches = SketchIndex(config)
+        self.parallel = ParallelScanner(config)
+        self.slow_queries = SlowQueryLog(config)
+        
+        if config.warm_footer_cache:
+            self.warm_up()
         
         logger.info("Data reader initialized")
     
-    def query(self, query_params: Dict[str, Any]) -> pa.Table:
+    def warm_up(self, schema_ids: Optional[List[str]] = None) -> int:
+        """
+        Load the footers of a data lake into the process-wide footer cache.
+        
+        Args:
+            schema_ids: Schemas to warm (default: every directory under data_path)
+            
+        Returns:
+            Number of footers cached
+        """
+        start_time = datetime.now()
+        
+        if schema_ids is None:
+            data_path = self.config.data_path
+            directories = sorted(p for p in data_path.iterdir() if p.is_dir()) if data_path.exists() else []
+        else:
+            directories = [self.config.data_path / schema_id for schema_id in schema_ids]
+        
+        footers = footer_cache.warm(directories)
+        
+        logger.info("Footer cache warmed", extra={
+            "footers": footers,
+            "cache_bytes": footer_cache.nbytes,
+            "warm_time_ms": (datetime.now() - start_time).total_seconds() * 1000
+        })
+        return footers
+    
+    def query(self, query_params: Dict[str, Any]) -> Union[pa.Table, QueryResult, Page]:
         """
         Execute a query against the data lake.
         
         Args:
-            query_params: Query parameters including filters and projections
+            query_params: Query parameters including filters and projections;
+                with "profile": True the query runs under the profiler.
+                "memory_limit" and "temp_directory" run the query on its
+                own DuckDB connection that spills sorts and joins beyond
+                the limit; "destination" streams the result into a Parquet
+                or Arrow IPC (.arrow/.ipc/.feather) file instead of memory.
+                "sample" (a fraction, "N%" or a row count) runs the query
+                over a TABLESAMPLE of the matching rows; "approx": True
+                samples `config.approx_sample` of them when no sample is given.
+                "page_size" (with an optional "cursor") reads one page, see
+                `query_page`
             
         Returns:
-            Arrow Table with query results
+            Arrow Table with query results, or the full QueryResult
+            (including its profile) when profiling. With an IPC
+            destination the table is memory-mapped from the file; a
+            Parquet destination is returned as a Dataset over the file,
+            decoded only as it is scanned. Paginated queries return a Page
         """
+        if query_params.get("page_size") is not None:
+            query_params = dict(query_params)
+            return self.query_page(query_params, query_params.pop("page_size"), query_params.pop("cursor", None))
+        
         start_time = datetime.now()
         
         logger.info("Executing query", extra=query_params)
         
+        query_params = dict(query_params)
+        profile = query_params.pop("profile", False)
+        spill = {key: query_params.pop(key, None) for key in ("memory_limit", "temp_directory", "destination")}
+        sample = query_params.pop("sample", None)
+        if query_params.pop("approx", False) and sample is None:
+            sample = self.config.approx_sample
+        sample = parse_sample(sample) if sample is not None else None
+        query_params["schema_id"] = query_params.get("schema_id") or "ticks_v1"
+        profiled = profile or (self.slow_queries.enabled and self.config.slow_query_profile)
+        
         try:
+            # Prune files using footer statistics
+            files = self._query_files(query_params)
+            prune_time = (datetime.now() - start_time).total_seconds() * 1000
+            
             # Build query
-            query = self._build_query(query_params)
+            query = self._build_query(query_params, files, sample=sample)
             
             # Execute query
-            result = self._execute_query(query, query_params)
+            result = self._execute_query(query, query_params, files, profile=profiled, **spill)
+            result.sample = sample
             
             query_time = (datetime.now() - start_time).total_seconds() * 1000
+            if result.profile:
+                result.profile.stages = {"prune": prune_time, **result.profile.stages}
+                result.profile.total_time_ms = query_time
             
             logger.info("Query completed", extra={
                 "query_time_ms": query_time,
-                "rows_returned": len(result.table),
-                "files_scanned": result.files_scanned
+                "rows_returned": result.rows_returned,
+                "files_scanned": result.files_scanned,
+                "bytes_scanned": result.bytes_scanned
             })
             
-            return result.table
+            # Logged with the sample actually drawn (approx resolved), so a
+            # replay runs the same sampled query rather than a full scan
+            self.slow_queries.record(
+                {**query_params, "sample": sample},
+                latency_ms=query_time,
+                rows_returned=result.rows_returned,
+                files_scanned=result.files_scanned,
+                bytes_scanned=result.bytes_scanned,
+                profile=result.profile
+            )
+            
+            return result if profile else result.table
             
         except Exception as e:
             logger.error(f"Query failed: {e}", exc_info=True)
             raise
     
-    def _build_query(self, query_params: Dict[str, Any]) -> str:
-        """Build SQL query from parameters."""
+    def query_page(
+        self,
+        query_params: Dict[str, Any],
+        page_size: int,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """
+        Read one page of a query, ordered by (ts, symbol, file, row).
+        
+        Pages are keyset-paginated: the returned cursor encodes the sort key
+        of the last row, and the next page starts strictly after it. Its
+        timestamp becomes the scan's lower bound, so files ending before the
+        cursor are pruned by their footers and nothing before it is read
+        again, however deep the page. Ties at one timestamp are broken by
+        symbol and by the row's position in the lake (file name and row
+        within the file), so pages neither skip nor repeat rows as long as
+        the files already paged through are not rewritten. Each page is read
+        from the fewest files, by first timestamp, that can hold it (see
+        `page_windows`) rather than by sorting everything after the cursor.
+        
+        Args:
+            query_params: Query parameters as accepted by `query`, without
+                "limit", "order_by", sampling or spilling
+            page_size: Rows per page
+            cursor: Token returned with the previous page (None for the first)
+            
+        Returns:
+            Page with its rows and the cursor of the next page (None on the
+            last page)
+        """
+        start_time = datetime.now()
+        
+        if isinstance(page_size, bool) or not isinstance(page_size, int) or page_size < 1:
+            raise ValueError(f"page_size must be a positive integer, got {page_size!r}")
+        
+        query_params = dict(query_params)
+        profile = query_params.pop("profile", False)
+        for key in ("sample", "approx", "limit", "order_by", "memory_limit", "temp_directory", "destination"):
+            if key in query_params:
+                raise ValueError(f"Paginated queries do not support {key!r}")
+        query_params["schema_id"] = query_params.get("schema_id") or "ticks_v1"
+        profiled = profile or (self.slow_queries.enabled and self.config.slow_query_profile)
+        
+        fingerprint = query_fingerprint(query_params)
+        after = decode_cursor(cursor, fingerprint) if cursor else None
+        # Logged as requested, so replay re-runs this page through `query_page`
+        logged_params = {**query_params, "page_size": page_size, "cursor": cursor}
+        if after is not None:
+            # Resume at the cursor: earlier rows and files are never read again
+            query_params["ts_start"] = after.ts_start
+        
+        try:
+            files = self._query_files(query_params)
+            for window, before in page_windows(self._file_extents(files), page_size, after):
+                query = self._build_query(query_params, window, page_size=page_size, after=after, before=before)
+                result = self._execute_query(query, query_params, window, profile=profiled)
+                if before is None or len(result.table) > page_size:
+                    break
+            table, next_cursor = split_page(result.table, page_size, fingerprint)
+            
+            query_time = (datetime.now() - start_time).total_seconds() * 1000
+            if result.profile:
+                result.profile.rows_returned = len(table)
+                result.profile.total_time_ms = query_time
+            
+            logger.info("Page completed", extra={
+                "query_time_ms": query_time,
+                "rows_returned": len(table),
+                "files_scanned": result.files_scanned,
+                "resumed": after is not None,
+                "last_page": next_cursor is None
+            })
+            
+            self.slow_queries.record(
+                logged_params,
+                latency_ms=query_time,
+                rows_returned=len(table),
+                files_scanned=result.files_scanned,
+                bytes_scanned=result.bytes_scanned,
+                profile=result.profile
+            )
+            
+            return Page(
+                table=table,
+                cursor=next_cursor,
+                rows_returned=len(table),
+                query_time_ms=query_time,
+                profile=result.profile if profile else None
+            )
+            
+        except Exception as e:
+            logger.error(f"Paginated query failed: {e}", exc_info=True)
+            raise
+    
+    def explain(self, query_params: Dict[str, Any]) -> QueryProfile:
+        """
+        Run a query under the profiler and return only its profile.
+        
+        Args:
+            query_params: Query parameters as accepted by `query`
+            
+        Returns:
+            Query profile
+        """
+        return self.query({**query_params, "profile": True}).profile
+    
+    def _query_files(self, query_params: Dict[str, Any]) -> List[Path]:
+        """Resolve the files a parameterized query has to scan."""
+        schema_id = query_params.get("schema_id", "ticks_v1")
+        symbol = query_params.get("symbol")
+        return self._resolve_files(
+            schema_id,
+            [symbol] if symbol else None,
+            query_params.get("ts_start"),
+            query_params.get("ts_end")
+        )
+    
+    def _build_query(
+        self,
+        query_params: Dict[str, Any],
+        files: Optional[List[Path]] = None,
+        sample: Optional[Union[float, int]] = None,
+        page_size: Optional[int] = None,
+        after: Optional[PageKey] = None,
+        before: Optional[pd.Timestamp] = None
+    ) -> str:
+        """
+        Build SQL query from parameters (over `files` when pruning left any,
+        and over a sample of the matching rows when `sample` is given).
+        
+        With `page_size` the query selects one page plus one lookahead row,
+        with the page key columns, in key order, after the key `after` and
+        before the timestamp `before`.
+        """
         
         # Get schema and fields
         schema_id = query_params.get("schema_id", "ticks_v1")
-        fields = query_params.get("fields", ["*"])
+        fields = query_params.get("fields") or ["*"]
         
         # Build field list
         if fields == ["*"]:
@@ -107,6 +401,12 @@ class DataReader:
         else:
             field_list = ", ".join(fields)
         
+        if page_size:
+            if field_list == "*":
+                field_list = "* EXCLUDE (filename, file_row_number)"
+            key_columns = ", ".join(f"{expr} AS {name}" for name, expr in PAGE_KEY_COLUMNS.items())
+            field_list = f"{field_list}, {key_columns}"
+        
         # Build WHERE clause
         where_conditions = []
         
@@ -125,9 +425,15 @@ class DataReader:
         if source_id := query_params.get("source_id"):
             where_conditions.append(f"source_id = '{source_id}'")
         
+        # Keyset: strictly after the last row of the previous page
+        if after is not None:
+            where_conditions.append(keyset_condition(after, self.config.data_path / schema_id))
+        if before is not None:
+            where_conditions.append(f"ts < '{before}'")
+        
         # Additional filters
         for key, value in query_params.items():
-            if key not in ["schema_id", "fields", "symbol", "ts_start", "ts_end", "source_id"]:
+            if key not in ["schema_id", "fields", "symbol", "ts_start", "ts_end", "source_id", "order_by", "limit"]:
                 if isinstance(value, str):
                     where_conditions.append(f"{key} = '{value}'")
                 else:
@@ -146,10 +452,28 @@ class DataReader:
         limit = query_params.get("limit")
         limit_clause = f"LIMIT {limit}" if limit else ""
         
+        if page_size:
+            order_clause = f"ORDER BY {PAGE_ORDER}"
+            limit_clause = f"LIMIT {page_size + 1}"
+        
+        # Build source
+        if page_size:
+            # Row positions break ties; an empty file list gets a typed empty relation
+            source = self._files_source(schema_id, files, row_ids=True)
+        elif files:
+            source = _parquet_source(files)
+        else:
+            source = self._schema_source(schema_id)
+        
+        # Filter first so predicates still reach the Parquet scan, then sample
+        if sample is not None:
+            source = f"(SELECT * FROM {source} {where_clause}) {sample_clause(sample)}"
+            where_clause = ""
+        
         # Build complete query
         query = f"""
         SELECT {field_list}
-        FROM read_parquet('{self.config.data_path}/{schema_id}/*.parquet')
+        FROM {source}
         {where_clause}
         {order_clause}
         {limit_clause}
@@ -157,38 +481,253 @@ class DataReader:
         
         return query.strip()
     
-    def _execute_query(self, query: str, query_params: Dict[str, Any]) -> QueryResult:
+    def _execute_query(
+        self,
+        query: str,
+        query_params: Dict[str, Any],
+        files: Optional[List[Path]] = None,
+        profile: bool = False,
+        memory_limit: Optional[str] = None,
+        temp_directory: Optional[Union[str, Path]] = None,
+        destination: Optional[Union[str, Path]] = None
+    ) -> QueryResult:
         """Execute the SQL query."""
         start_time = datetime.now()
         
+        con = self.duckdb_con
+        if memory_limit or temp_directory:
+            # Memory settings are per database, so a capped query gets its own
+            con = duckdb.connect(":memory:", config=self._spill_config(memory_limit, temp_directory))
+            if self._catalog_views:
+                self.catalog.attach(con)
+        
         # Execute query
-        result = self.duckdb_con.execute(query)
-        table = result.arrow()
+        try:
+            if destination:
+                # Streamed to disk; operator timings are not collected
+                table = _write_destination(con, query, Path(destination), self.config.batch_size)
+                raw_profile = {}
+            elif profile:
+                table, raw_profile = execute_profiled(con, query)
+            else:
+                result = con.execute(query)
+                table = result.arrow()
+        finally:
+            if con is not self.duckdb_con:
+                con.close()
         
         query_time = (datetime.now() - start_time).total_seconds() * 1000
         
-        # Count files scanned
-        schema_id = query_params.get("schema_id", "ticks_v1")
-        files_scanned = self._count_files_scanned(schema_id, query_params)
-        
-        return QueryResult(
+        files = files or []
+        rows_returned = num_rows(table)
+        result = QueryResult(
             table=table,
             query_time_ms=query_time,
-            rows_returned=len(table),
-            files_scanned=files_scanned,
-            bytes_scanned=0  # Could be calculated from file sizes
+            rows_returned=rows_returned,
+            files_scanned=len(files),
+            bytes_scanned=_file_bytes(files)
         )
+        
+        if profile:
+            # Walking every row group and column of the lake is left to
+            # profiled queries, off the plain read path
+            schema_id = query_params.get("schema_id", "ticks_v1")
+            files_considered = self._count_files_scanned(schema_id, query_params)
+            if not files:
+                files = footer_cache.list_files(self.config.data_path / schema_id)
+            
+            fields = query_params.get("fields")
+            symbol = query_params.get("symbol")
+            footprint = scan_footprint(
+                files,
+                columns=None if not fields or fields == ["*"] else fields,
+                symbols=[symbol] if symbol else None,
+                ts_start=query_params.get("ts_start"),
+                ts_end=query_params.get("ts_end")
+            )
+            result.files_scanned = len(files)
+            result.bytes_scanned = footprint["bytes_scanned"]
+            
+            operators, stages, rows_scanned = parse_profile(raw_profile)
+            result.profile = QueryProfile(
+                sql=query,
+                files_considered=files_considered,
+                files_pruned=files_considered - len(files),
+                files_scanned=len(files),
+                row_groups_total=footprint["row_groups_total"],
+                row_groups_skipped=footprint["row_groups_skipped"],
+                bytes_scanned=footprint["bytes_scanned"],
+                rows_scanned=rows_scanned,
+                rows_returned=rows_returned,
+                total_time_ms=query_time,
+                stages=stages,
+                operators=operators
+            )
+        
+        return result
+    
+    def _spill_config(
+        self,
+        memory_limit: Optional[str] = None,
+        temp_directory: Optional[Union[str, Path]] = None
+    ) -> Dict[str, Any]:
+        """DuckDB settings of a per-query connection with its own memory cap."""
+        settings = {"autoinstall_known_extensions": False}
+        memory_limit = memory_limit or self.config.memory_limit
+        temp_directory = temp_directory or self.config.temp_directory
+        if memory_limit:
+            settings["memory_limit"] = memory_limit
+        if temp_directory:
+            Path(temp_directory).mkdir(parents=True, exist_ok=True)
+            settings["temp_directory"] = str(temp_directory)
+        if self.config.duckdb_threads:
+            settings["threads"] = self.config.duckdb_threads
+        return settings
+    
+    def _files_source(self, schema_id: str, files: Optional[List[Path]], row_ids: bool = False) -> str:
+        """SQL source over pruned files, or a schema's empty relation when none are left."""
+        if files:
+            return _parquet_source(files, row_ids=row_ids)
+        return self._empty_source(schema_id, row_ids=row_ids)
+    
+    def _empty_source(self, schema_id: str, row_ids: bool = False) -> str:
+        """
+        Typed empty relation with a schema's columns, so queries pruned to no
+        files still bind their fields and return a well-formed table.
+        
+        Columns come from the registered schema definition, else from the
+        footer of a file of the schema, else from ticks_v1.
+        """
+        columns = self._empty_columns.get(schema_id)
+        if columns is None:
+            if self.schema_registry is None:
+                self.schema_registry = SchemaRegistry()
+            registered = schema_id in self.schema_registry.list_schemas()
+            arrow_schema = None
+            if registered:
+                arrow_schema = self.schema_registry.to_arrow_schema(schema_id)
+            else:
+                for file_path in footer_cache.list_files(self.config.data_path / schema_id):
+                    try:
+                        arrow_schema = footer_cache.get(file_path).schema.to_arrow_schema()
+                        break
+                    except Exception as e:
+                        logger.warning(f"Failed to read schema from {file_path}: {e}")
+            if arrow_schema is None:
+                arrow_schema = self.schema_registry.to_arrow_schema("ticks_v1")
+            
+            relation = self.duckdb_con.from_arrow(arrow_schema.empty_table())
+            columns = ", ".join(
+                f'NULL::{column_type} AS "{name}"'
+                for name, column_type in zip(relation.columns, relation.types)
+            )
+            # Footers change as files are written; definitions do not
+            if registered:
+                self._empty_columns[schema_id] = columns
+        
+        if row_ids:
+            columns += ", NULL::VARCHAR AS filename, NULL::BIGINT AS file_row_number"
+        return f"(SELECT {columns} WHERE false)"
+    
+    def _schema_source(self, schema_id: str) -> str:
+        """SQL source over every file of a schema: its catalog view, or a glob."""
+        if schema_id in self._catalog_views:
+            return f'{CATALOG_ALIAS}."{schema_id}"'
+        return f"read_parquet('{self.config.data_path}/{schema_id}/*.parquet')"
+    
+    def refresh_catalog(self, schema_ids: Optional[List[str]] = None) -> Path:
+        """
+        Rebuild the persistent catalog and re-attach it.
+        
+        Args:
+            schema_ids: Schemas to describe (default: all)
+            
+        Returns:
+            Catalog path
+        """
+        path = self.catalog.refresh(schema_ids)
+        if self._catalog_views or self.config.persistent_catalog:
+            try:
+                self.duckdb_con.execute(f"DETACH {CATALOG_ALIAS}")
+            except duckdb.Error:
+                pass
+            self._catalog_views = []
+            if self.catalog.attach(self.duckdb_con):
+                self._catalog_views = self.catalog.views(self.duckdb_con)
+        return path
+    
+    def catalog_statistics(self, schema_id: str = "ticks_v1") -> Optional[Dict[str, Any]]:
+        """
+        Schema statistics cached in the persistent catalog.
+        
+        Args:
+            schema_id: Schema identifier
+            
+        Returns:
+            Files, rows, bytes, ts bounds and symbols as of the last catalog
+            refresh, or None without a catalog entry
+        """
+        if not self._catalog_views:
+            return None
+        return self.catalog.statistics(self.duckdb_con, schema_id)
     
     def _count_files_scanned(self, schema_id: str, query_params: Dict[str, Any]) -> int:
         """Count number of files that would be scanned."""
+        return len(footer_cache.list_files(self.config.data_path / schema_id))
+    
+    def _file_extents(self, files: List[Path]) -> List[Tuple[Path, Optional[pd.Timestamp], int]]:
+        """First timestamp (None when unknown) and row count of files, from their footers."""
+        extents = []
+        for file_path, footer in footer_cache.get_many(files, validate=False).items():
+            if footer is None:
+                extents.append((file_path, None, 0))
+                continue
+            stats = footer_cache.stats(file_path, validate=False)
+            extents.append((file_path, stats["ts"][0] if "ts" in stats else None, footer.num_rows))
+        return extents
+    
+    def _resolve_files(
+        self,
+        schema_id: str,
+        symbols: Optional[List[str]] = None,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None
+    ) -> List[Path]:
+        """
+        Resolve the Parquet files that may contain matching rows.
+        
+        Files are pruned using the min/max statistics stored in their footers,
+        so only files overlapping the symbol set and time range are scanned.
+        """
         schema_path = self.config.data_path / schema_id
         
         if not schema_path.exists():
-            return 0
+            return []
+        
+        start = to_timestamp(ts_start)
+        end = to_timestamp(ts_end)
+        
+        files = []
+        for file_path, stats in footer_cache.directory_footers(schema_path, stats=True).items():
+            if stats is None:
+                files.append(file_path)
+                continue
+            
+            if "ts" in stats:
+                ts_min, ts_max = stats["ts"]
+                if start is not None and ts_max < start:
+                    continue
+                if end is not None and ts_min > end:
+                    continue
+            
+            if symbols and "symbol" in stats:
+                sym_min, sym_max = stats["symbol"]
+                if not any(sym_min <= s <= sym_max for s in symbols):
+                    continue
+            
+            files.append(file_path)
         
-        # Simple file counting - in production, this would use metadata
-        parquet_files = list(schema_path.glob("*.parquet"))
-        return len(parquet_files)
+        return files
     
     def read_time_slice(
         self,
@@ -300,7 +839,7 @@ class DataReader:
         
         query = f"""
         SELECT {fields_str}
-        FROM read_parquet('{self.config.data_path}/{schema_id}/*.parquet')
+        FROM {self._schema_source(schema_id)}
         WHERE {where_clause}
         ORDER BY ts
         """
@@ -309,6 +848,620 @@ class DataReader:
         result = self.duckdb_con.execute(query)
         return result.arrow()
     
+    def bars(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None,
+        interval: str = "1m",
+        aggs: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1",
+        sample: Optional[Union[float, str]] = None,
+        approx: bool = False,
+        ts_before: Optional[Union[str, datetime]] = None
+    ) -> pa.Table:
+        """
+        Aggregate ticks into time bars inside DuckDB.
+        
+        Args:
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (inclusive)
+            ts_end: End timestamp (inclusive, as in `query`)
+            interval: Bar width, e.g. "1s", "1m", "5m", "1h", "1d"
+            aggs: Aggregates to compute (see BAR_AGGREGATES); defaults to
+                ohlc, volume, vwap and trade_count
+            schema_id: Schema identifier
+            sample: Fraction of ticks to aggregate (e.g. 0.01 or "1%");
+                counts and volumes are scaled up and come with ``*_error``
+                columns (see `approx_bar_aggregates`)
+            approx: Sample `config.approx_sample` of the ticks when no
+                sample is given, and estimate quantiles with t-digest
+            ts_before: Exclusive end timestamp, instead of `ts_end`, so
+                consecutive requests tile. Bucket-aligned ranges are answered
+                from rollups (an inclusive `ts_end` is aligned when it is
+                one nanosecond before a bucket edge)
+            
+        Returns:
+            Arrow Table with one row per symbol and bar, ordered by symbol and ts
+        """
+        if ts_end is not None and ts_before is not None:
+            raise ValueError("Pass either ts_end or ts_before, not both")
+        
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        
+        aggs = aggs or [agg for agg in BAR_AGGREGATES if agg != "quantiles"]
+        unknown = [agg for agg in aggs if agg not in BAR_AGGREGATES]
+        if unknown:
+            raise ValueError(f"Unsupported bar aggregates: {unknown}")
+        
+        if approx and sample is None:
+            sample = self.config.approx_sample
+        if sample is not None:
+            sample = parse_sample(sample)
+            if sample_fraction(sample) is None:
+                raise ValueError("Bars need a fractional sample to scale counts and volumes")
+        
+        # Build WHERE clause
+        where_conditions = []
+        if symbols:
+            where_conditions.append(f"symbol IN ({_sql_list(symbols)})")
+        if ts_start:
+            where_conditions.append(f"ts >= '{ts_start}'")
+        if ts_end:
+            where_conditions.append(f"ts <= '{ts_end}'")
+        if ts_before:
+            where_conditions.append(f"ts < '{ts_before}'")
+        
+        where_clause = ""
+        if where_conditions:
+            where_clause = f"WHERE {' AND '.join(where_conditions)}"
+        
+        # Answer from the coarsest materialized rollup when one fits exactly;
+        # samples are always drawn from the raw ticks. At nanosecond
+        # precision an inclusive end is the exclusive end one nanosecond
+        # later, so only an end just before a bucket edge can use rollups
+        rollup = None
+        if sample is None and all(agg in ROLLUP_AGGREGATES for agg in aggs):
+            rollup_end = ts_before if not ts_end else to_timestamp(ts_end) + pd.Timedelta(1, "ns")
+            rollup = self.rollups.select_rollup(schema_id, interval, ts_start, rollup_end)
+        if rollup:
+            source = self.rollups.source_sql(schema_id, rollup)
+            aggregates = ROLLUP_AGGREGATES
+        elif sample is not None:
+            files = self._resolve_files(schema_id, symbols, ts_start, ts_end or ts_before)
+            # Filter first so predicates still reach the Parquet scan, then sample
+            source = f"(SELECT * FROM {self._files_source(schema_id, files)} {where_clause}) {sample_clause(sample)}"
+            where_clause = ""
+            aggregates = approx_bar_aggregates(sample)
+        else:
+            files = self._resolve_files(schema_id, symbols, ts_start, ts_end or ts_before)
+            source = self._files_source(schema_id, files)
+            aggregates = BAR_AGGREGATES
+        
+        select_list = ", ".join(
+            expr for agg in aggs for expr in aggregates[agg]
+        )
+        
+        query = f"""
+        SELECT
+            symbol,
+            time_bucket({interval_sql(interval)}, ts) AS ts,
+            {select_list}
+        FROM {source}
+        {where_clause}
+        GROUP BY ALL
+        ORDER BY symbol, ts
+        """
+        
+        logger.info("Computing bars", extra={
+            "schema_id": schema_id,
+            "interval": interval,
+            "source": f"rollup:{rollup}" if rollup else "ticks",
+            "sample": sample
+        })
+        
+        result = self.duckdb_con.execute(query)
+        return result.arrow()
+    
+    def downsample(
+        self,
+        symbol: str,
+        ts_start: Union[str, datetime],
+        ts_end: Union[str, datetime],
+        points: int = 2000,
+        method: str = "lttb",
+        field: str = "price",
+        schema_id: str = "ticks_v1"
+    ) -> pa.Table:
+        """
+        Reduce one symbol's series to at most `points` points for charting.
+        
+        The streamed scan is reduced batch by batch to the extremes of every
+        time bucket, so the full series is never held in memory. "minmax"
+        returns those rows as is; "lttb" preselects `LTTB_PRESELECT_RATIO`
+        times as many and picks the final points with
+        Largest-Triangle-Three-Buckets (MinMaxLTTB).
+        
+        Args:
+            symbol: Symbol
+            ts_start: Start timestamp (inclusive)
+            ts_end: End timestamp (inclusive)
+            points: Maximum number of points returned
+            method: "lttb" or "minmax"
+            field: Numeric column to downsample
+            schema_id: Schema identifier
+            
+        Returns:
+            Arrow Table with columns ts and `field`, ordered by ts
+        """
+        buckets, lttb_points = split_points(points, method)
+        
+        scan = self._build_scan({
+            "schema_id": schema_id,
+            "symbol": symbol,
+            "ts_start": ts_start,
+            "ts_end": ts_end,
+            "fields": ["ts", field]
+        })
+        start, end = self._data_bounds(schema_id, symbol, to_timestamp(ts_start), to_timestamp(ts_end))
+        
+        logger.debug("Downsampling series", extra={
+            "schema_id": schema_id,
+            "symbol": symbol,
+            "method": method,
+            "points": points
+        })
+        
+        cursor = self.duckdb_con.cursor()
+        try:
+            batches = cursor.execute(f"SELECT * FROM ({scan}) WHERE {field} IS NOT NULL").fetch_record_batch()
+            table = minmax_reduce(batches, start.value, end.value, buckets)
+        finally:
+            cursor.close()
+        
+        if lttb_points and len(table) > lttb_points:
+            x = epoch_ns(table.column("ts").combine_chunks()).astype("float64")
+            y = table.column(field).cast(pa.float64()).to_numpy()
+            table = table.take(lttb(x, y, lttb_points))
+        
+        return table
+    
+    def _data_bounds(
+        self,
+        schema_id: str,
+        symbol: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp
+    ) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """
+        Narrow a time range to the ts statistics of the files it touches, so
+        equal-width buckets are not wasted on a range without data.
+        """
+        files = self._resolve_files(schema_id, [symbol], start, end)
+        stats = footer_cache.get_many(files, stats=True).values()
+        if files and all(entry and "ts" in entry for entry in stats):
+            start = max(start, min(entry["ts"][0] for entry in stats))
+            end = min(end, max(entry["ts"][1] for entry in stats))
+        return start, end
+    
+    def asof_join(
+        self,
+        left_query: Dict[str, Any],
+        right_query: Dict[str, Any],
+        by: Optional[str] = "symbol",
+        on: str = "ts",
+        tolerance: Optional[Union[str, pd.Timedelta]] = None,
+        suffix: str = "_right",
+        batch_size: int = 65536
+    ) -> pa.RecordBatchReader:
+        """
+        Join each left row to the latest right row at or before it.
+        
+        Runs as a DuckDB ASOF JOIN over the pruned files of both sides and
+        streams the output, so neither side is materialized in Python and the
+        join itself stays within the configured memory limit.
+        
+        Args:
+            left_query: Query parameters for the left side (e.g. trades)
+            right_query: Query parameters for the right side (e.g. quotes, news)
+            by: Column that must match exactly (None to align all rows)
+            on: Ordered column to match on
+            tolerance: Maximum age of the matched right row, e.g. "500ms"
+            suffix: Suffix for right columns whose names clash with the left
+            batch_size: Rows per streamed record batch
+            
+        Returns:
+            RecordBatchReader over the joined rows, ordered by `on`
+        """
+        cursor = self.duckdb_con.cursor()
+        left_sql = self._build_scan(left_query)
+        right_sql = self._build_scan(right_query)
+        
+        # Resolve column names so clashing right columns can be renamed
+        left_columns = [row[0] for row in cursor.execute(f"DESCRIBE {left_sql}").fetchall()]
+        right_columns = [
+            row[0] for row in cursor.execute(f"DESCRIBE {right_sql}").fetchall()
+            if row[0] not in (by, on)
+        ]
+        
+        select_list = [f'l."{column}"' for column in left_columns]
+        for column in right_columns:
+            alias = f"{column}{suffix}" if column in left_columns else column
+            value = f'r."{column}"'
+            if tolerance is not None:
+                micros = int(pd.Timedelta(tolerance) / pd.Timedelta(microseconds=1))
+                value = (
+                    f"CASE WHEN l.\"{on}\" - r.\"{on}\" <= INTERVAL '{micros} microseconds' "
+                    f"THEN {value} END"
+                )
+            select_list.append(f'{value} AS "{alias}"')
+        
+        join_conditions = [f'l."{on}" >= r."{on}"']
+        if by:
+            join_conditions.insert(0, f'l."{by}" = r."{by}"')
+        
+        query = f"""
+        SELECT {", ".join(select_list)}
+        FROM ({left_sql}) l
+        ASOF LEFT JOIN ({right_sql}) r
+        ON {" AND ".join(join_conditions)}
+        ORDER BY l."{on}"
+        """
+        
+        logger.info("Executing as-of join", extra={
+            "left_schema": left_query.get("schema_id", "ticks_v1"),
+            "right_schema": right_query.get("schema_id", "ticks_v1"),
+            "by": by,
+            "on": on
+        })
+        
+        return cursor.execute(query).fetch_record_batch(batch_size)
+    
+    def snapshot(
+        self,
+        ts: Union[str, datetime],
+        symbols: Optional[Union[str, List[str]]] = None,
+        fields: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1"
+    ) -> pa.Table:
+        """
+        Get the last tick of every symbol as of a point in time.
+        
+        Uses the checkpoint index to read only the files holding each
+        symbol's latest state plus the raw rows of the final partial minute.
+        Raw files without checkpoints are scanned in full.
+        
+        Args:
+            ts: Snapshot time (inclusive)
+            symbols: Symbol or list of symbols (None for all symbols)
+            fields: Fields to return
+            schema_id: Schema identifier
+            
+        Returns:
+            Arrow Table with one row per symbol, ordered by symbol
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        
+        at = to_timestamp(ts)
+        plan = self.checkpoints.plan(schema_id, at, symbols)
+        cutoff = pd.Timestamp(plan.cutoff)
+        
+        symbol_filter = ""
+        if symbols:
+            symbol_filter = f" AND symbol IN ({_sql_list(symbols)})"
+        
+        parts = []
+        if plan.checkpoint_files:
+            parts.append(
+                f"SELECT * FROM {_parquet_source(plan.checkpoint_files)} "
+                f"WHERE ts < '{cutoff}'{symbol_filter}"
+            )
+        if plan.tail_files:
+            parts.append(
+                f"SELECT * FROM {_parquet_source(plan.tail_files)} "
+                f"WHERE ts >= '{cutoff}' AND ts <= '{at}'{symbol_filter}"
+            )
+        if plan.unindexed_files:
+            parts.append(
+                f"SELECT * FROM {_parquet_source(plan.unindexed_files)} "
+                f"WHERE ts <= '{at}'{symbol_filter}"
+            )
+        if not parts:
+            parts.append(f"SELECT * FROM {self._empty_source(schema_id)}")
+        
+        field_list = ", ".join(fields) if fields else "*"
+        query = f"""
+        SELECT {field_list}
+        FROM ({" UNION ALL BY NAME ".join(parts)})
+        QUALIFY row_number() OVER (PARTITION BY symbol ORDER BY ts DESC) = 1
+        ORDER BY symbol
+        """
+        
+        logger.debug("Computing snapshot", extra={
+            "schema_id": schema_id,
+            "ts": str(at),
+            "checkpoint_files": len(plan.checkpoint_files),
+            "tail_files": len(plan.tail_files),
+            "unindexed_files": len(plan.unindexed_files)
+        })
+        
+        result = self.duckdb_con.execute(query)
+        return result.arrow()
+    
+    def read_windows(
+        self,
+        events: Union[pa.Table, pd.DataFrame],
+        before: Union[str, pd.Timedelta],
+        after: Union[str, pd.Timedelta],
+        fields: Optional[List[str]] = None,
+        schema_id: str = "ticks_v1"
+    ) -> pa.Table:
+        """
+        Read the ticks around many events in a single scan.
+        
+        Only the files overlapping at least one window are scanned, once for
+        all events. Ticks are matched to windows with a hash join on symbol
+        and a time bucket as wide as a window (so each window touches at most
+        two buckets), filtered to the window bounds; nothing but the matched
+        rows is materialized or sorted.
+        
+        Args:
+            events: Table with `symbol` and `ts` columns, plus an optional
+                `event_id` column (defaults to the row number)
+            before: Window length before each event, e.g. "5min"
+            after: Window length after each event
+            fields: Fields to return
+            schema_id: Schema identifier
+        
+        Returns:
+            Arrow Table with an `event_id` column followed by the ticks of
+            each window (bounds inclusive), ordered by event_id and ts
+        """
+        if isinstance(events, pd.DataFrame):
+            events = pa.Table.from_pandas(events, preserve_index=False)
+        
+        missing = [c for c in ("symbol", "ts") if c not in events.column_names]
+        if missing:
+            raise ValueError(f"Events table is missing columns: {missing}")
+        if "event_id" not in events.column_names:
+            events = events.append_column("event_id", pa.array(range(len(events)), type=pa.int64()))
+        
+        before_micros = int(pd.Timedelta(before) / pd.Timedelta(microseconds=1))
+        after_micros = int(pd.Timedelta(after) / pd.Timedelta(microseconds=1))
+        bucket_micros = max(before_micros + after_micros, 1)
+        
+        # Temp tables are private to the cursor's connection
+        cursor = self.duckdb_con.cursor()
+        cursor.register("window_events", events.select(["event_id", "symbol", "ts"]))
+        try:
+            cursor.execute(f"""
+            CREATE TEMP TABLE windows AS
+            SELECT *, unnest(range(
+                epoch_us(window_start) // {bucket_micros}, epoch_us(window_end) // {bucket_micros} + 1
+            )) AS bucket
+            FROM (
+                SELECT
+                    event_id,
+                    symbol,
+                    (ts::TIMESTAMP_NS - INTERVAL '{before_micros} microseconds')::TIMESTAMP_NS AS window_start,
+                    (ts::TIMESTAMP_NS + INTERVAL '{after_micros} microseconds')::TIMESTAMP_NS AS window_end
+                FROM window_events
+            )
+            """)
+            
+            symbols = cursor.execute("SELECT list(DISTINCT symbol) FROM windows").fetchone()[0] or []
+            bounds = cursor.execute(
+                "SELECT DISTINCT window_start, window_end FROM windows ORDER BY window_start"
+            ).arrow()
+            files = self._window_files(
+                schema_id,
+                symbols,
+                bounds.column("window_start").to_numpy(),
+                bounds.column("window_end").to_numpy()
+            )
+            
+            columns = ", ".join(dict.fromkeys(["symbol", "ts"] + fields)) if fields else "*"
+            if fields:
+                field_list = ", ".join(f't."{field}"' for field in fields)
+            else:
+                field_list = "t.* EXCLUDE (_bucket)"
+            
+            query = f"""
+            SELECT w.event_id, {field_list}
+            FROM (
+                SELECT {columns}, epoch_us(ts) // {bucket_micros} AS _bucket
+                FROM {self._files_source(schema_id, files)}
+                WHERE symbol IN ({_sql_list(symbols) if symbols else "NULL"})
+            ) t
+            JOIN windows w
+            ON t.symbol = w.symbol AND t._bucket = w.bucket AND t.ts BETWEEN w.window_start AND w.window_end
+            ORDER BY w.event_id, t.ts
+            """
+            
+            logger.debug("Reading windows", extra={
+                "schema_id": schema_id,
+                "events": len(events),
+                "symbols": len(symbols),
+                "files": len(files)
+            })
+            
+            return cursor.execute(query).arrow()
+        finally:
+            cursor.close()
+    
+    def _window_files(
+        self,
+        schema_id: str,
+        symbols: List[str],
+        starts: np.ndarray,
+        ends: np.ndarray
+    ) -> List[Path]:
+        """Files of the symbols overlapping at least one window, given windows sorted by start."""
+        if not symbols or not len(starts):
+            return []
+        
+        # Windows starting before a file ends overlap it if any of them ends after it starts
+        latest_end = np.maximum.accumulate(ends)
+        files = self._resolve_files(schema_id, symbols, pd.Timestamp(starts[0]), pd.Timestamp(latest_end[-1]))
+        
+        overlapping = []
+        for file_path, stats in footer_cache.get_many(files, validate=False, stats=True).items():
+            if stats is not None and "ts" in stats:
+                ts_min, ts_max = stats["ts"]
+                count = np.searchsorted(starts, pd.Timestamp(ts_max).to_datetime64(), side="right")
+                if not count or latest_end[count - 1] < pd.Timestamp(ts_min).to_datetime64():
+                    continue
+            overlapping.append(file_path)
+        return overlapping
+    
+    def _build_scan(self, query_params: Dict[str, Any]) -> str:
+        """Build an unordered SELECT over the pruned files of one schema."""
+        schema_id = query_params.get("schema_id", "ticks_v1")
+        fields = query_params.get("fields") or ["*"]
+        
+        symbols = query_params.get("symbols")
+        if symbol := query_params.get("symbol"):
+            symbols = [symbol]
+        ts_start = query_params.get("ts_start")
+        ts_end = query_params.get("ts_end")
+        
+        where_conditions = []
+        if symbols:
+            where_conditions.append(f"symbol IN ({_sql_list(symbols)})")
+        if ts_start:
+            where_conditions.append(f"ts >= '{ts_start}'")
+        if ts_end:
+            where_conditions.append(f"ts <= '{ts_end}'")
+        if source_id := query_params.get("source_id"):
+            where_conditions.append(f"source_id = '{source_id}'")
+        
+        where_clause = ""
+        if where_conditions:
+            where_clause = f"WHERE {' AND '.join(where_conditions)}"
+        
+        files = self._resolve_files(schema_id, symbols, ts_start, ts_end)
+        if files:
+            source = _parquet_source(files)
+        else:
+            # Nothing survives pruning; let DuckDB report a missing dataset
+            source = self._schema_source(schema_id)
+        
+        return f"SELECT {', '.join(fields)} FROM {source} {where_clause}"
+    
+    def replay(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None,
+        speed: Optional[float] = None,
+        schema_id: str = "ticks_v1",
+        fields: Optional[List[str]] = None,
+        batch_size: int = 65536
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream ticks for many symbols in global timestamp order.
+        
+        Opens one sorted stream per pruned file and k-way merges them, so
+        memory stays proportional to the number of open streams rather than
+        the size of the result.
+        
+        Args:
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (inclusive)
+            ts_end: End timestamp (inclusive)
+            speed: Wall-clock pacing relative to event time (None = unpaced)
+            schema_id: Schema identifier
+            fields: Fields to return ("ts" is always included)
+            batch_size: Maximum rows per record batch
+            
+        Returns:
+            Iterator of record batches in ts order
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        
+        files = self._resolve_files(schema_id, symbols, ts_start, ts_end)
+        streams = [
+            FileStream(
+                file_path,
+                symbols=symbols,
+                ts_start=ts_start,
+                ts_end=ts_end,
+                fields=fields,
+                batch_size=batch_size
+            )
+            for file_path in files
+        ]
+        
+        logger.info("Starting replay", extra={
+            "schema_id": schema_id,
+            "streams": len(streams),
+            "speed": speed
+        })
+        
+        batches = merge_streams(streams, batch_size=batch_size)
+        if speed:
+            batches = pace(batches, speed)
+        return batches
+    
+    def read_parallel(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None,
+        schema_id: str = "ticks_v1",
+        fields: Optional[List[str]] = None,
+        ordered: bool = True,
+        workers: Optional[int] = None
+    ) -> pa.Table:
+        """
+        Read a large range by scanning the pruned files in worker processes.
+        
+        Args:
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (inclusive)
+            ts_end: End timestamp (inclusive)
+            schema_id: Schema identifier
+            fields: Fields to return (must include "ts" when ordered)
+            ordered: Return rows in global ts order; False skips the merge
+            workers: Worker processes (defaults to config.scan_workers)
+            
+        Returns:
+            Arrow Table with results
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        
+        where_conditions = []
+        if symbols:
+            where_conditions.append(f"symbol IN ({_sql_list(symbols)})")
+        if ts_start:
+            where_conditions.append(f"ts >= '{ts_start}'")
+        if ts_end:
+            where_conditions.append(f"ts <= '{ts_end}'")
+        
+        where_clause = ""
+        if where_conditions:
+            where_clause = f"WHERE {' AND '.join(where_conditions)}"
+        select_list = ", ".join(fields) if fields else "*"
+        
+        files = self._resolve_files(schema_id, symbols, ts_start, ts_end)
+        if not files:
+            result = self.duckdb_con.execute(
+                f"SELECT {select_list} FROM {self._empty_source(schema_id)} {where_clause}"
+            )
+            return result.arrow()
+        
+        return self.parallel.scan(
+            files,
+            select_list=select_list,
+            where_clause=where_clause,
+            ordered=ordered,
+            workers=workers
+        )
+    
     def get_metadata(
         self,
         schema_id: str = "ticks_v1",
@@ -317,9 +1470,12 @@ class DataReader:
         """
         Get metadata about the data lake.
         
+        Answered from (cached) Parquet footers; no data pages are read.
+        
         Args:
             schema_id: Schema identifier
-            symbol: Optional symbol filter
+            symbol: Optional symbol filter; restricts the files described to
+                those whose statistics may hold the symbol
             
         Returns:
             Metadata dictionary
@@ -338,23 +1494,24 @@ class DataReader:
         if not schema_path.exists():
             return metadata
         
-        # Scan files for metadata
-        parquet_files = list(schema_path.glob("*.parquet"))
-        metadata["total_files"] = len(parquet_files)
+        footers = self._footers(schema_id, symbol)
+        columns: List[str] = []
+        for file_path, footer in footers.items():
+            metadata["file_sizes"][file_path.name] = file_path.stat().st_size
+            if footer is None:
+                continue
+            metadata["total_rows"] += footer.num_rows
+            for i in range(footer.num_columns):
+                name = footer.schema.column(i).name
+                if name not in columns:
+                    columns.append(name)
         
-        if parquet_files:
-            # Read metadata from first file
-            first_file = parquet_files[0]
-            try:
-                parquet_file = pq.ParquetFile(first_file)
-                metadata["total_rows"] = parquet_file.metadata.num_rows
-                
-                # Get schema info
-                schema = parquet_file.schema_arrow
-                metadata["columns"] = [field.name for field in schema]
-                
-            except Exception as e:
-                logger.warning(f"Failed to read metadata from {first_file}: {e}")
+        metadata["total_files"] = len(footers)
+        metadata["columns"] = columns
+        
+        date_range = self.get_date_range(symbol, schema_id)
+        metadata["date_range"] = {"min_ts": date_range["min_ts"], "max_ts": date_range["max_ts"]}
+        metadata["symbols"] = [symbol] if symbol else self.list_symbols(schema_id)
         
         return metadata
     
@@ -362,25 +1519,153 @@ class DataReader:
         """
         List all symbols in the data lake.
         
+        Symbols come from partition directory names when the schema is
+        partitioned by symbol, otherwise from the symbol list each file
+        records in its footer. Only files written without that list (or
+        holding more than one symbol in their statistics) are scanned.
+        
         Args:
             schema_id: Schema identifier
             
         Returns:
             List of symbols
         """
-        query = f"""
-        SELECT DISTINCT symbol
-        FROM read_parquet('{self.config.data_path}/{schema_id}/*.parquet')
-        ORDER BY symbol
-        """
+        schema_path = self.config.data_path / schema_id
         
-        try:
-            result = self.duckdb_con.execute(query)
-            df = result.df()
-            return df["symbol"].tolist() if not df.empty else []
-        except Exception as e:
-            logger.warning(f"Failed to list symbols: {e}")
+        if not schema_path.exists():
             return []
+        
+        from_partitions = partition_symbols(schema_path)
+        if from_partitions is not None:
+            return from_partitions
+        
+        symbols = set()
+        unlisted = []
+        for file_path, footer in self._footers(schema_id).items():
+            listed = footer_symbols(footer) if footer is not None else None
+            if listed is not None:
+                symbols.update(listed)
+                continue
+            
+            stats = footer_cache.stats(file_path, validate=False) if footer is not None else {}
+            if "symbol" in stats and stats["symbol"][0] == stats["symbol"][1]:
+                symbols.add(stats["symbol"][0])
+            elif footer is None or footer.num_rows:
+                unlisted.append(file_path)
+        
+        if unlisted:
+            query = f"""
+            SELECT DISTINCT symbol
+            FROM {_parquet_source(unlisted)}
+            WHERE symbol IS NOT NULL
+            """
+            try:
+                symbols.update(row[0] for row in self.duckdb_con.execute(query).fetchall())
+            except Exception as e:
+                logger.warning(f"Failed to list symbols: {e}")
+        
+        return sorted(symbols)
+    
+    def count_symbols(
+        self,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None,
+        schema_id: str = "ticks_v1"
+    ) -> int:
+        """
+        Count the distinct symbols traded in a time range.
+        
+        The symbol sets files record in their footers are exact and merge by
+        union, so only files written without one are scanned. Files are
+        selected by their ts statistics: a file overlapping the range
+        contributes all of its symbols.
+        
+        Args:
+            ts_start: Start timestamp (inclusive)
+            ts_end: End timestamp (inclusive)
+            schema_id: Schema identifier
+            
+        Returns:
+            Number of distinct symbols
+        """
+        files = self._resolve_files(schema_id, None, ts_start, ts_end)
+        
+        symbols = set()
+        unlisted = []
+        for file_path, footer in footer_cache.get_many(files).items():
+            listed = footer_symbols(footer) if footer is not None else None
+            if listed is None:
+                unlisted.append(file_path)
+            else:
+                symbols.update(listed)
+        
+        if unlisted:
+            query = f"SELECT DISTINCT symbol FROM {_parquet_source(unlisted)} WHERE symbol IS NOT NULL"
+            symbols.update(row[0] for row in self.duckdb_con.execute(query).fetchall())
+        
+        return len(symbols)
+    
+    def quantiles(
+        self,
+        field: str = "size",
+        qs: Sequence[float] = (0.5, 0.99),
+        symbols: Optional[Union[str, List[str]]] = None,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None,
+        schema_id: str = "ticks_v1"
+    ) -> pa.Table:
+        """
+        Estimate quantiles of a field per symbol from the per-file sketches.
+        
+        The t-digests of the files overlapping the time range are merged, so
+        no ticks are scanned (files without a current sketch are sketched
+        from their rows). Like `count_symbols`, the range is applied at file
+        granularity.
+        
+        Args:
+            field: Sketched field ("price" or "size")
+            qs: Quantiles in [0, 1]
+            symbols: Symbol or list of symbols (None for all symbols)
+            ts_start: Start timestamp (inclusive)
+            ts_end: End timestamp (inclusive)
+            schema_id: Schema identifier
+            
+        Returns:
+            Arrow Table with symbol, count, min, max and one column per
+            quantile (e.g. p50, p99), ordered by symbol
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        
+        files = self._resolve_files(schema_id, symbols, ts_start, ts_end)
+        digests = self.sketches.merged(schema_id, files, field, symbols)
+        
+        names = digests.column("symbol").to_pylist()
+        means = digests.column("mean").to_numpy()
+        weights = digests.column("weight").to_numpy()
+        lows = digests.column("min").to_numpy()
+        highs = digests.column("max").to_numpy()
+        
+        # Centroids of one symbol are contiguous and ascending
+        starts = [i for i in range(len(names)) if i == 0 or names[i] != names[i - 1]]
+        bounds = list(zip(starts, starts[1:] + [len(names)]))
+        estimates = [
+            quantile(means[lo:hi], weights[lo:hi], lows[lo], highs[lo], qs)
+            for lo, hi in bounds
+        ]
+        
+        columns = [f"p{q * 100:g}" for q in qs]
+        result = pa.table({
+            "symbol": pa.array([names[lo] for lo, _ in bounds], pa.string()),
+            "count": pa.array([int(weights[lo:hi].sum()) for lo, hi in bounds], pa.int64()),
+            "min": pa.array([lows[lo] for lo, _ in bounds], pa.float64()),
+            "max": pa.array([highs[lo] for lo, _ in bounds], pa.float64()),
+            **{
+                column: pa.array([float(values[i]) for values in estimates], pa.float64())
+                for i, column in enumerate(columns)
+            }
+        })
+        return result.sort_by("symbol")
     
     def get_date_range(
         self,
@@ -390,6 +1675,11 @@ class DataReader:
         """
         Get date range of data.
         
+        Bounds and row counts come from footer statistics. With a symbol
+        filter, row groups holding only that symbol are counted from their
+        footers too; only files with mixed-symbol row groups (or without
+        statistics) are scanned.
+        
         Args:
             symbol: Optional symbol filter
             schema_id: Schema identifier
@@ -397,41 +1687,180 @@ class DataReader:
         Returns:
             Date range dictionary
         """
-        where_clause = ""
-        if symbol:
-            where_clause = f"WHERE symbol = '{symbol}'"
+        lows, highs = [], []
+        total_rows = 0
+        to_scan = []
         
-        query = f"""
-        SELECT 
-            MIN(ts) as min_ts,
-            MAX(ts) as max_ts,
-            COUNT(*) as total_rows
-        FROM read_parquet('{self.config.data_path}/{schema_id}/*.parquet')
-        {where_clause}
-        """
+        for file_path, footer in self._footers(schema_id, symbol).items():
+            counted = _footer_date_range(footer, symbol) if footer is not None else None
+            if counted is None:
+                to_scan.append(file_path)
+                continue
+            low, high, rows = counted
+            if rows:
+                lows.append(low)
+                highs.append(high)
+                total_rows += rows
         
-        try:
-            result = self.duckdb_con.execute(query)
-            df = result.df()
-            
-            if not df.empty:
-                return {
-                    "min_ts": df["min_ts"].iloc[0],
-                    "max_ts": df["max_ts"].iloc[0],
-                    "total_rows": df["total_rows"].iloc[0]
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get date range: {e}")
+        if to_scan:
+            where_clause = f"WHERE symbol = '{symbol}'" if symbol else ""
+            query = f"""
+            SELECT 
+                MIN(ts) as min_ts,
+                MAX(ts) as max_ts,
+                COUNT(*) as total_rows
+            FROM {_parquet_source(to_scan)}
+            {where_clause}
+            """
+            try:
+                low, high, rows = self.duckdb_con.execute(query).fetchone()
+                if rows:
+                    lows.append(to_timestamp(low))
+                    highs.append(to_timestamp(high))
+                    total_rows += rows
+            except Exception as e:
+                logger.warning(f"Failed to get date range: {e}")
+        
+        if not total_rows:
+            return {"min_ts": None, "max_ts": None, "total_rows": 0}
         
-        return {"min_ts": None, "max_ts": None, "total_rows": 0}
+        return {"min_ts": min(lows), "max_ts": max(highs), "total_rows": total_rows}
+    
+    def _footers(
+        self,
+        schema_id: str,
+        symbol: Optional[str] = None
+    ) -> Dict[Path, Optional[pq.FileMetaData]]:
+        """Cached footers of a schema's files, pruned by symbol statistics."""
+        schema_path = self.config.data_path / schema_id
+        
+        if not schema_path.exists():
+            return {}
+        
+        footers = footer_cache.directory_footers(schema_path)
+        if symbol is None:
+            return footers
+        
+        pruned = {}
+        for file_path, footer in footers.items():
+            stats = footer_cache.stats(file_path, validate=False) if footer is not None else {}
+            if "symbol" in stats and not stats["symbol"][0] <= symbol <= stats["symbol"][1]:
+                continue
+            pruned[file_path] = footer
+        return pruned
     
     def close(self) -> None:
         """Close the database connection."""
         if self.duckdb_con:
             self.duckdb_con.close()
+        self.parallel.close()
     
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close() 
\ No newline at end of file
+        self.close()
+
+
+def _sql_list(values: List[str]) -> str:
+    """Render a list of strings as a SQL value list."""
+    return ", ".join("'{}'".format(str(v).replace("'", "''")) for v in values)
+
+
+def _file_bytes(files: List[Path]) -> int:
+    """Total on-disk size of files (files removed since pruning count as empty)."""
+    total = 0
+    for file_path in files:
+        try:
+            total += file_path.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def _parquet_source(files: List[Path], row_ids: bool = False) -> str:
+    """
+    Render a read_parquet() call over an explicit (pruned), non-empty file
+    list, with `filename` and `file_row_number` columns when `row_ids` is set.
+    
+    Empty lists have no columns to read; see `DataReader._files_source`.
+    """
+    file_list = _sql_list([str(f) for f in files])
+    options = ", filename = true, file_row_number = true" if row_ids else ""
+    return f"read_parquet([{file_list}], union_by_name = true{options})"
+
+
+def _footer_date_range(
+    footer: pq.FileMetaData,
+    symbol: Optional[str] = None
+) -> Optional[Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp], int]]:
+    """
+    Time bounds and row count of a file from its footer alone.
+    
+    Returns:
+        (min_ts, max_ts, rows), or None when the footer cannot answer exactly
+        and the file has to be scanned
+    """
+    index = {footer.schema.column(i).name: i for i in range(footer.num_columns)}
+    if "ts" not in index or (symbol is not None and "symbol" not in index):
+        return None
+    
+    lows, highs = [], []
+    rows = 0
+    for rg in range(footer.num_row_groups):
+        row_group = footer.row_group(rg)
+        if not row_group.num_rows:
+            continue
+        
+        if symbol is not None:
+            sym_stats = row_group.column(index["symbol"]).statistics
+            if sym_stats is None or not sym_stats.has_min_max:
+                return None
+            if not sym_stats.min <= symbol <= sym_stats.max:
+                continue
+            if sym_stats.min != sym_stats.max or not sym_stats.has_null_count or sym_stats.null_count:
+                # Mixed-symbol row group: the footer cannot count the symbol's rows
+                return None
+        
+        ts_stats = row_group.column(index["ts"]).statistics
+        if ts_stats is None or not ts_stats.has_min_max:
+            return None
+        lows.append(to_timestamp(ts_stats.min))
+        highs.append(to_timestamp(ts_stats.max))
+        rows += row_group.num_rows
+    
+    if not rows:
+        return None, None, 0
+    return min(lows), max(highs), rows
+
+
+def _write_destination(
+    con: duckdb.DuckDBPyConnection,
+    query: str,
+    destination: Path,
+    batch_size: int
+) -> Union[pa.Table, ds.Dataset]:
+    """
+    Stream a query result into a Parquet or Arrow IPC file.
+    
+    Neither path materializes the result in memory: Parquet is written by
+    DuckDB's COPY, IPC batch by batch. IPC files are returned memory-mapped
+    (zero-copy, paged in on access). Parquet files have to be decoded, so
+    they are returned as a Dataset that decodes batches only as it is
+    scanned; calling `to_table()` on it reads the whole extract into memory.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    
+    if destination.suffix == ".parquet":
+        target = str(destination).replace("'", "''")
+        con.execute(f"COPY ({query}) TO '{target}' (FORMAT parquet, COMPRESSION zstd)")
+        return ds.dataset(destination, format="parquet")
+    
+    if destination.suffix not in (".arrow", ".ipc", ".feather"):
+        raise ValueError(f"Unsupported destination format: {destination.suffix}")
+    
+    reader = con.execute(query).fetch_record_batch(batch_size)
+    with ipc.new_file(destination, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+    return map_ipc(str(destination))
@@ -0,0 +1,209 @@
+"""
+K-way merged replay of tick streams for backtesting.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .footers import row_group_overlaps, to_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Footer key recording the columns a file is sorted by
+SORTED_BY_METADATA_KEY = b"tickdb.sorted_by"
+
+
+class FileStream:
+    """
+    Sorted stream of the matching rows of one Parquet file.
+    
+    Files written sorted by ts are read one row-group batch at a time, with
+    row groups outside the symbol set or time range skipped via statistics.
+    Files without the sorted marker are filtered and sorted once on open.
+    """
+    
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        symbols: Optional[List[str]] = None,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None,
+        fields: Optional[List[str]] = None,
+        batch_size: int = 65536
+    ):
+        """
+        Initialize file stream.
+        
+        Args:
+            file_path: Parquet file to read
+            symbols: Symbols to keep (None for all)
+            ts_start: Start timestamp (inclusive)
+            ts_end: End timestamp (inclusive)
+            fields: Fields to read ("ts" is always included)
+            batch_size: Rows per read batch
+        """
+        self.file_path = Path(file_path)
+        self.symbols = symbols
+        self.ts_start = to_timestamp(ts_start)
+        self.ts_end = to_timestamp(ts_end)
+        self.batch_size = batch_size
+        
+        self._file = pq.ParquetFile(self.file_path)
+        names = self._file.schema_arrow.names
+        columns = fields or names
+        if "ts" not in columns:
+            columns = ["ts"] + list(columns)
+        self.columns = [c for c in columns if c in names]
+        self._read_columns = list(self.columns)
+        if symbols and "symbol" not in self._read_columns:
+            self._read_columns.append("symbol")
+        
+        metadata = self._file.schema_arrow.metadata or {}
+        sorted_by = json.loads(metadata.get(SORTED_BY_METADATA_KEY, b"[]"))
+        self.is_sorted = sorted_by[:1] == ["ts"]
+    
+    def __iter__(self) -> Iterator[pa.Table]:
+        """Yield non-empty, ts-sorted tables of matching rows."""
+        row_groups = self._row_groups()
+        if not row_groups:
+            return
+        
+        if self.is_sorted:
+            for batch in self._file.iter_batches(
+                batch_size=self.batch_size,
+                row_groups=row_groups,
+                columns=self._read_columns
+            ):
+                table = self._filter(pa.Table.from_batches([batch]))
+                if len(table):
+                    yield table
+        else:
+            table = self._file.read_row_groups(row_groups, columns=self._read_columns)
+            table = self._filter(table).sort_by("ts")
+            for offset in range(0, len(table), self.batch_size):
+                yield table.slice(offset, self.batch_size)
+    
+    def _row_groups(self) -> List[int]:
+        """Row groups whose statistics overlap the symbol set and time range."""
+        metadata = self._file.metadata
+        index = {metadata.schema.column(i).name: i for i in range(metadata.num_columns)}
+        
+        row_groups = []
+        for rg in range(metadata.num_row_groups):
+            if row_group_overlaps(metadata.row_group(rg), index, self.symbols, self.ts_start, self.ts_end):
+                row_groups.append(rg)
+        return row_groups
+    
+    def _filter(self, table: pa.Table) -> pa.Table:
+        """Apply the symbol and time filters to a table."""
+        mask = None
+        if self.symbols:
+            mask = pc.is_in(table.column("symbol"), value_set=pa.array(self.symbols))
+        ts = table.column("ts")
+        for bound, op in ((self.ts_start, pc.greater_equal), (self.ts_end, pc.less_equal)):
+            if bound is not None:
+                condition = op(ts, pa.scalar(bound, type=ts.type))
+                mask = condition if mask is None else pc.and_(mask, condition)
+        
+        if mask is not None:
+            table = table.filter(mask)
+        return table.select(self.columns)
+
+
+def merge_streams(
+    streams: List[Iterator[pa.Table]],
+    batch_size: int = 65536
+) -> Iterator[pa.RecordBatch]:
+    """
+    K-way merge ts-sorted streams into globally ts-ordered record batches.
+    
+    Each stream holds at most one buffered chunk. Rows up to the smallest
+    "last ts" among the buffers of still-open streams can no longer be
+    preceded by unread rows, so they are merged and emitted, and the
+    drained streams are refilled.
+    
+    Args:
+        streams: Iterators of ts-sorted tables
+        batch_size: Maximum rows per emitted batch
+    
+    Yields:
+        Record batches in global ts order
+    """
+    iterators = [iter(stream) for stream in streams]
+    buffers: List[Optional[pa.Table]] = [None] * len(iterators)
+    open_streams = set(range(len(iterators)))
+    
+    while True:
+        # Refill drained buffers
+        for i in list(open_streams):
+            if buffers[i] is None or len(buffers[i]) == 0:
+                buffers[i] = next(iterators[i], None)
+                if buffers[i] is None:
+                    open_streams.discard(i)
+        
+        pending = [i for i, buffer in enumerate(buffers) if buffer is not None and len(buffer)]
+        if not pending:
+            return
+        
+        # Rows at or below the watermark are safe to emit
+        watermark = None
+        if open_streams:
+            watermark = min(_ts_ns(buffers[i].column("ts")[-1:])[0] for i in open_streams)
+        
+        parts = []
+        for i in pending:
+            buffer = buffers[i]
+            if watermark is None:
+                cut = len(buffer)
+            else:
+                ts = _ts_ns(buffer.column("ts"))
+                cut = int(ts.searchsorted(watermark, side="right"))
+            if cut:
+                parts.append(buffer.slice(0, cut))
+                buffers[i] = buffer.slice(cut)
+        
+        merged = pa.concat_tables(parts).sort_by("ts") if len(parts) > 1 else parts[0]
+        for batch in merged.to_batches(max_chunksize=batch_size):
+            yield batch
+
+
+def pace(
+    batches: Iterator[pa.RecordBatch],
+    speed: float
+) -> Iterator[pa.RecordBatch]:
+    """
+    Release batches in step with event time.
+    
+    Args:
+        batches: Record batches in ts order
+        speed: Replay speed relative to event time (1.0 = real time)
+    
+    Yields:
+        The same batches, delayed to match the replay clock
+    """
+    wall_start = None
+    event_start = None
+    for batch in batches:
+        first_ts = _ts_ns(batch.column(batch.schema.get_field_index("ts"))[:1])[0]
+        if wall_start is None:
+            wall_start = time.monotonic()
+            event_start = first_ts
+        else:
+            due = wall_start + (first_ts - event_start) / 1e9 / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        yield batch
+
+
+def _ts_ns(array: Union[pa.Array, pa.ChunkedArray]):
+    """Timestamps of an array as int64 nanoseconds (NumPy)."""
+    return array.cast(pa.timestamp("ns")).cast(pa.int64()).to_numpy()
@@ -0,0 +1,354 @@
+"""
+Materialized bar rollups maintained incrementally alongside the data lake.
+"""
+
+import json
+import logging
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .config import TickDBConfig
+
+logger = logging.getLogger(__name__)
+
+# Units accepted in bar intervals such as "1s", "5m", "1h" or "1d"
+INTERVAL_UNITS = {
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+}
+
+# DuckDB aligns sub-month time buckets to this origin
+BUCKET_ORIGIN = pd.Timestamp("2000-01-03")
+
+# Columns a table needs before bars can be rolled up from it
+ROLLUP_COLUMNS = {"ts", "symbol", "price", "size"}
+
+# Partial aggregate state stored per bucket; every column is mergeable
+ROLLUP_STATE = """
+    min(ts) AS open_ts,
+    arg_min(price, ts) AS open,
+    max(price) AS high,
+    min(price) AS low,
+    max(ts) AS close_ts,
+    arg_max(price, ts) AS close,
+    sum(size)::BIGINT AS volume,
+    sum(price * size) AS notional,
+    count(*)::BIGINT AS trade_count
+"""
+
+# Merge of partial aggregate states into the same state (used by compaction)
+ROLLUP_MERGE = """
+    min(open_ts) AS open_ts,
+    arg_min(open, open_ts) AS open,
+    max(high) AS high,
+    min(low) AS low,
+    max(close_ts) AS close_ts,
+    arg_max(close, close_ts) AS close,
+    sum(volume)::BIGINT AS volume,
+    sum(notional) AS notional,
+    sum(trade_count)::BIGINT AS trade_count
+"""
+
+# SQL select expressions answering each bar aggregate from rollup state
+ROLLUP_AGGREGATES = {
+    "ohlc": [
+        "arg_min(open, open_ts) AS open",
+        "max(high) AS high",
+        "min(low) AS low",
+        "arg_max(close, close_ts) AS close",
+    ],
+    "volume": ["sum(volume)::BIGINT AS volume"],
+    "vwap": ["sum(notional) / nullif(sum(volume), 0) AS vwap"],
+    "trade_count": ["sum(trade_count)::BIGINT AS trade_count"],
+}
+
+MANIFEST_FILE = "_rollup.json"
+
+
+def parse_interval(interval: str) -> pd.Timedelta:
+    """Parse an interval such as "5m" into a Timedelta."""
+    count, unit = interval[:-1], interval[-1:]
+    if not count.isdigit() or unit not in INTERVAL_UNITS or int(count) <= 0:
+        raise ValueError(f"Unsupported interval: {interval}")
+    return pd.Timedelta(**{INTERVAL_UNITS[unit]: int(count)})
+
+
+def interval_sql(interval: str) -> str:
+    """Convert an interval such as "5m" into a DuckDB INTERVAL literal."""
+    parse_interval(interval)
+    return f"INTERVAL '{int(interval[:-1])} {INTERVAL_UNITS[interval[-1]]}'"
+
+
+class RollupManager:
+    """
+    Materialized bar rollups for tick schemas.
+    
+    This class provides:
+    - Per-schema rollup datasets at ``data_path/<schema>_bars_<interval>``
+    - Incremental updates from every batch written by the loader
+    - Merge-on-read of partial bucket state, so late and out-of-order
+      batches fold correctly into existing buckets
+    - Compaction and full rebuilds from the raw dataset
+    - Routing of bar queries to the coarsest usable rollup
+    """
+    
+    def __init__(self, config: TickDBConfig):
+        """
+        Initialize rollup manager.
+        
+        Args:
+            config: TickDB configuration
+        """
+        self.config = config
+        self.intervals = sorted(config.rollup_intervals, key=parse_interval)
+    
+    def rollup_path(self, schema_id: str, interval: str) -> Path:
+        """Get the dataset directory of a rollup."""
+        return self.config.data_path / f"{schema_id}_bars_{interval}"
+    
+    def is_complete(self, schema_id: str, interval: str) -> bool:
+        """Whether a rollup covers every row of the raw dataset."""
+        manifest = self.rollup_path(schema_id, interval) / MANIFEST_FILE
+        if not manifest.exists():
+            return False
+        
+        with open(manifest, "r") as f:
+            return bool(json.load(f).get("complete", False))
+    
+    def update(
+        self,
+        table: pa.Table,
+        schema_id: str,
+        files_created: List[str]
+    ) -> List[str]:
+        """
+        Fold a freshly written batch into every rollup of its schema.
+        
+        Each batch produces one delta file of partial bucket state per interval,
+        named after the raw file it was computed from. Buckets shared with
+        earlier batches are merged when the rollup is read or compacted.
+        
+        Args:
+            table: Batch that was written to the raw dataset
+            schema_id: Schema identifier
+            files_created: Raw files the batch was written to
+        
+        Returns:
+            List of rollup files created
+        """
+        if not self.intervals or not ROLLUP_COLUMNS.issubset(table.column_names):
+            return []
+        
+        rollup_files = []
+        for interval in self.intervals:
+            rollup_dir = self.rollup_path(schema_id, interval)
+            
+            if not self.is_complete(schema_id, interval):
+                if self._has_other_raw_files(schema_id, files_created):
+                    # Earlier data is missing from this rollup; only a rebuild
+                    # can make it usable again
+                    logger.info("Skipping incomplete rollup", extra={
+                        "schema_id": schema_id,
+                        "interval": interval
+                    })
+                    continue
+                self._write_manifest(rollup_dir, complete=True)
+            
+            try:
+                state = self._aggregate(table, interval)
+                stem = Path(files_created[0]).stem if files_created else (
+                    datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+                )
+                file_path = rollup_dir / f"{stem}.parquet"
+                self._write(state, file_path)
+                rollup_files.append(str(file_path))
+            except Exception as e:
+                # A rollup missing a batch must not be used for routing
+                self._write_manifest(rollup_dir, complete=False)
+                logger.error(f"Failed to update rollup {rollup_dir}: {e}", exc_info=True)
+        
+        return rollup_files
+    
+    def rebuild(self, schema_id: str) -> Dict[str, int]:
+        """
+        Rebuild every rollup of a schema from the raw dataset.
+        
+        Args:
+            schema_id: Schema identifier
+        
+        Returns:
+            Number of buckets written per interval
+        """
+        raw_files = sorted((self.config.data_path / schema_id).glob("*.parquet"))
+        
+        buckets = {}
+        for interval in self.intervals:
+            rollup_dir = self.rollup_path(schema_id, interval)
+            if rollup_dir.exists():
+                shutil.rmtree(rollup_dir)
+            
+            if raw_files:
+                con = duckdb.connect(":memory:")
+                try:
+                    state = con.execute(f"""
+                    SELECT symbol, time_bucket({interval_sql(interval)}, ts) AS ts,
+                    {ROLLUP_STATE}
+                    FROM read_parquet({_file_list(raw_files)}, union_by_name = true)
+                    GROUP BY ALL
+                    ORDER BY ts, symbol
+                    """).arrow()
+                finally:
+                    con.close()
+                self._write(state, rollup_dir / "rebuild.parquet")
+                buckets[interval] = len(state)
+            else:
+                buckets[interval] = 0
+            
+            self._write_manifest(rollup_dir, complete=True)
+        
+        logger.info("Rebuilt rollups", extra={"schema_id": schema_id, "buckets": buckets})
+        return buckets
+    
+    def compact(self, schema_id: str) -> Dict[str, int]:
+        """
+        Merge the delta files of every rollup into a single file each.
+        
+        Args:
+            schema_id: Schema identifier
+        
+        Returns:
+            Number of delta files merged per interval
+        """
+        merged = {}
+        for interval in self.intervals:
+            rollup_dir = self.rollup_path(schema_id, interval)
+            files = sorted(rollup_dir.glob("*.parquet"))
+            if len(files) <= 1:
+                merged[interval] = 0
+                continue
+            
+            con = duckdb.connect(":memory:")
+            try:
+                state = con.execute(f"""
+                SELECT symbol, ts, {ROLLUP_MERGE}
+                FROM read_parquet({_file_list(files)})
+                GROUP BY ALL
+                ORDER BY ts, symbol
+                """).arrow()
+            finally:
+                con.close()
+            
+            # Write the merged file before removing the deltas it replaces
+            compacted = rollup_dir / f"compacted_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.parquet"
+            self._write(state, compacted)
+            for file_path in files:
+                file_path.unlink()
+            merged[interval] = len(files)
+        
+        return merged
+    
+    def select_rollup(
+        self,
+        schema_id: str,
+        interval: str,
+        ts_start: Optional[Union[str, datetime]] = None,
+        ts_end: Optional[Union[str, datetime]] = None
+    ) -> Optional[str]:
+        """
+        Pick the coarsest rollup that answers a bar query exactly.
+        
+        A rollup qualifies when it is complete, the requested interval is a
+        whole multiple of its interval, and the time bounds fall on its bucket
+        boundaries.
+        
+        Returns:
+            Rollup interval, or None if the query must run on raw ticks
+        """
+        requested = parse_interval(interval)
+        
+        for candidate in reversed(self.intervals):
+            width = parse_interval(candidate)
+            if requested % width != pd.Timedelta(0):
+                continue
+            if not all(_is_aligned(bound, width) for bound in (ts_start, ts_end)):
+                continue
+            if not self.is_complete(schema_id, candidate):
+                continue
+            if not any(self.rollup_path(schema_id, candidate).glob("*.parquet")):
+                continue
+            return candidate
+        
+        return None
+    
+    def source_sql(self, schema_id: str, interval: str) -> str:
+        """Render a read_parquet() call over the files of a rollup."""
+        files = sorted(self.rollup_path(schema_id, interval).glob("*.parquet"))
+        return f"read_parquet({_file_list(files)})"
+    
+    def _aggregate(self, table: pa.Table, interval: str) -> pa.Table:
+        """Compute partial bucket state for a batch."""
+        con = duckdb.connect(":memory:")
+        try:
+            con.register("batch", table)
+            return con.execute(f"""
+            SELECT symbol, time_bucket({interval_sql(interval)}, ts) AS ts,
+            {ROLLUP_STATE}
+            FROM batch
+            GROUP BY ALL
+            ORDER BY ts, symbol
+            """).arrow()
+        finally:
+            con.close()
+    
+    def _has_other_raw_files(self, schema_id: str, files_created: List[str]) -> bool:
+        """Whether the raw dataset holds files other than the given batch."""
+        new_files = {Path(f).name for f in files_created}
+        schema_path = self.config.data_path / schema_id
+        return any(
+            f.name not in new_files for f in schema_path.glob("*.parquet")
+        )
+    
+    def _write(self, table: pa.Table, file_path: Path) -> None:
+        """Write rollup state with the configured compression."""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            table,
+            file_path,
+            compression=self.config.compression,
+            compression_level=self.config.compression_level,
+            write_statistics=True
+        )
+    
+    def _write_manifest(self, rollup_dir: Path, complete: bool) -> None:
+        """Record whether a rollup covers the whole raw dataset."""
+        rollup_dir.mkdir(parents=True, exist_ok=True)
+        with open(rollup_dir / MANIFEST_FILE, "w") as f:
+            json.dump({
+                "complete": complete,
+                "updated_at": datetime.now().isoformat()
+            }, f)
+
+
+def _is_aligned(bound: Optional[Union[str, datetime]], width: pd.Timedelta) -> bool:
+    """Whether a time bound falls on a bucket boundary."""
+    if bound is None or bound == "":
+        return True
+    
+    ts = pd.Timestamp(bound)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return (ts - BUCKET_ORIGIN) % width == pd.Timedelta(0)
+
+
+def _file_list(files: List[Path]) -> str:
+    """Render a list of file paths as a DuckDB list literal."""
+    return "[" + ", ".join("'{}'".format(str(f).replace("'", "''")) for f in files) + "]"
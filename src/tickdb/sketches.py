@@ -0,0 +1,378 @@
+"""
+Per-file quantile sketches (t-digests) for scan-free quantile queries.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .config import TickDBConfig
+
+logger = logging.getLogger(__name__)
+
+# Numeric columns sketched for every symbol of every raw file
+SKETCH_FIELDS = ("price", "size")
+
+# t-digest compression: at most about this many centroids per digest, with
+# rank error shrinking towards the tails
+DIGEST_COMPRESSION = 200
+
+# Memory budget of the sketch files cached per index
+SKETCH_CACHE_BYTES = 64 * 1024 * 1024
+
+# Columns of a sketch file: one row per centroid
+SKETCH_SCHEMA = pa.schema([
+    ("field", pa.string()),
+    ("symbol", pa.string()),
+    ("mean", pa.float64()),
+    ("weight", pa.float64()),
+    ("min", pa.float64()),
+    ("max", pa.float64()),
+])
+
+
+def compress(
+    groups: np.ndarray,
+    means: np.ndarray,
+    weights: np.ndarray,
+    compression: int = DIGEST_COMPRESSION
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge sorted centroids of many digests into t-digests, all at once.
+    
+    Centroids are binned by the k1 scale function of their quantile within
+    their group, so each group keeps about `compression` / 2 centroids, small
+    ones at the tails. Raw values are centroids of weight 1, and digests are
+    merged by concatenating their centroids, so building and merging are the
+    same operation.
+    
+    Args:
+        groups: Group id of every centroid, ascending
+        means: Centroid means, ascending within each group
+        weights: Centroid weights
+        compression: t-digest compression
+        
+    Returns:
+        (groups, means, weights) of the merged centroids
+    """
+    if not len(means):
+        return groups, means, weights
+    
+    starts = np.flatnonzero(np.diff(groups, prepend=groups[0] - 1))
+    totals = np.add.reduceat(weights, starts)
+    counts = np.diff(starts, append=len(groups))
+    
+    # Quantile of each centroid's midpoint within its group
+    cumulative = np.cumsum(weights)
+    before = np.repeat(cumulative[starts] - weights[starts], counts)
+    q = (cumulative - before - weights / 2) / np.repeat(totals, counts)
+    bins = np.floor(compression / (2 * np.pi) * np.arcsin(2 * q - 1)).astype(np.int64)
+    
+    boundaries = np.flatnonzero((np.diff(groups) != 0) | (np.diff(bins) != 0)) + 1
+    clusters = np.concatenate(([0], boundaries))
+    merged_weights = np.add.reduceat(weights, clusters)
+    merged_means = np.add.reduceat(means * weights, clusters) / merged_weights
+    return groups[clusters], merged_means, merged_weights
+
+
+def quantile(
+    means: np.ndarray,
+    weights: np.ndarray,
+    low: float,
+    high: float,
+    qs: Sequence[float]
+) -> np.ndarray:
+    """
+    Quantiles of one digest, interpolating between centroid midpoints.
+    
+    Args:
+        means: Centroid means, ascending
+        weights: Centroid weights
+        low: Exact minimum
+        high: Exact maximum
+        qs: Quantiles in [0, 1]
+    """
+    total = weights.sum()
+    midpoints = np.cumsum(weights) - weights / 2
+    xp = np.concatenate(([0.0], midpoints, [total]))
+    fp = np.concatenate(([low], means, [high]))
+    return np.interp(np.asarray(qs) * total, xp, fp)
+
+
+def build_sketches(table: pa.Table, fields: Sequence[str] = SKETCH_FIELDS) -> pa.Table:
+    """
+    Build per-symbol t-digests of the numeric fields of a table.
+    
+    Args:
+        table: Ticks with a symbol column
+        fields: Columns to sketch (missing ones are skipped)
+        
+    Returns:
+        Sketch table (see SKETCH_SCHEMA)
+    """
+    parts = []
+    symbols = table.column("symbol").combine_chunks().dictionary_encode()
+    names = symbols.dictionary
+    codes = symbols.indices.to_numpy(zero_copy_only=False)
+    
+    for field in fields:
+        if field not in table.column_names:
+            continue
+        values = table.column(field).cast(pa.float64()).to_numpy(zero_copy_only=False)
+        valid = ~np.isnan(values)
+        parts.append(_digest(field, names, codes[valid], values[valid], np.ones(valid.sum())))
+    
+    return pa.concat_tables(parts) if parts else SKETCH_SCHEMA.empty_table()
+
+
+def merge_sketches(sketches: pa.Table) -> pa.Table:
+    """Merge the sketches of many files into one digest per field and symbol."""
+    if not len(sketches):
+        return sketches
+    
+    parts = []
+    for field in pc.unique(sketches.column("field")).to_pylist():
+        rows = sketches.filter(pc.equal(sketches.column("field"), field))
+        symbols = rows.column("symbol").combine_chunks().dictionary_encode()
+        codes = symbols.indices.to_numpy(zero_copy_only=False)
+        digest = _digest(
+            field,
+            symbols.dictionary,
+            codes,
+            rows.column("mean").to_numpy(),
+            rows.column("weight").to_numpy(),
+            low=rows.column("min").to_numpy(),
+            high=rows.column("max").to_numpy()
+        )
+        parts.append(digest)
+    return pa.concat_tables(parts)
+
+
+def _digest(
+    field: str,
+    names: pa.Array,
+    codes: np.ndarray,
+    means: np.ndarray,
+    weights: np.ndarray,
+    low: Optional[np.ndarray] = None,
+    high: Optional[np.ndarray] = None
+) -> pa.Table:
+    """Compress centroids grouped by symbol code into a sketch table."""
+    # Two stable passes sort by (code, mean) about 3x faster than lexsort
+    order = np.argsort(means)
+    order = order[np.argsort(codes[order], kind="stable")]
+    codes, means, weights = codes[order], means[order], weights[order]
+    low = means if low is None else low[order]
+    high = means if high is None else high[order]
+    
+    starts = np.flatnonzero(np.diff(codes, prepend=-1)) if len(codes) else np.empty(0, dtype=np.int64)
+    lows = np.minimum.reduceat(low, starts) if len(starts) else low
+    highs = np.maximum.reduceat(high, starts) if len(starts) else high
+    
+    groups, merged_means, merged_weights = compress(codes, means, weights)
+    # Exact bounds of each centroid's group
+    group_index = np.searchsorted(codes[starts], groups) if len(starts) else groups
+    return pa.table({
+        "field": pa.array([field] * len(groups), pa.string()),
+        "symbol": names.take(pa.array(groups)).cast(pa.string()),
+        "mean": merged_means,
+        "weight": merged_weights,
+        "min": lows[group_index],
+        "max": highs[group_index],
+    }, schema=SKETCH_SCHEMA)
+
+
+class SketchIndex:
+    """
+    Per-file quantile sketches of a tick schema.
+    
+    For every raw file a sidecar at ``data_path/<schema>_sketches`` holds a
+    t-digest of each sketched field per symbol. Digests of any set of files
+    merge into the digest of their union, so quantiles over a time range are
+    answered from the sketches of the files it touches without scanning
+    ticks. A sidecar older than its raw file (rewritten by compaction) is
+    stale and is rebuilt by `rebuild`.
+    """
+    
+    def __init__(self, config: TickDBConfig, max_cache_bytes: int = SKETCH_CACHE_BYTES):
+        """
+        Initialize sketch index.
+        
+        Args:
+            config: TickDB configuration
+            max_cache_bytes: Memory budget of cached sketch files
+        """
+        self.config = config
+        self.max_cache_bytes = max_cache_bytes
+        # Least recently used first: path -> (mtime_ns, table)
+        self._cache: "OrderedDict[str, Tuple[int, pa.Table]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+    
+    def index_path(self, schema_id: str) -> Path:
+        """Get the directory holding the sketch files of a schema."""
+        return self.config.data_path / f"{schema_id}_sketches"
+    
+    def update(
+        self,
+        table: pa.Table,
+        schema_id: str,
+        files_created: List[str]
+    ) -> List[str]:
+        """
+        Write sketches for freshly written raw files.
+        
+        Args:
+            table: Batch that was written to the raw dataset
+            schema_id: Schema identifier
+            files_created: Raw files the batch was written to
+            
+        Returns:
+            List of sketch files created
+        """
+        if "symbol" not in table.column_names:
+            return []
+        
+        sketch_files = []
+        for raw_file in files_created:
+            try:
+                file_path = self.index_path(schema_id) / Path(raw_file).name
+                self._write(build_sketches(table), file_path)
+                sketch_files.append(str(file_path))
+            except Exception as e:
+                # Without sketches the raw file is sketched at query time
+                logger.error(f"Failed to write sketches for {raw_file}: {e}", exc_info=True)
+        
+        return sketch_files
+    
+    def rebuild(self, schema_id: str) -> Dict[str, int]:
+        """
+        Bring the sketches of a schema in line with its raw files.
+        
+        Missing and stale sketches are rebuilt; sketches of raw files that
+        no longer exist are removed.
+        
+        Args:
+            schema_id: Schema identifier
+            
+        Returns:
+            Number of sketch files written and removed
+        """
+        raw_files = {f.name: f for f in (self.config.data_path / schema_id).glob("*.parquet")}
+        
+        written = 0
+        for name, raw_file in sorted(raw_files.items()):
+            file_path = self.index_path(schema_id) / name
+            if self._is_current(file_path, raw_file):
+                continue
+            table = pq.read_table(raw_file, columns=["symbol", *self._fields(raw_file)])
+            self._write(build_sketches(table), file_path)
+            written += 1
+        
+        removed = 0
+        for file_path in self.index_path(schema_id).glob("*.parquet"):
+            if file_path.name not in raw_files:
+                file_path.unlink()
+                removed += 1
+        
+        logger.info("Rebuilt sketches", extra={
+            "schema_id": schema_id,
+            "written": written,
+            "removed": removed
+        })
+        return {"written": written, "removed": removed}
+    
+    def merged(
+        self,
+        schema_id: str,
+        raw_files: List[Path],
+        field: str,
+        symbols: Optional[List[str]] = None
+    ) -> pa.Table:
+        """
+        Merge the sketches of a set of raw files.
+        
+        Raw files without a current sketch are sketched from their rows.
+        
+        Args:
+            schema_id: Schema identifier
+            raw_files: Raw files to cover
+            field: Sketched field
+            symbols: Symbols to keep (None for all)
+            
+        Returns:
+            One digest per symbol, its centroids ascending (see SKETCH_SCHEMA)
+        """
+        parts = []
+        for raw_file in raw_files:
+            file_path = self.index_path(schema_id) / raw_file.name
+            if self._is_current(file_path, raw_file):
+                parts.append(self._read(file_path))
+            else:
+                table = pq.read_table(raw_file, columns=["symbol", *self._fields(raw_file)])
+                parts.append(build_sketches(table))
+        
+        if not parts:
+            return SKETCH_SCHEMA.empty_table()
+        
+        sketches = pa.concat_tables(parts)
+        mask = pc.equal(sketches.column("field"), field)
+        if symbols:
+            mask = pc.and_(mask, pc.is_in(sketches.column("symbol"), pa.array(symbols)))
+        return merge_sketches(sketches.filter(mask))
+    
+    def _fields(self, raw_file: Path) -> List[str]:
+        """Sketched fields present in a raw file."""
+        names = pq.read_schema(raw_file).names
+        return [field for field in SKETCH_FIELDS if field in names]
+    
+    def _is_current(self, file_path: Path, raw_file: Path) -> bool:
+        """Whether a sketch file exists and is not older than its raw file."""
+        try:
+            return file_path.stat().st_mtime_ns >= raw_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+    
+    def _read(self, file_path: Path) -> pa.Table:
+        """
+        Read a sketch file through the LRU cache.
+        
+        Entries are keyed by path, so a rewritten file replaces its old
+        version instead of sitting next to it.
+        """
+        key = str(file_path)
+        version = file_path.stat().st_mtime_ns
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == version:
+                self._cache.move_to_end(key)
+                return entry[1]
+        
+        table = pq.read_table(file_path)
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._cache_bytes -= old[1].nbytes
+            self._cache[key] = (version, table)
+            self._cache_bytes += table.nbytes
+            while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._cache_bytes -= evicted.nbytes
+        return table
+    
+    def _write(self, sketches: pa.Table, file_path: Path) -> None:
+        """Write a sketch file."""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            sketches,
+            file_path,
+            compression=self.config.compression,
+            compression_level=self.config.compression_level
+        )
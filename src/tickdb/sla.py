@@ -0,0 +1,367 @@
+"""
+End-to-end SLA benchmark against the performance targets in the README.
+"""
+
+import logging
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as csv
+from pydantic import BaseModel
+
+from . import __version__
+from .config import TickDBConfig
+from .synth import generate_ticks, symbol_names
+
+logger = logging.getLogger(__name__)
+
+# Dataset the query targets are stated for
+SLA_ROWS = 100_000_000
+SLA_SYMBOLS = 2_000
+
+# Relative slowdown against a baseline reported as a regression
+REGRESSION_TOLERANCE = 0.10
+
+
+class SLATarget(BaseModel):
+    """A performance target promised in the README."""
+    
+    name: str
+    description: str
+    unit: str
+    threshold: float
+    higher_is_better: bool = False
+
+
+SLA_TARGETS = [
+    SLATarget(
+        name="ingest",
+        description="CSV ingest (4 cores)",
+        unit="GB/min",
+        threshold=1.0,
+        higher_is_better=True
+    ),
+    SLATarget(
+        name="full_scan",
+        description="Full-column scan",
+        unit="ms",
+        threshold=20.0
+    ),
+    SLATarget(
+        name="filtered_scan",
+        description="Filtered scan",
+        unit="ms",
+        threshold=5.0
+    ),
+]
+
+
+class SLAResult(BaseModel):
+    """Measurement of one target, with its baseline when compared."""
+    
+    name: str
+    description: str
+    unit: str
+    value: float
+    threshold: float
+    higher_is_better: bool = False
+    passed: bool
+    baseline: Optional[float] = None
+    change: Optional[float] = None
+    regression: bool = False
+
+
+class SLAReport(BaseModel):
+    """Results of an SLA run and the machine it ran on."""
+    
+    version: str = __version__
+    created_at: str = ""
+    rows: int = 0
+    files: int = 0
+    workers: int = 1
+    hardware: Dict[str, Any] = {}
+    results: List[SLAResult] = []
+    
+    @property
+    def passed(self) -> bool:
+        """Whether every target was met."""
+        return all(result.passed for result in self.results)
+    
+    @property
+    def regressions(self) -> List[SLAResult]:
+        """Results that regressed against the baseline."""
+        return [result for result in self.results if result.regression]
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the report as a JSON baseline."""
+        Path(path).write_text(self.model_dump_json(indent=2))
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SLAReport":
+        """Read a report written by `save`."""
+        return cls.model_validate_json(Path(path).read_text())
+
+
+def hardware_info() -> Dict[str, Any]:
+    """Describe the machine: CPU, cores, memory and library versions."""
+    cpu = platform.processor() or platform.machine()
+    try:
+        with open("/proc/cpuinfo") as f:
+            models = [line.split(":", 1)[1].strip() for line in f if line.startswith("model name")]
+        cpu = models[0] if models else cpu
+    except OSError:
+        pass
+    
+    try:
+        memory_bytes = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        memory_bytes = None
+    
+    return {
+        "cpu": cpu,
+        "cores": os.cpu_count(),
+        "cores_available": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        "memory_gb": round(memory_bytes / 1e9, 1) if memory_bytes else None,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "pyarrow": pa.__version__,
+    }
+
+
+def generate_sources(directory: Path, rows: int, files: int, seed: int = 0) -> List[Path]:
+    """
+    Write the SLA dataset as CSV files, one trading day each.
+    
+    Args:
+        directory: Output directory
+        rows: Total rows
+        files: Number of files (trading days)
+        seed: Random seed
+        
+    Returns:
+        Paths of the CSV files
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    sources = []
+    for day in range(files):
+        path = directory / f"ticks_{day:04d}.csv"
+        csv.write_csv(generate_ticks(rows, SLA_SYMBOLS, days=files, seed=seed, day=day), path)
+        sources.append(path)
+    return sources
+
+
+def _ingest_source(config: TickDBConfig, path: str, source_id: str) -> Dict[str, Any]:
+    """Load one source file in a worker process."""
+    from .loader import DataLoader
+    from .schemas import SchemaRegistry
+    
+    schema = SchemaRegistry().get_schema("ticks_v1")
+    return DataLoader(config).load_file(source_id, path, schema)
+
+
+def measure_ingest(config: TickDBConfig, sources: List[Path], workers: int = 1) -> Dict[str, float]:
+    """
+    Load source files into an empty lake, several at a time.
+    
+    Args:
+        config: Configuration of the lake
+        sources: CSV files to load
+        workers: Files loaded concurrently, one process each
+        
+    Returns:
+        Bytes and rows loaded, wall time and throughput in GB/min
+    """
+    source_bytes = sum(path.stat().st_size for path in sources)
+    jobs = [(config, str(path), f"sla{i:04d}") for i, path in enumerate(sources)]
+    
+    start = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_ingest_source, *zip(*jobs)))
+    else:
+        results = [_ingest_source(*job) for job in jobs]
+    seconds = time.perf_counter() - start
+    
+    errors = [error for result in results for error in result["errors"]]
+    if errors:
+        raise RuntimeError(f"Ingest failed: {errors[0]}")
+    
+    return {
+        "bytes": source_bytes,
+        "rows": sum(result["rows_processed"] for result in results),
+        "seconds": seconds,
+        "gb_per_min": source_bytes / 1e9 / (seconds / 60),
+    }
+
+
+def measure_queries(config: TickDBConfig, files: int, repeat: int = 20) -> Dict[str, float]:
+    """
+    Median warm latency of the target queries, in milliseconds.
+    
+    The full-column scan aggregates the price column of every row; the
+    filtered scan reads five minutes of a mid-activity symbol through
+    `TickDB.read`, with file and row-group pruning.
+    
+    Args:
+        config: Configuration of the loaded lake
+        files: Trading days in the lake
+        repeat: Timed runs per query, after one warm-up run
+    """
+    from .core import TickDB
+    
+    tickdb = TickDB(config.model_copy(update={"enable_metrics": False}))
+    source = f"read_parquet('{config.data_path / 'ticks_v1'}/*.parquet')"
+    day = pd.bdate_range("2025-01-02", periods=files)[files // 2] + pd.Timedelta(hours=11)
+    symbol = symbol_names(SLA_SYMBOLS)[SLA_SYMBOLS // 20]
+    
+    queries = {
+        "full_scan": lambda: tickdb.reader.duckdb_con.execute(f"SELECT sum(price) FROM {source}").fetchone(),
+        "filtered_scan": lambda: tickdb.read(
+            symbol=symbol,
+            ts_start=str(day),
+            ts_end=str(day + pd.Timedelta(minutes=5)),
+            fields=["ts", "price", "size"]
+        ),
+    }
+    
+    latencies = {}
+    try:
+        for name, query in queries.items():
+            query()
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                query()
+                times.append((time.perf_counter() - start) * 1000)
+            latencies[name] = statistics.median(times)
+    finally:
+        tickdb.reader.close()
+    return latencies
+
+
+def run_sla(
+    config: TickDBConfig,
+    rows: int = SLA_ROWS,
+    files: int = 20,
+    workers: Optional[int] = None,
+    repeat: int = 20,
+    work_dir: Optional[Union[str, Path]] = None,
+    seed: int = 0
+) -> SLAReport:
+    """
+    Generate the dataset, ingest it and run the query mix against the targets.
+    
+    Args:
+        config: Base configuration (compression, batch size, ...); data and
+            quarantine paths are placed under the work directory
+        rows: Rows in the dataset (the query targets are stated for 100M)
+        files: Source files (trading days)
+        workers: Files ingested concurrently (default: available cores)
+        repeat: Timed runs per query
+        work_dir: Directory for the dataset (default: a temporary
+            directory, removed afterwards)
+        seed: Random seed of the dataset
+        
+    Returns:
+        SLA report
+    """
+    hardware = hardware_info()
+    workers = workers or hardware["cores_available"] or 1
+    root = Path(work_dir) if work_dir else Path(tempfile.mkdtemp(prefix="tickdb_sla_"))
+    run_config = config.model_copy(update={
+        "data_path": root / "data",
+        "quarantine_path": root / "quarantine",
+        "enable_metrics": False,
+        "slow_query_log_path": None
+    })
+    
+    try:
+        logger.info("Generating SLA dataset", extra={"rows": rows, "files": files, "work_dir": str(root)})
+        sources = generate_sources(root / "sources", rows, files, seed=seed)
+        
+        ingest = measure_ingest(run_config, sources, workers=min(workers, files))
+        latencies = measure_queries(run_config, files, repeat=repeat)
+    finally:
+        if not work_dir:
+            shutil.rmtree(root, ignore_errors=True)
+    
+    values = {"ingest": ingest["gb_per_min"], **latencies}
+    results = []
+    for target in SLA_TARGETS:
+        value = values[target.name]
+        passed = value >= target.threshold if target.higher_is_better else value < target.threshold
+        results.append(SLAResult(
+            name=target.name,
+            description=target.description,
+            unit=target.unit,
+            value=value,
+            threshold=target.threshold,
+            higher_is_better=target.higher_is_better,
+            passed=passed
+        ))
+    
+    report = SLAReport(
+        created_at=datetime.now(timezone.utc).isoformat(),
+        rows=ingest["rows"],
+        files=files,
+        workers=workers,
+        hardware=hardware,
+        results=results
+    )
+    
+    logger.info("SLA run completed", extra={
+        "rows": report.rows,
+        "passed": report.passed,
+        **{result.name: result.value for result in results}
+    })
+    return report
+
+
+def compare_baseline(
+    report: SLAReport,
+    baseline: SLAReport,
+    tolerance: float = REGRESSION_TOLERANCE
+) -> SLAReport:
+    """
+    Flag results that got worse than a baseline by more than `tolerance`.
+    
+    Args:
+        report: Current report (updated in place)
+        baseline: Earlier report, e.g. of the previous version
+        tolerance: Relative change allowed before flagging a regression
+        
+    Returns:
+        The report, with baseline values, relative changes and regressions
+    """
+    previous = {result.name: result.value for result in baseline.results}
+    
+    for result in report.results:
+        if result.name not in previous or not previous[result.name]:
+            continue
+        result.baseline = previous[result.name]
+        result.change = result.value / result.baseline - 1
+        # Throughput regresses when it drops, latency when it grows
+        if result.higher_is_better:
+            result.regression = result.change < -tolerance
+        else:
+            result.regression = result.change > tolerance
+    
+    if baseline.hardware.get("cpu") != report.hardware.get("cpu") or baseline.rows != report.rows:
+        logger.warning("Baseline ran on other hardware or data", extra={
+            "baseline_cpu": baseline.hardware.get("cpu"),
+            "baseline_rows": baseline.rows,
+            "rows": report.rows
+        })
+    return report
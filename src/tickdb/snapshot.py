@@ -0,0 +1,220 @@
+"""
+Per-file checkpoint index backing cross-sectional snapshot queries.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+from .config import TickDBConfig
+from .footers import footer_cache, to_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Checkpoints keep the last tick of every symbol in each bucket of this width
+CHECKPOINT_INTERVAL = pd.Timedelta(minutes=1)
+
+# Footer key holding the per-file index
+INDEX_METADATA_KEY = b"tickdb.checkpoints"
+
+
+class SnapshotPlan(BaseModel):
+    """Files a snapshot query has to read."""
+    
+    cutoff: datetime
+    checkpoint_files: List[str] = []
+    tail_files: List[str] = []
+    unindexed_files: List[str] = []
+
+
+class CheckpointIndex:
+    """
+    Checkpoint index for "state of every symbol at time T" queries.
+    
+    For every raw file a sidecar file at ``data_path/<schema>_checkpoints``
+    keeps the last tick of each symbol per minute, sorted by symbol and ts.
+    Its footer records the file's time range and the last tick time of every
+    symbol, so a snapshot only opens the few files that can hold the latest
+    state and reads the raw rows of the final partial minute.
+    """
+    
+    def __init__(self, config: TickDBConfig):
+        """
+        Initialize checkpoint index.
+        
+        Args:
+            config: TickDB configuration
+        """
+        self.config = config
+    
+    def index_path(self, schema_id: str) -> Path:
+        """Get the directory holding the checkpoint files of a schema."""
+        return self.config.data_path / f"{schema_id}_checkpoints"
+    
+    def update(
+        self,
+        table: pa.Table,
+        schema_id: str,
+        files_created: List[str]
+    ) -> List[str]:
+        """
+        Write checkpoints for freshly written raw files.
+        
+        Args:
+            table: Batch that was written to the raw dataset
+            schema_id: Schema identifier
+            files_created: Raw files the batch was written to
+        
+        Returns:
+            List of checkpoint files created
+        """
+        if not self.config.enable_checkpoints:
+            return []
+        if "ts" not in table.column_names or "symbol" not in table.column_names:
+            return []
+        
+        checkpoint_files = []
+        for raw_file in files_created:
+            try:
+                file_path = self.index_path(schema_id) / Path(raw_file).name
+                self._write_checkpoints(table, file_path)
+                checkpoint_files.append(str(file_path))
+            except Exception as e:
+                # Without checkpoints the raw file is simply scanned in full
+                logger.error(f"Failed to write checkpoints for {raw_file}: {e}", exc_info=True)
+        
+        return checkpoint_files
+    
+    def rebuild(self, schema_id: str) -> int:
+        """
+        Build checkpoints for every raw file of a schema that lacks them.
+        
+        Args:
+            schema_id: Schema identifier
+        
+        Returns:
+            Number of checkpoint files written
+        """
+        written = 0
+        for raw_file in sorted((self.config.data_path / schema_id).glob("*.parquet")):
+            file_path = self.index_path(schema_id) / raw_file.name
+            if file_path.exists():
+                continue
+            self._write_checkpoints(pq.read_table(raw_file), file_path)
+            written += 1
+        
+        return written
+    
+    def plan(
+        self,
+        schema_id: str,
+        ts: Union[str, datetime],
+        symbols: Optional[List[str]] = None
+    ) -> SnapshotPlan:
+        """
+        Select the files needed to answer a snapshot at `ts`.
+        
+        Args:
+            schema_id: Schema identifier
+            ts: Snapshot time
+            symbols: Symbols of interest (None for all)
+        
+        Returns:
+            Snapshot plan
+        """
+        at = to_timestamp(ts)
+        cutoff = at.floor(CHECKPOINT_INTERVAL)
+        plan = SnapshotPlan(cutoff=cutoff.to_pydatetime())
+        wanted = set(symbols) if symbols else None
+        
+        # Files ending before the cutoff: only their checkpoints matter
+        closed = []
+        for raw_file in sorted((self.config.data_path / schema_id).glob("*.parquet")):
+            file_path = self.index_path(schema_id) / raw_file.name
+            if not file_path.exists():
+                plan.unindexed_files.append(str(raw_file))
+                continue
+            
+            index = self._read_index(file_path)
+            if index["ts_min"] > at.value:
+                continue
+            if index["ts_max"] >= cutoff.value:
+                # The final partial minute has to come from the raw rows
+                plan.tail_files.append(str(raw_file))
+                plan.checkpoint_files.append(str(file_path))
+            else:
+                closed.append((index, file_path))
+        
+        # Walk closed files newest first, keeping those holding a later tick
+        # for some symbol than any file seen so far
+        best: Dict[str, int] = {}
+        closed.sort(key=lambda item: item[0]["ts_max"], reverse=True)
+        for index, file_path in closed:
+            if wanted and len(best) == len(wanted) and min(best.values()) >= index["ts_max"]:
+                break
+            
+            improves = False
+            for symbol, last_ts in index["last_ts"].items():
+                if wanted and symbol not in wanted:
+                    continue
+                if last_ts > best.get(symbol, -1):
+                    best[symbol] = last_ts
+                    improves = True
+            
+            if improves:
+                plan.checkpoint_files.append(str(file_path))
+        
+        return plan
+    
+    def _write_checkpoints(self, table: pa.Table, file_path: Path) -> None:
+        """Compute and write the checkpoints of one raw file."""
+        con = duckdb.connect(":memory:")
+        try:
+            con.register("batch", table)
+            micros = int(CHECKPOINT_INTERVAL / pd.Timedelta(microseconds=1))
+            checkpoints = con.execute(f"""
+            SELECT * FROM batch
+            QUALIFY row_number() OVER (
+                PARTITION BY symbol, time_bucket(INTERVAL '{micros} microseconds', ts)
+                ORDER BY ts DESC
+            ) = 1
+            ORDER BY symbol, ts
+            """).arrow()
+            bounds = con.execute(
+                "SELECT symbol, epoch_ns(max(ts)) FROM batch GROUP BY symbol"
+            ).fetchall()
+            ts_min, ts_max = con.execute(
+                "SELECT epoch_ns(min(ts)), epoch_ns(max(ts)) FROM batch"
+            ).fetchone()
+        finally:
+            con.close()
+        
+        index = {
+            "ts_min": ts_min,
+            "ts_max": ts_max,
+            "last_ts": {symbol: last_ts for symbol, last_ts in bounds}
+        }
+        metadata = dict(checkpoints.schema.metadata or {})
+        metadata[INDEX_METADATA_KEY] = json.dumps(index).encode()
+        
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            checkpoints.replace_schema_metadata(metadata),
+            file_path,
+            compression=self.config.compression,
+            compression_level=self.config.compression_level,
+            row_group_size=self.config.batch_size,
+            write_statistics=True
+        )
+    
+    def _read_index(self, file_path: Path) -> Dict[str, Any]:
+        """Read the index stored in a checkpoint file footer, through the shared footer cache."""
+        return json.loads(footer_cache.get(file_path).metadata[INDEX_METADATA_KEY])
@@ -0,0 +1,471 @@
+"""
+Deterministic synthetic market data for benchmarks and tests.
+
+Generates trades, quotes and L2 book deltas with vectorized NumPy, one
+(day, part) segment at a time, so datasets of billions of rows can be
+written in parallel across processes or streamed as record batches.
+"""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+# Benchmark dataset sizes: total rows, symbols and trading days (one file each)
+SCALES: Dict[str, Dict[str, int]] = {
+    "S": {"rows": 200_000, "symbols": 50, "days": 2},
+    "M": {"rows": 2_000_000, "symbols": 500, "days": 5},
+    "L": {"rows": 20_000_000, "symbols": 2_000, "days": 10},
+}
+
+# Kinds of market data and the file formats they can be written as
+KINDS = ["trades", "quotes", "l2"]
+FORMATS = {"csv": ".csv", "csv.gz": ".csv.gz", "parquet": ".parquet"}
+
+# Regular session, 09:30 to 16:00
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+SESSION_LENGTH_NS = int(pd.Timedelta(hours=6, minutes=30).value)
+
+# Symbol activity follows a Zipf law with this exponent
+ZIPF_EXPONENT = 1.1
+
+# Depth of the U-shaped intraday volume curve: the open and close trade
+# this many times the midday rate, plus one
+INTRADAY_SMILE = 3.0
+
+# Log-return volatility per tick and overnight, and price tick size
+TICK_VOLATILITY = 2e-4
+DAILY_VOLATILITY = 0.02
+PRICE_TICK = 0.01
+
+# Venues and their share of trades
+EXCHANGES = ["XNAS", "XNYS", "ARCX", "BATS", "IEXG"]
+EXCHANGE_SHARES = [0.35, 0.25, 0.15, 0.15, 0.10]
+
+# Book levels of L2 deltas, and the share of each delta action
+L2_DEPTH = 10
+L2_ACTIONS = ["add", "update", "delete"]
+L2_ACTION_SHARES = [0.35, 0.50, 0.15]
+
+# Mean delay of out-of-order rows behind their neighbours
+OUT_OF_ORDER_LAG_NS = 100_000_000
+
+# Defects of bad rows, drawn uniformly
+BAD_ROW_DEFECTS = ["negative_price", "zero_price", "negative_size", "missing_symbol"]
+
+# Price and size column of each kind, where bad-row defects are planted
+FAULT_COLUMNS = {"trades": ("price", "size"), "quotes": ("bid", "bid_size"), "l2": ("price", "size")}
+
+# Rows per record batch of streamed output
+STREAM_BATCH_ROWS = 65_536
+
+
+class SynthSpec(BaseModel):
+    """Description of a synthetic dataset; the same spec always gives the same data."""
+    
+    kind: str = Field(default="trades", description="Market data kind: trades, quotes or l2")
+    rows: int = Field(default=1_000_000, ge=0, description="Total rows, split evenly across days and parts")
+    symbols: Union[int, List[str]] = Field(default=50, description="Number of symbols, or the symbols themselves")
+    days: int = Field(default=1, ge=1, description="Trading days (weekdays from start)")
+    start: str = Field(default="2025-01-02", description="First trading day")
+    seed: int = Field(default=0, ge=0, description="Random seed")
+    parts: int = Field(default=1, ge=1, description="Segments (files) per day, each covering a slice of the session")
+    depth: int = Field(default=L2_DEPTH, ge=1, description="Book levels of L2 deltas")
+    out_of_order_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Share of rows arriving late")
+    bad_row_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Share of rows with an invalid value")
+    
+    def symbol_names(self) -> List[str]:
+        """Symbols of the dataset, most active first."""
+        return symbol_names(self.symbols) if isinstance(self.symbols, int) else list(self.symbols)
+    
+    def segments(self) -> List[Tuple[int, int]]:
+        """(day, part) of every segment, in time order."""
+        return [(day, part) for day in range(self.days) for part in range(self.parts)]
+    
+    def segment_rows(self, day: int, part: int) -> int:
+        """Rows of one segment."""
+        return _share(_share(self.rows, self.days, day), self.parts, part)
+
+
+def symbol_names(count: int) -> List[str]:
+    """Distinct, deterministic ticker-like symbols ("AAA", "AAB", ...)."""
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    width = max(3, int(np.ceil(np.log(max(count, 2)) / np.log(26))))
+    digits = (np.arange(count)[:, None] // 26 ** np.arange(width - 1, -1, -1)) % 26
+    return ["".join(row) for row in letters[digits]]
+
+
+def activity_weights(count: int, exponent: float = ZIPF_EXPONENT) -> np.ndarray:
+    """Share of trades of each symbol, most active first."""
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return weights / weights.sum()
+
+
+def intraday_offsets(rng: np.random.Generator, rows: int, lower: float = 0.0, upper: float = 1.0) -> np.ndarray:
+    """
+    Sorted offsets (ns) into the session, denser at the open and close.
+    
+    Drawn from the density 1 + INTRADAY_SMILE * (2t - 1)^2 over the session
+    by inverting its CDF on a fine grid. `lower` and `upper` restrict the
+    draw to a quantile range of the curve, so the parts of a day each carry
+    the same number of rows.
+    """
+    grid = np.linspace(0.0, 1.0, 4097)
+    density = 1.0 + INTRADAY_SMILE * (2 * grid - 1) ** 2
+    cdf = np.concatenate(([0.0], np.cumsum((density[1:] + density[:-1]) / 2)))
+    cdf /= cdf[-1]
+    fractions = np.interp(lower + (upper - lower) * rng.random(rows), cdf, grid)
+    return np.sort((fractions * SESSION_LENGTH_NS).astype(np.int64))
+
+
+def generate_segment(spec: SynthSpec, day: int, part: int = 0) -> pa.Table:
+    """
+    Generate one part of one trading day of a dataset.
+    
+    Every segment draws from its own random stream, so segments can be
+    generated independently and in any order: the opening level of each
+    symbol depends only on the seed (trades and quotes of one seed agree on
+    prices), and the drift accumulated by earlier parts of the day is
+    drawn from a per-day stream.
+    
+    Args:
+        spec: Dataset description
+        day: Trading day (0-based)
+        part: Part of the day (0-based)
+        
+    Returns:
+        Table of the segment, in arrival order (sorted by ts unless
+        out-of-order rows were requested)
+    """
+    if spec.kind not in KINDS:
+        raise ValueError(f"Unknown kind {spec.kind!r} (expected one of {', '.join(KINDS)})")
+    
+    names = spec.symbol_names()
+    weights = activity_weights(len(names))
+    session = (pd.bdate_range(pd.Timestamp(spec.start).normalize(), periods=spec.days)[day] + SESSION_OPEN).value
+    stream = KINDS.index(spec.kind) + 1
+    rows = spec.segment_rows(day, part)
+    
+    level_rng = np.random.default_rng([spec.seed, 0])
+    gaps = level_rng.normal(0.0, DAILY_VOLATILITY, (spec.days, len(names)))
+    levels = level_rng.lognormal(np.log(50), 1.0, len(names)) * np.exp(np.cumsum(gaps, axis=0)[day])
+    
+    # Drift of each symbol over the parts of the day before this one
+    day_rng = np.random.default_rng([spec.seed, stream, day + 1])
+    part_ticks = _share(spec.rows, spec.days, day) / spec.parts * weights
+    steps = day_rng.normal(0.0, TICK_VOLATILITY * np.sqrt(part_ticks), (spec.parts, len(names)))
+    opening = levels * np.exp(np.cumsum(steps, axis=0)[part] - steps[part])
+    
+    rng = np.random.default_rng([spec.seed, stream, day + 1, part + 1])
+    codes = rng.choice(len(names), rows, p=weights)
+    ts = session + intraday_offsets(rng, rows, part / spec.parts, (part + 1) / spec.parts)
+    mid = opening[codes] * np.exp(_random_walk(rng, codes))
+    
+    columns = _GENERATORS[spec.kind](rng, mid, spec)
+    missing = _inject_faults(rng, ts, columns, spec, session)
+    
+    return pa.table({
+        "ts": pa.array(ts, type=pa.timestamp("ns")),
+        "symbol": pa.array(names, pa.string()).take(pa.array(codes, mask=missing)),
+        **columns,
+    })
+
+
+def generate(spec: SynthSpec, day: Optional[int] = None) -> pa.Table:
+    """
+    Generate a whole dataset, or one day of it, in memory.
+    
+    Args:
+        spec: Dataset description
+        day: Generate only this day (0-based), identical to the same rows
+            of the full dataset
+    """
+    parts = [
+        generate_segment(spec, segment_day, part)
+        for segment_day, part in spec.segments()
+        if day is None or segment_day == day
+    ]
+    table = pa.concat_tables(parts)
+    logger.debug("Generated synthetic data", extra={
+        "kind": spec.kind,
+        "rows": len(table),
+        "symbols": len(spec.symbol_names()),
+        "days": spec.days
+    })
+    return table
+
+
+def generate_ticks(
+    rows: int,
+    symbols: Union[int, List[str]] = 50,
+    days: int = 1,
+    start: Union[str, pd.Timestamp] = "2025-01-02",
+    seed: int = 0,
+    day: Optional[int] = None
+) -> pa.Table:
+    """
+    Generate trades across many symbols with realistic distributions.
+    
+    Symbols trade with Zipf-distributed activity, arrivals follow a U-shaped
+    intraday curve over weekday sessions, prices random-walk in log space
+    from a log-normal starting level per symbol and are rounded to the tick,
+    and sizes are heavy-tailed round and odd lots. Output is sorted by ts
+    and fully determined by the arguments.
+    
+    Args:
+        rows: Total rows, split evenly across days
+        symbols: Number of symbols, or the symbols themselves
+        days: Trading days (weekdays from `start`)
+        start: First trading day
+        seed: Random seed
+        day: Generate only this day (0-based) of the dataset, identical to
+            the same rows of the full dataset
+            
+    Returns:
+        Table with ts, symbol, price, size, side and exchange columns
+    """
+    spec = SynthSpec(rows=rows, symbols=symbols, days=days, start=str(pd.Timestamp(start).date()), seed=seed)
+    return generate(spec, day=day)
+
+
+def generate_scale(scale: str, seed: int = 0, day: Optional[int] = None) -> pa.Table:
+    """
+    Generate the benchmark dataset of a named scale (see SCALES).
+    
+    Args:
+        scale: "S", "M" or "L"
+        seed: Random seed
+        day: Generate only this day of the dataset
+    """
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale {scale!r} (expected one of {', '.join(SCALES)})")
+    spec = SCALES[scale]
+    return generate_ticks(spec["rows"], spec["symbols"], days=spec["days"], seed=seed, day=day)
+
+
+def segment_filename(spec: SynthSpec, day: int, part: int, file_format: str) -> str:
+    """File name of a segment, e.g. ``trades_20250102_000.parquet``."""
+    date = pd.bdate_range(pd.Timestamp(spec.start).normalize(), periods=spec.days)[day]
+    return f"{spec.kind}_{date:%Y%m%d}_{part:03d}{FORMATS[file_format]}"
+
+
+def write_table(table: pa.Table, path: Path, file_format: str) -> None:
+    """Write a table as CSV, gzip-compressed CSV or Parquet."""
+    if file_format == "parquet":
+        pq.write_table(table, path, compression="zstd")
+    elif file_format == "csv.gz":
+        with pa.CompressedOutputStream(str(path), "gzip") as out:
+            csv.write_csv(table, out)
+    elif file_format == "csv":
+        csv.write_csv(table, path)
+    else:
+        raise ValueError(f"Unknown format {file_format!r} (expected one of {', '.join(FORMATS)})")
+
+
+def write_segment(spec: SynthSpec, directory: str, file_format: str, day: int, part: int) -> Tuple[str, int]:
+    """Generate one segment and write it to its file; returns the path and row count."""
+    table = generate_segment(spec, day, part)
+    path = Path(directory) / segment_filename(spec, day, part, file_format)
+    write_table(table, path, file_format)
+    return str(path), len(table)
+
+
+def write_dataset(
+    spec: SynthSpec,
+    directory: Union[str, Path],
+    file_format: str = "parquet",
+    workers: Optional[int] = None
+) -> List[Path]:
+    """
+    Write a dataset as one file per segment, generating segments in parallel.
+    
+    Args:
+        spec: Dataset description
+        directory: Output directory (created if missing)
+        file_format: "csv", "csv.gz" or "parquet"
+        workers: Processes generating segments (default: CPU count)
+        
+    Returns:
+        Paths of the written files, in time order
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown format {file_format!r} (expected one of {', '.join(FORMATS)})")
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, len(spec.segments()))
+    jobs = [(spec, str(directory), file_format, day, part) for day, part in spec.segments()]
+    
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(write_segment, *zip(*jobs)))
+    else:
+        results = [write_segment(*job) for job in jobs]
+    
+    logger.info("Wrote synthetic dataset", extra={
+        "kind": spec.kind,
+        "directory": str(directory),
+        "format": file_format,
+        "files": len(results),
+        "rows": sum(rows for _, rows in results),
+        "workers": workers
+    })
+    return [Path(path) for path, _ in results]
+
+
+def iter_batches(
+    spec: SynthSpec,
+    workers: int = 1,
+    batch_rows: int = STREAM_BATCH_ROWS
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream a dataset as record batches, in time order.
+    
+    With several workers, upcoming segments are generated in other
+    processes while earlier ones are consumed; at most two segments per
+    worker are held in memory.
+    
+    Args:
+        spec: Dataset description
+        workers: Processes generating segments
+        batch_rows: Maximum rows per batch
+    """
+    segments = spec.segments()
+    if workers <= 1:
+        for day, part in segments:
+            yield from generate_segment(spec, day, part).to_batches(max_chunksize=batch_rows)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque = deque()
+        for day, part in segments:
+            pending.append(pool.submit(generate_segment, spec, day, part))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result().to_batches(max_chunksize=batch_rows)
+        while pending:
+            yield from pending.popleft().result().to_batches(max_chunksize=batch_rows)
+
+
+def _share(total: int, count: int, index: int) -> int:
+    """Rows of the `index`-th of `count` even shares of `total`."""
+    return total // count + (1 if index < total % count else 0)
+
+
+def _random_walk(rng: np.random.Generator, codes: np.ndarray) -> np.ndarray:
+    """Per-symbol random walks: cumulative log returns within each symbol's ticks."""
+    rows = len(codes)
+    returns = rng.normal(0.0, TICK_VOLATILITY, rows)
+    order = np.argsort(codes, kind="stable")
+    walk = np.cumsum(returns[order])
+    starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+    walk -= np.repeat(walk[starts] - returns[order][starts], np.diff(starts, append=rows))
+    drift = np.empty(rows)
+    drift[order] = walk
+    return drift
+
+
+def _round_to_tick(price: np.ndarray) -> np.ndarray:
+    """Prices rounded to the tick, at least one tick."""
+    return np.maximum(np.round(price / PRICE_TICK) * PRICE_TICK, PRICE_TICK)
+
+
+def _exchanges(rng: np.random.Generator, rows: int) -> pa.Array:
+    """Venue of each row."""
+    return pa.array(np.array(EXCHANGES)[rng.choice(len(EXCHANGES), rows, p=EXCHANGE_SHARES)])
+
+
+def _trade_columns(rng: np.random.Generator, mid: np.ndarray, spec: SynthSpec) -> Dict[str, Any]:
+    """Trades at the mid, with mostly round lots, a heavy tail of blocks and some odd lots."""
+    rows = len(mid)
+    size = np.where(
+        rng.random(rows) < 0.3,
+        rng.integers(1, 100, rows),
+        np.minimum((rng.pareto(1.5, rows) + 1).astype(np.int64) * 100, 1_000_000)
+    )
+    return {
+        "price": _round_to_tick(mid),
+        "size": size.astype(np.int64),
+        "side": pa.array(np.where(rng.random(rows) < 0.5, "B", "S")),
+        "exchange": _exchanges(rng, rows),
+    }
+
+
+def _quote_columns(rng: np.random.Generator, mid: np.ndarray, spec: SynthSpec) -> Dict[str, Any]:
+    """Top-of-book quotes around the mid, mostly one or two ticks wide."""
+    rows = len(mid)
+    spread = rng.geometric(0.6, rows)
+    bid = _round_to_tick(mid - spread * PRICE_TICK / 2)
+    return {
+        "bid": bid,
+        "ask": np.round((bid + spread * PRICE_TICK) / PRICE_TICK) * PRICE_TICK,
+        "bid_size": rng.integers(1, 50, rows) * 100,
+        "ask_size": rng.integers(1, 50, rows) * 100,
+        "exchange": _exchanges(rng, rows),
+    }
+
+
+def _l2_columns(rng: np.random.Generator, mid: np.ndarray, spec: SynthSpec) -> Dict[str, Any]:
+    """Book deltas, concentrated near the touch; deletes carry size 0."""
+    rows = len(mid)
+    bid_side = rng.random(rows) < 0.5
+    level = np.minimum(rng.geometric(0.35, rows) - 1, spec.depth - 1)
+    best_bid = np.floor(mid / PRICE_TICK)
+    price = np.where(bid_side, best_bid - level, best_bid + 1 + level) * PRICE_TICK
+    action = rng.choice(len(L2_ACTIONS), rows, p=L2_ACTION_SHARES)
+    size = np.where(action == L2_ACTIONS.index("delete"), 0, rng.integers(1, 100, rows) * 100)
+    return {
+        "side": pa.array(np.where(bid_side, "B", "S")),
+        "level": level.astype(np.int16),
+        "price": _round_to_tick(price),
+        "size": size.astype(np.int64),
+        "action": pa.array(np.array(L2_ACTIONS)[action]),
+    }
+
+
+_GENERATORS = {"trades": _trade_columns, "quotes": _quote_columns, "l2": _l2_columns}
+
+
+def _inject_faults(
+    rng: np.random.Generator,
+    ts: np.ndarray,
+    columns: Dict[str, Any],
+    spec: SynthSpec,
+    session: int
+) -> Optional[np.ndarray]:
+    """
+    Delay and corrupt rows in place, after all other draws of the segment.
+    
+    Late rows keep their position but get an earlier timestamp (never
+    before the open); bad rows get one of BAD_ROW_DEFECTS.
+    
+    Returns:
+        Mask of rows whose symbol is missing, or None
+    """
+    rows = len(ts)
+    if spec.out_of_order_rate:
+        late = np.flatnonzero(rng.random(rows) < spec.out_of_order_rate)
+        lag = rng.exponential(OUT_OF_ORDER_LAG_NS, len(late)).astype(np.int64)
+        ts[late] = np.maximum(ts[late] - lag, session)
+    
+    if not spec.bad_row_rate:
+        return None
+    
+    bad = np.flatnonzero(rng.random(rows) < spec.bad_row_rate)
+    defects = np.array(BAD_ROW_DEFECTS)[rng.integers(0, len(BAD_ROW_DEFECTS), len(bad))]
+    price, size = FAULT_COLUMNS[spec.kind]
+    columns[price][bad[defects == "negative_price"]] *= -1
+    columns[price][bad[defects == "zero_price"]] = 0
+    columns[size][bad[defects == "negative_size"]] = -np.maximum(columns[size][bad[defects == "negative_size"]], 1)
+    missing = np.zeros(rows, dtype=bool)
+    missing[bad[defects == "missing_symbol"]] = True
+    return missing
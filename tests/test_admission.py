@@ -0,0 +1,185 @@
+"""
+Unit tests for query admission control.
+"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from tickdb.admission import AdmissionController, AdmissionError, PriorityClass
+from tickdb.core import TickDB, TickDBConfig
+
+from .test_reader import make_ticks
+
+
+class TestAdmission:
+    """Test priority classes, limits and the mixed-load behaviour."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def config(self, temp_dir):
+        """Create a configuration with some data loaded."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["AAPL", "MSFT"], periods=2000), "ticks_v1", "feed")
+        return config
+    
+    @pytest.fixture
+    def controller(self, config):
+        """Create a controller with small, fast-failing classes."""
+        controller = AdmissionController(config, classes={
+            "interactive": PriorityClass(max_concurrency=4, threads=1, queue_timeout_s=2.0),
+            "batch": PriorityClass(max_concurrency=2, threads=1, memory_limit="256MB", queue_timeout_s=0.2),
+        })
+        yield controller
+        controller.close()
+    
+    def test_concurrency_limit(self, controller):
+        """Test a class never runs more queries than its limit."""
+        peak = []
+        lock = threading.Lock()
+        
+        def run():
+            with controller.admit("batch") as reader:
+                with lock:
+                    peak.append(controller.stats()["batch"]["running"])
+                time.sleep(0.05)
+        
+        controller.classes["batch"].queue_timeout_s = None
+        threads = [threading.Thread(target=run) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert max(peak) == 2
+        assert controller.stats()["batch"]["admitted"] == 6
+    
+    def test_queue_timeout_rejects(self, controller):
+        """Test queries are rejected once they wait out the queue timeout."""
+        release = threading.Event()
+        held = threading.Barrier(3)
+        
+        def hold():
+            with controller.admit("batch"):
+                held.wait()
+                release.wait()
+        
+        holders = [threading.Thread(target=hold) for _ in range(2)]
+        for thread in holders:
+            thread.start()
+        held.wait()
+        
+        with pytest.raises(AdmissionError):
+            with controller.admit("batch"):
+                pass
+        
+        release.set()
+        for thread in holders:
+            thread.join()
+        assert controller.stats()["batch"]["rejected"] == 1
+    
+    def test_class_connection_caps(self, controller):
+        """Test pooled readers run with their class's DuckDB caps."""
+        with controller.admit("batch") as reader:
+            con = reader.duckdb_con
+            assert con.execute("SELECT current_setting('threads')").fetchone()[0] == 1
+            memory_limit = con.execute("SELECT current_setting('memory_limit')").fetchone()[0]
+            assert memory_limit.startswith("244")
+        
+        with pytest.raises(KeyError):
+            with controller.admit("unknown"):
+                pass
+    
+    def test_interactive_protected_under_batch_load(self, controller):
+        """Test interactive reads keep being admitted while batch scans saturate their class."""
+        stop = threading.Event()
+        
+        def batch_load():
+            while not stop.is_set():
+                try:
+                    with controller.admit("batch") as reader:
+                        reader.query({"schema_id": "ticks_v1", "fields": ["symbol", "price"], "order_by": "price"})
+                except AdmissionError:
+                    pass
+        
+        loaders = [threading.Thread(target=batch_load) for _ in range(4)]
+        for thread in loaders:
+            thread.start()
+        
+        try:
+            for _ in range(20):
+                with controller.admit("interactive") as reader:
+                    assert len(reader.read_latest("AAPL", limit=1)) == 1
+        finally:
+            stop.set()
+            for thread in loaders:
+                thread.join()
+        
+        stats = controller.stats()
+        assert stats["interactive"]["admitted"] == 20
+        assert stats["interactive"]["rejected"] == 0
+        # Batch queries queued behind each other, never behind interactive ones
+        assert stats["interactive"]["wait_p99_ms"] < 50
+        assert stats["batch"]["admitted"] > 0
+        assert stats["batch"]["running"] == stats["batch"]["queued"] == 0
+    
+    def test_tickdb_reads_are_admitted(self, config):
+        """Test TickDB reads go through admission, interactive by default."""
+        tickdb = TickDB(config)
+        
+        assert len(tickdb.read("AAPL", fields=["ts"])) == 2000
+        assert tickdb.read_latest("AAPL", limit=5, fields=["ts"]).column("ts").to_pylist() == sorted(
+            tickdb.read("AAPL", fields=["ts"], priority="batch").column("ts").to_pylist(), reverse=True
+        )[:5]
+        
+        stats = tickdb.admission.stats()
+        assert stats["interactive"]["admitted"] == 2
+        assert stats["batch"]["admitted"] == 1
+        with pytest.raises(KeyError):
+            tickdb.read("AAPL", priority="unknown")
+        tickdb.admission.close()
+    
+    def test_tickdb_scans_are_admitted(self, config):
+        """Test scan entry points are admitted as batch and streams hold their slot until closed."""
+        tickdb = TickDB(config)
+        
+        assert len(tickdb.bars("AAPL", interval="1h")) > 0
+        assert tickdb.count_symbols() == 2
+        stats = tickdb.admission.stats()
+        assert stats["batch"]["admitted"] == 1
+        assert stats["interactive"]["admitted"] == 1
+        
+        batches = tickdb.replay("AAPL", fields=["ts"])
+        assert tickdb.admission.stats()["batch"]["running"] == 1
+        assert sum(len(batch) for batch in batches) == 2000
+        assert tickdb.admission.stats()["batch"]["running"] == 0
+        
+        joined = tickdb.asof_join({"symbol": "AAPL"}, {"symbol": "MSFT"}, by=None)
+        assert tickdb.admission.stats()["batch"]["running"] == 1
+        del joined
+        assert tickdb.admission.stats()["batch"]["running"] == 0
+        tickdb.admission.close()
+    
+    def test_invalidate_retires_readers(self, controller):
+        """Test readers pooled before an invalidation are not lent out again."""
+        with controller.admit("interactive") as held:
+            with controller.admit("interactive") as idle:
+                pass
+            controller.invalidate()
+        
+        with controller.admit("interactive") as reader:
+            assert reader is not held and reader is not idle
+        assert controller._all_readers == [reader]
@@ -0,0 +1,103 @@
+"""
+Unit tests for sampled and approximate queries.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pyarrow.compute as pc
+import pytest
+
+from tickdb.approx import parse_sample, sample_clause
+from tickdb.core import TickDB, TickDBConfig
+
+from .test_reader import make_ticks
+
+
+class TestSampleSpec:
+    """Test sample specifications."""
+    
+    def test_parse_sample(self):
+        """Test fractions, percentages and row counts."""
+        assert parse_sample(0.05) == 0.05
+        assert parse_sample("5%") == pytest.approx(0.05)
+        assert parse_sample(1000) == 1000
+        assert sample_clause(0.05) == "TABLESAMPLE 5 PERCENT (system)"
+        assert sample_clause(1000) == "TABLESAMPLE 1000 ROWS"
+    
+    @pytest.mark.parametrize("sample", [0, 1.5, -3, "x", True])
+    def test_invalid_sample(self, sample):
+        """Test out-of-range and malformed samples are rejected."""
+        with pytest.raises(ValueError):
+            parse_sample(sample)
+
+
+class TestApproxQueries:
+    """Test sampled reads and bars with error bounds."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def ticks(self):
+        """Enough ticks for system sampling to pick among many vectors."""
+        return make_ticks(["ES"], periods=200_000, freq="10ms")
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir, ticks):
+        """Create TickDB instance with the ticks loaded."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            rollup_intervals=[],
+            approx_sample=0.25
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(ticks, "ticks_v1", "test_source")
+        return tickdb
+    
+    def test_sampled_read(self, tickdb):
+        """Test row-count samples return exactly that many matching rows."""
+        result = tickdb.read("ES", fields=["ts", "price"], sample=500, profile=True)
+        
+        assert len(result.table) == 500
+        assert result.sample == 500
+        assert pc.all(pc.greater_equal(result.table.column("ts")[1:], result.table.column("ts")[:-1])).as_py()
+    
+    def test_approx_read_samples_default_fraction(self, tickdb):
+        """Test approx=True reads a fraction of the rows."""
+        result = tickdb.read("ES", fields=["ts"], approx=True, profile=True)
+        
+        assert result.sample == 0.25
+        assert 0 < len(result.table) < 200_000
+    
+    def test_sampled_bars_within_error_bounds(self, tickdb, ticks):
+        """Test scaled counts and volumes land within their error bounds."""
+        result = tickdb.bars("ES", interval="1d", approx=True).to_pylist()[0]
+        
+        assert result["trade_count"] == pytest.approx(200_000, abs=2 * result["trade_count_error"])
+        volume = pc.sum(ticks.column("size")).as_py()
+        assert result["volume"] == pytest.approx(volume, abs=2 * result["volume_error"])
+        assert 0 < result["volume_error"] < volume
+        assert result["vwap_error"] >= 0
+    
+    def test_quantiles(self, tickdb, ticks):
+        """Test exact and sampled price quantiles."""
+        prices = ticks.column("price").to_numpy()
+        
+        exact = tickdb.bars("ES", interval="1d", aggs=["quantiles"]).to_pylist()[0]
+        assert exact["price_p50"] == pytest.approx(np.quantile(prices, 0.5))
+        assert exact["price_p99"] == pytest.approx(np.quantile(prices, 0.99))
+        
+        approx = tickdb.bars("ES", interval="1d", aggs=["quantiles"], sample="50%").to_pylist()[0]
+        assert prices.min() <= approx["price_p50"] <= prices.max()
+    
+    def test_bars_reject_row_samples(self, tickdb):
+        """Test bars need a fraction to scale their estimates."""
+        with pytest.raises(ValueError):
+            tickdb.bars("ES", sample=1000)
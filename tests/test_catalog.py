@@ -0,0 +1,88 @@
+"""
+Unit tests for the persistent DuckDB catalog.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pyarrow.parquet as pq
+import pytest
+
+from tickdb.catalog import CATALOG_FILE
+from tickdb.core import TickDB, TickDBConfig
+
+from .test_reader import make_ticks
+
+
+class TestCatalog:
+    """Test views, statistics and settings persisted across readers."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def config(self, temp_dir):
+        """Create a configuration with the persistent catalog enabled."""
+        return TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            persistent_catalog=True,
+            memory_limit="1GB"
+        )
+    
+    @pytest.fixture
+    def tickdb(self, config):
+        """Create TickDB instance with data and a refreshed catalog."""
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["AAPL", "MSFT"], periods=60), "ticks_v1", "feed")
+        tickdb.refresh_catalog()
+        return tickdb
+    
+    def test_new_reader_serves_from_catalog(self, tickdb, config):
+        """Test a fresh reader attaches the catalog and queries through its views."""
+        assert (config.data_path / CATALOG_FILE).exists()
+        
+        reader = TickDB(config).reader
+        assert "ticks_v1" in reader._catalog_views
+        assert reader._schema_source("ticks_v1") == 'tickdb_catalog."ticks_v1"'
+        
+        count = reader.duckdb_con.execute('SELECT count(*) FROM tickdb_catalog."ticks_v1"').fetchone()[0]
+        assert count == 120
+        assert len(reader.query({"schema_id": "ticks_v1", "symbol": "AAPL", "fields": ["ts"]})) == 60
+        # Nothing survives pruning: the query runs against the view
+        assert len(reader.query({"schema_id": "ticks_v1", "symbol": "ZZZ", "fields": ["ts"]})) == 0
+        reader.close()
+    
+    def test_catalog_statistics(self, tickdb):
+        """Test schema statistics are cached at refresh time."""
+        stats = tickdb.reader.catalog_statistics("ticks_v1")
+        
+        assert stats["files"] == 1
+        assert stats["total_rows"] == 120
+        assert stats["symbols"] == ["AAPL", "MSFT"]
+        assert tickdb.reader.catalog_statistics("missing") is None
+    
+    def test_settings_applied(self, tickdb):
+        """Test persisted settings are applied to reader connections."""
+        con = tickdb.reader.duckdb_con
+        
+        assert con.execute("SELECT current_setting('parquet_metadata_cache')").fetchone()[0] is True
+        assert con.execute("SELECT current_setting('autoinstall_known_extensions')").fetchone()[0] is False
+    
+    def test_refresh_sees_new_schema(self, tickdb, config):
+        """Test a refresh replaces the catalog under attached readers."""
+        other = TickDB(config).reader
+        (config.data_path / "quotes").mkdir()
+        pq.write_table(make_ticks(["ES"], periods=10), config.data_path / "quotes" / "part.parquet")
+        
+        tickdb.refresh_catalog()
+        
+        assert "quotes" in tickdb.reader._catalog_views
+        # Readers attached before the refresh keep serving the old catalog
+        assert "quotes" not in other._catalog_views
+        assert other.duckdb_con.execute('SELECT count(*) FROM tickdb_catalog."ticks_v1"').fetchone()[0] == 120
+        other.close()
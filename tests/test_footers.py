@@ -0,0 +1,158 @@
+"""
+Unit tests for footer-answered metadata calls.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.footers import FooterCache, footer_cache
+
+from .test_reader import make_ticks
+
+
+class TestFooterMetadata:
+    """Test metadata, symbol and date range calls answered from footers."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with one file per symbol set and small row groups."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            batch_size=50
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["AAPL", "MSFT"], periods=100), "ticks_v1", "a")
+        tickdb.loader.store_table(
+            make_ticks(["ES"], start="2025-01-02", periods=100), "ticks_v1", "b"
+        )
+        return tickdb
+    
+    def scan(self, tickdb, symbol=None):
+        """Reference answer computed by scanning every row."""
+        files = sorted((tickdb.config.data_path / "ticks_v1").glob("*.parquet"))
+        table = pd.concat([pq.read_table(f).to_pandas() for f in files])
+        if symbol is not None:
+            table = table[table["symbol"] == symbol]
+        return table["ts"].min(), table["ts"].max(), len(table)
+    
+    def test_get_metadata_totals_all_files(self, tickdb):
+        """Test row counts cover every file, not just the first."""
+        metadata = tickdb.reader.get_metadata("ticks_v1")
+        
+        assert metadata["total_files"] == 2
+        assert metadata["total_rows"] == 300
+        assert metadata["symbols"] == ["AAPL", "ES", "MSFT"]
+        assert {"ts", "symbol", "price", "size"} <= set(metadata["columns"])
+        assert len(metadata["file_sizes"]) == 2
+        assert metadata["date_range"]["max_ts"] == pd.Timestamp("2025-01-02 00:01:39")
+    
+    def test_get_date_range_matches_scan(self, tickdb):
+        """Test footer-derived ranges equal a full scan, with and without a symbol."""
+        for symbol in (None, "AAPL", "ES"):
+            date_range = tickdb.reader.get_date_range(symbol, "ticks_v1")
+            expected = self.scan(tickdb, symbol)
+            assert (date_range["min_ts"], date_range["max_ts"], date_range["total_rows"]) == expected
+        
+        assert tickdb.reader.get_date_range("NOPE", "ticks_v1")["total_rows"] == 0
+    
+    def test_list_symbols_without_footer_list(self, tickdb, temp_dir):
+        """Test files written without a symbol list are scanned as a fallback."""
+        legacy = make_ticks(["ZN", "ZB"], periods=10).replace_schema_metadata(None)
+        pq.write_table(legacy, temp_dir / "data" / "ticks_v1" / "legacy.parquet")
+        
+        assert tickdb.reader.list_symbols("ticks_v1") == ["AAPL", "ES", "MSFT", "ZB", "ZN"]
+    
+    def test_list_symbols_from_partitions(self, tickdb, temp_dir):
+        """Test symbol-partitioned layouts list symbols from directory names."""
+        schema_path = temp_dir / "data" / "ticks_v2"
+        for symbol in ("NQ", "CL"):
+            (schema_path / f"symbol={symbol}").mkdir(parents=True)
+        
+        assert tickdb.reader.list_symbols("ticks_v2") == ["CL", "NQ"]
+    
+    def test_footer_cache_invalidated_on_rewrite(self, temp_dir):
+        """Test cached footers are reread when a file changes."""
+        file_path = temp_dir / "ticks.parquet"
+        pq.write_table(make_ticks(["ES"], periods=10), file_path)
+        assert footer_cache.get(file_path).num_rows == 10
+        assert footer_cache.get(file_path) is footer_cache.get(file_path)
+        
+        pq.write_table(make_ticks(["ES"], periods=25), file_path)
+        assert footer_cache.get(file_path).num_rows == 25
+
+
+class TestFooterCache:
+    """Test the footer cache budget, directory listings and warm-up."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    def write_files(self, directory, count):
+        """Write `count` small tick files into a directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            pq.write_table(make_ticks(["ES"], periods=10), directory / f"part_{i:03d}.parquet")
+    
+    def settle(self, directory):
+        """Backdate a directory's mtime so its listing can be cached."""
+        past = time.time() - 60
+        os.utime(directory, (past, past))
+    
+    def test_evicts_least_recently_used_over_budget(self, temp_dir):
+        """Test the cache stays within its memory budget."""
+        self.write_files(temp_dir, 4)
+        files = sorted(temp_dir.glob("*.parquet"))
+        cache = FooterCache()
+        one = cache.get(files[0]).serialized_size
+        cache.set_budget(one * 2)
+        
+        for file_path in files:
+            cache.get(file_path)
+        
+        assert len(cache) == 2
+        assert cache.nbytes <= one * 2
+        assert cache.get(files[-1]) is cache.get(files[-1])
+    
+    def test_listing_cached_until_directory_changes(self, temp_dir):
+        """Test directory listings are reused until a file is added."""
+        self.write_files(temp_dir, 2)
+        self.settle(temp_dir)
+        cache = FooterCache()
+        
+        listing = cache.list_files(temp_dir)
+        assert cache.list_files(temp_dir) is listing
+        
+        pq.write_table(make_ticks(["NQ"], periods=10), temp_dir / "part_new.parquet")
+        assert len(cache.list_files(temp_dir)) == 3
+    
+    def test_warm_up(self, temp_dir):
+        """Test readers can preload every footer of the lake."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        self.write_files(temp_dir / "data" / "ticks_v1", 3)
+        footer_cache.clear()
+        
+        tickdb = TickDB(config)
+        assert tickdb.reader.warm_up(["ticks_v1"]) == 3
+        assert len(footer_cache) == 3
@@ -0,0 +1,91 @@
+"""
+Unit tests for query latency histograms.
+"""
+
+import numpy as np
+import pytest
+from prometheus_client import CollectorRegistry
+
+from tickdb.latency import LatencyHistogram, latency_from_exposition, query_shape
+from tickdb.metrics import MetricsCollector
+
+
+class TestLatencyHistogram:
+    """Test quantiles of the log-linear histogram."""
+    
+    def test_quantiles_within_precision(self):
+        """Test quantiles stay within the relative precision at any magnitude."""
+        values = np.random.default_rng(0).lognormal(mean=7, sigma=2, size=20_000).astype(int) + 1
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        
+        for quantile in [0.5, 0.9, 0.99, 0.999]:
+            exact = np.sort(values)[int(round(quantile * len(values))) - 1]
+            assert histogram.value_at_quantile(quantile) == pytest.approx(exact, rel=2 ** -histogram.precision_bits)
+        assert histogram.value_at_quantile(1.0) == values.max()
+        assert histogram.count == len(values)
+    
+    def test_merge(self):
+        """Test merging equals recording both sets of values."""
+        first, second, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        first.record_many_ms([0.1, 2.5, 40.0])
+        second.record_many_ms([0.3, 900.0])
+        both.record_many_ms([0.1, 2.5, 40.0, 0.3, 900.0])
+        first.merge(second)
+        
+        assert first.counts == both.counts
+        assert first.summary() == both.summary()
+        with pytest.raises(ValueError):
+            first.merge(LatencyHistogram(precision_bits=3))
+    
+    def test_query_shape(self):
+        """Test shapes name the filters set, not their values."""
+        assert query_shape("read", {"symbol": "AAPL", "ts_start": "2025-01-02", "ts_end": None}) == "read:symbol+ts"
+        assert query_shape("read", {"symbol": None, "limit": 10}) == "read:limit"
+        assert query_shape("snapshot") == "snapshot"
+
+
+class TestQueryLatencyMetrics:
+    """Test latencies are exported per schema and query shape."""
+    
+    @pytest.fixture
+    def collector(self):
+        """Create a collector on an isolated registry."""
+        collector = MetricsCollector(registry=CollectorRegistry(), flush_interval=3600)
+        for i in range(1000):
+            collector.record_query(1 + i / 100, 10, schema_id="ticks_v1", shape="read:symbol+ts")
+        collector.record_query(50.0, 0, schema_id="ticks_v1", shape="bars:symbol")
+        collector.record_query(80.0, 0, schema_id="ticks_v1", shape="bars:symbol", status="failed")
+        return collector
+    
+    def test_quantiles_in_get_metrics(self, collector):
+        """Test successful queries feed per-shape and per-schema quantiles."""
+        latency = collector.get_metrics()["latency"]["ticks_v1"]
+        
+        assert latency["all"]["count"] == 1001
+        assert latency["shapes"]["bars:symbol"]["count"] == 1
+        assert latency["shapes"]["read:symbol+ts"]["p50_ms"] == pytest.approx(5.99, rel=0.01)
+        assert latency["shapes"]["read:symbol+ts"]["p99.9_ms"] == pytest.approx(10.98, rel=0.01)
+        assert latency["all"]["max_ms"] == 50.0
+    
+    def test_prometheus_export(self, collector):
+        """Test fine buckets and quantile gauges survive a scrape."""
+        registry = collector.registry
+        labels = {"schema_id": "ticks_v1", "shape": "read:symbol+ts"}
+        
+        assert registry.get_sample_value("tickdb_query_latency_seconds_count", labels) == 1000
+        assert registry.get_sample_value("tickdb_query_latency_seconds_bucket", {**labels, "le": "0.0016"}) == 60
+        assert registry.get_sample_value("tickdb_query_latency_seconds_bucket", {**labels, "le": "0.0064"}) == 540
+        
+        scraped = latency_from_exposition(collector.get_prometheus_metrics())["ticks_v1"]
+        local = collector.get_latency()["ticks_v1"]
+        assert scraped["all"]["count"] == 1001
+        assert scraped["all"]["p99_ms"] == pytest.approx(local["all"]["p99_ms"])
+        assert scraped["shapes"]["bars:symbol"]["p50_ms"] == pytest.approx(50.0)
+    
+    def test_reset(self, collector):
+        """Test resetting metrics drops recorded latencies."""
+        collector.reset_metrics()
+        
+        assert collector.get_metrics()["latency"] == {}
@@ -0,0 +1,87 @@
+"""
+Unit tests for per-stage ingest timings.
+"""
+
+import gzip
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import pyarrow.csv as csv
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.synth import SynthSpec, generate
+
+from .test_reader import make_ticks
+
+
+class TestIngestStages:
+    """Test load and store results report where ingest time went."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            rollup_intervals=[]
+        )
+        return TickDB(config)
+    
+    def test_load_gzip_stages(self, tickdb, temp_dir):
+        """Test every stage of a gzipped CSV load is timed."""
+        path = temp_dir / "ticks.csv.gz"
+        with gzip.open(path, "wb") as f:
+            csv.write_csv(generate(SynthSpec(rows=5_000, symbols=10)), f)
+        
+        result = tickdb.load_raw("feed", path, "ticks_v1")
+        stages = result["stages"]
+        
+        assert result["rows_processed"] == 5_000
+        for stage in ["decompress", "parse", "metadata", "partition", "sort", "encode", "fsync", "sketches"]:
+            assert stages[stage] >= 0
+        assert {"validate.schema", "validate.fields", "validate.prices", "validate.duplicates"} <= set(stages)
+        assert sum(stages.values()) <= result["processing_time_ms"]
+    
+    def test_rejected_table_stages(self, tickdb):
+        """Test a rejected table is timed through quarantine, without writes."""
+        table = make_ticks(["AAPL"], periods=100).drop_columns(["size"])
+        
+        result = tickdb.loader.store_table(table, "ticks_v1", "feed")
+        
+        assert result["rows_failed"] == 100
+        assert set(result["stages"]) == {"metadata", "validate.schema", "quarantine"}
+    
+    def test_fsync_disabled(self, temp_dir):
+        """Test files are not synced when fsync_writes is off."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            fsync_writes=False
+        )
+        result = TickDB(config).loader.store_table(make_ticks(["AAPL"], periods=100), "ticks_v1", "feed")
+        
+        assert "encode" in result["stages"]
+        assert "fsync" not in result["stages"]
+    
+    def test_metrics_receive_stages(self, tickdb, temp_dir):
+        """Test load_raw passes schema, duration and stages to the metrics."""
+        path = temp_dir / "ticks.csv"
+        csv.write_csv(generate(SynthSpec(rows=1_000, symbols=5)), path)
+        tickdb.metrics = Mock()
+        
+        result = tickdb.load_raw("feed", path, "ticks_v1")
+        kwargs = tickdb.metrics.record_ingest.call_args.kwargs
+        
+        assert kwargs["schema_id"] == "ticks_v1"
+        assert kwargs["duration_seconds"] == pytest.approx(result["processing_time_ms"] / 1000)
+        assert kwargs["stages"] == result["stages"]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the batched metrics hot path.
+"""
+
+import threading
+
+import pytest
+from prometheus_client import CollectorRegistry, Histogram
+
+from tickdb.metrics import MetricsCollector
+
+
+class TestMetricsFastPath:
+    """Test batched counters and observations reach Prometheus intact."""
+    
+    @pytest.fixture
+    def registry(self):
+        """Create an isolated Prometheus registry."""
+        return CollectorRegistry()
+    
+    @pytest.fixture
+    def collector(self, registry):
+        """Create a collector that only flushes on demand."""
+        return MetricsCollector(registry=registry, flush_interval=3600)
+    
+    def test_counters_batched_until_flush(self, collector, registry):
+        """Test updates stay in the thread's buffer until flushed."""
+        for _ in range(3):
+            collector.record_query(2.0, 10, schema_id="ticks_v1")
+        pending = list(collector._buffer().pending.values())
+        
+        assert pending == [[3, 30, 6.0]]
+        assert collector._series[("query", "ticks_v1", "success")].queries._value.get() == 0
+        
+        stats = collector.get_metrics()["metrics"]["query_ticks_v1"]
+        assert collector._buffer().pending == {}
+        assert registry.get_sample_value("tickdb_query_total", {"schema_id": "ticks_v1", "status": "success"}) == 3
+        assert registry.get_sample_value("tickdb_query_rows_total", {"schema_id": "ticks_v1"}) == 30
+        assert stats["total_queries"] == 3
+        assert stats["avg_latency_ms"] == pytest.approx(2.0)
+    
+    def test_scrape_flushes(self, collector):
+        """Test the exposition output includes unflushed updates."""
+        collector.record_ingest("feed", 1024, 100, 5, schema_id="ticks_v1", duration_seconds=0.5)
+        
+        text = collector.get_prometheus_metrics()
+        
+        assert 'tickdb_ingest_rows_total{schema_id="ticks_v1",source_id="feed",status="failed"} 5.0' in text
+        assert 'tickdb_ingest_duration_seconds_count{schema_id="ticks_v1",source_id="feed"} 1.0' in text
+    
+    def test_histogram_buckets_match_observe(self, collector, registry):
+        """Test batched observations land in the buckets observe() would pick."""
+        reference = Histogram("reference_seconds", "Reference", buckets=[0.001, 0.01, 0.1, 1.0], registry=registry)
+        stages = [{"parse": 0.5, "sort": 10.0}, {"parse": 1.0, "sort": 2000.0}, {"parse": 100.0}]
+        for stage_ms in stages:
+            collector.record_ingest("feed", 1, 1, 0, schema_id="ticks_v1", stages=stage_ms)
+            reference.observe(stage_ms["parse"] / 1000.0)
+        collector.flush()
+        
+        for bound in ["0.001", "0.01", "0.1", "1.0", "+Inf"]:
+            batched = registry.get_sample_value(
+                "tickdb_ingest_stage_seconds_bucket",
+                {"source_id": "feed", "schema_id": "ticks_v1", "stage": "parse", "le": bound}
+            )
+            assert batched == registry.get_sample_value("reference_seconds_bucket", {"le": bound})
+        assert registry.get_sample_value(
+            "tickdb_ingest_stage_seconds_count",
+            {"source_id": "feed", "schema_id": "ticks_v1", "stage": "sort"}
+        ) == 2
+    
+    def test_threads_flushed_and_forgotten(self, collector, registry):
+        """Test every thread's updates are flushed and finished threads' buffers dropped."""
+        def work():
+            for _ in range(500):
+                collector.record_append("ticks_v1", 2, 0, duration_seconds=0.01)
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        collector.flush()
+        
+        labels = {"source_id": "append", "schema_id": "ticks_v1", "status": "success"}
+        assert registry.get_sample_value("tickdb_ingest_total", labels) == 2000
+        assert registry.get_sample_value("tickdb_ingest_rows_total", labels) == 4000
+        assert len(collector._buffers) == 0
+    
+    def test_interval_flush(self, registry):
+        """Test a zero interval flushes on every call."""
+        collector = MetricsCollector(registry=registry, flush_interval=0)
+        collector.record_query(1.0, 1, schema_id="ticks_v1", status="failed")
+        
+        assert registry.get_sample_value("tickdb_query_total", {"schema_id": "ticks_v1", "status": "failed"}) == 1
+        assert registry.get_sample_value("tickdb_query_rows_total", {"schema_id": "ticks_v1"}) is None
+    
+    def test_summaries_exported(self, collector, registry):
+        """Test batched and direct summary observations are scraped with their count and sum."""
+        collector.record_query(2.0, 1, schema_id="ticks_v1")
+        collector.query_latency_ms.labels(schema_id="ticks_v1").observe(3.0)
+        
+        assert registry.get_sample_value("tickdb_query_latency_ms_count", {"schema_id": "ticks_v1"}) == 2
+        assert registry.get_sample_value("tickdb_query_latency_ms_sum", {"schema_id": "ticks_v1"}) == pytest.approx(5.0)
+        assert "# TYPE tickdb_query_latency_ms summary" in collector.get_prometheus_metrics()
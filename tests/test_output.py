@@ -0,0 +1,90 @@
+"""
+Unit tests for output adapters.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.output import convert, to_numpy, to_pandas
+
+from .test_reader import make_ticks
+
+
+class TestOutputAdapters:
+    """Test conversions share Arrow buffers where types allow."""
+    
+    @pytest.fixture
+    def table(self):
+        """Table with fixed-width, nullable and string columns."""
+        return pa.table({
+            "ts": pa.array(pd.date_range("2025-01-01", periods=4, freq="1s"), type=pa.timestamp("ns")),
+            "price": pa.array([1.0, 2.0, 3.0, 4.0]),
+            "size": pa.array([1, None, 3, 4], type=pa.int64()),
+            "symbol": pa.array(["ES", "ES", "NQ", "NQ"]),
+        })
+    
+    def test_numpy_views_fixed_width_columns(self, table):
+        """Test fixed-width columns without nulls are zero-copy views."""
+        arrays = to_numpy(table)
+        
+        price_buffer = table.column("price").chunk(0).buffers()[1]
+        assert arrays["price"].ctypes.data == price_buffer.address
+        assert not arrays["price"].flags.writeable
+        assert arrays["ts"].dtype == np.dtype("datetime64[ns]")
+        # Nulls and strings need a conversion
+        assert np.isnan(arrays["size"][1])
+        assert list(arrays["symbol"]) == ["ES", "ES", "NQ", "NQ"]
+    
+    def test_numpy_multi_chunk(self, table):
+        """Test multi-chunk columns are concatenated once."""
+        arrays = to_numpy(pa.concat_tables([table, table]))
+        
+        assert arrays["price"].tolist() == [1.0, 2.0, 3.0, 4.0] * 2
+    
+    def test_pandas_arrow_backed(self, table):
+        """Test pandas output uses Arrow-backed dtypes over the same buffers."""
+        df = to_pandas(table)
+        
+        assert isinstance(df["price"].dtype, pd.ArrowDtype)
+        assert isinstance(df["symbol"].dtype, pd.ArrowDtype)
+        assert df["size"].isna().tolist() == [False, True, False, False]
+        price = df["price"].array._pa_array.chunk(0)
+        assert price.buffers()[1].address == table.column("price").chunk(0).buffers()[1].address
+    
+    def test_polars(self, table):
+        """Test polars output."""
+        pl = pytest.importorskip("polars")
+        
+        df = convert(table, "polars")
+        
+        assert isinstance(df, pl.DataFrame)
+        assert df["price"].to_list() == [1.0, 2.0, 3.0, 4.0]
+    
+    def test_unknown_output(self, table):
+        """Test unknown formats are rejected."""
+        assert convert(table, "arrow") is table
+        with pytest.raises(ValueError):
+            convert(table, "excel")
+    
+    def test_read_output(self):
+        """Test TickDB.read converts its result."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = TickDBConfig(
+                data_path=Path(tmpdir) / "data",
+                quarantine_path=Path(tmpdir) / "quarantine",
+                enable_metrics=False
+            )
+            tickdb = TickDB(config)
+            tickdb.loader.store_table(make_ticks(["ES"], periods=10), "ticks_v1", "feed")
+            
+            arrays = tickdb.read(symbol="ES", fields=["ts", "price"], schema_id="ticks_v1", output="numpy")
+            df = tickdb.read(symbol="ES", fields=["ts", "price"], schema_id="ticks_v1", output="pandas")
+            
+            assert len(arrays["price"]) == 10
+            assert df["price"].tolist() == arrays["price"].tolist()
@@ -0,0 +1,147 @@
+"""
+Unit tests for keyset pagination.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.pagination import PageKey, decode_cursor, encode_cursor
+
+from .test_reader import make_ticks
+
+
+class TestCursor:
+    """Test resume token encoding."""
+    
+    def test_round_trip(self):
+        """Test a token decodes to the key it encodes."""
+        key = PageKey(ts=1_735_689_600_000_000_001, symbol="AAPL", file="ticks_v1_a.parquet", row=42)
+        token = encode_cursor(key, "abc")
+        
+        assert decode_cursor(token, "abc") == key
+        assert "=" not in token
+    
+    @pytest.mark.parametrize("token", ["", "not-a-token", encode_cursor(PageKey(ts=1, symbol="A", file="f", row=0), "other")])
+    def test_invalid_cursor(self, token):
+        """Test malformed tokens and tokens of other queries are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor(token, "abc")
+
+
+class TestPagination:
+    """Test paging through reads with resume tokens."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with three days of ticks, one day duplicated."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+        for day in ["2025-01-01", "2025-01-02", "2025-01-03"]:
+            tickdb.loader.store_table(make_ticks(["AAPL", "MSFT"], start=day, periods=500), "ticks_v1", "feed")
+        # Identical ticks in a second file: only the row position tells them apart
+        tickdb.loader.store_table(make_ticks(["AAPL", "MSFT"], start="2025-01-02", periods=500), "ticks_v1", "copy")
+        return tickdb
+    
+    def read_all(self, tickdb, page_size, **kwargs):
+        """Page through a read, returning the pages."""
+        pages = []
+        cursor = None
+        while True:
+            page = tickdb.read(page_size=page_size, cursor=cursor, **kwargs)
+            pages.append(page)
+            cursor = page.cursor
+            if cursor is None:
+                return pages
+    
+    def test_pages_cover_result_once(self, tickdb):
+        """Test pages concatenate to the full, ordered result."""
+        pages = self.read_all(tickdb, 333, fields=["ts", "symbol", "price"])
+        paged = pa.concat_tables(page.table for page in pages)
+        full = tickdb.read(fields=["ts", "symbol", "price"]).sort_by([("ts", "ascending"), ("symbol", "ascending")])
+        
+        assert len(paged) == 4000
+        assert [page.rows_returned for page in pages] == [333] * 12 + [4]
+        assert paged.column_names == ["ts", "symbol", "price"]
+        assert paged.equals(full)
+    
+    def test_exact_multiple_has_no_empty_page(self, tickdb):
+        """Test the last full page carries no cursor."""
+        pages = self.read_all(tickdb, 250, symbol="AAPL")
+        
+        assert [page.rows_returned for page in pages] == [250] * 8
+    
+    def test_pages_read_from_few_files(self, tickdb, temp_dir):
+        """Test pages only scan the files around them, never earlier ones."""
+        files = sorted((temp_dir / "data" / "ticks_v1").glob("*.parquet"), key=lambda f: f.stat().st_mtime_ns)
+        pages = self.read_all(tickdb, 900, fields=["ts"])
+        first = tickdb.read(page_size=10, fields=["ts"], profile=True)
+        deep = tickdb.read(page_size=10, cursor=pages[-2].cursor, fields=["ts"], profile=True)
+        
+        assert first.profile.files_scanned == 1
+        assert files[0].name in first.profile.sql
+        assert deep.profile.files_scanned == 1
+        assert files[2].name in deep.profile.sql
+        assert deep.table.column("ts")[0].as_py() >= pages[-2].table.column("ts")[-1].as_py()
+    
+    def test_cursor_bound_to_query(self, tickdb):
+        """Test a cursor cannot resume a query with other filters."""
+        page = tickdb.read(symbol="AAPL", page_size=10)
+        
+        with pytest.raises(ValueError, match="different query"):
+            tickdb.read(symbol="MSFT", page_size=10, cursor=page.cursor)
+        with pytest.raises(ValueError):
+            tickdb.read(symbol="AAPL", page_size=10, limit=5)
+    
+    def test_page_output_format(self, tickdb):
+        """Test pages are converted to the requested output."""
+        page = tickdb.read(symbol="AAPL", page_size=10, output="pandas")
+        
+        assert list(page.table.columns) == ["ts", "symbol", "price", "size", *page.table.columns[4:]]
+        assert len(page.table) == 10
+        assert page.cursor is not None
+    
+    def test_falsy_unsupported_options_rejected(self, tickdb):
+        """Test unsupported options are rejected whatever their value."""
+        for option in [{"limit": 0}, {"sample": 0}, {"approx": False}]:
+            with pytest.raises(ValueError, match="do not support"):
+                tickdb.reader.query_page({"symbol": "AAPL", **option}, 10)
+        with pytest.raises(ValueError):
+            tickdb.read(symbol="AAPL", page_size=10, limit=0)
+    
+    def test_pruned_page_has_schema_columns(self, tickdb, temp_dir):
+        """Test pages pruned to no files bind the fields of their own schema."""
+        events = pa.table({
+            "ts": pa.array([1_735_689_600_000_000_000], pa.timestamp("ns")),
+            "symbol": ["NVDA"],
+            "event_type": ["filing"],
+            "content": ["10-K"],
+            "score": [0.5],
+            "source": ["edgar"],
+        })
+        tickdb.loader.store_table(events, "alt_nvd_v1", "edgar")
+        (temp_dir / "data" / "quotes").mkdir()
+        pq.write_table(events.select(["ts", "symbol", "score"]), temp_dir / "data" / "quotes" / "part.parquet")
+        
+        registered = tickdb.read(schema_id="alt_nvd_v1", symbol="ZZZ", fields=["ts", "event_type", "score"], page_size=10)
+        unregistered = tickdb.read(schema_id="quotes", symbol="ZZZ", fields=["score"], page_size=10)
+        
+        assert registered.table.schema.names == ["ts", "event_type", "score"]
+        assert registered.table.schema.field("score").type == pa.float64()
+        assert registered.rows_returned == 0 and registered.cursor is None
+        assert unregistered.table.schema.names == ["score"]
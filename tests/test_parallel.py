@@ -0,0 +1,77 @@
+"""
+Unit tests for parallel partition-split scans.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.parallel import split_units
+
+from .test_reader import make_ticks
+
+
+class TestParallelScan:
+    """Test process-pool scans against the in-process reader."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with several overlapping files."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            scan_workers=2
+        )
+        tickdb = TickDB(config)
+        for i in range(5):
+            tickdb.loader.store_table(
+                make_ticks(["ES", "NQ", "CL"], start=f"2025-01-01 00:00:{i:02d}", freq="5s"),
+                "ticks_v1",
+                f"feed{i}"
+            )
+        yield tickdb
+        tickdb.reader.close()
+    
+    def test_ordered_matches_read_symbols(self, tickdb):
+        """Test an ordered parallel read returns the same rows in ts order."""
+        kwargs = {
+            "ts_start": "2025-01-01T00:01:00",
+            "ts_end": "2025-01-01T00:05:00",
+            "fields": ["ts", "symbol", "price"]
+        }
+        result = tickdb.read_parallel(["ES", "CL"], **kwargs)
+        
+        ts = result.column("ts").to_numpy().astype("int64")
+        assert (np.diff(ts) >= 0).all()
+        
+        expected = tickdb.reader.read_symbols(["ES", "CL"], **kwargs)
+        assert sorted(zip(*result.to_pydict().values())) == sorted(zip(*expected.to_pydict().values()))
+    
+    def test_unordered_and_empty(self, tickdb):
+        """Test relaxed ordering returns every row, and empty ranges a typed table."""
+        result = tickdb.read_parallel(ordered=False, workers=3)
+        assert len(result) == 5 * 3 * 120
+        
+        empty = tickdb.read_parallel("ES", ts_start="2030-01-01", fields=["ts", "price"])
+        assert len(empty) == 0
+        assert empty.column_names == ["ts", "price"]
+    
+    def test_split_units(self):
+        """Test work units are contiguous and cover every file once."""
+        files = [Path(f"f{i}") for i in range(10)]
+        
+        units = split_units(files, workers=2)
+        
+        assert len(units) == 8
+        assert [f for unit in units for f in unit] == files
+        assert split_units(files[:3], workers=4) == [[f] for f in files[:3]]
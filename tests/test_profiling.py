@@ -0,0 +1,88 @@
+"""
+Unit tests for query profiling.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.metrics import MetricsCollector
+from tickdb.profiling import QueryProfile
+from tickdb.reader import QueryResult
+
+from .test_reader import make_ticks
+
+
+class TestProfiling:
+    """Test the profile surface of reads."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with one file per hour and small row groups."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            batch_size=60
+        )
+        tickdb = TickDB(config)
+        for hour in range(3):
+            tickdb.loader.store_table(
+                make_ticks(["ES"], start=f"2025-01-01 0{hour}:00:00", periods=600), "ticks_v1", "feed"
+            )
+        return tickdb
+    
+    def test_read_profile(self, tickdb):
+        """Test profiled reads report pruning, bytes and stage timings."""
+        kwargs = {
+            "symbol": "ES",
+            "ts_start": "2025-01-01 01:02:00",
+            "ts_end": "2025-01-01 01:03:59",
+            "fields": ["ts", "price"],
+            "schema_id": "ticks_v1"
+        }
+        result = tickdb.read(profile=True, **kwargs)
+        
+        assert isinstance(result, QueryResult)
+        assert result.table.equals(tickdb.read(**kwargs))
+        
+        profile = result.profile
+        assert profile.files_considered == 3
+        assert profile.files_pruned == 2
+        assert profile.files_scanned == result.files_scanned == 1
+        assert profile.row_groups_total == 10
+        assert profile.row_groups_skipped == 8
+        assert profile.bytes_scanned == result.bytes_scanned > 0
+        assert profile.rows_returned == 120
+        assert {"prune", "scan"} <= set(profile.stages)
+        assert "TABLE_SCAN" in [op.operator_type for op in profile.operators]
+    
+    def test_explain(self, tickdb):
+        """Test explain returns a profile and narrower projections read fewer bytes."""
+        wide = tickdb.explain("ES", fields=["ts", "symbol", "price", "size"])
+        narrow = tickdb.explain("ES", fields=["ts", "price"])
+        
+        assert isinstance(wide, QueryProfile)
+        assert wide.files_pruned == 0
+        assert wide.row_groups_skipped == 0
+        assert 0 < narrow.bytes_scanned < wide.bytes_scanned
+        assert wide.rows_scanned == 1800
+    
+    def test_profile_metrics_labelled_by_schema(self, tickdb):
+        """Test profiled reads and explains export their profile under the schema."""
+        tickdb.metrics = MetricsCollector(registry=CollectorRegistry())
+        tickdb.read("ES", fields=["ts"], profile=True)
+        tickdb.explain("ES", fields=["ts"])
+        
+        registry = tickdb.metrics.registry
+        assert registry.get_sample_value("tickdb_query_files_scanned_count", {"schema_id": "ticks_v1"}) == 2
+        assert registry.get_sample_value("tickdb_query_files_scanned_count", {"schema_id": "unknown"}) is None
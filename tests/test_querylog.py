@@ -0,0 +1,134 @@
+"""
+Unit tests for the slow-query log and its replay tool.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tickdb.cli import main
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.querylog import SlowQueryLog, replay_queries
+
+from .test_reader import make_ticks
+
+
+class TestSlowQueryLog:
+    """Test slow-query capture and replay."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def config(self, temp_dir):
+        """Create a configuration that logs every read."""
+        return TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            slow_query_log_path=temp_dir / "slow_queries",
+            slow_query_threshold_ms=0.0,
+            slow_query_profile=True
+        )
+    
+    @pytest.fixture
+    def tickdb(self, config):
+        """Create TickDB instance with two symbols of ticks."""
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["ES", "NQ"]), "ticks_v1", "feed")
+        return tickdb
+    
+    def test_captures_normalized_entries(self, tickdb, config):
+        """Test slow reads are logged with normalized parameters and profiles."""
+        tickdb.read("ES", ts_start="2025-01-01 00:00:30", fields=["ts", "price"], schema_id="ticks_v1")
+        tickdb.read("NQ", ts_start="2025-01-01 00:01:00", fields=["ts", "price"], schema_id="ticks_v1")
+        
+        log = SlowQueryLog.read(config.slow_query_log_path)
+        
+        assert len(log) == 2
+        first = log.slice(0, 1).to_pylist()[0]
+        assert json.loads(first["params"]) == {
+            "fields": ["ts", "price"],
+            "schema_id": "ticks_v1",
+            "symbol": "ES",
+            "ts_start": "2025-01-01 00:00:30"
+        }
+        assert first["rows_returned"] == 90
+        assert first["files_scanned"] == 1
+        assert json.loads(first["profile"])["files_scanned"] == 1
+        # Same shape, different values
+        assert len(set(log.column("fingerprint").to_pylist())) == 1
+    
+    def test_threshold(self, temp_dir, config):
+        """Test fast reads are not logged."""
+        tickdb = TickDB(config.model_copy(update={"slow_query_threshold_ms": 60_000.0}))
+        tickdb.loader.store_table(make_ticks(["ES"]), "ticks_v1", "feed")
+        
+        tickdb.read("ES", fields=["ts"], schema_id="ticks_v1")
+        
+        assert len(SlowQueryLog.read(config.slow_query_log_path)) == 0
+    
+    def test_replay(self, tickdb, config):
+        """Test replay re-runs every captured query and reports percentiles."""
+        for symbol in ["ES", "NQ", "ES"]:
+            tickdb.read(symbol, fields=["ts", "price"], schema_id="ticks_v1")
+        
+        summary = replay_queries(config, config.slow_query_log_path, concurrency=2, repeat=2)
+        
+        assert summary["queries"] == 6
+        assert summary["errors"] == 0
+        assert all(r["replayed_rows"] == r["captured_rows"] == 120 for r in summary["results"])
+        assert set(summary["p99"]) == {"captured_ms", "replayed_ms", "delta_ms"}
+        # Replayed queries are not logged again
+        assert len(SlowQueryLog.read(config.slow_query_log_path)) == 3
+    
+    def test_replay_keeps_sample(self, tickdb, config):
+        """Test sampled and approximate queries are logged and replayed sampled."""
+        tickdb.read("ES", fields=["ts", "price"], schema_id="ticks_v1", sample=50)
+        tickdb.read("NQ", fields=["ts", "price"], schema_id="ticks_v1", approx=True)
+        
+        log = SlowQueryLog.read(config.slow_query_log_path).to_pylist()
+        assert [json.loads(entry["params"]).get("sample") for entry in log] == [50, config.approx_sample]
+        
+        summary = replay_queries(config, config.slow_query_log_path, concurrency=1)
+        
+        assert summary["errors"] == 0
+        assert [r["params"]["sample"] for r in summary["results"]] == [50, config.approx_sample]
+        assert summary["results"][0]["replayed_rows"] == summary["results"][0]["captured_rows"] == 50
+    
+    def test_replay_command(self, tickdb, config, temp_dir):
+        """Test the replay-queries CLI command."""
+        tickdb.read("ES", fields=["ts", "price"], schema_id="ticks_v1")
+        config_file = temp_dir / "config.json"
+        config_file.write_text(config.model_dump_json())
+        
+        result = CliRunner().invoke(main, [
+            "--config", str(config_file),
+            "replay-queries", str(config.slow_query_log_path),
+            "--output", str(temp_dir / "replay.json")
+        ])
+        
+        assert result.exit_code == 0, result.output
+        assert "p95" in result.output
+        assert len(json.loads((temp_dir / "replay.json").read_text())) == 1
+    
+    def test_replay_pages(self, tickdb, config):
+        """Test paged reads are logged with their page size and cursor and replayed as the same page."""
+        first = tickdb.read("ES", fields=["ts", "price"], schema_id="ticks_v1", page_size=50)
+        second = tickdb.read("ES", fields=["ts", "price"], schema_id="ticks_v1", page_size=50, cursor=first.cursor)
+        
+        log = SlowQueryLog.read(config.slow_query_log_path).to_pylist()
+        params = [json.loads(entry["params"]) for entry in log]
+        assert params[0] == {"fields": ["ts", "price"], "page_size": 50, "schema_id": "ticks_v1", "symbol": "ES"}
+        assert params[1] == {**params[0], "cursor": first.cursor}
+        
+        summary = replay_queries(config, config.slow_query_log_path, concurrency=1)
+        
+        assert summary["errors"] == 0
+        assert [r["replayed_rows"] for r in summary["results"]] == [len(first.table), len(second.table)] == [50, 50]
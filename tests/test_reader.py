@@ -0,0 +1,363 @@
+"""
+Unit tests for TickDB query APIs.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+
+
+def make_ticks(symbols, start="2025-01-01", periods=120, freq="1s", price=100.0):
+    """Build a ticks_v1 table with one tick per symbol per period."""
+    frames = []
+    for i, symbol in enumerate(symbols):
+        frames.append(pd.DataFrame({
+            "ts": pd.date_range(start, periods=periods, freq=freq),
+            "symbol": [symbol] * periods,
+            "price": [price + i + j * 0.01 for j in range(periods)],
+            "size": [10 + j % 5 for j in range(periods)]
+        }))
+    return pa.Table.from_pandas(pd.concat(frames), preserve_index=False)
+
+
+class TestBars:
+    """Test time-bucket aggregation."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with two symbols of ticks."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["ES", "NQ"]), "ticks_v1", "test_source")
+        return tickdb
+    
+    def test_one_minute_bars(self, tickdb):
+        """Test OHLCV bars match a pandas resample."""
+        result = tickdb.bars("ES", interval="1m")
+        
+        assert result.column_names == [
+            "symbol", "ts", "open", "high", "low", "close",
+            "volume", "vwap", "trade_count"
+        ]
+        assert len(result) == 2
+        
+        df = make_ticks(["ES"]).to_pandas().set_index("ts")
+        expected = df["price"].resample("1min").ohlc()
+        bars = result.to_pandas()
+        assert bars["open"].tolist() == pytest.approx(expected["open"].tolist())
+        assert bars["close"].tolist() == pytest.approx(expected["close"].tolist())
+        assert bars["trade_count"].tolist() == [60, 60]
+        assert bars["volume"].sum() == df["size"].sum()
+    
+    def test_time_range_is_half_open(self, tickdb):
+        """Test ts_before is exclusive so consecutive requests tile."""
+        first = tickdb.bars(
+            ["ES", "NQ"],
+            ts_start="2025-01-01T00:00:00",
+            ts_before="2025-01-01T00:01:00",
+            aggs=["trade_count"]
+        )
+        
+        assert first.column_names == ["symbol", "ts", "trade_count"]
+        assert first.column("trade_count").to_pylist() == [60, 60]
+        with pytest.raises(ValueError):
+            tickdb.bars("ES", ts_end="2025-01-01T00:01:00", ts_before="2025-01-01T00:01:00")
+    
+    def test_ts_end_matches_read(self, tickdb):
+        """Test ts_end is inclusive, as in read."""
+        bounds = {"ts_start": "2025-01-01T00:00:00", "ts_end": "2025-01-01T00:01:00"}
+        bars = tickdb.bars("ES", aggs=["trade_count"], **bounds)
+        
+        assert sum(bars.column("trade_count").to_pylist()) == len(tickdb.read(symbol="ES", **bounds))
+    
+    def test_no_matching_files(self, tickdb):
+        """Test pruned-away ranges return an empty table."""
+        result = tickdb.bars("ES", ts_start="2030-01-01", interval="1h")
+        
+        assert isinstance(result, pa.Table)
+        assert len(result) == 0
+    
+    def test_invalid_interval(self, tickdb):
+        """Test unsupported intervals are rejected."""
+        with pytest.raises(ValueError):
+            tickdb.bars("ES", interval="1fortnight")
+
+
+class TestDownsample:
+    """Test min-max and LTTB downsampling."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def ticks(self):
+        """Random-walk ticks with one spike and one dip."""
+        ticks = make_ticks(["ES"], periods=5000).to_pandas()
+        rng = np.random.default_rng(7)
+        ticks["price"] = 4500 + rng.normal(0, 0.25, len(ticks)).cumsum()
+        ticks.loc[1234, "price"] = 5000.0
+        ticks.loc[3210, "price"] = 4000.0
+        return pa.Table.from_pandas(ticks, preserve_index=False)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir, ticks):
+        """Create TickDB instance with the ticks loaded."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(ticks, "ticks_v1", "test_source")
+        return tickdb
+    
+    @pytest.mark.parametrize("method", ["lttb", "minmax"])
+    def test_at_most_n_points_keeping_extremes(self, tickdb, method):
+        """Test the result is bounded, ordered and keeps the spike and the dip."""
+        result = tickdb.downsample("ES", "2025-01-01", "2025-01-02", points=200, method=method)
+        
+        assert result.column_names == ["ts", "price"]
+        assert 100 < len(result) <= 200
+        prices = result.column("price").to_pylist()
+        assert max(prices) == 5000.0
+        assert min(prices) == 4000.0
+        assert pc.all(pc.greater(result.column("ts")[1:], result.column("ts")[:-1])).as_py()
+    
+    def test_short_series_returned_whole(self, tickdb, ticks):
+        """Test ranges with fewer ticks than points come back unchanged."""
+        result = tickdb.downsample("ES", "2025-01-01T00:00:00", "2025-01-01T00:00:09", points=100)
+        
+        assert result.column("price").to_pylist() == ticks.column("price").to_pylist()[:10]
+    
+    def test_invalid_method(self, tickdb):
+        """Test unknown methods and too few points are rejected."""
+        with pytest.raises(ValueError):
+            tickdb.downsample("ES", "2025-01-01", "2025-01-02", method="average")
+        with pytest.raises(ValueError):
+            tickdb.downsample("ES", "2025-01-01", "2025-01-02", points=1)
+
+
+class TestAsofJoin:
+    """Test as-of joins across schemas."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with ticks and news events."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["ES", "NQ"]), "ticks_v1", "test_source")
+        
+        news = pd.DataFrame({
+            "ts": pd.to_datetime([
+                "2025-01-01 00:00:10", "2025-01-01 00:00:50", "2025-01-01 00:00:20"
+            ]),
+            "symbol": ["ES", "ES", "NQ"],
+            "event_type": ["news"] * 3,
+            "score": [0.5, -0.25, 0.75]
+        })
+        tickdb.loader.store_table(
+            pa.Table.from_pandas(news, preserve_index=False), "alt_nvd_v1", "news_feed"
+        )
+        return tickdb
+    
+    def test_matches_merge_asof(self, tickdb):
+        """Test the join matches pandas merge_asof."""
+        reader = tickdb.asof_join(
+            {"schema_id": "ticks_v1", "fields": ["ts", "symbol", "price"]},
+            {"schema_id": "alt_nvd_v1", "fields": ["ts", "symbol", "score"]},
+        )
+        
+        assert isinstance(reader, pa.RecordBatchReader)
+        result = reader.read_all().to_pandas()
+        
+        ticks = make_ticks(["ES", "NQ"]).to_pandas()[["ts", "symbol", "price"]]
+        news = tickdb.read(schema_id="alt_nvd_v1", fields=["ts", "symbol", "score"])
+        expected = pd.merge_asof(
+            ticks.sort_values("ts"),
+            news.to_pandas().sort_values("ts"),
+            on="ts",
+            by="symbol"
+        )
+        
+        result = result.sort_values(["ts", "symbol"]).reset_index(drop=True)
+        expected = expected.sort_values(["ts", "symbol"]).reset_index(drop=True)
+        assert result["score"].isna().sum() == expected["score"].isna().sum()
+        assert result["score"].fillna(0).tolist() == expected["score"].fillna(0).tolist()
+    
+    def test_tolerance_and_clashing_columns(self, tickdb):
+        """Test stale matches are dropped and clashing names get a suffix."""
+        result = tickdb.asof_join(
+            {"schema_id": "ticks_v1", "symbol": "ES", "fields": ["ts", "symbol", "source_id"]},
+            {"schema_id": "alt_nvd_v1", "fields": ["ts", "symbol", "score", "source_id"]},
+            tolerance="5s"
+        ).read_all()
+        
+        assert result.column_names == ["ts", "symbol", "source_id", "score", "source_id_right"]
+        matched = result.filter(pc.is_valid(result.column("score")))
+        # Two news events, each matched by the ticks in its 5 second window
+        assert len(matched) == 12
+        assert set(matched.column("source_id_right").to_pylist()) == {"news_feed"}
+
+
+class TestReadWindows:
+    """Test batched event-window reads."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with ticks spread over two files."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["ES", "NQ"]), "ticks_v1", "a")
+        tickdb.loader.store_table(make_ticks(["ES", "CL"], start="2025-01-01 00:02:00"), "ticks_v1", "b")
+        return tickdb
+    
+    def test_matches_per_event_reads(self, tickdb):
+        """Test each window equals a read_time_slice around its event."""
+        events = pd.DataFrame({
+            "event_id": [7, 3, 11, 5],
+            "symbol": ["ES", "NQ", "ES", "CL"],
+            "ts": pd.to_datetime([
+                "2025-01-01 00:00:30", "2025-01-01 00:01:55", "2025-01-01 00:02:00", "2025-01-01 00:03:00"
+            ])
+        })
+        
+        result = tickdb.read_windows(events, before="5s", after="10s", fields=["ts", "symbol", "price"])
+        
+        assert result.column_names == ["event_id", "ts", "symbol", "price"]
+        for event in events.itertuples():
+            expected = tickdb.reader.read_time_slice(
+                event.symbol,
+                event.ts - pd.Timedelta("5s"),
+                event.ts + pd.Timedelta("10s"),
+                fields=["ts", "symbol", "price"]
+            )
+            window = result.filter(pc.equal(result.column("event_id"), event.event_id))
+            assert window.drop_columns(["event_id"]).equals(expected)
+        
+        # Windows past the end of NQ's data stop at its last tick
+        assert result.column("event_id").to_pylist().count(3) == 10
+    
+    def test_default_event_ids(self, tickdb):
+        """Test events without ids are tagged with their row number."""
+        events = pa.table({
+            "symbol": ["ES", "GC"],
+            "ts": pa.array([pd.Timestamp("2025-01-01 00:01:00")] * 2, type=pa.timestamp("us"))
+        })
+        
+        result = tickdb.read_windows(events, before="1s", after="0s")
+        
+        assert set(result.column("event_id").to_pylist()) == {0}
+        assert len(result) == 2
+    
+    def test_scans_only_overlapping_files(self, tickdb):
+        """Test files between the windows are not scanned."""
+        tickdb.loader.store_table(make_ticks(["ES"], start="2025-01-01 00:10:00"), "ticks_v1", "c")
+        events = pd.DataFrame({
+            "symbol": ["ES", "ES"],
+            "ts": pd.to_datetime(["2025-01-01 00:00:10", "2025-01-01 00:11:00"])
+        })
+        
+        starts = (events["ts"] - pd.Timedelta("5s")).to_numpy()
+        ends = (events["ts"] + pd.Timedelta("5s")).to_numpy()
+        files = tickdb.reader._window_files("ticks_v1", ["ES"], starts, ends)
+        result = tickdb.read_windows(events, before="5s", after="5s", fields=["ts"])
+        
+        assert {pq.read_table(f).column("ts")[0].as_py().minute for f in files} == {0, 10}
+        assert result.column("event_id").to_pylist() == [0] * 11 + [1] * 11
+
+
+class TestSpill:
+    """Test per-query memory limits and result destinations."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with two days of data."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        for day in ("2025-01-01", "2025-01-02"):
+            tickdb.loader.store_table(make_ticks(["ES", "NQ"], start=day, periods=5000), "ticks_v1", "feed")
+        return tickdb
+    
+    def test_memory_limited_sort_spills(self, tickdb, temp_dir):
+        """Test a capped query spills its sort and returns the same rows."""
+        params = {"schema_id": "ticks_v1", "fields": ["ts", "symbol", "price"], "order_by": "price, ts"}
+        expected = tickdb.reader.query(params)
+        
+        result = tickdb.reader.query({**params, "memory_limit": "64MB", "temp_directory": str(temp_dir / "spill")})
+        
+        assert result.equals(expected)
+        # The shared connection keeps its own settings
+        assert tickdb.reader.duckdb_con.execute("SELECT current_setting('memory_limit')").fetchone()[0] != "61.0 MiB"
+    
+    @pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+    def test_destination(self, tickdb, temp_dir, suffix):
+        """Test results stream into a destination file and read back from it."""
+        params = {"schema_id": "ticks_v1", "symbol": "ES", "fields": ["ts", "price"]}
+        destination = temp_dir / "out" / f"extract{suffix}"
+        
+        result = tickdb.reader.query({**params, "destination": str(destination)})
+        
+        assert destination.exists()
+        if suffix == ".parquet":
+            # Parquet extracts come back lazily, decoded only when scanned
+            assert isinstance(result, ds.Dataset)
+            assert result.count_rows() == 10000
+            result = result.to_table()
+        assert len(result) == 10000
+        assert result.column("ts").to_pylist() == tickdb.reader.query(params).column("ts").to_pylist()
+        assert len(tickdb.read(output="pandas", destination=str(temp_dir / "out" / f"again{suffix}"), **params)) == 10000
+        
+        with pytest.raises(ValueError):
+            tickdb.reader.query({**params, "destination": str(temp_dir / "extract.csv")})
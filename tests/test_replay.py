@@ -0,0 +1,106 @@
+"""
+Unit tests for k-way merged replay.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.replay import merge_streams, pace
+
+from .test_reader import make_ticks
+
+
+class TestReplay:
+    """Test replay of many streams in global ts order."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with overlapping sorted and unsorted files."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(make_ticks(["ES", "NQ"], freq="3s"), "ticks_v1", "a")
+        tickdb.loader.store_table(
+            make_ticks(["ES", "CL"], start="2025-01-01 00:00:01", freq="2s"), "ticks_v1", "b"
+        )
+        
+        # File written before sorting on ingest, in reverse ts order
+        legacy = make_ticks(["GC"], start="2025-01-01 00:00:02", freq="5s")
+        legacy = legacy.take(pa.array(np.arange(len(legacy))[::-1]))
+        pq.write_table(legacy, config.data_path / "ticks_v1" / "legacy.parquet", row_group_size=16)
+        return tickdb
+    
+    def test_global_ts_order(self, tickdb):
+        """Test replay yields every matching row in ts order."""
+        batches = list(tickdb.replay(
+            ["ES", "CL", "GC"],
+            ts_start="2025-01-01T00:01:00",
+            ts_end="2025-01-01T00:04:00",
+            fields=["ts", "symbol", "price"],
+            batch_size=50
+        ))
+        
+        assert all(len(batch) <= 50 for batch in batches)
+        result = pa.Table.from_batches(batches)
+        assert result.column_names == ["ts", "symbol", "price"]
+        
+        ts = result.column("ts").to_numpy()
+        assert (np.diff(ts.astype("int64")) >= 0).all()
+        
+        expected = tickdb.reader.read_symbols(
+            ["ES", "CL", "GC"],
+            ts_start="2025-01-01T00:01:00",
+            ts_end="2025-01-01T00:04:00",
+            fields=["ts", "symbol", "price"]
+        )
+        assert sorted(zip(*result.to_pydict().values())) == sorted(zip(*expected.to_pydict().values()))
+    
+    def test_ingest_marks_files_sorted(self, tickdb):
+        """Test files written by the loader carry the sorted marker."""
+        files = sorted((tickdb.config.data_path / "ticks_v1").glob("ticks_v1_*.parquet"))
+        metadata = pq.read_schema(files[0]).metadata
+        
+        assert metadata[b"tickdb.sorted_by"] == b'["ts"]'
+    
+    def test_merge_streams(self):
+        """Test merging interleaved streams one chunk at a time."""
+        def stream(values, chunk):
+            table = pa.table({"ts": pa.array(values, type=pa.timestamp("ns"))})
+            for offset in range(0, len(table), chunk):
+                yield table.slice(offset, chunk)
+        
+        merged = pa.Table.from_batches(list(merge_streams([
+            stream(list(range(0, 100, 3)), 4),
+            stream(list(range(1, 100, 2)), 7),
+            stream([], 1),
+        ])))
+        
+        values = merged.column("ts").cast(pa.int64()).to_pylist()
+        assert values == sorted(list(range(0, 100, 3)) + list(range(1, 100, 2)))
+    
+    def test_pace(self):
+        """Test paced replay follows event time scaled by speed."""
+        batches = [
+            pa.record_batch({"ts": pa.array([i * 1_000_000_000], type=pa.timestamp("ns"))})
+            for i in range(3)
+        ]
+        
+        start = time.monotonic()
+        assert len(list(pace(iter(batches), speed=20.0))) == 3
+        assert time.monotonic() - start >= 0.1
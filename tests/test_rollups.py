@@ -0,0 +1,122 @@
+"""
+Unit tests for materialized bar rollups.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.reader import DataReader
+
+from .test_reader import make_ticks
+
+
+class TestRollups:
+    """Test incremental rollup maintenance and routing."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with an in-order and a late batch."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(
+            make_ticks(["ES", "NQ"], start="2025-01-01 00:01:00"), "ticks_v1", "feed"
+        )
+        # Late batch overlapping the buckets already rolled up
+        tickdb.loader.store_table(
+            make_ticks(["ES"], start="2025-01-01 00:00:30", price=50.0), "ticks_v1", "late"
+        )
+        return tickdb
+    
+    def raw_bars(self, tickdb, **kwargs):
+        """Compute bars from raw ticks, bypassing rollups."""
+        config = tickdb.config.model_copy(update={"rollup_intervals": []})
+        with DataReader(config) as reader:
+            return reader.bars(**kwargs)
+    
+    def test_rollup_matches_raw(self, tickdb):
+        """Test rollup-routed bars equal raw bars, including late data."""
+        kwargs = {"symbols": ["ES", "NQ"], "interval": "1m"}
+        
+        assert tickdb.reader.rollups.select_rollup("ticks_v1", "1m") == "1m"
+        pd.testing.assert_frame_equal(
+            tickdb.bars(**kwargs).to_pandas(),
+            self.raw_bars(tickdb, **kwargs).to_pandas()
+        )
+    
+    def test_routes_to_coarsest_rollup(self, tickdb):
+        """Test routing picks the coarsest aligned rollup."""
+        rollups = tickdb.reader.rollups
+        
+        assert rollups.select_rollup("ticks_v1", "1d") == "1d"
+        assert rollups.select_rollup("ticks_v1", "5m") == "1m"
+        assert rollups.select_rollup("ticks_v1", "30s") == "1s"
+        assert rollups.select_rollup(
+            "ticks_v1", "1m", ts_start="2025-01-01T00:01:30"
+        ) == "1s"
+        assert rollups.select_rollup(
+            "ticks_v1", "1m", ts_start="2025-01-01T00:01:30.5"
+        ) is None
+    
+    def test_inclusive_end_routes_to_rollup(self, tickdb, caplog):
+        """Test an inclusive end just before a bucket edge is answered from rollups."""
+        kwargs = {"symbols": ["ES", "NQ"], "interval": "1m", "ts_start": "2025-01-01 00:01:00"}
+        
+        with caplog.at_level(logging.INFO, logger="tickdb.reader"):
+            inclusive = tickdb.reader.bars(ts_end="2025-01-01 00:02:59.999999999", **kwargs)
+            tickdb.reader.bars(ts_end="2025-01-01 00:03:00", **kwargs)
+        
+        sources = [record.source for record in caplog.records if record.getMessage() == "Computing bars"]
+        assert sources == ["rollup:1m", "ticks"]
+        pd.testing.assert_frame_equal(
+            inclusive.to_pandas(),
+            self.raw_bars(tickdb, ts_before="2025-01-01 00:03:00", **kwargs).to_pandas()
+        )
+    
+    def test_compaction_preserves_bars(self, tickdb):
+        """Test compacting delta files keeps bars unchanged."""
+        kwargs = {"symbols": "ES", "interval": "1m"}
+        before = tickdb.bars(**kwargs)
+        
+        merged = tickdb.loader.rollups.compact("ticks_v1")
+        
+        assert merged["1m"] == 2
+        pd.testing.assert_frame_equal(
+            tickdb.bars(**kwargs).to_pandas(), before.to_pandas()
+        )
+    
+    def test_rebuild_enables_rollups(self, temp_dir):
+        """Test data written before rollups existed needs a rebuild."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            rollup_intervals=[]
+        )
+        TickDB(config).loader.store_table(make_ticks(["ES"]), "ticks_v1", "feed")
+        
+        tickdb = TickDB(config.model_copy(update={"rollup_intervals": ["1m"]}))
+        tickdb.loader.store_table(
+            make_ticks(["ES"], start="2025-01-02"), "ticks_v1", "feed"
+        )
+        assert tickdb.reader.rollups.select_rollup("ticks_v1", "1m") is None
+        
+        buckets = tickdb.rebuild_rollups("ticks_v1")
+        
+        assert buckets == {"1m": 4}
+        assert tickdb.reader.rollups.select_rollup("ticks_v1", "1m") == "1m"
+        assert tickdb.bars("ES").column("trade_count").to_pylist() == [60] * 4
@@ -0,0 +1,145 @@
+"""
+Unit tests for per-file sketches.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+from tickdb.sketches import SketchIndex, build_sketches, merge_sketches, quantile
+
+from .test_reader import make_ticks
+
+
+def heavy_tailed(symbols, start, periods, seed):
+    """Ticks with Pareto-distributed trade sizes."""
+    rng = np.random.default_rng(seed)
+    ticks = make_ticks(symbols, start=start, periods=periods).to_pandas()
+    ticks["size"] = (rng.pareto(1.5, len(ticks)) * 10 + 1).astype("int64")
+    return pa.Table.from_pandas(ticks, preserve_index=False)
+
+
+class TestDigest:
+    """Test t-digest building, merging and quantiles."""
+    
+    def test_merged_digests_match_whole(self):
+        """Test merging per-part digests gives accurate ranks."""
+        rng = np.random.default_rng(0)
+        values = rng.lognormal(0, 1, 200_000)
+        table = pa.table({"symbol": ["A"] * len(values), "size": values})
+        
+        parts = [build_sketches(table.slice(i * 20_000, 20_000), fields=["size"]) for i in range(10)]
+        merged = merge_sketches(pa.concat_tables(parts))
+        
+        assert len(merged) <= 110
+        assert merged.column("weight").to_numpy().sum() == len(values)
+        estimates = quantile(
+            merged.column("mean").to_numpy(),
+            merged.column("weight").to_numpy(),
+            merged.column("min")[0].as_py(),
+            merged.column("max")[0].as_py(),
+            [0.5, 0.99, 0.999]
+        )
+        ranks = [(values < estimate).mean() for estimate in estimates]
+        assert ranks == pytest.approx([0.5, 0.99, 0.999], abs=0.002)
+    
+    def test_groups_kept_apart(self):
+        """Test digests of different symbols do not mix."""
+        table = pa.table({"symbol": ["A", "B"] * 500, "price": [1.0, 100.0] * 500})
+        sketches = build_sketches(table)
+        
+        assert sorted(set(sketches.column("symbol").to_pylist())) == ["A", "B"]
+        for row in sketches.to_pylist():
+            assert row["mean"] == (1.0 if row["symbol"] == "A" else 100.0)
+
+
+class TestSketchIndex:
+    """Test sketches written on load, queried and rebuilt."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with two days of ticks."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False,
+            rollup_intervals=[]
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(heavy_tailed(["AAPL", "MSFT"], "2025-01-01", 5000, 1), "ticks_v1", "feed")
+        tickdb.loader.store_table(heavy_tailed(["AAPL", "NVDA"], "2025-01-02", 5000, 2), "ticks_v1", "feed")
+        return tickdb
+    
+    def test_quantiles_from_sketches(self, tickdb, temp_dir):
+        """Test quantiles merge the sketches of the files in range."""
+        sketch_files = list((temp_dir / "data" / "ticks_v1_sketches").glob("*.parquet"))
+        assert len(sketch_files) == 2
+        
+        result = tickdb.quantiles("size", qs=[0.5, 0.99], symbols="AAPL")
+        assert result.column_names == ["symbol", "count", "min", "max", "p50", "p99"]
+        
+        row = result.to_pylist()[0]
+        sizes = np.concatenate([
+            heavy_tailed(["AAPL", "MSFT"], "2025-01-01", 5000, 1).to_pandas().query("symbol == 'AAPL'")["size"],
+            heavy_tailed(["AAPL", "NVDA"], "2025-01-02", 5000, 2).to_pandas().query("symbol == 'AAPL'")["size"],
+        ])
+        assert row["count"] == 10_000
+        assert row["max"] == sizes.max()
+        assert (sizes <= row["p99"]).mean() == pytest.approx(0.99, abs=0.005)
+    
+    def test_time_range_selects_files(self, tickdb):
+        """Test symbol counts and quantiles only cover overlapping files."""
+        assert tickdb.count_symbols() == 3
+        assert tickdb.count_symbols(ts_start="2025-01-02") == 2
+        
+        result = tickdb.quantiles("price", ts_start="2025-01-02")
+        assert result.column("symbol").to_pylist() == ["AAPL", "NVDA"]
+        assert result.column("count").to_pylist() == [5000, 5000]
+    
+    def test_compaction_rebuilds_sketches(self, tickdb, temp_dir):
+        """Test stale, missing and orphaned sketches are reconciled."""
+        raw_dir = temp_dir / "data" / "ticks_v1"
+        sketch_dir = temp_dir / "data" / "ticks_v1_sketches"
+        first, second = sorted(raw_dir.glob("*.parquet"))
+        
+        # Compact both raw files into one, as an external compactor would
+        merged = pa.concat_tables([pq.read_table(first), pq.read_table(second)])
+        pq.write_table(merged, first)
+        second.unlink()
+        
+        assert tickdb.compact()["sketches"] == {"written": 1, "removed": 1}
+        assert [f.name for f in sketch_dir.glob("*.parquet")] == [first.name]
+        assert tickdb.quantiles("price", symbols="AAPL").column("count").to_pylist() == [10_000]
+        assert tickdb.compact()["sketches"] == {"written": 0, "removed": 0}
+    
+    def test_cache_bounded(self, tickdb, temp_dir):
+        """Test rewritten sketch files replace their cached version and the cache stays in budget."""
+        sketches = tickdb.reader.sketches
+        first, second = sorted((temp_dir / "data" / "ticks_v1_sketches").glob("*.parquet"))
+        sketches._read(first)
+        sketches._read(second)
+        
+        table = pq.read_table(first)
+        pq.write_table(table, first)
+        os.utime(first, ns=(first.stat().st_atime_ns, first.stat().st_mtime_ns + 1_000_000))
+        sketches._read(first)
+        
+        assert list(sketches._cache) == [str(second), str(first)]
+        assert sketches._cache_bytes == sum(table.nbytes for _, table in sketches._cache.values())
+        
+        small = SketchIndex(tickdb.config, max_cache_bytes=1)
+        small._read(first)
+        small._read(second)
+        assert list(small._cache) == [str(second)]
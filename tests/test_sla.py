@@ -0,0 +1,70 @@
+"""
+Unit tests for the SLA benchmark.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from tickdb.config import TickDBConfig
+from tickdb.sla import SLA_TARGETS, SLAReport, SLAResult, compare_baseline, run_sla
+
+
+def make_report(**values):
+    """Report with the given value per target."""
+    return SLAReport(
+        rows=1000,
+        hardware={"cpu": "test"},
+        results=[
+            SLAResult(
+                name=target.name,
+                description=target.description,
+                unit=target.unit,
+                value=values[target.name],
+                threshold=target.threshold,
+                higher_is_better=target.higher_is_better,
+                passed=True
+            )
+            for target in SLA_TARGETS
+        ]
+    )
+
+
+class TestSLA:
+    """Test SLA runs, reports and baseline comparison."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    def test_run_small_dataset(self, temp_dir):
+        """Test a run ingests the generated rows and measures every target."""
+        report = run_sla(TickDBConfig(), rows=20_000, files=2, workers=1, repeat=2, work_dir=temp_dir)
+        
+        assert report.rows == 20_000
+        assert [result.name for result in report.results] == [target.name for target in SLA_TARGETS]
+        assert all(result.value > 0 for result in report.results)
+        assert report.hardware["cores"] >= 1
+        assert len(list((temp_dir / "data" / "ticks_v1").glob("*.parquet"))) == 2
+    
+    def test_regressions_flagged_by_direction(self):
+        """Test lower throughput and higher latency beyond tolerance regress."""
+        baseline = make_report(ingest=1.0, full_scan=10.0, filtered_scan=2.0)
+        report = compare_baseline(make_report(ingest=0.8, full_scan=10.5, filtered_scan=1.0), baseline)
+        
+        flagged = {result.name: result.regression for result in report.results}
+        assert flagged == {"ingest": True, "full_scan": False, "filtered_scan": False}
+        assert report.results[0].change == pytest.approx(-0.2)
+        
+        report = compare_baseline(make_report(ingest=1.2, full_scan=12.0, filtered_scan=2.0), baseline)
+        assert [result.name for result in report.regressions] == ["full_scan"]
+    
+    def test_report_round_trip(self, temp_dir):
+        """Test saved reports load back as baselines."""
+        report = make_report(ingest=1.0, full_scan=10.0, filtered_scan=2.0)
+        report.save(temp_dir / "baseline.json")
+        
+        assert SLAReport.load(temp_dir / "baseline.json") == report
@@ -0,0 +1,92 @@
+"""
+Unit tests for cross-sectional snapshots.
+"""
+
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from tickdb.core import TickDB, TickDBConfig
+
+from .test_reader import make_ticks
+
+
+class TestSnapshot:
+    """Test snapshot queries backed by the checkpoint index."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @pytest.fixture
+    def tickdb(self, temp_dir):
+        """Create TickDB instance with batches spread over several minutes."""
+        config = TickDBConfig(
+            data_path=temp_dir / "data",
+            quarantine_path=temp_dir / "quarantine",
+            enable_metrics=False
+        )
+        tickdb = TickDB(config)
+        tickdb.loader.store_table(
+            make_ticks(["ES", "NQ", "CL"], periods=40, freq="3s"), "ticks_v1", "a"
+        )
+        tickdb.loader.store_table(
+            make_ticks(["ES"], start="2025-01-01 00:02:00", periods=90, freq="2s"), "ticks_v1", "b"
+        )
+        tickdb.loader.store_table(
+            make_ticks(["NQ", "GC"], start="2025-01-01 00:05:00", periods=30, freq="7s"), "ticks_v1", "c"
+        )
+        return tickdb
+    
+    def expected(self, tickdb, ts, symbols=None):
+        """Compute the snapshot with a full scan."""
+        where = f"ts <= '{ts}'"
+        if symbols:
+            where += " AND symbol IN ({})".format(", ".join(f"'{s}'" for s in symbols))
+        return duckdb.sql(f"""
+        SELECT symbol, ts, price
+        FROM read_parquet('{tickdb.config.data_path}/ticks_v1/*.parquet')
+        WHERE {where}
+        QUALIFY row_number() OVER (PARTITION BY symbol ORDER BY ts DESC) = 1
+        ORDER BY symbol
+        """).arrow()
+    
+    @pytest.mark.parametrize("ts", [
+        "2025-01-01 00:00:00",
+        "2025-01-01 00:01:30.5",
+        "2025-01-01 00:03:00",
+        "2025-01-01 00:05:13",
+        "2025-01-01 01:00:00",
+    ])
+    def test_matches_full_scan(self, tickdb, ts):
+        """Test snapshots equal a window-function scan at various times."""
+        result = tickdb.snapshot(ts, fields=["symbol", "ts", "price"])
+        
+        assert result.equals(self.expected(tickdb, ts))
+    
+    def test_symbol_subset_skips_files(self, tickdb):
+        """Test a subset snapshot only opens the files it needs."""
+        plan = tickdb.reader.checkpoints.plan("ticks_v1", "2025-01-01 00:10:00", ["GC"])
+        
+        assert len(plan.checkpoint_files) == 1
+        assert plan.tail_files == []
+        
+        result = tickdb.snapshot("2025-01-01 00:10:00", symbols=["GC", "CL"], fields=["symbol", "ts", "price"])
+        assert result.equals(self.expected(tickdb, "2025-01-01 00:10:00", ["GC", "CL"]))
+    
+    def test_unindexed_files_are_scanned(self, tickdb):
+        """Test raw files without checkpoints still contribute."""
+        checkpoint_dir = tickdb.reader.checkpoints.index_path("ticks_v1")
+        for file_path in checkpoint_dir.glob("*.parquet"):
+            file_path.unlink()
+        
+        ts = "2025-01-01 00:04:00"
+        result = tickdb.snapshot(ts, fields=["symbol", "ts", "price"])
+        assert result.equals(self.expected(tickdb, ts))
+        
+        assert tickdb.loader.checkpoints.rebuild("ticks_v1") == 3
+        assert tickdb.reader.checkpoints.plan("ticks_v1", ts).unindexed_files == []
@@ -0,0 +1,131 @@
+"""
+Unit tests for the synthetic tick generator.
+"""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
+import pytest
+
+from tickdb.synth import (
+    SynthSpec,
+    activity_weights,
+    generate,
+    generate_scale,
+    generate_segment,
+    generate_ticks,
+    iter_batches,
+    symbol_names,
+    write_dataset,
+)
+
+
+class TestGenerateTicks:
+    """Test generated ticks are deterministic and realistic."""
+    
+    def test_deterministic(self):
+        """Test the same arguments give the same table, another seed another one."""
+        first = generate_ticks(10_000, 20, days=2, seed=7)
+        
+        assert first.equals(generate_ticks(10_000, 20, days=2, seed=7))
+        assert not first.equals(generate_ticks(10_000, 20, days=2, seed=8))
+    
+    def test_single_day_matches_dataset(self):
+        """Test one day generated alone equals its rows of the whole dataset."""
+        whole = generate_scale("S")
+        second = generate_scale("S", day=1)
+        
+        assert second.equals(whole.slice(len(whole) - len(second)))
+    
+    def test_shape(self):
+        """Test row counts, sorting, sessions and value ranges."""
+        table = generate_ticks(50_000, 100, days=3, start="2025-01-03")
+        
+        assert len(table) == 50_000
+        assert table.column_names == ["ts", "symbol", "price", "size", "side", "exchange"]
+        assert pc.all(pc.greater_equal(table.column("ts")[1:], table.column("ts")[:-1])).as_py()
+        
+        ts = table.column("ts").to_pandas()
+        # Friday, then the next Monday and Tuesday, within 09:30-16:00
+        assert sorted(ts.dt.date.astype(str).unique()) == ["2025-01-03", "2025-01-06", "2025-01-07"]
+        minutes = ts.dt.hour * 60 + ts.dt.minute
+        assert minutes.min() >= 570 and minutes.max() < 960
+        assert pc.min(table.column("price")).as_py() > 0
+        assert pc.min(table.column("size")).as_py() >= 1
+    
+    def test_zipf_activity(self):
+        """Test the most active symbols trade in proportion to their weights."""
+        table = generate_ticks(200_000, 50)
+        counts = table.column("symbol").value_counts().to_pylist()
+        shares = {row["values"]: row["counts"] / len(table) for row in counts}
+        
+        weights = activity_weights(50)
+        names = symbol_names(50)
+        assert shares[names[0]] == pytest.approx(weights[0], rel=0.02)
+        assert shares[names[0]] / shares[names[9]] == pytest.approx(10 ** 1.1, rel=0.1)
+        assert len(set(names)) == 50 and np.all(np.diff(weights) < 0)
+
+
+class TestSynthSpec:
+    """Test quotes, L2 deltas, segments, faults and file output."""
+    
+    @pytest.mark.parametrize("kind,columns", [
+        ("quotes", ["ts", "symbol", "bid", "ask", "bid_size", "ask_size", "exchange"]),
+        ("l2", ["ts", "symbol", "side", "level", "price", "size", "action"]),
+    ])
+    def test_kinds(self, kind, columns):
+        """Test quotes are never crossed and L2 deltas stay within the book depth."""
+        table = generate(SynthSpec(kind=kind, rows=20_000, symbols=100, depth=5))
+        
+        assert table.column_names == columns
+        assert len(table) == 20_000
+        if kind == "quotes":
+            assert pc.all(pc.greater(table.column("ask"), table.column("bid"))).as_py()
+        else:
+            assert pc.max(table.column("level")).as_py() == 4
+            deletes = pc.equal(table.column("action"), "delete")
+            assert pc.all(pc.equal(table.filter(deletes).column("size"), 0)).as_py()
+    
+    def test_parts_split_sessions(self):
+        """Test parts are generated independently and concatenate in time order."""
+        spec = SynthSpec(rows=30_000, symbols=20, days=2, parts=3)
+        whole = generate(spec)
+        
+        assert len(whole) == 30_000
+        assert pc.all(pc.greater_equal(whole.column("ts")[1:], whole.column("ts")[:-1])).as_py()
+        assert generate_segment(spec, 1, 2).equals(whole.slice(30_000 - spec.segment_rows(1, 2)))
+    
+    def test_faults(self):
+        """Test faults change only the requested share of rows."""
+        clean = generate(SynthSpec(rows=50_000, symbols=20))
+        faulty = generate(SynthSpec(rows=50_000, symbols=20, out_of_order_rate=0.02, bad_row_rate=0.01))
+        
+        late = pc.sum(pc.less(faulty.column("ts"), clean.column("ts"))).as_py()
+        assert late == pytest.approx(1_000, rel=0.2)
+        assert pc.any(pc.less(faulty.column("ts")[1:], faulty.column("ts")[:-1])).as_py()
+        bad = pc.sum(pc.or_(
+            pc.less_equal(faulty.column("price"), 0),
+            pc.or_(pc.less(faulty.column("size"), 0), pc.is_null(faulty.column("symbol")))
+        )).as_py()
+        assert bad == pytest.approx(500, rel=0.2)
+        assert faulty.column("exchange").equals(clean.column("exchange"))
+    
+    @pytest.mark.parametrize("file_format", ["csv", "csv.gz", "parquet"])
+    def test_write_dataset(self, tmp_path, file_format):
+        """Test files are written per segment and read back unchanged."""
+        spec = SynthSpec(rows=4_000, symbols=10, days=2)
+        paths = write_dataset(spec, tmp_path, file_format=file_format, workers=2)
+        
+        assert [path.name for path in paths] == [f"trades_2025010{day}_000.{file_format}" for day in (2, 3)]
+        read = pq.read_table if file_format == "parquet" else csv.read_csv
+        assert read(paths[1]).column("price").equals(generate(spec, day=1).column("price"))
+    
+    def test_stream_batches(self):
+        """Test the batch stream yields the dataset in order."""
+        spec = SynthSpec(rows=10_000, symbols=10, days=2)
+        batches = list(iter_batches(spec, workers=2, batch_rows=3_000))
+        
+        assert max(len(batch) for batch in batches) == 3_000
+        assert pa.Table.from_batches(batches).equals(generate(spec))